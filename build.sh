@@ -9,6 +9,25 @@ BUILD_DIR="$ROOT/build"
 DIST_DIR="$ROOT/dist"
 DATA_DIR="$ROOT/data"
 PYTHON="${PYTHON:-python3}"
+BUNDLE_DIR="$DIST_DIR/bundle"
+BUNDLE_UBUNTU_IMAGE="${BUNDLE_UBUNTU_IMAGE:-ubuntu:24.04}"
+BUNDLE_PLATFORM="${BUNDLE_PLATFORM:-linux/amd64}"
+BUNDLE_EXTRA_IMAGES="${BUNDLE_EXTRA_IMAGES:-busybox:latest}"
+# Packages installed by installer.pyz and by the configuration tasks.
+BUNDLE_PACKAGES="ca-certificates curl gnupg lsb-release jq ethtool iputils-ping openssl wireguard wireguard-tools \
+dnsmasq nftables iptables nginx libnginx-mod-stream docker-ce docker-ce-cli containerd.io \
+docker-buildx-plugin docker-compose-plugin"
+
+# -------- Arguments --------
+BUILD_BUNDLE=0
+TOOLS=()
+for arg in "$@"; do
+  if [[ "$arg" == "--bundle" ]]; then
+    BUILD_BUNDLE=1
+  else
+    TOOLS+=("$arg")
+  fi
+done
 
 echo "Using Python: $("$PYTHON" -V)"
 
@@ -60,8 +79,95 @@ build_tool() {
   echo
 }
 
-if [[ $# -gt 0 ]]; then
-  for t in "$@"; do
+build_bundle_debs() {
+  local debs_dir="$BUNDLE_DIR/debs"
+  mkdir -p "$debs_dir"
+
+  echo "==== Resolving .deb closure in $BUNDLE_UBUNTU_IMAGE ===="
+  docker run --rm --platform "$BUNDLE_PLATFORM" \
+    -e BUNDLE_PACKAGES="$BUNDLE_PACKAGES" \
+    -v "$debs_dir:/bundle/debs" \
+    "$BUNDLE_UBUNTU_IMAGE" bash -euo pipefail -c '
+      export DEBIAN_FRONTEND=noninteractive
+      apt-get update
+      apt-get install -y --no-install-recommends ca-certificates curl dpkg-dev
+      install -m 0755 -d /etc/apt/keyrings
+      curl -fsSL https://download.docker.com/linux/ubuntu/gpg -o /etc/apt/keyrings/docker.asc
+      codename="$(. /etc/os-release && echo "${UBUNTU_CODENAME:-$VERSION_CODENAME}")"
+      echo "deb [arch=$(dpkg --print-architecture) signed-by=/etc/apt/keyrings/docker.asc] https://download.docker.com/linux/ubuntu $codename stable" \
+        > /etc/apt/sources.list.d/docker.list
+      apt-get update
+      cd /bundle/debs
+      # Full dependency closure, including packages already present in the build image.
+      apt-cache depends --recurse --no-recommends --no-suggests --no-conflicts --no-breaks \
+        --no-replaces --no-enhances $BUNDLE_PACKAGES | grep "^\w" | sort -u | xargs apt-get download
+      dpkg-scanpackages --multiversion . /dev/null > Packages
+      gzip -9kf Packages
+    '
+}
+
+build_bundle_images() {
+  local images_dir="$BUNDLE_DIR/images"
+  mkdir -p "$images_dir"
+
+  local images
+  images="$(grep -E '^[[:space:]]*image:' "$DATA_DIR/docker-compose.yml" | awk '{print $2}')"
+
+  for image in $images $BUNDLE_EXTRA_IMAGES; do
+    local archive
+    archive="$images_dir/$(echo "$image" | tr '/:' '__').tar.gz"
+    echo "==== Saving image: $image ===="
+    docker pull --quiet --platform "$BUNDLE_PLATFORM" "$image"
+    docker save "$image" | gzip -1 > "$archive"
+  done
+}
+
+build_bundle_manifest() {
+  echo "==== Writing bundle manifest ===="
+  (
+    cd "$BUNDLE_DIR"
+    find debs images -type f | sort | xargs sha256sum > SHA256SUMS
+  )
+
+  "$PYTHON" - "$BUNDLE_DIR" "$BUNDLE_UBUNTU_IMAGE" "$BUNDLE_PLATFORM" <<'PY'
+import json
+import pathlib
+import sys
+from datetime import datetime, timezone
+
+bundle_dir, ubuntu_image, platform = pathlib.Path(sys.argv[1]), sys.argv[2], sys.argv[3]
+checksums = {}
+for line in (bundle_dir / "SHA256SUMS").read_text(encoding="utf-8").splitlines():
+    digest, path = line.split(maxsplit=1)
+    checksums[path] = digest
+
+manifest = {
+    "created_at": datetime.now(timezone.utc).isoformat(),
+    "ubuntu_image": ubuntu_image,
+    "platform": platform,
+    "debs": [{"file": p, "sha256": d} for p, d in checksums.items() if p.endswith(".deb")],
+    "images": [{"file": p, "sha256": d} for p, d in checksums.items() if p.endswith(".tar.gz")],
+}
+(bundle_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+PY
+}
+
+build_bundle() {
+  if ! command -v docker >/dev/null 2>&1; then
+    echo "Bundle mode requires docker on the build machine"
+    exit 1
+  fi
+
+  rm -rf "$BUNDLE_DIR"
+  mkdir -p "$BUNDLE_DIR"
+  build_bundle_debs
+  build_bundle_images
+  build_bundle_manifest
+  echo "Bundle written to: $BUNDLE_DIR"
+}
+
+if [[ ${#TOOLS[@]} -gt 0 ]]; then
+  for t in "${TOOLS[@]}"; do
     build_tool "$t"
   done
 else
@@ -82,4 +188,8 @@ echo "Copying data dir to the dist"
 mkdir -p "$DIST_DIR/data"
 cp -R "$DATA_DIR/"* "$DIST_DIR/data" 2>/dev/null || true
 
+if [[ "$BUILD_BUNDLE" -eq 1 ]]; then
+  build_bundle
+fi
+
 echo "All done. Artifacts are in: $DIST_DIR"
@@ -0,0 +1,72 @@
+#!/bin/sh
+# /usr/local/sbin/internal-cert-rotate
+#
+# Issues a new internal server certificate when it is missing, expires within the
+# renewal window or its key does not match the certificate profile. The key and
+# certificate are installed with rename(), so readers see either the old or the new
+# file, and nginx is reloaded gracefully: old workers finish their connections.
+# Run daily by internal-cert-rotate.timer; a valid certificate costs two openssl calls.
+set -eu
+
+PKI=/etc/ssl/internal-pki
+NAME={{DOMAIN_NAME}}
+RENEW_DAYS={{CERT_RENEW_DAYS}}
+CERT_DAYS={{CERT_DAYS}}
+LIVE_CRT=/etc/ssl/certs/internal.crt
+LIVE_KEY=/etc/ssl/private/internal.key
+
+umask 077
+cd "$PKI"
+
+renew=0
+if [ ! -f "$NAME.key" ] || [ ! -f "$NAME.crt" ]; then
+  echo "Server certificate is missing."
+  renew=1
+elif ! openssl pkey -in "$NAME.key" -noout -text | grep -q '{{CERT_KEY_MARKER}}'; then
+  echo "Server key does not match the certificate profile."
+  renew=1
+else
+  not_after="$(openssl x509 -in "$NAME.crt" -noout -enddate | cut -d= -f2)"
+  days_left=$(( ($(date -d "$not_after" +%s) - $(date +%s)) / 86400 ))
+  echo "Server certificate expires on $not_after ($days_left days left)."
+  if [ "$days_left" -le "$RENEW_DAYS" ]; then
+    renew=1
+  fi
+fi
+
+if [ "$renew" -eq 1 ]; then
+  echo "Issuing a new server certificate."
+  rm -f "$NAME.key.new" "$NAME.csr.new" "$NAME.crt.new"
+  openssl {{CERT_SERVER_GENKEY}}
+  openssl req -new -key "$NAME.key.new" -out "$NAME.csr.new" -config san.cnf
+  openssl x509 -req -in "$NAME.csr.new" -CA ca.crt -CAkey ca.key -CAcreateserial \
+    -out "$NAME.crt.new" -days "$CERT_DAYS" -sha256 -extensions req_ext -extfile san.cnf
+  mv -f "$NAME.key.new" "$NAME.key"
+  mv -f "$NAME.csr.new" "$NAME.csr"
+  mv -f "$NAME.crt.new" "$NAME.crt"
+fi
+
+changed=0
+if ! cmp -s "$NAME.key" "$LIVE_KEY"; then
+  install -m 0600 -o root -g root "$NAME.key" "$LIVE_KEY.new"
+  changed=1
+fi
+if ! cmp -s "$NAME.crt" "$LIVE_CRT"; then
+  install -m 0644 -o root -g root "$NAME.crt" "$LIVE_CRT.new"
+  changed=1
+fi
+if [ -f "$LIVE_KEY.new" ]; then
+  mv -f "$LIVE_KEY.new" "$LIVE_KEY"
+fi
+if [ -f "$LIVE_CRT.new" ]; then
+  mv -f "$LIVE_CRT.new" "$LIVE_CRT"
+fi
+
+if [ "$changed" -eq 1 ]; then
+  echo "Installed the server certificate."
+  if systemctl is-active --quiet nginx 2>/dev/null; then
+    nginx -t -q
+    nginx -s reload
+    echo "Reloaded nginx."
+  fi
+fi
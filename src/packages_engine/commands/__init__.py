@@ -2,6 +2,14 @@ from .install_command import InstallCommand
 from .autostart_command import AutostartCommand
 from .configure_command import ConfigureCommand
 from .self_deploy_command import SelfDeployCommand
+from .dns_benchmark_command import DnsBenchmarkCommand
+from .http_benchmark_command import HttpBenchmarkCommand
+from .vpn_throughput_command import VpnThroughputCommand
+from .engine_benchmark_command import EngineBenchmarkCommand
+from .compile_bundle_command import CompileBundleCommand
+from .apply_bundle_command import ApplyBundleCommand
 
 __all__ = ["InstallCommand", "AutostartCommand",
-           "ConfigureCommand", "SelfDeployCommand"]
+           "ConfigureCommand", "SelfDeployCommand", "DnsBenchmarkCommand", "HttpBenchmarkCommand",
+           "VpnThroughputCommand", "EngineBenchmarkCommand", "CompileBundleCommand",
+           "ApplyBundleCommand"]
@@ -0,0 +1,46 @@
+from packages_engine.services.config_bundle.config_bundle_service_contract import (
+    ConfigBundleServiceContract,
+)
+from packages_engine.services.input_collection import InputCollectionServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+
+
+class ApplyBundleCommand:
+    def __init__(
+        self,
+        input_collection: InputCollectionServiceContract,
+        notifications: NotificationsServiceContract,
+        config_bundle: ConfigBundleServiceContract,
+    ):
+        self.input_collection = input_collection
+        self.notifications = notifications
+        self.config_bundle = config_bundle
+
+    def execute(self) -> bool:
+        bundle_path = self.input_collection.read_str("Bundle file", "config_bundle.tar.gz")
+        key_path = self.input_collection.read_str("Bundle key file", "bundle.key")
+
+        read_result = self.config_bundle.read(bundle_path, key_path)
+        if not read_result.success or read_result.data is None:
+            self.notifications.error(f"\t{read_result.message}")
+            return False
+        artifacts = read_result.data
+        self.notifications.info(f"Bundle {bundle_path} holds {len(artifacts)} verified files.")
+
+        apply_result = self.config_bundle.apply(artifacts)
+        if not apply_result.success or apply_result.data is None:
+            self.notifications.error(
+                f"\tApplying bundle {bundle_path} failed: {apply_result.message}"
+            )
+            return False
+
+        plan = apply_result.data
+        for change in plan.changes:
+            self.notifications.info(f"\tInstalled {change.path}")
+        for command in plan.commands:
+            self.notifications.info(f"\tRan {command}")
+        self.notifications.success(
+            f"Applied {len(plan.changes)} changed files of {len(artifacts)}, "
+            f"reloaded: {', '.join(plan.reloads()) or 'nothing'}."
+        )
+        return True
@@ -0,0 +1,43 @@
+from packages_engine.commands.configure_command import ConfigureCommand
+from packages_engine.services.config_bundle.config_bundle_service_contract import (
+    ConfigBundleServiceContract,
+)
+from packages_engine.services.dry_run.plan_host import PlanHost
+from packages_engine.services.input_collection import InputCollectionServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+
+
+class CompileBundleCommand:
+    def __init__(
+        self,
+        input_collection: InputCollectionServiceContract,
+        notifications: NotificationsServiceContract,
+        config_bundle: ConfigBundleServiceContract,
+        configure_command: ConfigureCommand,
+        plan_host: PlanHost,
+    ):
+        self.input_collection = input_collection
+        self.notifications = notifications
+        self.config_bundle = config_bundle
+        self.configure_command = configure_command
+        self.plan_host = plan_host
+
+    def execute(self) -> bool:
+        bundle_path = self.input_collection.read_str("Bundle file", "config_bundle.tar.gz")
+        key_path = self.input_collection.read_str("Bundle key file", "bundle.key")
+
+        if not self.configure_command.execute():
+            self.notifications.error("\tConfiguration failed, no bundle was compiled.")
+            return False
+
+        artifacts = self.plan_host.artifacts()
+        if not artifacts:
+            self.notifications.error("\tConfiguration rendered no files to compile.")
+            return False
+
+        write_result = self.config_bundle.write(bundle_path, key_path, artifacts)
+        if not write_result.success:
+            self.notifications.error(f"\t{write_result.message}")
+            return False
+        self.notifications.success(f"Compiled {len(artifacts)} files into {bundle_path}.")
+        return True
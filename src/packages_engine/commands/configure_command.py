@@ -15,11 +15,12 @@ class ConfigureCommand:
         self.config_data_reader = config_data_reader
         self.tasks = tasks
 
-    def execute(self):
-        """Method that executes all the configured configuration tasks."""
+    def execute(self) -> bool:
+        """Method that executes all the configured configuration tasks, True if all succeeded."""
         stored_config_data = self.config_data_reader.load_stored()
         config_data = self.config_data_reader.read(stored_config_data)
         for task in self.tasks:
             configure_result = task.configure(config_data)
             if not configure_result.success:
-                return
+                return False
+        return True
@@ -0,0 +1,57 @@
+from packages_engine.models.benchmark import DnsBenchmarkPlan, DnsQuery
+from packages_engine.services.configuration.configuration_tasks.dnsmasq import INTERNAL_SERVICES
+from packages_engine.services.dns_benchmark import DnsBenchmarkServiceContract
+from packages_engine.services.input_collection import InputCollectionServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+
+
+class DnsBenchmarkCommand:
+    def __init__(
+        self,
+        input_collection: InputCollectionServiceContract,
+        notifications: NotificationsServiceContract,
+        dns_benchmark: DnsBenchmarkServiceContract,
+    ):
+        self.input_collection = input_collection
+        self.notifications = notifications
+        self.dns_benchmark = dns_benchmark
+
+    def execute(self):
+        server = self.input_collection.read_str("Resolver address", "10.10.0.1")
+        domain_name = self.input_collection.read_str("Internal domain", "internal.app")
+        upstream_names = self.input_collection.read_str(
+            "Upstream names (comma separated)", "example.com,wikipedia.org,ubuntu.com"
+        )
+        rounds = self.input_collection.read_int("Rounds per name", 20)
+        concurrency = self.input_collection.read_int("Concurrent queries", 10)
+
+        queries = [DnsQuery(f"{name}.{domain_name}", "internal") for name in INTERNAL_SERVICES]
+        queries.extend(
+            DnsQuery(name.strip(), "upstream") for name in upstream_names.split(",") if name.strip()
+        )
+        plan = DnsBenchmarkPlan(server, queries, rounds=rounds, concurrency=concurrency)
+
+        self.notifications.info(
+            f"Querying {server} with {len(queries)} names, {rounds} rounds, "
+            f"{concurrency} in flight."
+        )
+        result = self.dns_benchmark.run(plan)
+        if not result.success or result.data is None:
+            self.notifications.error(f"\tDNS benchmark failed: {result.message}")
+            return
+
+        report = result.data
+        for category in report.categories:
+            self.notifications.info(
+                f"\t{category.category}: {category.sent} queries, "
+                f"p50 {category.latency.p50_ms:.2f} ms, p95 {category.latency.p95_ms:.2f} ms, "
+                f"p99 {category.latency.p99_ms:.2f} ms, failures {category.failure_rate:.1%}, "
+                f"cache hits {category.cache_hit_ratio:.1%}"
+            )
+            if category.errors:
+                breakdown = ", ".join(f"{name}={count}" for name, count in category.errors.items())
+                self.notifications.warning(f"\t{category.category} errors: {breakdown}")
+        self.notifications.success(
+            f"DNS benchmark finished. Answers within {report.cache_hit_threshold_ms:.2f} ms "
+            "count as cache hits."
+        )
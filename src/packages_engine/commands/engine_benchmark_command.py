@@ -0,0 +1,101 @@
+from packages_engine.models.benchmark import (
+    EngineBenchmarkPlan,
+    EngineBenchmarkReport,
+    find_regressions,
+    scaling_exponents,
+)
+from packages_engine.services.engine_benchmark.engine_benchmark_service_contract import (
+    EngineBenchmarkServiceContract,
+)
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.input_collection import InputCollectionServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+
+
+class EngineBenchmarkCommand:
+    def __init__(
+        self,
+        input_collection: InputCollectionServiceContract,
+        notifications: NotificationsServiceContract,
+        file_system: FileSystemServiceContract,
+        engine_benchmark: EngineBenchmarkServiceContract,
+    ):
+        self.input_collection = input_collection
+        self.notifications = notifications
+        self.file_system = file_system
+        self.engine_benchmark = engine_benchmark
+
+    def execute(self) -> bool:
+        data_dir = self.input_collection.read_str("Templates data directory", "data")
+        client_counts = self.input_collection.read_str(
+            "Client counts (comma separated)", "10,100,1000,10000"
+        )
+        repeats = self.input_collection.read_int("Repeats per case", 3)
+        results_path = self.input_collection.read_str("Results file", "engine_benchmark.json")
+        baseline_path = self.input_collection.read_str("Baseline results file (optional)", "")
+        threshold_percent = self.input_collection.read_int("Allowed regression (percent)", 20)
+
+        try:
+            counts = [int(count) for count in client_counts.split(",") if count.strip()]
+        except ValueError:
+            self.notifications.error(f"\tInvalid client counts {client_counts}.")
+            return False
+        if not counts or min(counts) < 1:
+            self.notifications.error(f"\tInvalid client counts {client_counts}.")
+            return False
+
+        self.notifications.info(
+            f"Benchmarking the engine with {client_counts} clients, best of {repeats}."
+        )
+        result = self.engine_benchmark.run(EngineBenchmarkPlan(data_dir, counts, repeats))
+        if not result.success or result.data is None:
+            self.notifications.error(f"\tEngine benchmark failed: {result.message}")
+            return False
+
+        report = result.data
+        self._report(report)
+
+        save_result = self.file_system.write_json(results_path, report.as_object())
+        if not save_result.success:
+            self.notifications.error(f"\tSaving results to {results_path} failed.")
+            return False
+
+        if baseline_path and not self._compare(report, baseline_path, threshold_percent / 100):
+            return False
+        self.notifications.success(f"Engine benchmark finished. Results saved to {results_path}.")
+        return True
+
+    def _report(self, report: EngineBenchmarkReport):
+        for case in report.cases:
+            self.notifications.info(
+                f"\t{case.key}: {case.seconds * 1000:.3f} ms, "
+                f"peak {case.peak_bytes / 1024:.1f} KiB"
+            )
+        for name, exponents in scaling_exponents(report.cases).items():
+            curve = ", ".join(f"{exponent:.2f}" for exponent in exponents)
+            self.notifications.info(f"\t{name} scaling exponents: {curve}")
+
+    def _compare(self, report: EngineBenchmarkReport, baseline_path: str, threshold: float) -> bool:
+        baseline_result = self.file_system.read_json(baseline_path)
+        if not baseline_result.success or baseline_result.data is None:
+            self.notifications.warning(f"\tBaseline {baseline_path} could not be read.")
+            return True
+        try:
+            baseline = EngineBenchmarkReport.from_object(baseline_result.data)
+        except (KeyError, TypeError, ValueError):
+            self.notifications.warning(f"\tBaseline {baseline_path} is not an engine benchmark.")
+            return True
+
+        regressions = find_regressions(report, baseline, threshold)
+        for regression in regressions:
+            self.notifications.error(
+                f"\t{regression.key} {regression.metric} grew from {regression.baseline:g} "
+                f"to {regression.current:g} ({regression.ratio:.2f}x)."
+            )
+        if regressions:
+            self.notifications.error(
+                f"\t{len(regressions)} regressions over {threshold:.0%} against {baseline_path}."
+            )
+            return False
+        self.notifications.info(f"\tNo regressions over {threshold:.0%} against {baseline_path}.")
+        return True
@@ -0,0 +1,121 @@
+from urllib.parse import urlsplit
+
+from packages_engine.models.benchmark import HttpBenchmarkPlan, HttpBenchmarkReport
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.http_benchmark import HttpBenchmarkServiceContract, parse_request_mix
+from packages_engine.services.input_collection import InputCollectionServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+
+REGRESSION_TOLERANCE = 0.1
+
+
+class HttpBenchmarkCommand:
+    def __init__(
+        self,
+        input_collection: InputCollectionServiceContract,
+        notifications: NotificationsServiceContract,
+        file_system: FileSystemServiceContract,
+        http_benchmark: HttpBenchmarkServiceContract,
+    ):
+        self.input_collection = input_collection
+        self.notifications = notifications
+        self.file_system = file_system
+        self.http_benchmark = http_benchmark
+
+    def execute(self):
+        target = self.input_collection.read_str("Target URL", "https://gitea.internal.app")
+        ca_file = self.input_collection.read_str("CA file (empty for system CAs)", "")
+        request_mix = self.input_collection.read_str(
+            "Request mix (METHOD /path:weight, comma separated)",
+            "GET /:5,GET /explore/repos:3,GET /api/v1/version:2",
+        )
+        concurrency = self.input_collection.read_int("Concurrent connections", 20)
+        total_requests = self.input_collection.read_int("Total requests", 2000)
+        keep_alive = self.input_collection.read_str("Reuse connections (y/n)", "y")
+        results_path = self.input_collection.read_str("Results file", "http_benchmark.json")
+        baseline_path = self.input_collection.read_str("Baseline results file (optional)", "")
+
+        url = urlsplit(target)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            self.notifications.error(f"\tInvalid target URL {target}.")
+            return
+        try:
+            requests = parse_request_mix(request_mix)
+        except ValueError as error:
+            self.notifications.error(f"\t{error}.")
+            return
+
+        use_tls = url.scheme == "https"
+        plan = HttpBenchmarkPlan(
+            url.hostname,
+            url.port or (443 if use_tls else 80),
+            requests,
+            use_tls=use_tls,
+            ca_file=ca_file or None,
+            concurrency=concurrency,
+            total_requests=total_requests,
+            keep_alive=keep_alive.strip().lower().startswith("y"),
+        )
+
+        self.notifications.info(
+            f"Sending {total_requests} requests to {target} over {concurrency} connections."
+        )
+        result = self.http_benchmark.run(plan)
+        if not result.success or result.data is None:
+            self.notifications.error(f"\tHTTP benchmark failed: {result.message}")
+            return
+
+        report = result.data
+        self._report(report)
+
+        if baseline_path:
+            self._compare(report, baseline_path)
+
+        save_result = self.file_system.write_json(results_path, report.as_object())
+        if not save_result.success:
+            self.notifications.error(f"\tSaving results to {results_path} failed.")
+            return
+        self.notifications.success(f"HTTP benchmark finished. Results saved to {results_path}.")
+
+    def _report(self, report: HttpBenchmarkReport):
+        latency = report.latency
+        self.notifications.info(
+            f"\t{report.requests} requests in {report.duration_seconds:.2f} s, "
+            f"{report.throughput_rps:.1f} req/s, {report.connections_opened} connections, "
+            f"{report.failed} failed"
+        )
+        self.notifications.info(
+            f"\tLatency p50 {latency.p50_ms:.2f} ms, p95 {latency.p95_ms:.2f} ms, "
+            f"p99 {latency.p99_ms:.2f} ms, max {latency.max_ms:.2f} ms"
+        )
+        for request in report.per_request:
+            self.notifications.info(
+                f"\t{request.method} {request.path}: {request.requests} requests, "
+                f"p95 {request.latency.p95_ms:.2f} ms, {request.failed} failed"
+            )
+        if report.status_counts:
+            statuses = ", ".join(f"{code}={count}" for code, count in report.status_counts.items())
+            self.notifications.info(f"\tStatuses: {statuses}")
+        if report.errors:
+            breakdown = ", ".join(f"{name}={count}" for name, count in report.errors.items())
+            self.notifications.warning(f"\tErrors: {breakdown}")
+
+    def _compare(self, report: HttpBenchmarkReport, baseline_path: str):
+        baseline_result = self.file_system.read_json(baseline_path)
+        if not baseline_result.success or not isinstance(baseline_result.data, dict):
+            self.notifications.warning(f"\tBaseline {baseline_path} could not be read.")
+            return
+        baseline = baseline_result.data
+        baseline_rps = float(baseline.get("throughput_rps", 0))
+        baseline_p95 = float(baseline.get("latency", {}).get("p95_ms", 0))
+
+        self.notifications.info(f"\tBaseline {baseline_rps:.1f} req/s, p95 {baseline_p95:.2f} ms")
+        if baseline_rps and report.throughput_rps < baseline_rps * (1 - REGRESSION_TOLERANCE):
+            self.notifications.warning(
+                f"\tThroughput dropped from {baseline_rps:.1f} "
+                f"to {report.throughput_rps:.1f} req/s."
+            )
+        if baseline_p95 and report.latency.p95_ms > baseline_p95 * (1 + REGRESSION_TOLERANCE):
+            self.notifications.warning(
+                f"\tp95 latency grew from {baseline_p95:.2f} to {report.latency.p95_ms:.2f} ms."
+            )
@@ -24,7 +24,7 @@ class SelfDeployCommand:
         server_data_dir = self.input_collection.read_str("Server data directory", "srv")
         data_location = f"/usr/local/share/{server_data_dir}/data"
         scripts_location = "/usr/local/sbin"
-        self._copy_paths(
+        copy_result = self._copy_paths(
             ["data/.", "autostart.pyz", "configurator.pyz", "installer.pyz"],
             [
                 data_location,
@@ -33,6 +33,12 @@ class SelfDeployCommand:
                 f"{scripts_location}/installer.pyz",
             ],
         )
+        if not copy_result:
+            return
+
+        # Offline bundle produced by "build.sh --bundle" is optional.
+        if self.file_system.path_exists("bundle"):
+            self._copy_paths(["bundle/."], ["/usr/local/share/bundle"])
 
     def _check_paths(self, paths: list[str]) -> bool:
         self.notifications.info("Will check paths if self deployment possible")
@@ -45,14 +51,15 @@ class SelfDeployCommand:
                 return False
         return True
 
-    def _copy_paths(self, paths_from: list[str], paths_to: list[str]):
+    def _copy_paths(self, paths_from: list[str], paths_to: list[str]) -> bool:
         for path_from, path_to in zip(paths_from, paths_to):
             self.notifications.info(f'Copying from "{path_from}" to "{path_to}"')
             copy_result = self.file_system.copy_path(path_from, path_to)
             if not copy_result.success:
                 self.notifications.error(f'\tCopying from "{path_from}" to "{path_to}" failed')
-                return
+                return False
             else:
                 self.notifications.success(
                     f'\tCopying from "{path_from}" to "{path_to}" successful'
                 )
+        return True
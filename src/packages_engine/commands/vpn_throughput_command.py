@@ -0,0 +1,157 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from packages_engine.models.benchmark import VpnThroughputPlan, VpnThroughputReport
+from packages_engine.services.configuration import ConfigurationDataReaderServiceContract
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.input_collection import InputCollectionServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.vpn_throughput import VpnThroughputServiceContract
+
+
+class VpnThroughputCommand:
+    def __init__(
+        self,
+        input_collection: InputCollectionServiceContract,
+        notifications: NotificationsServiceContract,
+        file_system: FileSystemServiceContract,
+        config_data_reader: ConfigurationDataReaderServiceContract,
+        vpn_throughput: VpnThroughputServiceContract,
+    ):
+        self.input_collection = input_collection
+        self.notifications = notifications
+        self.file_system = file_system
+        self.config_data_reader = config_data_reader
+        self.vpn_throughput = vpn_throughput
+
+    def execute(self):
+        mode = self.input_collection.read_str("Mode (server, client)", "client").strip()
+        if mode == "server":
+            self._serve()
+        elif mode == "client":
+            self._run_client()
+        else:
+            self.notifications.error(f"\tUnknown mode {mode}.")
+
+    def _serve(self):
+        host = self.input_collection.read_str("Listen address", "10.10.0.1")
+        port = self.input_collection.read_int("Port", 5201)
+        results_path = self.input_collection.read_str(
+            "Results file", "/var/log/vpn_throughput.json"
+        )
+
+        registry = self._client_registry()
+        self.notifications.info(
+            f"Listening on {host}:{port} over TCP and UDP for {len(registry)} known peers. "
+            "Press Ctrl+C to stop."
+        )
+
+        def record(address: str, report: Any) -> str:
+            peer = registry.get(address, address)
+            self._append_record(results_path, peer, address, report)
+            return peer
+
+        result = self.vpn_throughput.serve(host, port, record)
+        if not result.success:
+            self.notifications.error(f"\t{result.message}")
+            return
+        self.notifications.success("VPN throughput server stopped.")
+
+    def _client_registry(self) -> dict[str, str]:
+        stored = self.config_data_reader.load_stored()
+        registry: dict[str, str] = {}
+        for client_name in stored.wireguard_client_names if stored else []:
+            ip_result = self.file_system.read_text(f"/etc/wireguard/clients/{client_name}.ip")
+            if ip_result.success and ip_result.data:
+                registry[ip_result.data.strip()] = client_name
+        return registry
+
+    def _append_record(self, results_path: str, peer: str, address: str, report: Any):
+        records: list[Any] = []
+        if self.file_system.path_exists(results_path):
+            read_result = self.file_system.read_json(results_path)
+            if read_result.success and isinstance(read_result.data, list):
+                records = list(read_result.data)
+        records.append(
+            {
+                **report,
+                "peer": peer,
+                "address": address,
+                "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            }
+        )
+        write_result = self.file_system.write_json(results_path, records)
+        if not write_result.success:
+            self.notifications.error(f"\tRecording the run from {peer} failed.")
+            return
+        self.notifications.info(
+            f"\tRecorded {report.get('protocol')} run from {peer}: "
+            f"{report.get('aggregate_mbps')} Mbit/s"
+        )
+
+    def _run_client(self):
+        host = self.input_collection.read_str("Server address", "10.10.0.1")
+        port = self.input_collection.read_int("Port", 5201)
+        protocol = self.input_collection.read_str("Protocol (tcp, udp)", "tcp").strip()
+        streams = self.input_collection.read_int("Parallel streams", 4)
+        duration = self.input_collection.read_int("Duration in seconds", 10)
+        bitrate = 100
+        if protocol == "udp":
+            bitrate = self.input_collection.read_int("UDP target bitrate in Mbit/s", 100)
+        rtt_samples = self.input_collection.read_int("RTT samples", 20)
+        results_path = self.input_collection.read_str("Results file", "vpn_throughput.json")
+
+        plan = VpnThroughputPlan(
+            host,
+            port,
+            protocol,
+            streams=streams,
+            duration_seconds=float(duration),
+            udp_bitrate_mbps=float(bitrate),
+            rtt_samples=rtt_samples,
+        )
+
+        self.notifications.info(
+            f"Measuring {protocol} throughput to {host}:{port} with {streams} streams "
+            f"for {duration} s."
+        )
+        result = self.vpn_throughput.run_client(plan)
+        if not result.success or result.data is None:
+            self.notifications.error(f"\tVPN throughput run failed: {result.message}")
+            return
+
+        report = result.data
+        self._report(report)
+
+        save_result = self.file_system.write_json(results_path, report.as_object())
+        if not save_result.success:
+            self.notifications.error(f"\tSaving results to {results_path} failed.")
+            return
+        self.notifications.success(f"VPN throughput run finished. Results saved to {results_path}.")
+
+    def _report(self, report: VpnThroughputReport):
+        for stream in report.streams:
+            line = f"\tStream {stream.stream}: {stream.rate_mbps:.2f} Mbit/s"
+            if report.protocol == "udp":
+                line += (
+                    f", lost {stream.packets_lost}/{stream.packets_sent}, "
+                    f"jitter {stream.jitter_ms:.3f} ms, out of order {stream.out_of_order}"
+                )
+            self.notifications.info(line)
+        self.notifications.info(f"\tAggregate: {report.aggregate_mbps:.2f} Mbit/s")
+        if report.protocol == "udp":
+            self.notifications.info(
+                f"\tUDP loss {report.loss_ratio:.2%}, jitter {report.jitter_ms:.3f} ms"
+            )
+        for title, rtt in (("Idle", report.idle_rtt), ("Loaded", report.loaded_rtt)):
+            self.notifications.info(
+                f"\t{title} RTT p50 {rtt.p50_ms:.2f} ms, p95 {rtt.p95_ms:.2f} ms, "
+                f"max {rtt.max_ms:.2f} ms"
+            )
+        if report.rtt_errors:
+            breakdown = ", ".join(f"{name}={count}" for name, count in report.rtt_errors.items())
+            self.notifications.warning(f"\tRTT probe errors: {breakdown}")
+        if report.peer:
+            self.notifications.info(f"\tRecorded on the server as {report.peer}.")
+        else:
+            self.notifications.warning("\tThe server did not record this run.")
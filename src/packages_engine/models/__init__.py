@@ -1,4 +1,7 @@
+from .benchmark import *
+from .bundle import *
 from .configuration import *
 from .operation_result import OperationResult
+from .plan import *
 
-__all__ = ["configuration", "OperationResult"]
+__all__ = ["benchmark", "bundle", "configuration", "OperationResult", "plan"]
@@ -0,0 +1,41 @@
+from .dns_benchmark import DnsBenchmarkPlan, DnsBenchmarkReport, DnsCategoryReport, DnsQuery
+from .engine_benchmark import (
+    EngineBenchmarkCase,
+    EngineBenchmarkPlan,
+    EngineBenchmarkRegression,
+    EngineBenchmarkReport,
+    find_regressions,
+    scaling_exponents,
+)
+from .http_benchmark import (
+    HttpBenchmarkPlan,
+    HttpBenchmarkReport,
+    HttpRequestReport,
+    HttpRequestSpec,
+)
+from .latency_histogram import LatencyHistogram
+from .latency_summary import LatencySummary, latency_percentile
+from .vpn_throughput import VpnStreamReport, VpnThroughputPlan, VpnThroughputReport
+
+__all__ = [
+    "DnsBenchmarkPlan",
+    "DnsBenchmarkReport",
+    "DnsCategoryReport",
+    "DnsQuery",
+    "EngineBenchmarkCase",
+    "EngineBenchmarkPlan",
+    "EngineBenchmarkRegression",
+    "EngineBenchmarkReport",
+    "find_regressions",
+    "scaling_exponents",
+    "HttpBenchmarkPlan",
+    "HttpBenchmarkReport",
+    "HttpRequestReport",
+    "HttpRequestSpec",
+    "LatencyHistogram",
+    "LatencySummary",
+    "latency_percentile",
+    "VpnStreamReport",
+    "VpnThroughputPlan",
+    "VpnThroughputReport",
+]
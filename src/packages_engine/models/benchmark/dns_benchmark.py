@@ -0,0 +1,80 @@
+"""DNS benchmark data models."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .latency_summary import LatencySummary
+
+
+@dataclass
+class DnsQuery:
+    """A name to resolve and the category it is reported under."""
+
+    name: str
+    category: str
+    qtype: int = 1
+
+
+@dataclass
+class DnsBenchmarkPlan:
+    """What to send to the resolver and how hard."""
+
+    server: str
+    queries: list[DnsQuery]
+    port: int = 53
+    rounds: int = 20
+    concurrency: int = 10
+    timeout_seconds: float = 2.0
+    cache_hit_ms: float = 2.0
+
+
+@dataclass
+class DnsCategoryReport:
+    """Results of the queries of one category."""
+
+    category: str
+    sent: int
+    failed: int
+    latency: LatencySummary
+    cache_hits: int
+    errors: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of the sent queries that failed."""
+        return self.failed / self.sent if self.sent else 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of the answered queries that were fast enough to come from the cache."""
+        answered = self.sent - self.failed
+        return self.cache_hits / answered if answered else 0.0
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "category": self.category,
+            "sent": self.sent,
+            "failed": self.failed,
+            "failure_rate": round(self.failure_rate, 4),
+            "cache_hit_ratio": round(self.cache_hit_ratio, 4),
+            "latency": self.latency.as_object(),
+            "errors": dict(self.errors),
+        }
+
+
+@dataclass
+class DnsBenchmarkReport:
+    """Per category results of a DNS benchmark run."""
+
+    server: str
+    cache_hit_threshold_ms: float
+    categories: list[DnsCategoryReport]
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "server": self.server,
+            "cache_hit_threshold_ms": round(self.cache_hit_threshold_ms, 3),
+            "categories": [category.as_object() for category in self.categories],
+        }
@@ -0,0 +1,153 @@
+"""Engine benchmark data models."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class EngineBenchmarkPlan:
+    """Templates, client counts and repeats of an engine benchmark run."""
+
+    data_dir: str
+    client_counts: list[int] = field(default_factory=lambda: [10, 100, 1000, 10000])
+    repeats: int = 3
+
+
+@dataclass
+class EngineBenchmarkCase:
+    """Best time and peak traced memory of one case at one client count."""
+
+    name: str
+    clients: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        """Identifies the case across runs."""
+        return f"{self.name}/{self.clients}"
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "name": self.name,
+            "clients": self.clients,
+            "seconds": self.seconds,
+            "peak_bytes": self.peak_bytes,
+        }
+
+    @classmethod
+    def from_object(cls, obj: Any) -> "EngineBenchmarkCase":
+        """Converts object to the class"""
+        return cls(obj["name"], int(obj["clients"]), float(obj["seconds"]), int(obj["peak_bytes"]))
+
+
+@dataclass
+class EngineBenchmarkReport:
+    """Results of an engine benchmark run."""
+
+    python_version: str
+    repeats: int
+    cases: list[EngineBenchmarkCase] = field(default_factory=list)
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "python_version": self.python_version,
+            "repeats": self.repeats,
+            "cases": [case.as_object() for case in self.cases],
+        }
+
+    @classmethod
+    def from_object(cls, obj: Any) -> "EngineBenchmarkReport":
+        """Converts object to the class"""
+        return cls(
+            obj["python_version"],
+            int(obj["repeats"]),
+            [EngineBenchmarkCase.from_object(case) for case in obj["cases"]],
+        )
+
+
+@dataclass
+class EngineBenchmarkRegression:
+    """A case that got slower or used more memory than the baseline allows."""
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current value relative to the baseline."""
+        return self.current / self.baseline if self.baseline else math.inf
+
+
+def find_regressions(
+    current: EngineBenchmarkReport,
+    baseline: EngineBenchmarkReport,
+    threshold: float,
+    min_seconds: float = 0.001,
+) -> list[EngineBenchmarkRegression]:
+    """
+    Compare a run against a baseline.
+
+    Cases missing from either run are skipped. Times below `min_seconds` in
+    the baseline are too noisy to compare and only their memory is checked.
+
+    Args:
+        current: The run to check.
+        baseline: The run to compare against.
+        threshold: Allowed growth, 0.2 allows 20% more time or memory.
+        min_seconds: Shortest baseline time that is compared.
+
+    Returns:
+        list[EngineBenchmarkRegression]: Cases over the threshold, in run order.
+    """
+    baseline_cases = {case.key: case for case in baseline.cases}
+    regressions = []
+    for case in current.cases:
+        reference = baseline_cases.get(case.key)
+        if reference is None:
+            continue
+        if reference.seconds >= min_seconds and case.seconds > reference.seconds * (1 + threshold):
+            regressions.append(
+                EngineBenchmarkRegression(case.key, "seconds", reference.seconds, case.seconds)
+            )
+        if case.peak_bytes > reference.peak_bytes * (1 + threshold):
+            regressions.append(
+                EngineBenchmarkRegression(
+                    case.key, "peak_bytes", reference.peak_bytes, case.peak_bytes
+                )
+            )
+    return regressions
+
+
+def scaling_exponents(cases: list[EngineBenchmarkCase]) -> dict[str, list[float]]:
+    """
+    Estimate how each case's time grows with the client count.
+
+    Between consecutive client counts the exponent k solves
+    t2 / t1 = (n2 / n1) ** k, so about 1 is linear and about 2 is quadratic.
+
+    Args:
+        cases: Cases of one run.
+
+    Returns:
+        dict[str, list[float]]: Exponents by case name, one per pair of
+        consecutive client counts.
+    """
+    by_name: dict[str, list[EngineBenchmarkCase]] = {}
+    for case in cases:
+        by_name.setdefault(case.name, []).append(case)
+
+    exponents: dict[str, list[float]] = {}
+    for name, named_cases in by_name.items():
+        ordered = sorted(named_cases, key=lambda case: case.clients)
+        exponents[name] = [
+            math.log(larger.seconds / smaller.seconds) / math.log(larger.clients / smaller.clients)
+            for smaller, larger in zip(ordered, ordered[1:])
+            if smaller.seconds > 0 and larger.seconds > 0 and larger.clients > smaller.clients
+        ]
+    return exponents
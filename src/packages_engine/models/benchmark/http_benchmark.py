@@ -0,0 +1,91 @@
+"""HTTP benchmark data models."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .latency_histogram import LatencyHistogram
+from .latency_summary import LatencySummary
+
+
+@dataclass
+class HttpRequestSpec:
+    """A request of the mix and its share of the load."""
+
+    method: str
+    path: str
+    weight: int = 1
+
+
+@dataclass
+class HttpBenchmarkPlan:
+    """Target, request mix and load settings of an HTTP benchmark."""
+
+    host: str
+    port: int
+    requests: list[HttpRequestSpec]
+    use_tls: bool = False
+    ca_file: Optional[str] = None
+    concurrency: int = 10
+    total_requests: int = 1000
+    keep_alive: bool = True
+    timeout_seconds: float = 10.0
+
+
+@dataclass
+class HttpRequestReport:
+    """Results of one request of the mix."""
+
+    method: str
+    path: str
+    requests: int
+    failed: int
+    latency: LatencySummary
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "method": self.method,
+            "path": self.path,
+            "requests": self.requests,
+            "failed": self.failed,
+            "latency": self.latency.as_object(),
+        }
+
+
+@dataclass
+class HttpBenchmarkReport:
+    """Results of an HTTP benchmark run."""
+
+    target: str
+    requests: int
+    failed: int
+    duration_seconds: float
+    bytes_received: int
+    connections_opened: int
+    latency: LatencySummary
+    histogram: LatencyHistogram
+    per_request: list[HttpRequestReport] = field(default_factory=list)
+    status_counts: dict[str, int] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput_rps(self) -> float:
+        """Completed requests per second."""
+        return self.requests / self.duration_seconds if self.duration_seconds else 0.0
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "target": self.target,
+            "requests": self.requests,
+            "failed": self.failed,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "throughput_rps": round(self.throughput_rps, 2),
+            "bytes_received": self.bytes_received,
+            "connections_opened": self.connections_opened,
+            "latency": self.latency.as_object(),
+            "histogram": self.histogram.as_object(),
+            "per_request": [request.as_object() for request in self.per_request],
+            "status_counts": dict(self.status_counts),
+            "errors": dict(self.errors),
+        }
@@ -0,0 +1,81 @@
+"""HDR-style latency histogram data model shared by the benchmark tools."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+# Buckets keep the 5 most significant bits of the microsecond value, so
+# each bucket is at most 1/16 (about 6%) wider than its lower bound.
+SIGNIFICANT_BITS = 5
+
+
+def bucket_lower_us(value_us: int) -> int:
+    """Lower bound of the bucket holding a value.
+
+    Args:
+        value_us: Non-negative value in microseconds.
+
+    Returns:
+        int: Lower bound of the bucket in microseconds.
+    """
+    shift = max(0, value_us.bit_length() - SIGNIFICANT_BITS)
+    return (value_us >> shift) << shift
+
+
+def bucket_upper_us(lower_us: int) -> int:
+    """Exclusive upper bound of the bucket starting at a lower bound.
+
+    Args:
+        lower_us: Lower bound returned by bucket_lower_us.
+
+    Returns:
+        int: Upper bound of the bucket in microseconds.
+    """
+    shift = max(0, lower_us.bit_length() - SIGNIFICANT_BITS)
+    return lower_us + (1 << shift)
+
+
+@dataclass
+class LatencyHistogram:
+    """Log-linear latency histogram keyed by bucket lower bound in microseconds."""
+
+    counts: dict[int, int] = field(default_factory=dict)
+
+    def record(self, latency_ms: float):
+        """Count one latency sample."""
+        lower = bucket_lower_us(max(0, round(latency_ms * 1000)))
+        self.counts[lower] = self.counts.get(lower, 0) + 1
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add the counts of another histogram."""
+        for lower, count in other.counts.items():
+            self.counts[lower] = self.counts.get(lower, 0) + count
+
+    @property
+    def total(self) -> int:
+        """Number of recorded samples."""
+        return sum(self.counts.values())
+
+    def percentile_ms(self, percentile: float) -> float:
+        """Upper bound of the bucket holding a percentile, in milliseconds."""
+        total = self.total
+        if not total:
+            return 0.0
+        target = max(1, math.ceil(percentile / 100 * total))
+        seen = 0
+        for lower in sorted(self.counts):
+            seen += self.counts[lower]
+            if seen >= target:
+                return bucket_upper_us(lower) / 1000
+        return bucket_upper_us(max(self.counts)) / 1000
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return [
+            {
+                "from_ms": lower / 1000,
+                "to_ms": bucket_upper_us(lower) / 1000,
+                "count": self.counts[lower],
+            }
+            for lower in sorted(self.counts)
+        ]
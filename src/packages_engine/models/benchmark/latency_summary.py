@@ -0,0 +1,53 @@
+"""Latency summary data model shared by the benchmark tools."""
+
+import math
+from dataclasses import dataclass
+
+
+def latency_percentile(sorted_samples: list[float], percentile: float) -> float:
+    """Nearest-rank percentile of sorted samples.
+
+    Args:
+        sorted_samples: Samples in ascending order.
+        percentile: Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, 0.0 when there are no samples.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+@dataclass
+class LatencySummary:
+    """Latency percentiles of a set of samples, in milliseconds."""
+
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_samples(cls, samples_ms: list[float]):
+        """Helper method to summarize latency samples."""
+        ordered = sorted(samples_ms)
+        return LatencySummary(
+            count=len(ordered),
+            p50_ms=latency_percentile(ordered, 50),
+            p95_ms=latency_percentile(ordered, 95),
+            p99_ms=latency_percentile(ordered, 99),
+            max_ms=ordered[-1] if ordered else 0.0,
+        )
+
+    def as_object(self) -> dict:
+        """Converts class to object"""
+        return {
+            "count": self.count,
+            "p50_ms": round(self.p50_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
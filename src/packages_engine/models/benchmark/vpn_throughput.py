@@ -0,0 +1,104 @@
+"""VPN throughput benchmark data models."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .latency_summary import LatencySummary
+
+
+@dataclass
+class VpnThroughputPlan:
+    """Target and load settings of a VPN throughput run."""
+
+    host: str
+    port: int = 5201
+    protocol: str = "tcp"
+    streams: int = 4
+    duration_seconds: float = 10.0
+    udp_bitrate_mbps: float = 100.0
+    udp_payload_bytes: int = 1200
+    rtt_samples: int = 20
+    timeout_seconds: float = 5.0
+
+
+@dataclass
+class VpnStreamReport:
+    """Bytes and, for UDP, packet counts the server received on one stream."""
+
+    stream: int
+    bytes_received: int
+    seconds: float
+    packets_sent: int = 0
+    packets_received: int = 0
+    out_of_order: int = 0
+    jitter_ms: float = 0.0
+
+    @property
+    def rate_mbps(self) -> float:
+        """Received rate in megabits per second."""
+        return self.bytes_received * 8 / self.seconds / 1_000_000 if self.seconds else 0.0
+
+    @property
+    def packets_lost(self) -> int:
+        """UDP packets that never arrived."""
+        return max(0, self.packets_sent - self.packets_received)
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "stream": self.stream,
+            "bytes_received": self.bytes_received,
+            "seconds": round(self.seconds, 3),
+            "rate_mbps": round(self.rate_mbps, 2),
+            "packets_sent": self.packets_sent,
+            "packets_received": self.packets_received,
+            "packets_lost": self.packets_lost,
+            "out_of_order": self.out_of_order,
+            "jitter_ms": round(self.jitter_ms, 3),
+        }
+
+
+@dataclass
+class VpnThroughputReport:
+    """Results of a VPN throughput run."""
+
+    target: str
+    protocol: str
+    streams: list[VpnStreamReport]
+    idle_rtt: LatencySummary
+    loaded_rtt: LatencySummary
+    peer: str = ""
+    rtt_errors: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def aggregate_mbps(self) -> float:
+        """Combined received rate of all streams in megabits per second."""
+        seconds = max((stream.seconds for stream in self.streams), default=0.0)
+        total = sum(stream.bytes_received for stream in self.streams)
+        return total * 8 / seconds / 1_000_000 if seconds else 0.0
+
+    @property
+    def loss_ratio(self) -> float:
+        """Share of UDP packets lost across all streams."""
+        sent = sum(stream.packets_sent for stream in self.streams)
+        return sum(stream.packets_lost for stream in self.streams) / sent if sent else 0.0
+
+    @property
+    def jitter_ms(self) -> float:
+        """Highest jitter of any UDP stream."""
+        return max((stream.jitter_ms for stream in self.streams), default=0.0)
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "target": self.target,
+            "protocol": self.protocol,
+            "peer": self.peer,
+            "aggregate_mbps": round(self.aggregate_mbps, 2),
+            "loss_ratio": round(self.loss_ratio, 5),
+            "jitter_ms": round(self.jitter_ms, 3),
+            "idle_rtt": self.idle_rtt.as_object(),
+            "loaded_rtt": self.loaded_rtt.as_object(),
+            "rtt_errors": dict(self.rtt_errors),
+            "streams": [stream.as_object() for stream in self.streams],
+        }
@@ -0,0 +1,19 @@
+from .config_bundle import (
+    ARTIFACT_PATHS,
+    DEFAULT_MODE,
+    DEFAULT_OWNER,
+    EXCLUDED_PATHS,
+    MAX_MODE,
+    BundleArtifact,
+    is_artifact_path,
+)
+
+__all__ = [
+    "ARTIFACT_PATHS",
+    "DEFAULT_MODE",
+    "DEFAULT_OWNER",
+    "EXCLUDED_PATHS",
+    "MAX_MODE",
+    "BundleArtifact",
+    "is_artifact_path",
+]
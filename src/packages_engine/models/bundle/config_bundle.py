@@ -0,0 +1,88 @@
+"""Configuration bundle data models."""
+
+import hashlib
+import posixpath
+import re
+from dataclasses import dataclass
+from typing import Any
+
+# Rendered configuration that compiles into a bundle, most specific paths first
+ARTIFACT_PATHS: tuple[str, ...] = (
+    "/etc/nginx/",
+    "/etc/dnsmasq.d/",
+    "/etc/dnsmasq.hosts.d/",
+    "/etc/nftables.conf",
+    "/etc/nftables.d/",
+    "/etc/systemd/system/",
+    "/etc/systemd/resolved.conf.d/",
+    "/srv/stack/",
+    "/srv/caches/",
+    "/srv/postgres/conf/",
+)
+# Secrets generated on the server never leave it. Gitea writes its internal
+# token, JWT and LFS secrets into app.ini, so a rendered copy would wipe them.
+EXCLUDED_PATHS: tuple[str, ...] = ("/etc/nginx/tls/", "/srv/gitea/config/")
+DEFAULT_MODE = 0o644
+DEFAULT_OWNER = "root:root"
+MAX_MODE = 0o7777
+# `user:group`, each a system name or a numeric id
+OWNER_PATTERN = re.compile(r"(?:[a-z_][a-z0-9_-]*|\d+):(?:[a-z_][a-z0-9_-]*|\d+)")
+
+
+def is_artifact_path(path: str) -> bool:
+    """
+    Check if a file belongs in a configuration bundle.
+
+    Args:
+        path: Absolute path of the file.
+
+    Returns:
+        bool: True for rendered configuration, False for anything else.
+    """
+    # `/etc/nginx/../../root/.ssh/authorized_keys` starts with an artifact path too
+    if not path.startswith("/") or posixpath.normpath(path) != path:
+        return False
+    if any(path.startswith(prefix) for prefix in EXCLUDED_PATHS):
+        return False
+    return any(path.startswith(prefix) for prefix in ARTIFACT_PATHS)
+
+
+@dataclass
+class BundleArtifact:
+    """
+    One rendered file of a configuration bundle.
+
+    Attributes:
+        path: Absolute target path on the server.
+        content: Rendered content.
+        mode: Target mode.
+        owner: Target owner as `user:group`.
+    """
+
+    path: str
+    content: str
+    mode: int = DEFAULT_MODE
+    owner: str = DEFAULT_OWNER
+
+    @property
+    def sha256(self) -> str:
+        """Hex digest of the content."""
+        return hashlib.sha256(self.content.encode("utf-8")).hexdigest()
+
+    def has_valid_permissions(self) -> bool:
+        """Check that the mode fits chmod and the owner is `user:group`."""
+        return 0 <= self.mode <= MAX_MODE and OWNER_PATTERN.fullmatch(self.owner) is not None
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            "path": self.path,
+            "mode": f"{self.mode:04o}",
+            "owner": self.owner,
+            "sha256": self.sha256,
+        }
+
+    @classmethod
+    def from_object(cls, obj: Any, content: str) -> "BundleArtifact":
+        """Converts object to the class"""
+        return cls(obj["path"], content, int(obj["mode"], 8), obj["owner"])
@@ -23,6 +23,15 @@ class ConfigurationData:
     num_wireguard_clients: int
     wireguard_client_names: list[str]
     clients_data_dir: str
+    package_cache_mode: str
+    package_cache_host: str
+    pgbouncer_enabled: bool
+    gitea_redis_enabled: bool
+    certificate_profile: str
+    certificate_renew_days: int
+    tcp_forwarding_mode: str
+    flowtable_enabled: bool
+    mtu_probe_address: str
 
     @classmethod
     def default(cls):
@@ -43,6 +52,15 @@ class ConfigurationData:
             num_wireguard_clients=0,
             wireguard_client_names=[],
             clients_data_dir="",
+            package_cache_mode="off",
+            package_cache_host="",
+            pgbouncer_enabled=False,
+            gitea_redis_enabled=False,
+            certificate_profile="rsa",
+            certificate_renew_days=30,
+            tcp_forwarding_mode="proxy",
+            flowtable_enabled=False,
+            mtu_probe_address="",
         )
 
     def as_object(self) -> Any:
@@ -63,6 +81,15 @@ class ConfigurationData:
             "num_wireguard_clients": self.num_wireguard_clients,
             "wireguard_client_names": self.wireguard_client_names,
             "clients_data_dir": self.clients_data_dir,
+            "package_cache_mode": self.package_cache_mode,
+            "package_cache_host": self.package_cache_host,
+            "pgbouncer_enabled": self.pgbouncer_enabled,
+            "gitea_redis_enabled": self.gitea_redis_enabled,
+            "certificate_profile": self.certificate_profile,
+            "certificate_renew_days": self.certificate_renew_days,
+            "tcp_forwarding_mode": self.tcp_forwarding_mode,
+            "flowtable_enabled": self.flowtable_enabled,
+            "mtu_probe_address": self.mtu_probe_address,
         }
 
     @classmethod
@@ -84,4 +111,13 @@ class ConfigurationData:
         data.num_wireguard_clients = obj["num_wireguard_clients"]
         data.wireguard_client_names = obj["wireguard_client_names"]
         data.clients_data_dir = obj["clients_data_dir"]
+        data.package_cache_mode = obj["package_cache_mode"]
+        data.package_cache_host = obj["package_cache_host"]
+        data.pgbouncer_enabled = obj["pgbouncer_enabled"]
+        data.gitea_redis_enabled = obj["gitea_redis_enabled"]
+        data.certificate_profile = obj["certificate_profile"]
+        data.certificate_renew_days = obj["certificate_renew_days"]
+        data.tcp_forwarding_mode = obj["tcp_forwarding_mode"]
+        data.flowtable_enabled = obj["flowtable_enabled"]
+        data.mtu_probe_address = obj["mtu_probe_address"]
         return data
@@ -0,0 +1,3 @@
+from .configuration_plan import RELOAD_COMMANDS, RELOAD_RULES, ConfigurationPlan, FileChange
+
+__all__ = ["RELOAD_COMMANDS", "RELOAD_RULES", "ConfigurationPlan", "FileChange"]
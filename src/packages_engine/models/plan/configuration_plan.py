@@ -0,0 +1,174 @@
+"""Configuration plan data models."""
+
+import difflib
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+# What has to be reloaded when a file under the path changes, most specific paths first.
+# /etc/dnsmasq.hosts.d/ is missing on purpose: dnsmasq rereads it through inotify (hostsdir),
+# and a restart would only flush its cache.
+RELOAD_RULES: list[tuple[str, str]] = [
+    ("/etc/nginx/", "nginx"),
+    ("/etc/dnsmasq.d/", "dnsmasq"),
+    ("/etc/wireguard/wg0.conf", "wg-quick@wg0"),
+    ("/etc/nftables.conf", "nftables"),
+    ("/etc/nftables.d/", "nftables"),
+    ("/etc/systemd/resolved.conf.d/", "systemd-resolved"),
+    ("/etc/systemd/system/", "daemon-reload"),
+    ("/etc/docker/daemon.json", "docker"),
+    ("/etc/sysctl.d/", "systemd-sysctl"),
+    ("/etc/modules-load.d/", "systemd-modules-load"),
+    ("/srv/stack/", "compose:/srv/stack"),
+    ("/srv/caches/", "compose:/srv/caches"),
+    ("/srv/gitea/config/", "gitea"),
+    ("/srv/postgres/conf/", "postgres"),
+]
+# Least disruptive command that makes each reload take effect
+RELOAD_COMMANDS: dict[str, str] = {
+    "daemon-reload": "sudo systemctl daemon-reload",
+    "nginx": "sudo nginx -t -q && sudo systemctl reload nginx",
+    "dnsmasq": "sudo systemctl reload-or-restart dnsmasq",
+    "wg-quick@wg0": (
+        "sudo bash -lc 'wg-quick strip wg0 > /run/wg0.conf && wg syncconf wg0 /run/wg0.conf'"
+    ),
+    "nftables": "sudo nft -f /etc/nftables.conf",
+    "systemd-resolved": "sudo systemctl reload-or-restart systemd-resolved",
+    "docker": "sudo systemctl restart docker",
+    "systemd-sysctl": "sudo sysctl --system",
+    "systemd-modules-load": "sudo systemctl restart systemd-modules-load",
+    "compose:/srv/stack": "cd /srv/stack && sudo docker compose up -d --remove-orphans",
+    "compose:/srv/caches": "cd /srv/caches && sudo docker compose up -d --remove-orphans",
+    "gitea": "sudo docker restart gitea",
+    "postgres": "sudo docker restart postgres",
+}
+SYSTEMD_UNIT_DIR = "/etc/systemd/system/"
+# Unit files whose units are restarted, when enabled, after daemon-reload
+RESTARTED_UNIT_TYPES = (".service", ".timer", ".socket")
+_RESTART = re.compile(r"systemctl\s+(?:restart|reload|reload-or-restart|try-restart)\s+([\w@.-]+)")
+
+
+@dataclass
+class FileChange:
+    """
+    One file a configuration run would create, change or remove.
+
+    Attributes:
+        path: Absolute path of the file.
+        before: Current content, None when the file does not exist yet.
+        after: Planned content, None when the file would be removed.
+        mode: Planned mode, None when the run does not set one.
+    """
+
+    path: str
+    before: Optional[str]
+    after: Optional[str]
+    mode: Optional[int] = None
+
+    def diff(self) -> str:
+        """
+        Show the change as a unified diff.
+
+        Returns:
+            str: The diff, `/dev/null` stands for a missing side.
+        """
+        before_lines = (self.before or "").splitlines(keepends=True)
+        after_lines = (self.after or "").splitlines(keepends=True)
+        lines = difflib.unified_diff(
+            before_lines,
+            after_lines,
+            fromfile="/dev/null" if self.before is None else f"a{self.path}",
+            tofile="/dev/null" if self.after is None else f"b{self.path}",
+        )
+        return "".join(line if line.endswith("\n") else line + "\n" for line in lines)
+
+
+@dataclass
+class ConfigurationPlan:
+    """
+    Files and commands a configuration run would change and run.
+
+    Attributes:
+        changes: Changed files, by path.
+        commands: Commands in the order they would run.
+    """
+
+    changes: list[FileChange] = field(default_factory=list)
+    commands: list[str] = field(default_factory=list)
+
+    def reloads(self) -> list[str]:
+        """
+        Find what the changed files require to be reloaded.
+
+        Changed unit files and drop-ins also require their unit to be restarted,
+        so a changed oneshot service runs again and a changed timer is rescheduled.
+
+        Returns:
+            list[str]: Units, `daemon-reload` and `compose:<directory>` stacks, in rule order,
+            then the units of changed unit files.
+        """
+        reloads = []
+        for prefix, unit in RELOAD_RULES:
+            needed = any(change.path.startswith(prefix) for change in self.changes)
+            if needed and unit not in reloads:
+                reloads.append(unit)
+        for change in self.changes:
+            unit = _unit_of(change.path)
+            if unit is not None and unit not in reloads:
+                reloads.append(unit)
+        return reloads
+
+    def reload_commands(self) -> list[str]:
+        """
+        Build the commands that perform the reloads, unit files first.
+
+        Units of changed unit files without a command of their own are restarted
+        only when they are enabled, so disabled units are not started.
+
+        Returns:
+            list[str]: Commands in the order they have to run.
+        """
+        reloads = self.reloads()
+        if "daemon-reload" in reloads:
+            reloads.remove("daemon-reload")
+            reloads.insert(0, "daemon-reload")
+        return [
+            RELOAD_COMMANDS.get(
+                unit,
+                f"! sudo systemctl is-enabled --quiet {unit} || sudo systemctl restart {unit}",
+            )
+            for unit in reloads
+        ]
+
+    def redundant_restarts(self) -> list[str]:
+        """
+        Find units the commands restart or reload though none of their files changed.
+
+        Returns:
+            list[str]: Units in the order of their first restart.
+        """
+        reloads = self.reloads()
+        redundant = []
+        for command in self.commands:
+            for unit in _RESTART.findall(command):
+                unit = unit.removesuffix(".service")
+                if unit not in reloads and unit not in redundant:
+                    redundant.append(unit)
+        return redundant
+
+
+def _unit_of(path: str) -> Optional[str]:
+    # /etc/systemd/system/<unit> and drop-ins /etc/systemd/system/<unit>.d/<name>.conf
+    if not path.startswith(SYSTEMD_UNIT_DIR):
+        return None
+    name = path[len(SYSTEMD_UNIT_DIR) :].split("/")
+    if len(name) == 1:
+        unit = name[0]
+    elif len(name) == 2 and name[0].endswith(".d"):
+        unit = name[0].removesuffix(".d")
+    else:
+        return None
+    if not unit.endswith(RESTARTED_UNIT_TYPES):
+        return None
+    # Services are named without the suffix, like the units of RELOAD_RULES
+    return unit.removesuffix(".service")
@@ -0,0 +1,6 @@
+"""Necessary imports for export."""
+
+from .config_bundle_service import ConfigBundleService
+from .config_bundle_service_contract import ConfigBundleServiceContract
+
+__all__ = ["ConfigBundleService", "ConfigBundleServiceContract"]
@@ -0,0 +1,242 @@
+"""Config Bundle Service - compiles rendered configuration into signed bundles and applies them."""
+
+import hashlib
+import hmac
+import io
+import json
+import os
+import posixpath
+import shlex
+import tarfile
+from pathlib import Path
+from typing import Optional
+
+from packages_engine.models import OperationResult
+from packages_engine.models.bundle import BundleArtifact, is_artifact_path
+from packages_engine.models.plan import ConfigurationPlan, FileChange
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.system_management import SystemManagementServiceContract
+
+from .config_bundle_service_contract import ConfigBundleServiceContract
+
+MANIFEST_NAME = "manifest.json"
+SIGNATURE_NAME = "manifest.sig"
+FILES_DIR = "files"
+MANIFEST_VERSION = 1
+
+
+class ConfigBundleService(ConfigBundleServiceContract):
+    """
+    Configuration bundle implementation.
+
+    Bundles and keys are local files of the machine the tool runs on, so a
+    bundle can be compiled on one machine and applied on another. Applying
+    goes through the file system and system management services of the
+    server.
+
+    Attributes:
+        file_system: Files of the server the bundles are applied to.
+        system_management: Runs the permission and reload commands.
+    """
+
+    def __init__(
+        self,
+        file_system: FileSystemServiceContract,
+        system_management: SystemManagementServiceContract,
+    ):
+        self.file_system = file_system
+        self.system_management = system_management
+
+    def write(
+        self, bundle_path: str, key_path: str, artifacts: list[BundleArtifact]
+    ) -> OperationResult[bool]:
+        key = _read_key(key_path)
+        if key is None:
+            return OperationResult[bool].fail(f"Bundle key {key_path} could not be read")
+
+        manifest = json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "artifacts": [artifact.as_object() for artifact in artifacts],
+            },
+            indent=2,
+        ).encode("utf-8")
+        try:
+            # Bundles hold database passwords and secret keys, so the file is private from the
+            # start instead of being created with the umask and restricted afterwards
+            if os.path.lexists(bundle_path):
+                os.unlink(bundle_path)
+            descriptor = os.open(bundle_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            with os.fdopen(descriptor, "wb") as file:
+                with tarfile.open(fileobj=file, mode="w:gz") as archive:
+                    _add_member(archive, MANIFEST_NAME, manifest)
+                    _add_member(archive, SIGNATURE_NAME, _sign(key, manifest).encode("ascii"))
+                    for artifact in artifacts:
+                        content = artifact.content.encode("utf-8")
+                        _add_member(archive, FILES_DIR + artifact.path, content)
+        except OSError as error:
+            return OperationResult[bool].fail(f"Writing bundle {bundle_path} failed: {error}")
+        return OperationResult[bool].succeed(True)
+
+    def read(self, bundle_path: str, key_path: str) -> OperationResult[list[BundleArtifact]]:
+        key = _read_key(key_path)
+        if key is None:
+            return OperationResult[list[BundleArtifact]].fail(
+                f"Bundle key {key_path} could not be read"
+            )
+
+        try:
+            with tarfile.open(bundle_path, "r:gz") as archive:
+                manifest = _read_member(archive, MANIFEST_NAME)
+                signature = _read_member(archive, SIGNATURE_NAME).decode("ascii")
+                if not hmac.compare_digest(signature, _sign(key, manifest)):
+                    return OperationResult[list[BundleArtifact]].fail(
+                        f"Bundle {bundle_path} is not signed with the key {key_path}"
+                    )
+                artifacts = []
+                for artifact_object in json.loads(manifest)["artifacts"]:
+                    if not is_artifact_path(artifact_object["path"]):
+                        return OperationResult[list[BundleArtifact]].fail(
+                            f"Bundle {bundle_path} has a file outside the configuration "
+                            f"paths {artifact_object['path']}"
+                        )
+                    content = _read_member(archive, FILES_DIR + artifact_object["path"])
+                    artifact = BundleArtifact.from_object(artifact_object, content.decode("utf-8"))
+                    if artifact.sha256 != artifact_object["sha256"]:
+                        return OperationResult[list[BundleArtifact]].fail(
+                            f"Bundle {bundle_path} has a corrupted file {artifact.path}"
+                        )
+                    if not artifact.has_valid_permissions():
+                        return OperationResult[list[BundleArtifact]].fail(
+                            f"Bundle {bundle_path} has an invalid mode or owner for {artifact.path}"
+                        )
+                    artifacts.append(artifact)
+        except (OSError, tarfile.TarError, KeyError, TypeError, ValueError) as error:
+            return OperationResult[list[BundleArtifact]].fail(
+                f"Reading bundle {bundle_path} failed: {error}"
+            )
+        return OperationResult[list[BundleArtifact]].succeed(artifacts)
+
+    def apply(self, artifacts: list[BundleArtifact]) -> OperationResult[ConfigurationPlan]:
+        plan = ConfigurationPlan()
+        staged = []
+        for artifact in artifacts:
+            before = self._current_text(artifact.path)
+            if before != artifact.content:
+                change = FileChange(artifact.path, before, artifact.content, artifact.mode)
+                plan.changes.append(change)
+                staged.append(artifact)
+        if not staged:
+            return OperationResult[ConfigurationPlan].succeed(plan)
+
+        # Nothing is installed until every file is staged with its final mode and owner
+        stage_result = self._stage(plan, staged)
+        if not stage_result.success:
+            self._run(plan, _remove_command([_new_path(artifact.path) for artifact in staged]))
+            return stage_result.as_fail()
+
+        installed: list[FileChange] = []
+        for change in plan.changes:
+            path = shlex.quote(change.path)
+            install = f"sudo mv -f {shlex.quote(_new_path(change.path))} {path}"
+            if change.before is not None:
+                install = f"sudo cp -a {path} {shlex.quote(_old_path(change.path))} && {install}"
+            install_result = self._run(plan, install)
+            if not install_result.success:
+                self._roll_back(plan, installed)
+                leftovers = [_new_path(item.path) for item in plan.changes]
+                leftovers.extend(_old_path(item.path) for item in plan.changes)
+                self._run(plan, _remove_command(leftovers))
+                return install_result.as_fail()
+            installed.append(change)
+        backups = [_old_path(change.path) for change in installed if change.before is not None]
+        if backups:
+            self._run(plan, _remove_command(backups))
+
+        for command in plan.reload_commands():
+            execute_result = self._run(plan, command)
+            if not execute_result.success:
+                return execute_result.as_fail()
+        return OperationResult[ConfigurationPlan].succeed(plan)
+
+    def _stage(
+        self, plan: ConfigurationPlan, artifacts: list[BundleArtifact]
+    ) -> OperationResult[bool]:
+        create = []
+        for artifact in artifacts:
+            user, group = artifact.owner.split(":")
+            create.append(
+                f"sudo install -D -m {artifact.mode:04o} -o {shlex.quote(user)} "
+                f"-g {shlex.quote(group)} /dev/null {shlex.quote(_new_path(artifact.path))}"
+            )
+        create_result = self._run(plan, " && ".join(create))
+        if not create_result.success:
+            return create_result
+        for artifact in artifacts:
+            write_result = self.file_system.write_text(_new_path(artifact.path), artifact.content)
+            if not write_result.success:
+                return write_result
+        return OperationResult[bool].succeed(True)
+
+    def _roll_back(self, plan: ConfigurationPlan, installed: list[FileChange]):
+        restore = [
+            (
+                f"sudo mv -f {shlex.quote(_old_path(change.path))} {shlex.quote(change.path)}"
+                if change.before is not None
+                else f"sudo rm -f {shlex.quote(change.path)}"
+            )
+            for change in reversed(installed)
+        ]
+        if restore:
+            self._run(plan, "; ".join(restore))
+
+    def _run(self, plan: ConfigurationPlan, command: str) -> OperationResult[bool]:
+        plan.commands.append(command)
+        return self.system_management.execute_raw_command(command)
+
+    def _current_text(self, path: str) -> Optional[str]:
+        if not self.file_system.path_exists(path):
+            return None
+        read_result = self.file_system.read_text(path)
+        return read_result.data if read_result.success else None
+
+
+def _new_path(path: str) -> str:
+    # Hidden names stay out of the globs and conf-dirs that load the real files
+    directory, name = posixpath.split(path)
+    return posixpath.join(directory, f".{name}.bundle-new")
+
+
+def _old_path(path: str) -> str:
+    directory, name = posixpath.split(path)
+    return posixpath.join(directory, f".{name}.bundle-old")
+
+
+def _remove_command(paths: list[str]) -> str:
+    return "sudo rm -f " + " ".join(shlex.quote(path) for path in paths)
+
+
+def _read_key(key_path: str) -> Optional[bytes]:
+    try:
+        key = Path(key_path).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return key.encode("utf-8") if key else None
+
+
+def _sign(key: bytes, manifest: bytes) -> str:
+    return hmac.new(key, manifest, hashlib.sha256).hexdigest()
+
+
+def _add_member(archive: tarfile.TarFile, name: str, data: bytes):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o600
+    archive.addfile(info, io.BytesIO(data))
+
+
+def _read_member(archive: tarfile.TarFile, name: str) -> bytes:
+    member = archive.extractfile(name)
+    if member is None:
+        raise KeyError(name)
+    return member.read()
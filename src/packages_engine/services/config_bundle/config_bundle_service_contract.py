@@ -0,0 +1,65 @@
+"""Config Bundle Service Contract - defines interface for compiled configuration bundles."""
+
+from abc import ABC, abstractmethod
+
+from packages_engine.models import OperationResult
+from packages_engine.models.bundle import BundleArtifact
+from packages_engine.models.plan import ConfigurationPlan
+
+
+class ConfigBundleServiceContract(ABC):
+    """
+    Abstract base class defining the contract for configuration bundles.
+
+    A bundle is a gzipped tar archive with the rendered files, a manifest
+    of their target paths, modes, owners and SHA-256 hashes, and an
+    HMAC-SHA256 signature of the manifest made with a shared key.
+    """
+
+    @abstractmethod
+    def write(
+        self, bundle_path: str, key_path: str, artifacts: list[BundleArtifact]
+    ) -> OperationResult[bool]:
+        """
+        Write artifacts into a signed bundle.
+
+        Args:
+            bundle_path: Local path of the bundle to create.
+            key_path: Local path of the signing key.
+            artifacts: Rendered files to put into the bundle.
+
+        Returns:
+            OperationResult[bool]: Success if the bundle was written, failure otherwise.
+        """
+
+    @abstractmethod
+    def read(self, bundle_path: str, key_path: str) -> OperationResult[list[BundleArtifact]]:
+        """
+        Read the artifacts of a bundle after checking its signature and hashes.
+
+        Args:
+            bundle_path: Local path of the bundle.
+            key_path: Local path of the signing key.
+
+        Returns:
+            OperationResult[list[BundleArtifact]]: The artifacts, or failure if the
+            bundle cannot be read, is not signed with the key or was altered.
+        """
+
+    @abstractmethod
+    def apply(self, artifacts: list[BundleArtifact]) -> OperationResult[ConfigurationPlan]:
+        """
+        Install the artifacts that differ from the server and reload what they affect.
+
+        Every file is first staged next to its target with its final mode and
+        owner and then renamed over it, so no file is ever half written or
+        readable with the wrong mode. When an install fails, the files
+        already installed are restored.
+
+        Args:
+            artifacts: Artifacts of a verified bundle.
+
+        Returns:
+            OperationResult[ConfigurationPlan]: Installed files and the commands run,
+            or failure if a file or command fails.
+        """
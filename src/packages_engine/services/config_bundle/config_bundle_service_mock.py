@@ -0,0 +1,66 @@
+"""Mock Config Bundle Service - test double for compiled configuration bundles."""
+
+from dataclasses import dataclass
+
+from packages_engine.models import OperationResult
+from packages_engine.models.bundle import BundleArtifact
+from packages_engine.models.plan import ConfigurationPlan
+
+from .config_bundle_service_contract import ConfigBundleServiceContract
+
+
+@dataclass
+class WriteParams:
+    """Arguments of one write call."""
+
+    bundle_path: str
+    key_path: str
+    artifacts: list[BundleArtifact]
+
+
+@dataclass
+class ReadParams:
+    """Arguments of one read call."""
+
+    bundle_path: str
+    key_path: str
+
+
+class MockConfigBundleService(ConfigBundleServiceContract):
+    """
+    Mock implementation of ConfigBundleService for testing purposes.
+
+    Attributes:
+        write_params: Arguments passed to write.
+        write_result: Result returned by write.
+        read_params: Arguments passed to read.
+        read_result: Result returned by read.
+        apply_params: Artifacts passed to apply.
+        apply_result: Result returned by apply.
+    """
+
+    def __init__(self):
+        """Initialize the mock with successful empty results."""
+        self.write_params: list[WriteParams] = []
+        self.write_result = OperationResult[bool].succeed(True)
+        self.read_params: list[ReadParams] = []
+        self.read_result = OperationResult[list[BundleArtifact]].succeed([])
+        self.apply_params: list[list[BundleArtifact]] = []
+        self.apply_result = OperationResult[ConfigurationPlan].succeed(ConfigurationPlan())
+
+    def write(
+        self, bundle_path: str, key_path: str, artifacts: list[BundleArtifact]
+    ) -> OperationResult[bool]:
+        """Record the arguments and return the configured result."""
+        self.write_params.append(WriteParams(bundle_path, key_path, artifacts))
+        return self.write_result
+
+    def read(self, bundle_path: str, key_path: str) -> OperationResult[list[BundleArtifact]]:
+        """Record the arguments and return the configured result."""
+        self.read_params.append(ReadParams(bundle_path, key_path))
+        return self.read_result
+
+    def apply(self, artifacts: list[BundleArtifact]) -> OperationResult[ConfigurationPlan]:
+        """Record the artifacts and return the configured result."""
+        self.apply_params.append(artifacts)
+        return self.apply_result
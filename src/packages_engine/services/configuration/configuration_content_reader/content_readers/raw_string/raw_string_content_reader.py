@@ -61,5 +61,10 @@ class RawStringContentReader(ContentReader):
         result = result.replace("{{GITEA_DB_PASSWORD}}", config.gitea_db_password)
         result = result.replace("{{PG_ADMIN_EMAIL}}", config.pg_admin_email)
         result = result.replace("{{PG_ADMIN_PASSWORD}}", config.pg_admin_password)
+        result = result.replace("{{PACKAGE_CACHE_HOST}}", config.package_cache_host)
+        result = result.replace(
+            "{{GITEA_DB_HOST}}",
+            "pgbouncer:6432" if config.pgbouncer_enabled else "postgres:5432",
+        )
 
         return OperationResult[str].succeed(result)
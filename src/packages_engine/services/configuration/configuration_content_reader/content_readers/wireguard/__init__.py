@@ -1,6 +1,21 @@
 """Necessary imports for export."""
 
+from .wireguard_mtu import (
+    DEFAULT_WIREGUARD_MTU,
+    SERVER_MTU_PATH,
+    client_mtu_path,
+    parse_mtu,
+    read_mtu,
+)
 from .wireguard_server_config_content_reader import WireguardServerConfigContentReader
 from .wireguard_shared_config_content_reader import WireguardSharedConfigContentReader
 
-__all__ = ["WireguardServerConfigContentReader", "WireguardSharedConfigContentReader"]
+__all__ = [
+    "DEFAULT_WIREGUARD_MTU",
+    "SERVER_MTU_PATH",
+    "client_mtu_path",
+    "parse_mtu",
+    "read_mtu",
+    "WireguardServerConfigContentReader",
+    "WireguardSharedConfigContentReader",
+]
@@ -0,0 +1,58 @@
+"""WireGuard MTU files shared by the MTU discovery task and the config readers."""
+
+from packages_engine.services.file_system import FileSystemServiceContract
+
+SERVER_MTU_PATH = "/etc/wireguard/server.mtu"
+# wg-quick's own guess, used until the path has been probed
+DEFAULT_WIREGUARD_MTU = 1420
+MIN_WIREGUARD_MTU = 576
+MAX_WIREGUARD_MTU = 9000
+
+
+def client_mtu_path(client_name: str) -> str:
+    """
+    Get the path of a client's MTU override.
+
+    Args:
+        client_name: WireGuard client name.
+
+    Returns:
+        str: Path of the override file next to the client's keys.
+    """
+    return f"/etc/wireguard/clients/{client_name}.mtu"
+
+
+def parse_mtu(text: str) -> int | None:
+    """
+    Parse the content of an MTU file.
+
+    Args:
+        text: File content.
+
+    Returns:
+        int | None: The MTU, or None if the content is not a usable MTU.
+    """
+    value = text.strip()
+    if not value.isdigit():
+        return None
+    mtu = int(value)
+    if mtu < MIN_WIREGUARD_MTU or mtu > MAX_WIREGUARD_MTU:
+        return None
+    return mtu
+
+
+def read_mtu(file_system: FileSystemServiceContract, path: str) -> int | None:
+    """
+    Read an MTU file.
+
+    Args:
+        file_system: Service used to read the file.
+        path: Location of the MTU file.
+
+    Returns:
+        int | None: The MTU, or None if the file is missing or not a usable MTU.
+    """
+    read_result = file_system.read_text(path)
+    if not read_result.success or read_result.data is None:
+        return None
+    return parse_mtu(read_result.data)
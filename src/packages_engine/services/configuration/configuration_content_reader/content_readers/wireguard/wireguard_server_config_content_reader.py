@@ -9,6 +9,8 @@ from packages_engine.services.configuration.configuration_content_reader.content
 )
 from packages_engine.services.file_system import FileSystemServiceContract
 
+from .wireguard_mtu import DEFAULT_WIREGUARD_MTU, SERVER_MTU_PATH, read_mtu
+
 
 class WireguardServerConfigContentReader(ContentReader):
     """
@@ -16,7 +18,8 @@ class WireguardServerConfigContentReader(ContentReader):
 
     Reads the server's private key, server configuration template, and client configuration
     template, then generates a complete WireGuard server configuration including all
-    configured client peers.
+    configured client peers. The interface MTU comes from the discovered server MTU
+    and falls back to wg-quick's default when it has not been probed.
 
     Attributes:
         file_system: Service for file system operations.
@@ -59,6 +62,8 @@ class WireguardServerConfigContentReader(ContentReader):
         server_config_tpl = server_config_tpl_result.data
 
         server_config = server_config_tpl.replace("{{SERVER_KEY}}", server_key)
+        server_mtu = read_mtu(self.file_system, SERVER_MTU_PATH) or DEFAULT_WIREGUARD_MTU
+        server_config = server_config.replace("{{WIREGUARD_MTU}}", str(server_mtu))
 
         client_config_tpl_result = self.file_system.read_text(
             f"/usr/local/share/{config.server_data_dir}/data/wireguard/wg0.client.conf"
@@ -9,6 +9,8 @@ from packages_engine.services.configuration.configuration_content_reader.content
 )
 from packages_engine.services.file_system import FileSystemServiceContract
 
+from .wireguard_mtu import DEFAULT_WIREGUARD_MTU, SERVER_MTU_PATH, client_mtu_path, read_mtu
+
 
 class WireguardSharedConfigContentReader(ContentReader):
     """
@@ -16,7 +18,8 @@ class WireguardSharedConfigContentReader(ContentReader):
 
     Reads the server's public key and shared configuration template, then generates
     individual client configurations for all configured clients. Each configuration
-    includes the client's private key and connection details for the server.
+    includes the client's private key and connection details for the server. The
+    MTU is the client's override if one is set, otherwise the discovered server MTU.
 
     Attributes:
         file_system: Service for file system operations.
@@ -58,6 +61,8 @@ class WireguardSharedConfigContentReader(ContentReader):
             return shared_config_tpl_result.as_fail()
         shared_config_tpl = shared_config_tpl_result.data
 
+        server_mtu = read_mtu(self.file_system, SERVER_MTU_PATH) or DEFAULT_WIREGUARD_MTU
+
         shared_configs = ""
         for client_name in config.wireguard_client_names:
             client_endpoint_result = self.file_system.read_text(
@@ -74,12 +79,14 @@ class WireguardSharedConfigContentReader(ContentReader):
 
             client_endpoint = client_endpoint_result.data
             client_private_key = client_private_key_result.data
+            client_mtu = read_mtu(self.file_system, client_mtu_path(client_name)) or server_mtu
 
             shared_config = shared_config_tpl.replace("{{CLIENT_NAME}}", client_name)
             shared_config = shared_config.replace("{{CLIENT_PRIVATE_KEY}}", client_private_key)
             shared_config = shared_config.replace("{{CLIENT_IP_ADDRESS}}", client_endpoint)
             shared_config = shared_config.replace("{{SERVER_PUBLIC_KEY}}", server_public_key)
             shared_config = shared_config.replace("{{REMOTE_IP_ADDRESS}}", config.remote_ip_address)
+            shared_config = shared_config.replace("{{WIREGUARD_MTU}}", str(client_mtu))
             shared_configs = shared_configs + "\n\n\n\n" + shared_config
 
         return OperationResult[str].succeed(shared_configs.strip())
@@ -58,6 +58,51 @@ class ConfigurationDataReaderService(ConfigurationDataReaderServiceContract):
             "Mounted directory for the Clients Configuration"
         )
 
+        data.package_cache_mode = self.input_collection.read_str(
+            "Package caches mode (off, server, client)", "off"
+        ).strip()
+        if data.package_cache_mode == "server":
+            data.package_cache_host = "127.0.0.1"
+        elif data.package_cache_mode == "client":
+            data.package_cache_host = self.input_collection.read_str("Package caches host address")
+        else:
+            data.package_cache_mode = "off"
+            data.package_cache_host = ""
+
+        pgbouncer_option = self.input_collection.read_str(
+            "Type 'y' to pool Gitea database connections through PgBouncer.", "y"
+        ).strip()
+        data.pgbouncer_enabled = pgbouncer_option in ("y", "Y")
+
+        redis_option = self.input_collection.read_str(
+            "Type 'y' to run a Redis-compatible cache, session and queue store for Gitea.", "y"
+        ).strip()
+        data.gitea_redis_enabled = redis_option in ("y", "Y")
+
+        data.certificate_profile = self.input_collection.read_str(
+            "Certificate key profile (ecdsa, rsa)", "ecdsa"
+        ).strip()
+        if data.certificate_profile not in ("ecdsa", "rsa"):
+            data.certificate_profile = "ecdsa"
+        data.certificate_renew_days = self.input_collection.read_int(
+            "Renew the server certificate this many days before it expires", 30
+        )
+
+        data.tcp_forwarding_mode = self.input_collection.read_str(
+            "TCP forwarding for PostgreSQL and Git SSH (proxy, kernel)", "proxy"
+        ).strip()
+        if data.tcp_forwarding_mode not in ("proxy", "kernel"):
+            data.tcp_forwarding_mode = "proxy"
+
+        flowtable_option = self.input_collection.read_str(
+            "Type 'y' to offload VPN to container forwarding with an nftables flowtable.", "y"
+        ).strip()
+        data.flowtable_enabled = flowtable_option in ("y", "Y")
+
+        data.mtu_probe_address = self.input_collection.read_str(
+            "Path MTU probe address on the clients' side (empty to skip)", ""
+        ).strip()
+
         self.file_system.write_json(
             "/usr/local/share/args/configuration_data.json", data.as_object()
         )
@@ -3,7 +3,28 @@
 Generates and manages SSL/TLS certificates for secure communications.
 """
 
+from .certificate_profile import (
+    CERTIFICATE_PROFILES,
+    DEFAULT_CERTIFICATE_PROFILE,
+    CertificateProfile,
+    certificate_profile,
+)
+from .certificate_rotation import (
+    CERTIFICATE_ROTATION_SCRIPT,
+    DEFAULT_CERTIFICATE_RENEW_DAYS,
+    render_certificate_rotation,
+)
 from .certificates_ubuntu_configuration_task import CertificatesUbuntuConfigurationTask
 from .certificates_windows_configuration_task import CertificatesWindowsConfigurationTask
 
-__all__ = ["CertificatesUbuntuConfigurationTask", "CertificatesWindowsConfigurationTask"]
+__all__ = [
+    "CERTIFICATE_PROFILES",
+    "DEFAULT_CERTIFICATE_PROFILE",
+    "CertificateProfile",
+    "certificate_profile",
+    "CERTIFICATE_ROTATION_SCRIPT",
+    "DEFAULT_CERTIFICATE_RENEW_DAYS",
+    "render_certificate_rotation",
+    "CertificatesUbuntuConfigurationTask",
+    "CertificatesWindowsConfigurationTask",
+]
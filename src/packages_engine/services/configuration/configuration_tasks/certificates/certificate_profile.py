@@ -0,0 +1,73 @@
+"""Key algorithms used for the internal CA and server certificates.
+
+ECDSA P-256 signatures are an order of magnitude cheaper for the server
+than RSA-2048 ones, which makes full TLS handshakes cheaper for nginx.
+RSA is kept for clients that cannot handle ECDSA certificates.
+"""
+
+from dataclasses import dataclass
+
+DEFAULT_CERTIFICATE_PROFILE = "ecdsa"
+
+
+@dataclass
+class CertificateProfile:
+    """Key generation settings of a certificate profile.
+
+    Attributes:
+        name: Profile name stored in the configuration data.
+        ca_genkey: openssl arguments generating the CA key into `{key}`.
+        server_genkey: openssl arguments generating the server key into `{key}`.
+        key_marker: Text printed by `openssl pkey -text` for keys of this profile.
+    """
+
+    name: str
+    ca_genkey: str
+    server_genkey: str
+    key_marker: str
+
+
+_EC_P256_GENKEY = (
+    "genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 "
+    "-pkeyopt ec_param_enc:named_curve -out {key}"
+)
+
+CERTIFICATE_PROFILES = {
+    "ecdsa": CertificateProfile(
+        name="ecdsa",
+        ca_genkey=_EC_P256_GENKEY,
+        server_genkey=_EC_P256_GENKEY,
+        key_marker="ASN1 OID: prime256v1",
+    ),
+    "rsa": CertificateProfile(
+        name="rsa",
+        ca_genkey="genrsa -out {key} 4096",
+        server_genkey="genrsa -out {key} 2048",
+        key_marker="modulus:",
+    ),
+}
+
+
+def certificate_profile(name: str) -> CertificateProfile:
+    """Get the certificate profile by name.
+
+    Args:
+        name: Profile name, `ecdsa` or `rsa`.
+
+    Returns:
+        CertificateProfile: The named profile, or the default one for unknown names.
+    """
+    return CERTIFICATE_PROFILES.get(name, CERTIFICATE_PROFILES[DEFAULT_CERTIFICATE_PROFILE])
+
+
+def genkey_command(genkey: str, key_path: str) -> str:
+    """Build the openssl command writing a private key.
+
+    Args:
+        genkey: openssl arguments of the profile.
+        key_path: Output path of the key.
+
+    Returns:
+        str: Command generating the key with owner-only permissions.
+    """
+    return f"(umask 077 && openssl {genkey.format(key=key_path)})"
@@ -0,0 +1,35 @@
+"""Rendering of the internal server certificate rotation script.
+
+The script owns issuing, renewing and installing the server certificate, so
+the configurator and the daily systemd timer run the same code path.
+"""
+
+from .certificate_profile import CertificateProfile
+
+CERTIFICATE_ROTATION_SCRIPT = "/usr/local/sbin/internal-cert-rotate"
+SERVER_CERTIFICATE_DAYS = 825
+DEFAULT_CERTIFICATE_RENEW_DAYS = 30
+
+
+def render_certificate_rotation(content: str, profile: CertificateProfile, renew_days: int) -> str:
+    """Replace the {{CERT_*}} placeholders of the rotation script.
+
+    Args:
+        content: Script template content.
+        profile: Certificate profile the server key must match.
+        renew_days: Renew the certificate when it expires within this many days,
+            limited to half the certificate lifetime.
+
+    Returns:
+        str: Content with the placeholders replaced.
+    """
+    result = content.replace(
+        "{{CERT_RENEW_DAYS}}", str(max(1, min(renew_days, SERVER_CERTIFICATE_DAYS // 2)))
+    )
+    result = result.replace("{{CERT_DAYS}}", str(SERVER_CERTIFICATE_DAYS))
+    result = result.replace("{{CERT_KEY_MARKER}}", profile.key_marker)
+    result = result.replace(
+        "{{CERT_SERVER_GENKEY}}", profile.server_genkey.format(key='"$NAME.key.new"')
+    )
+
+    return result
@@ -10,6 +10,9 @@ from packages_engine.services.file_system import FileSystemServiceContract
 from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
 
+from .certificate_profile import certificate_profile, genkey_command
+from .certificate_rotation import CERTIFICATE_ROTATION_SCRIPT, render_certificate_rotation
+
 
 class CertificatesUbuntuConfigurationTask(ConfigurationTask):
     """Creates internal CA and server certificates for secure services."""
@@ -37,6 +40,11 @@ class CertificatesUbuntuConfigurationTask(ConfigurationTask):
     def configure(self, data: ConfigurationData) -> OperationResult[bool]:
         """Generate CA, server certificates, and configure PKI directories.
 
+        Keys are generated with the algorithm of the configured certificate
+        profile; an existing CA is kept so clients keep trusting it. The server
+        certificate is issued by the rotation script, which a daily systemd
+        timer runs again to renew it before it expires.
+
         Args:
             data: Configuration data with domain name and directories
 
@@ -77,13 +85,13 @@ class CertificatesUbuntuConfigurationTask(ConfigurationTask):
             return write_result.as_fail()
         self.notifications.success("(Re)writing SAN template successful.")
 
-        domain = data.domain_name
         pki = "/etc/ssl/internal-pki"
+        profile = certificate_profile(data.certificate_profile)
 
         self.notifications.info("Creating CA if missing (idempotent).")
         res = self.controller.run_raw_commands(
             [
-                f"test -f {pki}/ca.key || (umask 077 && openssl genrsa -out {pki}/ca.key 4096)",
+                f"test -f {pki}/ca.key || {genkey_command(profile.ca_genkey, f'{pki}/ca.key')}",
                 f'test -f {pki}/ca.crt || openssl req -x509 -new -sha256 -days 3650 -key {pki}/ca.key -subj "/CN=Internal VPN CA" -out {pki}/ca.crt',
                 f"sudo chmod 600 {pki}/ca.key",
             ]
@@ -93,21 +101,57 @@ class CertificatesUbuntuConfigurationTask(ConfigurationTask):
             return res.as_fail()
         self.notifications.success("Creating CA succeeded.")
 
-        self.notifications.info("Creating server key/cert if missing (idempotent).")
+        self.notifications.info("Installing server certificate rotation.")
+        for template_path, destination_path in [
+            ("certificates/internal-cert-rotate.sh", CERTIFICATE_ROTATION_SCRIPT),
+            (
+                "systemd/internal-cert-rotate.service",
+                "/etc/systemd/system/internal-cert-rotate.service",
+            ),
+            (
+                "systemd/internal-cert-rotate.timer",
+                "/etc/systemd/system/internal-cert-rotate.timer",
+            ),
+        ]:
+            read_result = self.reader.read(
+                ConfigurationContent.RAW_STRING,
+                data,
+                f"/usr/local/share/{data.server_data_dir}/data/{template_path}",
+            )
+            if not read_result.success or read_result.data is None:
+                self.notifications.error(f"\tFailed to read {template_path} template.")
+                return read_result.as_fail()
+            write_result = self.file_system.write_text(
+                destination_path,
+                render_certificate_rotation(read_result.data, profile, data.certificate_renew_days),
+            )
+            if not write_result.success:
+                self.notifications.error(f"\tFailed to write {destination_path}.")
+                return write_result.as_fail()
         res = self.controller.run_raw_commands(
             [
-                f"test -f {pki}/{domain}.key || (umask 077 && openssl genrsa -out {pki}/{domain}.key 2048)",
-                f"test -f {pki}/{domain}.csr || openssl req -new -key {pki}/{domain}.key -out {pki}/{domain}.csr -config {pki}/san.cnf",
-                f"test -f {pki}/{domain}.crt || openssl x509 -req -in {pki}/{domain}.csr -CA {pki}/ca.crt -CAkey {pki}/ca.key -CAcreateserial -out {pki}/{domain}.crt -days 825 -sha256 -extensions req_ext -extfile {pki}/san.cnf",
-                f"sudo install -m 0644 -o root -g root {pki}/{domain}.crt /etc/ssl/certs/internal.crt",
-                f"sudo install -m 0600 -o root -g root {pki}/{domain}.key /etc/ssl/private/internal.key",
+                f"sudo chown root:root {CERTIFICATE_ROTATION_SCRIPT}",
+                f"sudo chmod 0755 {CERTIFICATE_ROTATION_SCRIPT}",
+                "sudo chmod 0644 /etc/systemd/system/internal-cert-rotate.service "
+                "/etc/systemd/system/internal-cert-rotate.timer",
+                "sudo systemctl daemon-reload",
+                "sudo systemctl enable --now internal-cert-rotate.timer",
             ]
         )
+        if not res.success:
+            self.notifications.error("\tInstalling server certificate rotation failed.")
+            return res.as_fail()
+        self.notifications.success("\tInstalling server certificate rotation succeeded.")
 
+        self.notifications.info(
+            "Issuing server key/cert if missing or expiring within "
+            f"{data.certificate_renew_days} days."
+        )
+        res = self.controller.run_raw_commands([f"sudo {CERTIFICATE_ROTATION_SCRIPT}"])
         if not res.success:
-            self.notifications.error("Creating server key/cert failed.")
+            self.notifications.error("Issuing server key/cert failed.")
             return res.as_fail()
-        self.notifications.success("Creating server key/cert succeeded.")
+        self.notifications.success("Issuing server key/cert succeeded.")
 
         self.notifications.success("\tCertificates ready.")
 
@@ -0,0 +1,246 @@
+"""Default configuration task list of the configurator.
+
+Shared by the configurator tool and everything that needs to run the same
+tasks in the same order, such as the engine benchmark.
+"""
+
+from packages_engine.services.configuration.configuration_content_reader import (
+    ConfigurationContentReaderServiceContract,
+)
+from packages_engine.services.configuration.configuration_tasks import (
+    ConfigurationTask,
+    GenericConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.autostart import (
+    AutostartUbuntuConfigurationTask,
+    AutostartWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.certificates import (
+    CertificatesUbuntuConfigurationTask,
+    CertificatesWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.dnsmasq import (
+    DnsmasqUbuntuConfigurationTask,
+    DnsmasqWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.docker_orchestration import (
+    DockerOrchestrationUbuntuConfigurationTask,
+    DockerOrchestrationWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.docker_resources import (
+    DockerResourcesUbuntuConfigurationTask,
+    DockerResourcesWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.docker_seed_gitea import (
+    DockerSeedGiteaUbuntuConfigurationTask,
+    DockerSeedGiteaWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.docker_setup_gitea_admin import (
+    DockerSetupGiteaAdminUbuntuConfigurationTask,
+    DockerSetupGiteaAdminWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.network_tuning import (
+    NetworkTuningUbuntuConfigurationTask,
+    NetworkTuningWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.nftables import (
+    NftablesUbuntuConfigurationTask,
+    NftablesWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.nftables_offload import (
+    NftablesOffloadUbuntuConfigurationTask,
+    NftablesOffloadWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.nginx import (
+    NginxUbuntuConfigurationTask,
+    NginxWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.package_caches import (
+    PackageCachesUbuntuConfigurationTask,
+    PackageCachesWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.share_certificates import (
+    ShareCertificatesUbuntuConfigurationTask,
+    ShareCertificatesWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.systemd import (
+    SystemdUbuntuConfigurationTask,
+    SystemdWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.wireguard import (
+    WireguardUbuntuConfigurationTask,
+    WireguardWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.wireguard_mtu import (
+    WireguardMtuUbuntuConfigurationTask,
+    WireguardMtuWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.wireguard_peers import (
+    WireguardPeersUbuntuConfigurationTask,
+    WireguardPeersWindowsConfigurationTask,
+)
+from packages_engine.services.configuration.configuration_tasks.wireguard_share import (
+    WireguardShareUbuntuConfigurationTask,
+    WireguardShareWindowsConfigurationTask,
+)
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.host_resources import HostResourcesServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.package_controller import PackageControllerServiceContract
+from packages_engine.services.path_mtu import PathMtuServiceContract
+
+
+def create_default_configuration_tasks(
+    content_reader: ConfigurationContentReaderServiceContract,
+    file_system: FileSystemServiceContract,
+    notifications: NotificationsServiceContract,
+    controller: PackageControllerServiceContract,
+    host_resources: HostResourcesServiceContract,
+    path_mtu: PathMtuServiceContract,
+) -> list[ConfigurationTask]:
+    """
+    Create the configurator tasks in the order they run.
+
+    Args:
+        content_reader: Service for reading configuration templates.
+        file_system: Service for file operations.
+        notifications: Service for user notifications.
+        controller: Service for executing system commands.
+        host_resources: Service for detecting host resources.
+        path_mtu: Service for discovering the WireGuard path MTU.
+
+    Returns:
+        list[ConfigurationTask]: The tasks, each choosing its Ubuntu or Windows variant.
+    """
+    wireguard_peers = GenericConfigurationTask(
+        WireguardPeersUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller
+        ),
+        WireguardPeersWindowsConfigurationTask(),
+    )
+
+    wireguard_mtu = GenericConfigurationTask(
+        WireguardMtuUbuntuConfigurationTask(file_system, notifications, path_mtu),
+        WireguardMtuWindowsConfigurationTask(),
+    )
+
+    wireguard = GenericConfigurationTask(
+        WireguardUbuntuConfigurationTask(content_reader, file_system, notifications, controller),
+        WireguardWindowsConfigurationTask(),
+    )
+
+    wireguard_share = GenericConfigurationTask(
+        WireguardShareUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller
+        ),
+        WireguardShareWindowsConfigurationTask(),
+    )
+
+    dnsmasq = GenericConfigurationTask(
+        DnsmasqUbuntuConfigurationTask(content_reader, file_system, notifications, controller),
+        DnsmasqWindowsConfigurationTask(),
+    )
+
+    nftables = GenericConfigurationTask(
+        NftablesUbuntuConfigurationTask(content_reader, file_system, notifications, controller),
+        NftablesWindowsConfigurationTask(),
+    )
+
+    network_tuning = GenericConfigurationTask(
+        NetworkTuningUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller, host_resources
+        ),
+        NetworkTuningWindowsConfigurationTask(),
+    )
+
+    systemd = GenericConfigurationTask(
+        SystemdUbuntuConfigurationTask(content_reader, file_system, notifications, controller),
+        SystemdWindowsConfigurationTask(),
+    )
+
+    package_caches = GenericConfigurationTask(
+        PackageCachesUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller
+        ),
+        PackageCachesWindowsConfigurationTask(),
+    )
+
+    docker_resources = GenericConfigurationTask(
+        DockerResourcesUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller, host_resources
+        ),
+        DockerResourcesWindowsConfigurationTask(),
+    )
+
+    docker_seed_gitea = GenericConfigurationTask(
+        DockerSeedGiteaUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller, host_resources
+        ),
+        DockerSeedGiteaWindowsConfigurationTask(),
+    )
+
+    docker_orchestration = GenericConfigurationTask(
+        DockerOrchestrationUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller
+        ),
+        DockerOrchestrationWindowsConfigurationTask(),
+    )
+
+    nftables_offload = GenericConfigurationTask(
+        NftablesOffloadUbuntuConfigurationTask(
+            file_system, notifications, controller, host_resources
+        ),
+        NftablesOffloadWindowsConfigurationTask(),
+    )
+
+    docker_setup_gitea_admin = GenericConfigurationTask(
+        DockerSetupGiteaAdminUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller
+        ),
+        DockerSetupGiteaAdminWindowsConfigurationTask(),
+    )
+
+    certificates = GenericConfigurationTask(
+        CertificatesUbuntuConfigurationTask(content_reader, file_system, notifications, controller),
+        CertificatesWindowsConfigurationTask(),
+    )
+
+    share_certificates = GenericConfigurationTask(
+        ShareCertificatesUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller
+        ),
+        ShareCertificatesWindowsConfigurationTask(),
+    )
+
+    nginx = GenericConfigurationTask(
+        NginxUbuntuConfigurationTask(
+            content_reader, file_system, notifications, controller, host_resources
+        ),
+        NginxWindowsConfigurationTask(),
+    )
+
+    autostart = GenericConfigurationTask(
+        AutostartUbuntuConfigurationTask(content_reader, file_system, notifications, controller),
+        AutostartWindowsConfigurationTask(),
+    )
+
+    return [
+        nftables,
+        network_tuning,
+        dnsmasq,
+        wireguard_peers,
+        wireguard_mtu,
+        wireguard,
+        wireguard_share,
+        systemd,
+        package_caches,
+        docker_resources,
+        docker_seed_gitea,
+        docker_orchestration,
+        nftables_offload,
+        docker_setup_gitea_admin,
+        certificates,
+        share_certificates,
+        nginx,
+        autostart,
+    ]
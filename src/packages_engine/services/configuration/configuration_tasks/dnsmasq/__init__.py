@@ -3,7 +3,22 @@
 Configures dnsmasq for DNS and DHCP services.
 """
 
+from .dnsmasq_records import (
+    DNSMASQ_HOSTS_PATH,
+    INTERNAL_SERVICES,
+    dnsmasq_cache_size,
+    render_dnsmasq_cache,
+    render_internal_hosts,
+)
 from .dnsmasq_ubuntu_configuration_task import DnsmasqUbuntuConfigurationTask
 from .dnsmasq_windows_configuration_task import DnsmasqWindowsConfigurationTask
 
-__all__ = ["DnsmasqUbuntuConfigurationTask", "DnsmasqWindowsConfigurationTask"]
+__all__ = [
+    "DNSMASQ_HOSTS_PATH",
+    "INTERNAL_SERVICES",
+    "dnsmasq_cache_size",
+    "render_dnsmasq_cache",
+    "render_internal_hosts",
+    "DnsmasqUbuntuConfigurationTask",
+    "DnsmasqWindowsConfigurationTask",
+]
@@ -0,0 +1,57 @@
+"""Dnsmasq cache sizing and internal host records.
+
+Internal service names live in a hosts file under a `hostsdir`, which
+dnsmasq watches with inotify, so record changes need no restart and keep
+the cache warm. The cache grows with the number of VPN clients.
+"""
+
+DNSMASQ_CONF_PATH = "/etc/dnsmasq.d/internal.conf"
+# Left while a written internal.conf is not validated and loaded yet
+DNSMASQ_CONF_CHANGED = "/run/dnsmasq-conf.changed"
+DNSMASQ_HOSTS_DIR = "/etc/dnsmasq.hosts.d"
+DNSMASQ_HOSTS_PATH = f"{DNSMASQ_HOSTS_DIR}/internal.hosts"
+INTERNAL_SERVICES_ADDRESS = "10.10.0.1"
+INTERNAL_SERVICES = ["ssh", "gitea", "postgresql"]
+
+CACHE_BASE_ENTRIES = 1000
+CACHE_ENTRIES_PER_CLIENT = 500
+# dnsmasq warns that larger caches slow down lookups
+CACHE_MAX_ENTRIES = 10000
+
+
+def dnsmasq_cache_size(clients: int) -> int:
+    """Size the dnsmasq cache for the VPN clients.
+
+    Args:
+        clients: Number of WireGuard clients.
+
+    Returns:
+        int: Number of cache entries.
+    """
+    return min(CACHE_MAX_ENTRIES, CACHE_BASE_ENTRIES + max(0, clients) * CACHE_ENTRIES_PER_CLIENT)
+
+
+def render_internal_hosts(domain_name: str) -> str:
+    """Render the hosts file with the internal service names.
+
+    Args:
+        domain_name: Private domain served to the VPN clients.
+
+    Returns:
+        str: Hosts file content.
+    """
+    lines = [f"{INTERNAL_SERVICES_ADDRESS} {name}.{domain_name}" for name in INTERNAL_SERVICES]
+    return "\n".join(lines) + "\n"
+
+
+def render_dnsmasq_cache(content: str, clients: int) -> str:
+    """Replace the {{DNSMASQ_CACHE_SIZE}} placeholder.
+
+    Args:
+        content: Template content.
+        clients: Number of WireGuard clients.
+
+    Returns:
+        str: Content with the placeholder replaced.
+    """
+    return content.replace("{{DNSMASQ_CACHE_SIZE}}", str(dnsmasq_cache_size(clients)))
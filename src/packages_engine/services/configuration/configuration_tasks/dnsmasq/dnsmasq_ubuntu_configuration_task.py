@@ -10,9 +10,25 @@ from packages_engine.services.file_system import FileSystemServiceContract
 from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
 
+from .dnsmasq_records import (
+    DNSMASQ_CONF_CHANGED,
+    DNSMASQ_CONF_PATH,
+    DNSMASQ_HOSTS_DIR,
+    DNSMASQ_HOSTS_PATH,
+    render_dnsmasq_cache,
+    render_internal_hosts,
+)
+
 
 class DnsmasqUbuntuConfigurationTask(ConfigurationTask):
-    """Configures Dnsmasq DNS/DHCP service with template-based config and systemd integration."""
+    """Configures Dnsmasq DNS/DHCP service with template-based config and systemd integration.
+
+    Internal records are written to a watched hosts directory and dnsmasq is only
+    restarted when its configuration changes, so the cache survives re-runs. A
+    change marker stays until the new configuration passed `dnsmasq --test` and
+    dnsmasq was restarted, so a failed run is retried even though the file
+    already has the new content.
+    """
 
     def __init__(
         self,
@@ -53,17 +69,45 @@ class DnsmasqUbuntuConfigurationTask(ConfigurationTask):
             self.notifications.error("\tReading Dnsmasq Config template data failed.")
             return read_result.as_fail()
         self.notifications.success("\tReading Dnsmasq Config template data successful.")
-        self.notifications.info(
-            f"\tWill configure using the following configuration:\n\n{read_result.data}"
-        )
+        config = render_dnsmasq_cache(read_result.data, data.num_wireguard_clients)
+        self.notifications.info(f"\tWill configure using the following configuration:\n\n{config}")
 
         self.notifications.info("Writing Dnsmasq Config data.")
-        mk_res = self.controller.run_raw_commands(["sudo install -d -m 0755 /etc/dnsmasq.d"])
+        mk_res = self.controller.run_raw_commands(
+            [f"sudo install -d -m 0755 /etc/dnsmasq.d {DNSMASQ_HOSTS_DIR}"]
+        )
         if not mk_res.success:
             self.notifications.error("\tCreating /etc/dnsmasq.d failed.")
             return mk_res.as_fail()
 
-        write_res = self.file_system.write_text("/etc/dnsmasq.d/internal.conf", read_result.data)
+        # Picked up by dnsmasq through inotify, no restart needed
+        hosts_res = self.file_system.write_text(
+            DNSMASQ_HOSTS_PATH, render_internal_hosts(data.domain_name)
+        )
+        if not hosts_res.success:
+            self.notifications.error("\tWriting Dnsmasq internal records failed.")
+            return hosts_res.as_fail()
+
+        pending = self.file_system.path_exists(DNSMASQ_CONF_CHANGED)
+        if self.file_system.path_exists(DNSMASQ_CONF_PATH) and not pending:
+            current_res = self.file_system.read_text(DNSMASQ_CONF_PATH)
+            if current_res.success and current_res.data == config:
+                self.notifications.success(
+                    "\tDnsmasq configuration is unchanged. Internal records were updated in place."
+                )
+                enable_res = self.controller.run_raw_commands(
+                    ["sudo systemctl enable --now dnsmasq"]
+                )
+                if not enable_res.success:
+                    self.notifications.error("\tRunning Dnsmasq failed.")
+                    return enable_res.as_fail()
+                return OperationResult[bool].succeed(True)
+
+        marker_res = self.controller.run_raw_commands([f"sudo touch {DNSMASQ_CONF_CHANGED}"])
+        if not marker_res.success:
+            self.notifications.error("\tMarking Dnsmasq Config data as changed failed.")
+            return marker_res.as_fail()
+        write_res = self.file_system.write_text(DNSMASQ_CONF_PATH, config)
         if not write_res.success:
             self.notifications.error("\tWriting Dnsmasq Config data failed.")
             return write_res.as_fail()
@@ -81,14 +125,15 @@ class DnsmasqUbuntuConfigurationTask(ConfigurationTask):
         )
         run_res = self.controller.run_raw_commands(
             [
-                "sudo chown root:root /etc/dnsmasq.d/internal.conf",
-                "sudo chmod 0644 /etc/dnsmasq.d/internal.conf",
+                f"sudo chown root:root {DNSMASQ_CONF_PATH} {DNSMASQ_HOSTS_PATH}",
+                f"sudo chmod 0644 {DNSMASQ_CONF_PATH} {DNSMASQ_HOSTS_PATH}",
                 "sudo systemctl reset-failed dnsmasq || true",
                 "sudo systemctl enable --now dnsmasq",
                 "sudo install -d -m 0755 /etc/systemd/system/dnsmasq.service.d",
                 "sudo bash -lc 'cat > /etc/systemd/system/dnsmasq.service.d/10-after-wg0.conf <<EOF\n[Unit]\nAfter=wg-quick@wg0.service\nWants=wg-quick@wg0.service\nEOF'",
                 "sudo systemctl daemon-reload",
                 "sudo systemctl reload-or-restart dnsmasq",
+                f"sudo rm -f {DNSMASQ_CONF_CHANGED}",
             ]
         )
         if not run_res.success:
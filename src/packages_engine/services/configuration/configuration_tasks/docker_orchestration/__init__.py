@@ -3,6 +3,15 @@
 Manages Docker networks, daemon configuration, and container lifecycle.
 """
 
+from .docker_daemon_json import (
+    DOCKER_DAEMON_JSON,
+    DOCKER_DAEMON_PROFILE,
+    add_unique_value,
+    docker_daemon_json_commands,
+    merge_docker_daemon_json,
+    merge_docker_daemon_profile,
+    restart_docker_on_daemon_json_change_command,
+)
 from .docker_orchestration_ubuntu_configuration_task import (
     DockerOrchestrationUbuntuConfigurationTask,
 )
@@ -11,6 +20,13 @@ from .docker_orchestration_windows_configuration_task import (
 )
 
 __all__ = [
+    "DOCKER_DAEMON_JSON",
+    "DOCKER_DAEMON_PROFILE",
+    "add_unique_value",
+    "docker_daemon_json_commands",
+    "merge_docker_daemon_json",
+    "merge_docker_daemon_profile",
+    "restart_docker_on_daemon_json_change_command",
     "DockerOrchestrationUbuntuConfigurationTask",
     "DockerOrchestrationWindowsConfigurationTask",
 ]
@@ -0,0 +1,132 @@
+"""Docker daemon.json merge.
+
+Shared by the configuration tasks which maintain keys of /etc/docker/daemon.json,
+so each of them merges its own keys and keeps the keys owned by the others.
+"""
+
+import copy
+import json
+from typing import Any, Callable
+
+from packages_engine.models import OperationResult
+from packages_engine.services.file_system import FileSystemServiceContract
+
+DOCKER_DAEMON_JSON = "/etc/docker/daemon.json"
+DOCKER_DAEMON_JSON_CHANGED = "/run/docker-daemon-json.changed"
+
+DOCKER_DAEMON_PROFILE = {
+    # binary, compressed and rotated logs instead of unbounded json-file logs
+    "log-driver": "local",
+    "log-opts": {"max-size": "20m", "max-file": "5"},
+    # published ports are handled by iptables only, no docker-proxy process per port
+    "userland-proxy": False,
+    # containers keep running while the daemon restarts
+    "live-restore": True,
+    "max-concurrent-downloads": 6,
+    "max-concurrent-uploads": 4,
+}
+
+
+def merge_docker_daemon_json(
+    file_system: FileSystemServiceContract, merge: Callable[[dict[str, Any]], dict[str, Any]]
+) -> OperationResult[bool]:
+    """Merge keys into the Docker daemon configuration.
+
+    The file is read and written through the file system service, so plans show its diff.
+    It is rewritten only when the merged document differs semantically from the current one.
+
+    Args:
+        file_system: Service for file operations.
+        merge: Returns the merged document for a copy of the current one ({} when missing).
+
+    Returns:
+        OperationResult[bool]: True when Docker has to be restarted, because the file was
+            rewritten now or by an earlier run which did not get to restart Docker.
+    """
+    current: dict[str, Any] = {}
+    if file_system.path_exists(DOCKER_DAEMON_JSON):
+        read_result = file_system.read_text(DOCKER_DAEMON_JSON)
+        if not read_result.success:
+            return read_result.as_fail()
+        try:
+            current = json.loads(read_result.data or "{}")
+        except json.JSONDecodeError:
+            return OperationResult[bool].fail(f"{DOCKER_DAEMON_JSON} is not valid JSON")
+        if not isinstance(current, dict):
+            return OperationResult[bool].fail(f"{DOCKER_DAEMON_JSON} is not a JSON object")
+
+    merged = merge(copy.deepcopy(current))
+    if merged == current:
+        return OperationResult[bool].succeed(file_system.path_exists(DOCKER_DAEMON_JSON_CHANGED))
+
+    write_result = file_system.write_text(DOCKER_DAEMON_JSON, json.dumps(merged, indent=2) + "\n")
+    if not write_result.success:
+        return write_result
+    return OperationResult[bool].succeed(True)
+
+
+def merge_docker_daemon_profile(daemon: dict[str, Any]) -> dict[str, Any]:
+    """Merge DOCKER_DAEMON_PROFILE into a daemon configuration, objects recursively.
+
+    Args:
+        daemon: The current daemon configuration.
+
+    Returns:
+        dict[str, Any]: The configuration with the profile values.
+    """
+    return _merge_objects(daemon, DOCKER_DAEMON_PROFILE)
+
+
+def add_unique_value(daemon: dict[str, Any], key: str, value: str) -> dict[str, Any]:
+    """Add a value to a list of the daemon configuration, sorted and without duplicates.
+
+    Args:
+        daemon: The daemon configuration, changed in place.
+        key: Key of the list (e.g. "dns"), created when missing.
+        value: The value to add.
+
+    Returns:
+        dict[str, Any]: The daemon configuration.
+    """
+    daemon[key] = sorted({*daemon.get(key, []), value})
+    return daemon
+
+
+def docker_daemon_json_commands(restart_needed: bool) -> list[str]:
+    """Build the commands finishing a daemon.json merge.
+
+    Args:
+        restart_needed: Result of merge_docker_daemon_json.
+
+    Returns:
+        list[str]: Commands fixing the permissions and leaving the change marker, consumed
+            by restart_docker_on_daemon_json_change_command. Empty when no restart is needed.
+    """
+    if not restart_needed:
+        return []
+    return [
+        f"sudo chown root:root {DOCKER_DAEMON_JSON} && sudo chmod 0644 {DOCKER_DAEMON_JSON}",
+        f"sudo touch {DOCKER_DAEMON_JSON_CHANGED}",
+    ]
+
+
+def restart_docker_on_daemon_json_change_command() -> str:
+    """Build the command restarting Docker only when daemon.json was rewritten.
+
+    Returns:
+        str: Shell command restarting Docker and clearing the change marker.
+    """
+    return (
+        f"test ! -f {DOCKER_DAEMON_JSON_CHANGED} || "
+        f"(sudo systemctl restart docker && sudo rm -f {DOCKER_DAEMON_JSON_CHANGED})"
+    )
+
+
+def _merge_objects(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_objects(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
@@ -9,6 +9,20 @@ from packages_engine.services.configuration.configuration_content_reader import
     ConfigurationContentReaderServiceContract,
 )
 from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+from packages_engine.services.configuration.configuration_tasks.docker_orchestration.docker_daemon_json import (
+    add_unique_value,
+    docker_daemon_json_commands,
+    merge_docker_daemon_json,
+    merge_docker_daemon_profile,
+    restart_docker_on_daemon_json_change_command,
+)
+from packages_engine.services.configuration.configuration_tasks.docker_resources import (
+    compose_profiles,
+    restart_requested_containers_command,
+)
+from packages_engine.services.configuration.configuration_tasks.nftables import (
+    forward_network_commands,
+)
 from packages_engine.services.file_system import FileSystemServiceContract
 from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
@@ -44,8 +58,8 @@ class DockerOrchestrationUbuntuConfigurationTask(ConfigurationTask):
     def configure(self, data: ConfigurationData) -> OperationResult[bool]:
         """Orchestrate Docker containers and network setup.
 
-        Creates Docker network, configures DNS, sets up systemd dependencies,
-        deploys compose stack, and waits for services to be healthy.
+        Creates Docker networks, applies the daemon profile and DNS, sets up systemd
+        dependencies, deploys compose stack, and waits for services to be healthy.
 
         Args:
             data: Configuration data including domain name.
@@ -54,29 +68,52 @@ class DockerOrchestrationUbuntuConfigurationTask(ConfigurationTask):
             OperationResult[bool]: Success if orchestration completes.
         """
         self.notifications.info("Orchestrating Docker containers.")
+        # merge daemon profile, DNS & search domain (idempotent & deduped)
+        daemon_result = merge_docker_daemon_json(
+            self.file_system,
+            lambda daemon: add_unique_value(
+                add_unique_value(merge_docker_daemon_profile(daemon), "dns", "10.10.0.1"),
+                "dns-search",
+                data.domain_name,
+            ),
+        )
+        if not daemon_result.success:
+            self.notifications.error("\tFailed to orchestrate Docker containers.")
+            return daemon_result.as_fail()
+        restart_docker = bool(daemon_result.data)
+
         cmds = [
             # network (only create if missing)
             "sudo docker network inspect vpn-internal >/dev/null 2>&1 || "
             "sudo docker network create --driver bridge --attachable vpn-internal",
-            # daemon.json must exist first
-            "sudo install -d -m 0755 /etc/docker",
-            "test -f /etc/docker/daemon.json || echo '{}' | sudo tee /etc/docker/daemon.json >/dev/null",
-            # merge DNS & search domain (idempotent & deduped)
-            f"sudo jq --arg dns '10.10.0.1' --arg search '{data.domain_name}' "
-            '\'.dns = ((.dns // []) + [$dns] | unique) | ."dns-search" = ((."dns-search" // []) + [$search] | unique)\' '
-            "/etc/docker/daemon.json | sudo tee /etc/docker/daemon.json.tmp >/dev/null && "
-            "sudo mv /etc/docker/daemon.json.tmp /etc/docker/daemon.json && "
-            "sudo chown root:root /etc/docker/daemon.json && sudo chmod 0644 /etc/docker/daemon.json",
+            *docker_daemon_json_commands(restart_docker),
             # optionally ensure docker starts after wg0 so 10.10.0.1 DNS is up on boot
             "sudo install -d -m 0755 /etc/systemd/system/docker.service.d",
             "sudo bash -lc 'cat > /etc/systemd/system/docker.service.d/10-after-wg0.conf <<EOF\n[Unit]\nAfter=wg-quick@wg0.service\nWants=wg-quick@wg0.service\nEOF'",
             "sudo systemctl daemon-reload",
             "sudo systemctl enable docker",
-            "sudo systemctl restart docker",
+            "sudo systemctl start docker",
+            # restart only when the effective daemon configuration changed
+            *([restart_docker_on_daemon_json_change_command()] if restart_docker else []),
+            # fixed-address network targeted by the kernel TCP forwarding mode
+            *forward_network_commands(),
+            # offline bundle: load image archives in parallel instead of pulling them
+            "test ! -d /usr/local/share/bundle/images || "
+            "find /usr/local/share/bundle/images -name '*.tar.gz' -print0 | "
+            "xargs -0 -r -P 4 -I{} sh -c 'gzip -dc \"$1\" | sudo docker load -q' _ {}",
             # compose: pull updated images and up with --remove-orphans
-            "cd /srv/stack && sudo docker compose pull --quiet || true",
+            "test -d /usr/local/share/bundle/images || "
+            "(cd /srv/stack && sudo docker compose pull --quiet) || true",
             "cd /srv/stack && sudo docker compose config -q",
             "cd /srv/stack && sudo docker compose up -d --remove-orphans",
+            # --remove-orphans keeps services of profiles that were turned off, so remove them
+            *[
+                f"cd /srv/stack && sudo docker compose --profile {profile} rm -sf {profile}"
+                for profile, enabled in compose_profiles(data).items()
+                if not enabled
+            ],
+            # configuration files rewritten before the stack was up
+            restart_requested_containers_command(),
             # wait for healthchecks so subsequent tasks can rely on services being ready
             "cd /srv/stack && sudo docker compose ps",
             "timeout 120 bash -lc '"
@@ -3,14 +3,50 @@
 Manages Docker directories, docker-compose files, and permissions.
 """
 
+from .compose_profiles import compose_profiles
+from .connection_pool import ConnectionPool, compute_connection_pool, render_connection_pool
+from .container_resource_limits import (
+    DEFAULT_CONTAINER_RESOURCE_WEIGHTS,
+    ContainerResourceLimits,
+    ContainerResourceWeight,
+    compute_container_resource_limits,
+    render_container_resource_limits,
+)
+from .container_restart import (
+    CONTAINER_RESTART_DIR,
+    request_container_restart_command,
+    restart_requested_containers_command,
+)
 from .docker_resources_ubuntu_configuration_task import (
     DockerResourcesUbuntuConfigurationTask,
 )
 from .docker_resources_windows_configuration_task import (
     DockerResourcesWindowsConfigurationTask,
 )
+from .postgres_tuning import (
+    POSTGRES_MAX_CONNECTIONS,
+    PostgresTuning,
+    compute_postgres_tuning,
+    render_postgres_tuning,
+)
 
 __all__ = [
+    "compose_profiles",
+    "CONTAINER_RESTART_DIR",
+    "request_container_restart_command",
+    "restart_requested_containers_command",
+    "ConnectionPool",
+    "compute_connection_pool",
+    "render_connection_pool",
+    "DEFAULT_CONTAINER_RESOURCE_WEIGHTS",
+    "ContainerResourceLimits",
+    "ContainerResourceWeight",
+    "compute_container_resource_limits",
+    "render_container_resource_limits",
+    "POSTGRES_MAX_CONNECTIONS",
+    "PostgresTuning",
+    "compute_postgres_tuning",
+    "render_postgres_tuning",
     "DockerResourcesUbuntuConfigurationTask",
     "DockerResourcesWindowsConfigurationTask",
 ]
@@ -0,0 +1,17 @@
+"""Docker Compose profiles of the optional services."""
+
+from packages_engine.models.configuration import ConfigurationData
+
+
+def compose_profiles(data: ConfigurationData) -> dict[str, bool]:
+    """Map each optional Compose profile to whether it is enabled.
+
+    Each profile holds the service of the same name.
+
+    Args:
+        data: Configuration data with the optional service switches.
+
+    Returns:
+        dict[str, bool]: Enabled state by profile name.
+    """
+    return {"pgbouncer": data.pgbouncer_enabled, "redis": data.gitea_redis_enabled}
@@ -0,0 +1,94 @@
+"""Database connection pool sizing for PgBouncer and Gitea.
+
+The pool is sized from the PostgreSQL max_connections setting so the server
+keeps headroom for pgAdmin, maintenance and superuser connections.
+"""
+
+from dataclasses import dataclass
+
+# Server connections kept outside of the pool (superuser, pgAdmin, maintenance).
+POSTGRES_RESERVED_CONNECTIONS = 10
+PGBOUNCER_MAX_CLIENT_CONN = 500
+
+
+@dataclass
+class ConnectionPool:
+    """Computed connection pool settings.
+
+    Attributes:
+        default_pool_size: PgBouncer server connections per database/user pair.
+        reserve_pool_size: Additional PgBouncer server connections under load.
+        max_db_connections: Upper bound of PgBouncer server connections.
+        max_client_conn: Maximum number of PgBouncer client connections.
+        gitea_max_open_conns: Gitea MAX_OPEN_CONNS.
+        gitea_max_idle_conns: Gitea MAX_IDLE_CONNS.
+        gitea_conn_max_lifetime: Gitea CONN_MAX_LIFETIME.
+    """
+
+    default_pool_size: int
+    reserve_pool_size: int
+    max_db_connections: int
+    max_client_conn: int
+    gitea_max_open_conns: int
+    gitea_max_idle_conns: int
+    gitea_conn_max_lifetime: str
+
+
+def compute_connection_pool(
+    max_connections: int, cpu_count: int, pgbouncer_enabled: bool
+) -> ConnectionPool:
+    """Compute the connection pool settings.
+
+    With PgBouncer, Gitea may keep many cheap client connections while the
+    number of PostgreSQL backends stays at the pool size. Without it, Gitea
+    itself is limited to the pool size and keeps its connections open so
+    backends are not forked per request.
+
+    Args:
+        max_connections: PostgreSQL max_connections.
+        cpu_count: Number of CPUs available to PostgreSQL.
+        pgbouncer_enabled: Whether Gitea connects through PgBouncer.
+
+    Returns:
+        ConnectionPool: Pool settings for PgBouncer and Gitea.
+    """
+    budget = max(max_connections - POSTGRES_RESERVED_CONNECTIONS, 2)
+    default_pool_size = min(budget * 2 // 3, max(10, max(cpu_count, 1) * 4))
+    reserve_pool_size = min(budget - default_pool_size, max(2, default_pool_size // 4))
+
+    if pgbouncer_enabled:
+        gitea_max_open_conns = min(PGBOUNCER_MAX_CLIENT_CONN // 2, default_pool_size * 4)
+        gitea_max_idle_conns = default_pool_size * 2
+        gitea_conn_max_lifetime = "5m"
+    else:
+        gitea_max_open_conns = default_pool_size
+        gitea_max_idle_conns = default_pool_size
+        gitea_conn_max_lifetime = "30m"
+
+    return ConnectionPool(
+        default_pool_size=default_pool_size,
+        reserve_pool_size=reserve_pool_size,
+        max_db_connections=default_pool_size + reserve_pool_size,
+        max_client_conn=PGBOUNCER_MAX_CLIENT_CONN,
+        gitea_max_open_conns=gitea_max_open_conns,
+        gitea_max_idle_conns=gitea_max_idle_conns,
+        gitea_conn_max_lifetime=gitea_conn_max_lifetime,
+    )
+
+
+def render_connection_pool(content: str, pool: ConnectionPool) -> str:
+    """Replace the {{PGBOUNCER_*}} placeholders.
+
+    Args:
+        content: Template content.
+        pool: Computed pool settings.
+
+    Returns:
+        str: Content with the placeholders replaced.
+    """
+    result = content.replace("{{PGBOUNCER_DEFAULT_POOL_SIZE}}", str(pool.default_pool_size))
+    result = result.replace("{{PGBOUNCER_RESERVE_POOL_SIZE}}", str(pool.reserve_pool_size))
+    result = result.replace("{{PGBOUNCER_MAX_DB_CONNECTIONS}}", str(pool.max_db_connections))
+    result = result.replace("{{PGBOUNCER_MAX_CLIENT_CONN}}", str(pool.max_client_conn))
+
+    return result
@@ -0,0 +1,141 @@
+"""Container resource limits derived from the host capacity.
+
+Splits the host memory and CPUs between the compose services according to a
+weighting so that pgAdmin or a busy Gitea cannot starve PostgreSQL.
+"""
+
+from dataclasses import dataclass
+from typing import Collection, Optional
+
+MIB = 1024 * 1024
+HOST_MEMORY_RESERVE_MIN_MIB = 512
+CONTAINER_MEMORY_MIN_MIB = 128
+CONTAINER_CPUS_MIN = 0.25
+# Share of the Redis limit for the dataset, the rest covers the AOF rewrite and fragmentation
+REDIS_MAXMEMORY_FRACTION = 0.75
+
+
+@dataclass
+class ContainerResourceWeight:
+    """Weighting of a single compose service.
+
+    Attributes:
+        memory: Relative share of the memory available to containers.
+        cpu: Fraction of the host CPUs the service may use (hard cap).
+        reservation: Fraction of the memory limit that is reserved for the service.
+        pids_limit: Maximum number of processes inside the container.
+    """
+
+    memory: float
+    cpu: float
+    reservation: float
+    pids_limit: int
+
+
+@dataclass
+class ContainerResourceLimits:
+    """Computed limits of a single compose service.
+
+    Attributes:
+        mem_limit_mib: Hard memory limit in MiB.
+        mem_reservation_mib: Soft memory reservation in MiB.
+        cpus: Number of CPUs the service may use.
+        pids_limit: Maximum number of processes inside the container.
+    """
+
+    mem_limit_mib: int
+    mem_reservation_mib: int
+    cpus: float
+    pids_limit: int
+
+
+# Postgres may use every CPU and has its whole limit reserved; the other services
+# are capped so at least a quarter of the CPU time always stays available to it.
+# PgBouncer and Valkey (the redis service) run mostly on a single thread.
+DEFAULT_CONTAINER_RESOURCE_WEIGHTS: dict[str, ContainerResourceWeight] = {
+    "postgres": ContainerResourceWeight(memory=0.5, cpu=1.0, reservation=1.0, pids_limit=512),
+    "gitea": ContainerResourceWeight(memory=0.35, cpu=0.5, reservation=0.5, pids_limit=1024),
+    "pgadmin": ContainerResourceWeight(memory=0.15, cpu=0.25, reservation=0.25, pids_limit=256),
+    "pgbouncer": ContainerResourceWeight(memory=0.02, cpu=0.25, reservation=0.5, pids_limit=64),
+    "redis": ContainerResourceWeight(memory=0.08, cpu=0.25, reservation=0.5, pids_limit=64),
+}
+
+
+def compute_container_resource_limits(
+    memory_total_bytes: int,
+    cpu_count: int,
+    weights: Optional[dict[str, ContainerResourceWeight]] = None,
+    disabled: Collection[str] = (),
+) -> dict[str, ContainerResourceLimits]:
+    """Compute per-service limits from the host capacity.
+
+    An eighth of the host memory (at least 512 MiB) is left to the host itself,
+    the rest is split between the services proportionally to their memory weight.
+    Disabled services take no share and get the minimum limits, which only keep
+    their compose definition valid.
+
+    Args:
+        memory_total_bytes: Total host memory in bytes.
+        cpu_count: Number of logical host CPUs.
+        weights: Per-service weighting, defaults to DEFAULT_CONTAINER_RESOURCE_WEIGHTS.
+        disabled: Services whose compose profile is turned off.
+
+    Returns:
+        dict[str, ContainerResourceLimits]: Limits keyed by compose service name.
+    """
+    weights = DEFAULT_CONTAINER_RESOURCE_WEIGHTS if weights is None else weights
+    total_mib = memory_total_bytes // MIB
+    host_reserve_mib = max(HOST_MEMORY_RESERVE_MIN_MIB, total_mib // 8)
+    enabled = {service: weight for service, weight in weights.items() if service not in disabled}
+    available_mib = max(total_mib - host_reserve_mib, CONTAINER_MEMORY_MIN_MIB * len(enabled))
+    memory_weight_sum = sum(weight.memory for weight in enabled.values()) or 1.0
+    cpu_count = max(cpu_count, 1)
+
+    limits: dict[str, ContainerResourceLimits] = {}
+    for service, weight in weights.items():
+        mem_limit_mib, cpus = CONTAINER_MEMORY_MIN_MIB, CONTAINER_CPUS_MIN
+        if service in enabled:
+            mem_limit_mib = max(
+                mem_limit_mib, int(available_mib * weight.memory / memory_weight_sum)
+            )
+            cpus = min(float(cpu_count), max(cpus, round(cpu_count * weight.cpu, 2)))
+        limits[service] = ContainerResourceLimits(
+            mem_limit_mib=mem_limit_mib,
+            mem_reservation_mib=int(mem_limit_mib * min(weight.reservation, 1.0)),
+            cpus=cpus,
+            pids_limit=weight.pids_limit,
+        )
+
+    return limits
+
+
+def render_container_resource_limits(
+    content: str, limits: dict[str, ContainerResourceLimits]
+) -> str:
+    """Replace the resource placeholders of the compose template.
+
+    For every service the {{<SERVICE>_MEM_LIMIT}}, {{<SERVICE>_MEM_RESERVATION}},
+    {{<SERVICE>_CPUS}} and {{<SERVICE>_PIDS_LIMIT}} placeholders are replaced, and
+    {{REDIS_MAXMEMORY}} keeps the Valkey dataset within its container limit.
+
+    Args:
+        content: Compose template content.
+        limits: Limits keyed by compose service name.
+
+    Returns:
+        str: Content with the placeholders replaced.
+    """
+    result = content
+    for service, limit in limits.items():
+        prefix = service.upper()
+        result = result.replace(f"{{{{{prefix}_MEM_LIMIT}}}}", f"{limit.mem_limit_mib}m")
+        result = result.replace(
+            f"{{{{{prefix}_MEM_RESERVATION}}}}", f"{limit.mem_reservation_mib}m"
+        )
+        result = result.replace(f"{{{{{prefix}_CPUS}}}}", f"{limit.cpus:g}")
+        result = result.replace(f"{{{{{prefix}_PIDS_LIMIT}}}}", str(limit.pids_limit))
+    if "redis" in limits:
+        maxmemory_mib = int(limits["redis"].mem_limit_mib * REDIS_MAXMEMORY_FRACTION)
+        result = result.replace("{{REDIS_MAXMEMORY}}", f"{maxmemory_mib}mb")
+
+    return result
@@ -0,0 +1,41 @@
+"""Container restarts deferred until the Compose stack is up.
+
+Tasks that rewrite a bind-mounted configuration file run before the stack is
+brought up, when the new dependencies of the file (such as PgBouncer or Redis)
+are not running yet. They leave a marker per container instead, and the
+orchestration restarts the marked containers after `docker compose up`.
+"""
+
+CONTAINER_RESTART_DIR = "/run/container-restart"
+
+
+def request_container_restart_command(container: str) -> str:
+    """Build the command marking a container for a restart after the stack is up.
+
+    Args:
+        container: Name of the container whose configuration changed.
+
+    Returns:
+        str: Shell command leaving the marker.
+    """
+    return (
+        f"sudo mkdir -p {CONTAINER_RESTART_DIR} && sudo touch {CONTAINER_RESTART_DIR}/{container}"
+    )
+
+
+def restart_requested_containers_command() -> str:
+    """Build the command restarting every marked container that is running.
+
+    A container that is not running picks up its configuration when it starts,
+    so only its marker is cleared.
+
+    Returns:
+        str: Shell command restarting the containers and clearing their markers.
+    """
+    return (
+        f"for marker in {CONTAINER_RESTART_DIR}/*; do "
+        'test -f "$marker" || continue; name=$(basename "$marker"); '
+        'if [ -n "$(sudo docker ps -q --filter "name=^${name}$")" ]; then '
+        'sudo docker restart "$name" >/dev/null || exit 1; fi; '
+        'sudo rm -f "$marker"; done'
+    )
@@ -3,6 +3,8 @@
 Creates directories and docker-compose configuration for Docker services.
 """
 
+from typing import Optional
+
 from packages_engine.models import OperationResult
 from packages_engine.models.configuration import ConfigurationContent, ConfigurationData
 from packages_engine.services.configuration.configuration_content_reader import (
@@ -10,15 +12,33 @@ from packages_engine.services.configuration.configuration_content_reader import
 )
 from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
 from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.host_resources import HostResourcesServiceContract
 from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
 
+from .compose_profiles import compose_profiles
+from .connection_pool import compute_connection_pool, render_connection_pool
+from .container_resource_limits import (
+    MIB,
+    ContainerResourceWeight,
+    compute_container_resource_limits,
+    render_container_resource_limits,
+)
+from .container_restart import request_container_restart_command
+from .postgres_tuning import compute_postgres_tuning, render_postgres_tuning
+
+POSTGRES_CONF = "/srv/postgres/conf/postgresql.conf"
+COMPOSE_ENV = "/srv/stack/.env"
+
 
 class DockerResourcesUbuntuConfigurationTask(ConfigurationTask):
     """Sets up Docker directories and compose configuration on Ubuntu.
 
     Creates service directories with proper permissions and deploys
-    docker-compose.yml configuration.
+    docker-compose.yml configuration with resource limits sized to the host,
+    together with the PostgreSQL settings matching its share of the host and
+    the Compose profiles of the optional services. Changed PostgreSQL settings
+    restart PostgreSQL after the stack is up.
     """
 
     def __init__(
@@ -27,6 +47,8 @@ class DockerResourcesUbuntuConfigurationTask(ConfigurationTask):
         file_system: FileSystemServiceContract,
         notifications: NotificationsServiceContract,
         controller: PackageControllerServiceContract,
+        host_resources: HostResourcesServiceContract,
+        weights: Optional[dict[str, ContainerResourceWeight]] = None,
     ):
         """Initialize Docker resources task.
 
@@ -35,17 +57,24 @@ class DockerResourcesUbuntuConfigurationTask(ConfigurationTask):
             file_system: Service for file operations.
             notifications: Service for user notifications.
             controller: Service for executing system commands.
+            host_resources: Service for detecting host memory and CPUs.
+            weights: Per-service resource weighting, defaults to
+                DEFAULT_CONTAINER_RESOURCE_WEIGHTS.
         """
         self.reader = reader
         self.file_system = file_system
         self.notifications = notifications
         self.controller = controller
+        self.host_resources = host_resources
+        self.weights = weights
 
     def configure(self, data: ConfigurationData) -> OperationResult[bool]:
         """Create Docker directories and deploy compose configuration.
 
         Creates directories for postgres, gitea, and pgadmin with proper
-        ownership, then writes docker-compose.yml from template.
+        ownership, then writes docker-compose.yml from template with
+        container resource limits computed from the host memory and CPUs,
+        and postgresql.conf tuned for the PostgreSQL limits and disk type.
 
         Args:
             data: Configuration data including server data directory path.
@@ -61,11 +90,14 @@ class DockerResourcesUbuntuConfigurationTask(ConfigurationTask):
                 "sudo install -d -m 0755 /srv/stack",
                 # postgres (UID:GID 999:999 is what the official image uses)
                 "sudo install -d -m 0700 -o 999 -g 999 /srv/postgres/data",
+                "sudo install -d -m 0755 /srv/postgres/conf",
                 # gitea (rootless: 1000:1000; separate data and config)
                 "sudo install -d -m 0750 -o 1000 -g 1000 /srv/gitea/data",
                 "sudo install -d -m 0750 -o 1000 -g 1000 /srv/gitea/config",
                 # pgadmin (5050:5050)
                 "sudo install -d -m 0750 -o 5050 -g 5050 /srv/pgadmin/data",
+                # redis-compatible store (valkey image runs as 999:1000)
+                "sudo install -d -m 0750 -o 999 -g 1000 /srv/redis/data",
             ]
         )
         if not fix_dirs.success:
@@ -85,20 +117,83 @@ class DockerResourcesUbuntuConfigurationTask(ConfigurationTask):
             return read_result.as_fail()
         self.notifications.success("\tReading Docker Config template data succeeded.")
 
-        self.notifications.info("Writing Docker configuration.")
-        write_result = self.file_system.write_text(
-            "/srv/stack/docker-compose.yml", read_result.data
+        self.notifications.info("Detecting host capacity.")
+        memory_result = self.host_resources.memory_total_bytes()
+        if not memory_result.success or memory_result.data is None:
+            self.notifications.error("\tDetecting host capacity failed.")
+            return memory_result.as_fail()
+        cpu_count = self.host_resources.cpu_count()
+        rotational = self.host_resources.storage_is_rotational()
+        self.notifications.success(
+            f"\tDetected {memory_result.data // MIB} MiB of memory, {cpu_count} CPUs "
+            f"and {'rotational' if rotational else 'SSD'} storage."
         )
+        disabled = [profile for profile, enabled in compose_profiles(data).items() if not enabled]
+        limits = compute_container_resource_limits(
+            memory_result.data, cpu_count, self.weights, disabled
+        )
+        postgres_limits = limits.get("postgres")
+        postgres_tuning = compute_postgres_tuning(
+            postgres_limits.mem_limit_mib if postgres_limits else memory_result.data // MIB,
+            cpu_count,
+            rotational,
+        )
+        connection_pool = compute_connection_pool(
+            postgres_tuning.max_connections, cpu_count, data.pgbouncer_enabled
+        )
+        compose_content = render_container_resource_limits(read_result.data, limits)
+        compose_content = render_postgres_tuning(compose_content, postgres_tuning)
+        compose_content = render_connection_pool(compose_content, connection_pool)
+
+        self.notifications.info("Writing Docker configuration.")
+        write_result = self.file_system.write_text("/srv/stack/docker-compose.yml", compose_content)
         if not write_result.success:
             self.notifications.error("\tWriting Docker configuration failed.")
             return write_result.as_fail()
         self.notifications.success("\tWriting Docker configuration succeeded.")
 
+        self.notifications.info("Writing Docker Compose profiles.")
+        profiles = [profile for profile, enabled in compose_profiles(data).items() if enabled]
+        env_result = self.file_system.write_text(
+            COMPOSE_ENV, f"COMPOSE_PROFILES={','.join(profiles)}\n"
+        )
+        if not env_result.success:
+            self.notifications.error("\tWriting Docker Compose profiles failed.")
+            return env_result.as_fail()
+        self.notifications.success("\tWriting Docker Compose profiles succeeded.")
+
+        self.notifications.info("Reading PostgreSQL tuning template data.")
+        postgres_read_result = self.reader.read(
+            ConfigurationContent.RAW_STRING,
+            data,
+            f"/usr/local/share/{data.server_data_dir}/data/postgres/postgresql.conf",
+        )
+        if not postgres_read_result.success or postgres_read_result.data is None:
+            self.notifications.error("\tReading PostgreSQL tuning template data failed.")
+            return postgres_read_result.as_fail()
+        self.notifications.success("\tReading PostgreSQL tuning template data succeeded.")
+
+        self.notifications.info("Writing PostgreSQL tuning.")
+        postgres_content = render_postgres_tuning(postgres_read_result.data, postgres_tuning)
+        # A running PostgreSQL keeps its settings until it is restarted
+        postgres_changed = self.file_system.path_exists(POSTGRES_CONF) and (
+            self.file_system.read_text(POSTGRES_CONF).data != postgres_content
+        )
+        postgres_write_result = self.file_system.write_text(POSTGRES_CONF, postgres_content)
+        if not postgres_write_result.success:
+            self.notifications.error("\tWriting PostgreSQL tuning failed.")
+            return postgres_write_result.as_fail()
+        self.notifications.success("\tWriting PostgreSQL tuning succeeded.")
+
         self.notifications.info("Fixing Docker configuration permissions.")
         perm_res = self.controller.run_raw_commands(
             [
                 "sudo chown root:root /srv/stack/docker-compose.yml",
                 "sudo chmod 0644 /srv/stack/docker-compose.yml",
+                f"sudo chown root:root {COMPOSE_ENV}",
+                f"sudo chmod 0600 {COMPOSE_ENV}",
+                f"sudo chown root:root {POSTGRES_CONF}",
+                f"sudo chmod 0644 {POSTGRES_CONF}",
             ]
         )
         if not perm_res.success:
@@ -106,4 +201,13 @@ class DockerResourcesUbuntuConfigurationTask(ConfigurationTask):
             return perm_res.as_fail()
         self.notifications.success("Fixing Docker configuration permissions successful.")
 
+        if postgres_changed:
+            self.notifications.info("Will restart PostgreSQL once the stack is up.")
+            restart_result = self.controller.run_raw_commands(
+                [request_container_restart_command("postgres")]
+            )
+            if not restart_result.success:
+                self.notifications.error("\tRequesting the PostgreSQL restart failed.")
+                return restart_result.as_fail()
+
         return OperationResult[bool].succeed(True)
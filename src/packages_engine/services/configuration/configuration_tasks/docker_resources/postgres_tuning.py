@@ -0,0 +1,134 @@
+"""PostgreSQL settings derived from the memory, CPUs and disk type available to it.
+
+Follows the usual sizing rules (a quarter of the memory for shared buffers,
+three quarters as effective cache, work memory split between connections)
+instead of the stock settings meant for a 256MB machine.
+"""
+
+from dataclasses import dataclass
+
+POSTGRES_MAX_CONNECTIONS = 100
+SHARED_BUFFERS_MIN_MIB = 128
+SHM_SIZE_MIN_MIB = 256
+
+
+@dataclass
+class PostgresTuning:
+    """Computed PostgreSQL settings.
+
+    Attributes:
+        max_connections: Maximum number of client connections.
+        shared_buffers_mib: Shared buffer pool size in MiB.
+        effective_cache_size_mib: Planner estimate of the available cache in MiB.
+        work_mem_mib: Memory per sort/hash operation in MiB.
+        maintenance_work_mem_mib: Memory for vacuum and index builds in MiB.
+        min_wal_size_mib: WAL size kept for recycling in MiB.
+        max_wal_size_mib: WAL size triggering a checkpoint in MiB.
+        random_page_cost: Planner cost of a random page fetch.
+        effective_io_concurrency: Number of concurrent disk I/O operations.
+        max_worker_processes: Maximum number of background processes.
+        max_parallel_workers: Maximum number of parallel workers.
+        max_parallel_workers_per_gather: Maximum parallel workers of a single query.
+        max_parallel_maintenance_workers: Maximum parallel workers of a maintenance command.
+        autovacuum_max_workers: Maximum number of autovacuum workers.
+        autovacuum_vacuum_cost_limit: Autovacuum I/O budget per round.
+        shm_size_mib: Size of the container /dev/shm in MiB.
+    """
+
+    max_connections: int
+    shared_buffers_mib: int
+    effective_cache_size_mib: int
+    work_mem_mib: int
+    maintenance_work_mem_mib: int
+    min_wal_size_mib: int
+    max_wal_size_mib: int
+    random_page_cost: float
+    effective_io_concurrency: int
+    max_worker_processes: int
+    max_parallel_workers: int
+    max_parallel_workers_per_gather: int
+    max_parallel_maintenance_workers: int
+    autovacuum_max_workers: int
+    autovacuum_vacuum_cost_limit: int
+    shm_size_mib: int
+
+
+def compute_postgres_tuning(memory_mib: int, cpu_count: int, rotational: bool) -> PostgresTuning:
+    """Compute PostgreSQL settings.
+
+    Args:
+        memory_mib: Memory available to PostgreSQL (its container limit) in MiB.
+        cpu_count: Number of CPUs available to PostgreSQL.
+        rotational: Whether the data lives on rotational disks.
+
+    Returns:
+        PostgresTuning: Settings to render into postgresql.conf and the compose file.
+    """
+    cpu_count = max(cpu_count, 1)
+    shared_buffers_mib = max(SHARED_BUFFERS_MIN_MIB, memory_mib // 4)
+    work_mem_mib = max(4, (memory_mib - shared_buffers_mib) // (POSTGRES_MAX_CONNECTIONS * 3))
+    if memory_mib >= 8192:
+        max_wal_size_mib = 4096
+    elif memory_mib >= 2048:
+        max_wal_size_mib = 2048
+    else:
+        max_wal_size_mib = 1024
+    parallel_per_operation = min(4, max(1, cpu_count // 2))
+
+    return PostgresTuning(
+        max_connections=POSTGRES_MAX_CONNECTIONS,
+        shared_buffers_mib=shared_buffers_mib,
+        effective_cache_size_mib=max(256, memory_mib * 3 // 4),
+        work_mem_mib=work_mem_mib,
+        maintenance_work_mem_mib=min(2048, max(64, memory_mib // 16)),
+        min_wal_size_mib=max_wal_size_mib // 4,
+        max_wal_size_mib=max_wal_size_mib,
+        random_page_cost=4.0 if rotational else 1.1,
+        effective_io_concurrency=2 if rotational else 200,
+        max_worker_processes=max(8, cpu_count),
+        max_parallel_workers=cpu_count,
+        max_parallel_workers_per_gather=parallel_per_operation,
+        max_parallel_maintenance_workers=parallel_per_operation,
+        autovacuum_max_workers=max(3, min(6, cpu_count // 2)),
+        autovacuum_vacuum_cost_limit=200 if rotational else 1000,
+        shm_size_mib=max(SHM_SIZE_MIN_MIB, shared_buffers_mib),
+    )
+
+
+def render_postgres_tuning(content: str, tuning: PostgresTuning) -> str:
+    """Replace the {{POSTGRES_*}} tuning placeholders.
+
+    Memory settings are rendered in PostgreSQL units (MB) except
+    {{POSTGRES_SHM_SIZE}}, which uses the compose notation.
+
+    Args:
+        content: Template content.
+        tuning: Computed settings.
+
+    Returns:
+        str: Content with the placeholders replaced.
+    """
+    values = {
+        "MAX_CONNECTIONS": str(tuning.max_connections),
+        "SHARED_BUFFERS": f"{tuning.shared_buffers_mib}MB",
+        "EFFECTIVE_CACHE_SIZE": f"{tuning.effective_cache_size_mib}MB",
+        "WORK_MEM": f"{tuning.work_mem_mib}MB",
+        "MAINTENANCE_WORK_MEM": f"{tuning.maintenance_work_mem_mib}MB",
+        "MIN_WAL_SIZE": f"{tuning.min_wal_size_mib}MB",
+        "MAX_WAL_SIZE": f"{tuning.max_wal_size_mib}MB",
+        "RANDOM_PAGE_COST": f"{tuning.random_page_cost:g}",
+        "EFFECTIVE_IO_CONCURRENCY": str(tuning.effective_io_concurrency),
+        "MAX_WORKER_PROCESSES": str(tuning.max_worker_processes),
+        "MAX_PARALLEL_WORKERS": str(tuning.max_parallel_workers),
+        "MAX_PARALLEL_WORKERS_PER_GATHER": str(tuning.max_parallel_workers_per_gather),
+        "MAX_PARALLEL_MAINTENANCE_WORKERS": str(tuning.max_parallel_maintenance_workers),
+        "AUTOVACUUM_MAX_WORKERS": str(tuning.autovacuum_max_workers),
+        "AUTOVACUUM_VACUUM_COST_LIMIT": str(tuning.autovacuum_vacuum_cost_limit),
+        "SHM_SIZE": f"{tuning.shm_size_mib}m",
+    }
+
+    result = content
+    for key, value in values.items():
+        result = result.replace(f"{{{{POSTGRES_{key}}}}}", value)
+
+    return result
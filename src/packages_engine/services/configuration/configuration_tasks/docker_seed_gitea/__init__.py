@@ -3,14 +3,18 @@
 Initializes Gitea configuration files for Docker deployments.
 """
 
+from .app_ini import set_ini_values
 from .docker_seed_gitea_ubuntu_configuration_task import (
     DockerSeedGiteaUbuntuConfigurationTask,
 )
 from .docker_seed_gitea_windows_configuration_task import (
     DockerSeedGiteaWindowsConfigurationTask,
 )
+from .gitea_performance_profile import gitea_performance_profile
 
 __all__ = [
+    "set_ini_values",
+    "gitea_performance_profile",
     "DockerSeedGiteaUbuntuConfigurationTask",
     "DockerSeedGiteaWindowsConfigurationTask",
 ]
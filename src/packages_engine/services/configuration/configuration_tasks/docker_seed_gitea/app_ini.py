@@ -0,0 +1,61 @@
+"""Helpers for updating Gitea app.ini content in place.
+
+Gitea rewrites app.ini itself (installation, environment-to-ini), so managed
+settings are merged into the existing file instead of replacing it.
+"""
+
+import re
+
+
+def set_ini_values(content: str, section: str, values: dict[str, str]) -> str:
+    """Set keys of an ini section, keeping the rest of the content untouched.
+
+    Existing keys (matched case-insensitively) are rewritten in place, missing
+    keys are appended to the end of the section and a missing section is
+    appended to the end of the content.
+
+    Args:
+        content: Current app.ini content.
+        section: Section name without brackets.
+        values: Keys and values to set.
+
+    Returns:
+        str: Updated content.
+    """
+    lines = content.splitlines()
+    pending = {key.upper(): (key, value) for key, value in values.items()}
+    in_section = False
+    section_end = -1
+    result: list[str] = []
+
+    for line in lines:
+        header = re.match(r"^\s*\[([^\]]+)\]\s*$", line)
+        if header:
+            if in_section:
+                section_end = len(result)
+            in_section = header.group(1).strip() == section
+        elif in_section:
+            key_match = re.match(r"^\s*([^=;#\s]+)\s*=", line)
+            if key_match and key_match.group(1).upper() in pending:
+                key, value = pending.pop(key_match.group(1).upper())
+                line = f"{key} = {value}"
+        result.append(line)
+
+    section_found = in_section or section_end >= 0
+    if in_section:
+        section_end = len(result)
+
+    missing = [f"{key} = {value}" for key, value in pending.values()]
+    if missing:
+        if section_found:
+            # keep blank lines separating the next section after the inserted keys
+            while section_end > 0 and result[section_end - 1].strip() == "":
+                section_end -= 1
+            result[section_end:section_end] = missing
+        else:
+            if result and result[-1].strip() != "":
+                result.append("")
+            result.append(f"[{section}]")
+            result.extend(missing)
+
+    return "\n".join(result) + "\n"
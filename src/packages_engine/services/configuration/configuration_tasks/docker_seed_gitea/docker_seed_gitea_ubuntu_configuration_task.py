@@ -1,6 +1,7 @@
 """Ubuntu configuration task for seeding Gitea app.ini.
 
-Creates initial Gitea configuration file if it doesn't exist.
+Creates initial Gitea configuration file if it doesn't exist and keeps the
+managed database pool settings and performance profile up to date.
 """
 
 from packages_engine.models import OperationResult
@@ -9,16 +10,28 @@ from packages_engine.services.configuration.configuration_content_reader import
     ConfigurationContentReaderServiceContract,
 )
 from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+from packages_engine.services.configuration.configuration_tasks.docker_resources import (
+    POSTGRES_MAX_CONNECTIONS,
+    compute_connection_pool,
+    request_container_restart_command,
+)
 from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.host_resources import HostResourcesServiceContract
 from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
 
+from .app_ini import set_ini_values
+from .gitea_performance_profile import gitea_performance_profile
+
 
 class DockerSeedGiteaUbuntuConfigurationTask(ConfigurationTask):
     """Seeds Gitea app.ini configuration on Ubuntu.
 
     Creates Gitea's app.ini from template if not present, ensuring
-    proper directory structure and permissions.
+    proper directory structure and permissions. The [database] connection
+    target, pool limits and the performance profile (cache, session, queue,
+    indexer, git timeouts, archive cleanup) are merged into the file on
+    every run, and a changed file restarts Gitea after the stack is up.
     """
 
     def __init__(
@@ -27,6 +40,7 @@ class DockerSeedGiteaUbuntuConfigurationTask(ConfigurationTask):
         file_system: FileSystemServiceContract,
         notifications: NotificationsServiceContract,
         controller: PackageControllerServiceContract,
+        host_resources: HostResourcesServiceContract,
     ):
         """Initialize the Gitea seeding task.
 
@@ -35,57 +49,88 @@ class DockerSeedGiteaUbuntuConfigurationTask(ConfigurationTask):
             file_system: Service for file operations.
             notifications: Service for user notifications.
             controller: Service for executing system commands.
+            host_resources: Service for detecting the CPUs the pool is sized for.
         """
         self.reader = reader
         self.file_system = file_system
         self.notifications = notifications
         self.controller = controller
+        self.host_resources = host_resources
 
     def configure(self, data: ConfigurationData) -> OperationResult[bool]:
-        """Create Gitea app.ini configuration if missing.
+        """Create Gitea app.ini configuration if missing and update managed settings.
 
-        Checks for existing config, reads template, creates directory structure,
-        writes config file, and sets proper ownership/permissions.
+        Checks for existing config, reads it or the template, creates directory
+        structure, merges the managed settings, writes the config file when
+        it changed, and sets proper ownership/permissions.
 
         Args:
             data: Configuration data including server data directory path.
 
         Returns:
-            OperationResult[bool]: Success if config exists or was created.
+            OperationResult[bool]: Success if config is up to date or was written.
         """
         self.notifications.info("Seeding Gitea app.ini if missing.")
 
         gitea_ini_path = "/srv/gitea/config/app.ini"
         self.notifications.info("Will check Gitea configuration and create it if needed.")
-        if self.file_system.path_exists(gitea_ini_path):
-            self.notifications.success(
-                "\tGitea configuration exists already. Nothing needs to be done."
+        config_exists = self.file_system.path_exists(gitea_ini_path)
+        if config_exists:
+            current_result = self.file_system.read_text(gitea_ini_path)
+            if not current_result.success or current_result.data is None:
+                self.notifications.error("\tFailed to read existing Gitea configuration.")
+                return current_result.as_fail()
+            content = current_result.data
+        else:
+            self.notifications.info("Will read Gitea configurations template.")
+            appini_tmpl = self.reader.read(
+                ConfigurationContent.RAW_STRING,
+                data,
+                f"/usr/local/share/{data.server_data_dir}/data/gitea/app.ini",
             )
-            return OperationResult[bool].succeed(True)
-
-        self.notifications.info("Will read Gitea configurations template.")
-        appini_tmpl = self.reader.read(
-            ConfigurationContent.RAW_STRING,
-            data,
-            f"/usr/local/share/{data.server_data_dir}/data/gitea/app.ini",
-        )
 
-        if not appini_tmpl.success or appini_tmpl.data is None:
-            self.notifications.error("\tFailed to read gitea/app.ini template.")
-            return appini_tmpl.as_fail()
-        self.notifications.success("\tReading Gitea configurations template succeeded.")
+            if not appini_tmpl.success or appini_tmpl.data is None:
+                self.notifications.error("\tFailed to read gitea/app.ini template.")
+                return appini_tmpl.as_fail()
+            self.notifications.success("\tReading Gitea configurations template succeeded.")
 
-        self.notifications.info("Will install Gitea path if it does not exist.")
-        install_result = self.controller.run_raw_commands(
-            ["umask 0137 && install -d -m 0750 -o 1000 -g 1000 /srv/gitea/config"]
+            self.notifications.info("Will install Gitea path if it does not exist.")
+            install_result = self.controller.run_raw_commands(
+                ["umask 0137 && install -d -m 0750 -o 1000 -g 1000 /srv/gitea/config"]
+            )
+            if not install_result.success:
+                self.notifications.error("\tInstall failed.")
+                return install_result.as_fail()
+            self.notifications.success("\tInstall succeeded.")
+            content = appini_tmpl.data
+
+        pool = compute_connection_pool(
+            POSTGRES_MAX_CONNECTIONS, self.host_resources.cpu_count(), data.pgbouncer_enabled
         )
-        if not install_result.success:
-            self.notifications.error("\tInstall failed.")
-            return install_result.as_fail()
-        self.notifications.success("\tInstall succeeded.")
-
-        self.notifications.info("Gitea configuration does not exist. Will create it now.")
-        write_result = self.file_system.write_text(gitea_ini_path, appini_tmpl.data)
+        managed_sections = {
+            "database": {
+                "HOST": "pgbouncer:6432" if data.pgbouncer_enabled else "postgres:5432",
+                "MAX_OPEN_CONNS": str(pool.gitea_max_open_conns),
+                "MAX_IDLE_CONNS": str(pool.gitea_max_idle_conns),
+                "CONN_MAX_LIFETIME": pool.gitea_conn_max_lifetime,
+            },
+            **gitea_performance_profile(data.gitea_redis_enabled),
+        }
+        updated_content = content
+        for section, values in managed_sections.items():
+            updated_content = set_ini_values(updated_content, section, values)
+
+        if config_exists:
+            if updated_content == content:
+                self.notifications.success(
+                    "\tGitea configuration exists already. Nothing needs to be done."
+                )
+                return OperationResult[bool].succeed(True)
+            self.notifications.info("Gitea configuration exists. Will update managed settings.")
+        else:
+            self.notifications.info("Gitea configuration does not exist. Will create it now.")
+
+        write_result = self.file_system.write_text(gitea_ini_path, updated_content)
         if not write_result.success:
             self.notifications.error("\tFailed storing Gitea configuration.")
             return write_result.as_fail()
@@ -102,4 +147,14 @@ class DockerSeedGiteaUbuntuConfigurationTask(ConfigurationTask):
             return process_result.as_fail()
         self.notifications.success("\tProcessing succeeded.")
 
+        if config_exists:
+            # Gitea reads app.ini only at startup
+            self.notifications.info("Will restart Gitea once the stack is up.")
+            restart_result = self.controller.run_raw_commands(
+                [request_container_restart_command("gitea")]
+            )
+            if not restart_result.success:
+                self.notifications.error("\tRequesting the Gitea restart failed.")
+                return restart_result.as_fail()
+
         return OperationResult[bool].succeed(True)
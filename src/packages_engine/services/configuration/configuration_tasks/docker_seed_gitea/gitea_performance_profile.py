@@ -0,0 +1,65 @@
+"""Gitea performance profile merged into app.ini.
+
+Covers the cache, session and queue backends, the code and issue indexers,
+git operation timeouts and the repository archive cleanup cron. Every key
+is set for both backends so switching Redis off reverts Gitea to the local
+adapters on the next run.
+"""
+
+REDIS_URL = "redis://redis:6379"
+
+
+def gitea_performance_profile(redis_enabled: bool) -> dict[str, dict[str, str]]:
+    """Build the app.ini sections of the performance profile.
+
+    Args:
+        redis_enabled: Whether the Redis-compatible service is part of the stack.
+
+    Returns:
+        dict[str, dict[str, str]]: Keys and values per app.ini section.
+    """
+    if redis_enabled:
+        cache = {
+            "ADAPTER": "redis",
+            "HOST": f"{REDIS_URL}/0?pool_size=100&idle_timeout=180s",
+            "ITEM_TTL": "16h",
+        }
+        session = {"PROVIDER": "redis", "PROVIDER_CONFIG": f"{REDIS_URL}/1"}
+        queue = {"TYPE": "redis", "CONN_STR": f"{REDIS_URL}/2"}
+    else:
+        # in-process LRU instead of the unbounded default memory adapter
+        cache = {
+            "ADAPTER": "twoqueue",
+            "HOST": '{"size":50000,"recent_ratio":0.25,"ghost_ratio":0.5}',
+            "ITEM_TTL": "16h",
+        }
+        session = {"PROVIDER": "file", "PROVIDER_CONFIG": "data/sessions"}
+        queue = {"TYPE": "level", "CONN_STR": ""}
+
+    return {
+        "cache": cache,
+        "session": session,
+        "queue": {**queue, "LENGTH": "100000", "BATCH_LENGTH": "20"},
+        "indexer": {
+            "ISSUE_INDEXER_TYPE": "bleve",
+            "REPO_INDEXER_ENABLED": "true",
+            "REPO_INDEXER_TYPE": "bleve",
+            "REPO_INDEXER_PATH": "indexers/repos.bleve",
+            "REPO_INDEXER_EXCLUDE_VENDORED": "true",
+            "MAX_FILE_SIZE": "1048576",
+        },
+        "git.timeout": {
+            "DEFAULT": "360",
+            "MIGRATE": "600",
+            "MIRROR": "300",
+            "CLONE": "300",
+            "PULL": "300",
+            "GC": "120",
+        },
+        "cron.archive_cleanup": {
+            "ENABLED": "true",
+            "RUN_AT_START": "true",
+            "SCHEDULE": "@midnight",
+            "OLDER_THAN": "24h",
+        },
+    }
@@ -0,0 +1,30 @@
+"""Network stack tuning configuration tasks.
+
+Tunes the kernel network stack for WireGuard throughput.
+"""
+
+from .network_tuning import (
+    NETWORK_TUNING_MODULES,
+    NETWORK_TUNING_SYSCTL_PATH,
+    compute_network_tuning,
+    default_route_interface,
+    render_sysctl_profile,
+    render_udp_gro_forwarding,
+    sysctl_proc_path,
+    sysctl_value_differs,
+)
+from .network_tuning_ubuntu_configuration_task import NetworkTuningUbuntuConfigurationTask
+from .network_tuning_windows_configuration_task import NetworkTuningWindowsConfigurationTask
+
+__all__ = [
+    "NETWORK_TUNING_MODULES",
+    "NETWORK_TUNING_SYSCTL_PATH",
+    "compute_network_tuning",
+    "default_route_interface",
+    "render_sysctl_profile",
+    "render_udp_gro_forwarding",
+    "sysctl_proc_path",
+    "sysctl_value_differs",
+    "NetworkTuningUbuntuConfigurationTask",
+    "NetworkTuningWindowsConfigurationTask",
+]
@@ -0,0 +1,131 @@
+"""Network stack tuning for WireGuard throughput.
+
+Socket buffer ceilings follow the host memory, the conntrack table follows
+the expected number of VPN peers (capped by memory), and BBR with the fq
+qdisc replaces CUBIC for the TCP connections carried over the tunnel.
+Live values are read from /proc/sys so only keys that differ are applied.
+"""
+
+MIB = 1024 * 1024
+
+NETWORK_TUNING_SYSCTL_PATH = "/etc/sysctl.d/60-network-tuning.conf"
+NETWORK_TUNING_MODULES_PATH = "/etc/modules-load.d/network-tuning.conf"
+NETWORK_TUNING_MODULES = ["tcp_bbr", "sch_fq", "nf_conntrack"]
+PROC_SYS_DIR = "/proc/sys"
+PROC_NET_ROUTE_PATH = "/proc/net/route"
+
+SOCKET_BUFFER_MEMORY_SHARE = 256
+SOCKET_BUFFER_MIN_BYTES = 4 * MIB
+SOCKET_BUFFER_MAX_BYTES = 64 * MIB
+NETDEV_MAX_BACKLOG = 16384
+CONNTRACK_ENTRIES_PER_PEER = 16384
+CONNTRACK_MIN_ENTRIES = 65536
+# About 320 bytes per entry; the table may take up to ~2% of the memory
+CONNTRACK_MEMORY_BYTES_PER_ENTRY = 16384
+CONNTRACK_TCP_ESTABLISHED_TIMEOUT = 86400
+CONNTRACK_TCP_TIME_WAIT_TIMEOUT = 30
+
+
+def compute_network_tuning(memory_bytes: int, peers: int) -> dict[str, str]:
+    """Compute the sysctl settings of the network tuning profile.
+
+    Args:
+        memory_bytes: Total memory of the host.
+        peers: Expected number of WireGuard peers.
+
+    Returns:
+        dict[str, str]: sysctl keys and values in the order they are rendered.
+    """
+    buffer_max = min(
+        SOCKET_BUFFER_MAX_BYTES,
+        max(SOCKET_BUFFER_MIN_BYTES, memory_bytes // SOCKET_BUFFER_MEMORY_SHARE),
+    )
+    conntrack_max = min(
+        max(CONNTRACK_MIN_ENTRIES, peers * CONNTRACK_ENTRIES_PER_PEER),
+        max(CONNTRACK_MIN_ENTRIES, memory_bytes // CONNTRACK_MEMORY_BYTES_PER_ENTRY),
+    )
+    return {
+        "net.core.rmem_max": str(buffer_max),
+        "net.core.wmem_max": str(buffer_max),
+        "net.ipv4.tcp_rmem": f"4096 131072 {buffer_max}",
+        "net.ipv4.tcp_wmem": f"4096 16384 {buffer_max}",
+        "net.core.netdev_max_backlog": str(NETDEV_MAX_BACKLOG),
+        "net.core.default_qdisc": "fq",
+        "net.ipv4.tcp_congestion_control": "bbr",
+        "net.ipv4.tcp_mtu_probing": "1",
+        "net.ipv4.tcp_slow_start_after_idle": "0",
+        "net.netfilter.nf_conntrack_max": str(conntrack_max),
+        "net.netfilter.nf_conntrack_buckets": str(conntrack_max // 4),
+        "net.netfilter.nf_conntrack_tcp_timeout_established": str(
+            CONNTRACK_TCP_ESTABLISHED_TIMEOUT
+        ),
+        "net.netfilter.nf_conntrack_tcp_timeout_time_wait": str(CONNTRACK_TCP_TIME_WAIT_TIMEOUT),
+    }
+
+
+def render_sysctl_profile(settings: dict[str, str]) -> str:
+    """Render the /etc/sysctl.d profile.
+
+    Args:
+        settings: sysctl keys and values.
+
+    Returns:
+        str: Profile content.
+    """
+    lines = ["# Network tuning for WireGuard throughput; generated by the configurator."]
+    lines.extend(f"{key} = {value}" for key, value in settings.items())
+    return "\n".join(lines) + "\n"
+
+
+def sysctl_proc_path(key: str) -> str:
+    """Map a sysctl key to its /proc/sys file.
+
+    Args:
+        key: Dotted sysctl key.
+
+    Returns:
+        str: Path of the file holding the live value.
+    """
+    return f"{PROC_SYS_DIR}/{key.replace('.', '/')}"
+
+
+def sysctl_value_differs(live: str, value: str) -> bool:
+    """Compare a live /proc/sys value with the desired one.
+
+    Args:
+        live: Content of the /proc/sys file; multi-value keys are tab separated.
+        value: Desired value from the profile.
+
+    Returns:
+        bool: True if the value has to be applied.
+    """
+    return live.split() != value.split()
+
+
+def default_route_interface(route_table: str) -> str:
+    """Find the uplink interface in /proc/net/route.
+
+    Args:
+        route_table: Content of /proc/net/route.
+
+    Returns:
+        str: Interface of the IPv4 default route, empty if there is none.
+    """
+    for line in route_table.splitlines()[1:]:
+        fields = line.split()
+        if len(fields) >= 8 and fields[1] == "00000000" and fields[7] == "00000000":
+            return fields[0]
+    return ""
+
+
+def render_udp_gro_forwarding(content: str, uplink: str) -> str:
+    """Replace the {{NETWORK_UPLINK}} placeholder.
+
+    Args:
+        content: Template content.
+        uplink: Uplink interface name.
+
+    Returns:
+        str: Content with the placeholder replaced.
+    """
+    return content.replace("{{NETWORK_UPLINK}}", uplink)
@@ -0,0 +1,173 @@
+"""Network stack tuning configuration task for Ubuntu systems."""
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationContent, ConfigurationData
+from packages_engine.services.configuration.configuration_content_reader import (
+    ConfigurationContentReaderServiceContract,
+)
+from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.host_resources import HostResourcesServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.package_controller import PackageControllerServiceContract
+
+from .network_tuning import (
+    MIB,
+    NETWORK_TUNING_MODULES,
+    NETWORK_TUNING_MODULES_PATH,
+    NETWORK_TUNING_SYSCTL_PATH,
+    PROC_NET_ROUTE_PATH,
+    compute_network_tuning,
+    default_route_interface,
+    render_sysctl_profile,
+    render_udp_gro_forwarding,
+    sysctl_proc_path,
+    sysctl_value_differs,
+)
+
+UDP_GRO_FORWARDING_UNIT = "udp-gro-forwarding.service"
+
+
+class NetworkTuningUbuntuConfigurationTask(ConfigurationTask):
+    """Tunes socket buffers, queueing, congestion control and conntrack for the VPN.
+
+    The sysctl profile is sized from the host memory and the number of
+    WireGuard clients. Only the keys whose live /proc/sys value differs are
+    applied, and UDP GRO forwarding is enabled on the uplink by a oneshot unit.
+    """
+
+    def __init__(
+        self,
+        reader: ConfigurationContentReaderServiceContract,
+        file_system: FileSystemServiceContract,
+        notifications: NotificationsServiceContract,
+        controller: PackageControllerServiceContract,
+        host_resources: HostResourcesServiceContract,
+    ):
+        """Initialize the network tuning task.
+
+        Args:
+            reader: Service for reading configuration templates.
+            file_system: Service for file operations and /proc reads.
+            notifications: Service for user notifications.
+            controller: Service for executing system commands.
+            host_resources: Service for detecting the host memory.
+        """
+        self.reader = reader
+        self.file_system = file_system
+        self.notifications = notifications
+        self.controller = controller
+        self.host_resources = host_resources
+
+    def configure(self, data: ConfigurationData) -> OperationResult[bool]:
+        """Write and apply the network tuning profile.
+
+        Args:
+            data: Configuration data with the number of WireGuard clients.
+
+        Returns:
+            OperationResult[bool]: Success if the profile is written and live.
+        """
+        self.notifications.info("Tuning the network stack for WireGuard throughput.")
+        memory_result = self.host_resources.memory_total_bytes()
+        if not memory_result.success or memory_result.data is None:
+            self.notifications.error("\tDetecting host memory failed.")
+            return memory_result.as_fail()
+        settings = compute_network_tuning(memory_result.data, data.num_wireguard_clients)
+        self.notifications.success(
+            f"\tSized for {memory_result.data // MIB} MiB of memory "
+            f"and {data.num_wireguard_clients} peers."
+        )
+
+        write_profile = self.file_system.write_text(
+            NETWORK_TUNING_SYSCTL_PATH, render_sysctl_profile(settings)
+        )
+        if not write_profile.success:
+            self.notifications.error(f"\tWriting {NETWORK_TUNING_SYSCTL_PATH} failed.")
+            return write_profile.as_fail()
+        write_modules = self.file_system.write_text(
+            NETWORK_TUNING_MODULES_PATH, "\n".join(NETWORK_TUNING_MODULES) + "\n"
+        )
+        if not write_modules.success:
+            self.notifications.error(f"\tWriting {NETWORK_TUNING_MODULES_PATH} failed.")
+            return write_modules.as_fail()
+
+        self.notifications.info("Loading network tuning modules.")
+        # Modules built into the kernel are not an error
+        modules_result = self.controller.run_raw_commands(
+            [f"sudo modprobe {module} || true" for module in NETWORK_TUNING_MODULES]
+        )
+        if not modules_result.success:
+            self.notifications.error("\tLoading network tuning modules failed.")
+            return modules_result.as_fail()
+        self.notifications.success("\tLoading network tuning modules succeeded.")
+
+        apply_result = self._apply_changed_settings(settings)
+        if not apply_result.success:
+            return apply_result.as_fail()
+
+        return self._enable_udp_gro_forwarding(data)
+
+    def _apply_changed_settings(self, settings: dict[str, str]) -> OperationResult[bool]:
+        changed = {}
+        for key, value in settings.items():
+            live = self.file_system.read_text(sysctl_proc_path(key))
+            if not live.success or live.data is None or sysctl_value_differs(live.data, value):
+                changed[key] = value
+
+        if not changed:
+            self.notifications.success(f"\tAll {len(settings)} network settings are already live.")
+            return OperationResult[bool].succeed(True)
+
+        self.notifications.info(f"Applying {len(changed)} of {len(settings)} network settings.")
+        apply_result = self.controller.run_raw_commands(
+            [f"sudo sysctl -q -w '{key}={value}'" for key, value in changed.items()]
+        )
+        if not apply_result.success:
+            self.notifications.error("\tApplying network settings failed.")
+            return apply_result.as_fail()
+        self.notifications.success("\tApplying network settings succeeded.")
+        return OperationResult[bool].succeed(True)
+
+    def _enable_udp_gro_forwarding(self, data: ConfigurationData) -> OperationResult[bool]:
+        route_result = self.file_system.read_text(PROC_NET_ROUTE_PATH)
+        uplink = (
+            default_route_interface(route_result.data)
+            if route_result.success and route_result.data is not None
+            else ""
+        )
+        if not uplink:
+            self.notifications.warning("\tNo default route found. UDP GRO forwarding skipped.")
+            return OperationResult[bool].succeed(True)
+
+        self.notifications.info(f"Enabling UDP GRO forwarding on {uplink}.")
+        template_result = self.reader.read(
+            ConfigurationContent.RAW_STRING,
+            data,
+            f"/usr/local/share/{data.server_data_dir}/data/systemd/{UDP_GRO_FORWARDING_UNIT}",
+        )
+        if not template_result.success or template_result.data is None:
+            self.notifications.error(f"\tReading {UDP_GRO_FORWARDING_UNIT} template failed.")
+            return template_result.as_fail()
+
+        write_result = self.file_system.write_text(
+            f"/etc/systemd/system/{UDP_GRO_FORWARDING_UNIT}",
+            render_udp_gro_forwarding(template_result.data, uplink),
+        )
+        if not write_result.success:
+            self.notifications.error(f"\tWriting {UDP_GRO_FORWARDING_UNIT} failed.")
+            return write_result.as_fail()
+
+        unit_result = self.controller.run_raw_commands(
+            [
+                "sudo systemctl daemon-reload",
+                f"sudo systemctl enable {UDP_GRO_FORWARDING_UNIT}",
+                f"sudo systemctl restart {UDP_GRO_FORWARDING_UNIT}",
+            ]
+        )
+        if not unit_result.success:
+            self.notifications.error("\tEnabling UDP GRO forwarding failed.")
+            return unit_result.as_fail()
+        self.notifications.success("\tEnabling UDP GRO forwarding succeeded.")
+
+        return OperationResult[bool].succeed(True)
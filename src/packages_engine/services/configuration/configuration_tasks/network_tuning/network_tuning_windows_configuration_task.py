@@ -0,0 +1,20 @@
+"""Windows network tuning configuration. Network tuning for Windows is not currently supported."""
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+
+
+class NetworkTuningWindowsConfigurationTask(ConfigurationTask):
+    """Network tuning configuration for Windows (not implemented)."""
+
+    def configure(self, data: ConfigurationData) -> OperationResult[bool]:
+        """Tune the network stack on Windows.
+
+        Args:
+            data: Unused configuration data.
+
+        Returns:
+            Always returns failure indicating Windows is not supported.
+        """
+        return OperationResult[bool].fail("Not supported")
@@ -3,7 +3,44 @@
 Configures nftables firewall rules and policies.
 """
 
+from .client_policy import (
+    CLIENT_POLICY_CHAINS,
+    HOST_FW_CLIENTS_PATH,
+    ClientPolicy,
+    client_policies,
+    render_client_elements,
+)
 from .nftables_ubuntu_configuration_task import NftablesUbuntuConfigurationTask
 from .nftables_windows_configuration_task import NftablesWindowsConfigurationTask
+from .tcp_forwarding import (
+    FORWARD_BRIDGE,
+    FORWARD_NETWORK,
+    FORWARD_SUBNET,
+    GITEA_FORWARD_ADDRESS,
+    POSTGRES_FORWARD_ADDRESS,
+    TCP_FORWARDING_TABLE,
+    forward_network_commands,
+    render_tcp_forwarding,
+    tcp_forwarding_policy_rules,
+    tcp_forwarding_rules,
+)
 
-__all__ = ["NftablesUbuntuConfigurationTask", "NftablesWindowsConfigurationTask"]
+__all__ = [
+    "CLIENT_POLICY_CHAINS",
+    "HOST_FW_CLIENTS_PATH",
+    "ClientPolicy",
+    "client_policies",
+    "render_client_elements",
+    "FORWARD_BRIDGE",
+    "FORWARD_NETWORK",
+    "FORWARD_SUBNET",
+    "GITEA_FORWARD_ADDRESS",
+    "POSTGRES_FORWARD_ADDRESS",
+    "TCP_FORWARDING_TABLE",
+    "forward_network_commands",
+    "render_tcp_forwarding",
+    "tcp_forwarding_policy_rules",
+    "tcp_forwarding_rules",
+    "NftablesUbuntuConfigurationTask",
+    "NftablesWindowsConfigurationTask",
+]
@@ -0,0 +1,76 @@
+"""Per-client firewall policy generated from the configured WireGuard clients.
+
+The host_fw table declares a `wg_clients` address set and a `client_policy`
+verdict map. Their elements are rendered into a separate file that flushes
+and refills both in one transaction, so adding or removing a client only
+changes set elements and the rules themselves are never reloaded. Lookups
+in the set and the map cost the same however many clients there are.
+"""
+
+from dataclasses import dataclass
+
+from packages_engine.models.configuration import ConfigurationData
+
+HOST_FW_CLIENTS_PATH = "/etc/nftables.d/20-host-fw-clients.nft"
+CLIENT_SET = "wg_clients"
+CLIENT_POLICY_MAP = "client_policy"
+# Policy name -> chain of 10-host-fw.nft holding the ports it may reach
+CLIENT_POLICY_CHAINS = {"admin": "admin_client", "member": "member_client"}
+
+
+@dataclass
+class ClientPolicy:
+    """Firewall policy of a single WireGuard client.
+
+    Attributes:
+        name: Client name from the configuration.
+        address: Address assigned to the client on wg0.
+        policy: Key of CLIENT_POLICY_CHAINS.
+    """
+
+    name: str
+    address: str
+    policy: str
+
+
+def client_policies(data: ConfigurationData) -> list[ClientPolicy]:
+    """List the WireGuard clients with their firewall policy.
+
+    Addresses follow the WireGuard peer generation (10.10.0.2 upwards). The
+    first client is the administrator; the others are members.
+
+    Args:
+        data: Configuration data with the WireGuard client names.
+
+    Returns:
+        list[ClientPolicy]: One entry per configured client.
+    """
+    return [
+        ClientPolicy(name, f"10.10.0.{index + 2}", "admin" if index == 0 else "member")
+        for index, name in enumerate(data.wireguard_client_names)
+    ]
+
+
+def render_client_elements(policies: list[ClientPolicy]) -> str:
+    """Render the nft script replacing the client set and verdict map elements.
+
+    Args:
+        policies: Client policies to load.
+
+    Returns:
+        str: nft script applied with `nft -f`.
+    """
+    lines = [
+        "#!/usr/sbin/nft -f",
+        "# Generated from the configured WireGuard clients; do not edit.",
+        f"flush set inet host_fw {CLIENT_SET}",
+        f"flush map inet host_fw {CLIENT_POLICY_MAP}",
+    ]
+    if policies:
+        addresses = ", ".join(policy.address for policy in policies)
+        verdicts = ", ".join(
+            f"{policy.address} : jump {CLIENT_POLICY_CHAINS[policy.policy]}" for policy in policies
+        )
+        lines.append(f"add element inet host_fw {CLIENT_SET} {{ {addresses} }}")
+        lines.append(f"add element inet host_fw {CLIENT_POLICY_MAP} {{ {verdicts} }}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,130 @@
+"""Tracking of the host firewall ruleset applied to the kernel.
+
+10-host-fw.nft is a transaction script (`add table`, `flush table`, then the
+full definition), so `nft -f` replaces the rules in a single atomic commit
+without a window where the table is missing. After applying it the checksum
+of the script and a normalized `nft -j list table inet host_fw` snapshot are
+recorded. A later run whose rendered script has the same checksum and whose
+live table still matches the snapshot has nothing to apply.
+
+The checksum is compared through the file system service, so a simulated or
+planned host without the recorded state reads as changed. Only the live
+snapshot needs a command, which saves it to a file and never fails.
+"""
+
+import hashlib
+
+from packages_engine.models import OperationResult
+from packages_engine.services.file_system import FileSystemServiceContract
+
+HOST_FW_RULES_PATH = "/etc/nftables.d/10-host-fw.nft"
+HOST_FW_STATE_DIR = "/var/lib/host-fw"
+HOST_FW_CHECKSUM_PATH = f"{HOST_FW_STATE_DIR}/applied.sha256"
+HOST_FW_SNAPSHOT_PATH = f"{HOST_FW_STATE_DIR}/applied.json"
+HOST_FW_LIVE_DIR = "/run/host-fw"
+HOST_FW_LIVE_SNAPSHOT_PATH = f"{HOST_FW_LIVE_DIR}/live.json"
+
+# Handles change on every commit and set elements are managed separately
+_SNAPSHOT_FILTER = (
+    '[.nftables[] | select(has("metainfo") | not) '
+    '| if has("set") then .set |= del(.elem) elif has("map") then .map |= del(.elem) else . end] '
+    '| walk(if type == "object" then del(.handle) else . end)'
+)
+_SNAPSHOT_COMMAND = f"sudo nft -j list table inet host_fw 2>/dev/null | jq -S '{_SNAPSHOT_FILTER}'"
+
+
+def rules_checksum(rules: str) -> str:
+    """Checksum of a rendered rules script, as `sha256sum` prints it for the file.
+
+    Args:
+        rules: The rendered 10-host-fw.nft.
+
+    Returns:
+        str: Hex encoded SHA-256 of the script.
+    """
+    return hashlib.sha256(rules.encode("utf-8")).hexdigest()
+
+
+def rules_checksum_matches(file_system: FileSystemServiceContract, rules: str) -> bool:
+    """Check whether the rendered rules are the ones applied by the last run.
+
+    Args:
+        file_system: Service for file operations.
+        rules: The rendered 10-host-fw.nft.
+
+    Returns:
+        bool: True if the recorded checksum equals the checksum of the rules.
+    """
+    recorded = _read(file_system, HOST_FW_CHECKSUM_PATH)
+    if recorded is None or not recorded.split():
+        return False
+    return recorded.split()[0] == rules_checksum(rules)
+
+
+def snapshot_live_ruleset_command() -> str:
+    """Command saving the normalized live table for live_ruleset_matches.
+
+    Returns:
+        str: Shell command writing HOST_FW_LIVE_SNAPSHOT_PATH, succeeding even
+        when the table is missing (the snapshot is then empty).
+    """
+    return (
+        f"sudo install -d -m 0700 {HOST_FW_LIVE_DIR} && "
+        f"{{ {_SNAPSHOT_COMMAND} | sudo tee {HOST_FW_LIVE_SNAPSHOT_PATH} >/dev/null; }} || true"
+    )
+
+
+def live_ruleset_matches(file_system: FileSystemServiceContract) -> bool:
+    """Check whether the live table saved by snapshot_live_ruleset_command is the applied one.
+
+    The live snapshot is removed once read, so a stale one is never compared.
+
+    Args:
+        file_system: Service for file operations.
+
+    Returns:
+        bool: True if both snapshots exist, are not empty and are equal.
+    """
+    live = _read(file_system, HOST_FW_LIVE_SNAPSHOT_PATH)
+    if live is not None:
+        file_system.remove_location(HOST_FW_LIVE_SNAPSHOT_PATH)
+    applied = _read(file_system, HOST_FW_SNAPSHOT_PATH)
+    return bool(live and live.strip()) and live == applied
+
+
+def record_ruleset_commands() -> list[str]:
+    """Commands recording the table snapshot of the rules that were just applied.
+
+    The checksum is written with write_ruleset_checksum once they succeeded.
+
+    Returns:
+        list[str]: Shell commands writing the table snapshot.
+    """
+    return [
+        f"sudo install -d -m 0700 {HOST_FW_STATE_DIR}",
+        f"{_SNAPSHOT_COMMAND} | sudo tee {HOST_FW_SNAPSHOT_PATH} >/dev/null",
+    ]
+
+
+def write_ruleset_checksum(
+    file_system: FileSystemServiceContract, rules: str
+) -> OperationResult[bool]:
+    """Record the checksum of the applied rules in the `sha256sum` format.
+
+    Args:
+        file_system: Service for file operations.
+        rules: The rendered 10-host-fw.nft that was applied.
+
+    Returns:
+        OperationResult[bool]: Result of the write.
+    """
+    return file_system.write_text(
+        HOST_FW_CHECKSUM_PATH, f"{rules_checksum(rules)}  {HOST_FW_RULES_PATH}\n"
+    )
+
+
+def _read(file_system: FileSystemServiceContract, path: str) -> str | None:
+    if not file_system.path_exists(path):
+        return None
+    read_result = file_system.read_text(path)
+    return read_result.data if read_result.success else None
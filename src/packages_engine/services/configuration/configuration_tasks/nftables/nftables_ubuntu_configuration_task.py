@@ -10,6 +10,17 @@ from packages_engine.services.file_system import FileSystemServiceContract
 from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
 
+from .client_policy import HOST_FW_CLIENTS_PATH, client_policies, render_client_elements
+from .host_fw_state import (
+    HOST_FW_RULES_PATH,
+    live_ruleset_matches,
+    record_ruleset_commands,
+    rules_checksum_matches,
+    snapshot_live_ruleset_command,
+    write_ruleset_checksum,
+)
+from .tcp_forwarding import render_tcp_forwarding
+
 
 class NftablesUbuntuConfigurationTask(ConfigurationTask):
     """Configures nftables firewall with host rules, sysctl settings, and iptables-nft backend."""
@@ -37,6 +48,14 @@ class NftablesUbuntuConfigurationTask(ConfigurationTask):
     def configure(self, data: ConfigurationData) -> OperationResult[bool]:
         """Configure nftables by setting up rules, enabling IP forwarding, and configuring iptables backend.
 
+        In the `kernel` TCP forwarding mode a nat table forwarding PostgreSQL and
+        Git SSH from the VPN to the containers is rendered into the rules. The
+        client set and verdict map are refilled from the configured WireGuard
+        clients on every run. The rules and the client elements are applied
+        together in one atomic `nft -f /etc/nftables.conf` commit, and
+        everything but the client elements is skipped when the live table
+        already matches the rendered rules.
+
         Args:
             data: Configuration data containing server settings and template paths
 
@@ -71,12 +90,35 @@ class NftablesUbuntuConfigurationTask(ConfigurationTask):
             return write_main.as_fail()
 
         # Write your host rules
-        write_host = self.file_system.write_text("/etc/nftables.d/10-host-fw.nft", read_result.data)
+        rules = render_tcp_forwarding(read_result.data, data)
+        write_host = self.file_system.write_text(HOST_FW_RULES_PATH, rules)
         if not write_host.success:
-            self.notifications.error("\tWriting /etc/nftables.d/10-host-fw.nft failed.")
+            self.notifications.error(f"\tWriting {HOST_FW_RULES_PATH} failed.")
             return write_host.as_fail()
+
+        # Client set and verdict map elements, applied without reloading the rules
+        write_clients = self.file_system.write_text(
+            HOST_FW_CLIENTS_PATH, render_client_elements(client_policies(data))
+        )
+        if not write_clients.success:
+            self.notifications.error(f"\tWriting {HOST_FW_CLIENTS_PATH} failed.")
+            return write_clients.as_fail()
         self.notifications.success("\tNftables files written.")
 
+        self.notifications.info("Comparing host-fw rules with the live ruleset.")
+        if self._rules_unchanged(rules):
+            self.notifications.success(
+                "\tHost-fw rules are up to date. Updating client elements only."
+            )
+            # Flush and refill the client elements in one transaction
+            elements_res = self.controller.run_raw_commands([f"sudo nft -f {HOST_FW_CLIENTS_PATH}"])
+            if not elements_res.success:
+                self.notifications.error("\tUpdating client elements failed.")
+                return elements_res.as_fail()
+            self.notifications.success("\tUpdating client elements succeeded.")
+            return OperationResult[bool].succeed(True)
+        self.notifications.info("\tHost-fw rules changed. Will apply them.")
+
         # Apply system settings (forwarding/bridge visibility) — optional but useful
         self.notifications.info("Applying sysctl/module settings.")
         sysctl_res = self.controller.run_raw_commands(
@@ -109,25 +151,35 @@ class NftablesUbuntuConfigurationTask(ConfigurationTask):
             return alt_res.as_fail()
         self.notifications.success("\tSetting iptables alternatives succeeded.")
 
-        # Validate then load ONLY your table (don’t restart the service yet)
+        # Validate, then replace the rules and refill the client set and map in a single atomic
+        # transaction, so the table flush never leaves the clients out (no delete/recreate gap)
         self.notifications.info("\tLoading nft rules.")
         apply_res = self.controller.run_raw_commands(
             [
-                # If table exists, delete it to avoid “File exists” on reload
-                'sudo nft list tables | grep -q "table inet host_fw" && sudo nft delete table inet host_fw || true',
-                "sudo nft -c -f /etc/nftables.d/10-host-fw.nft",
-                "sudo nft -f /etc/nftables.d/10-host-fw.nft",
+                "sudo nft -c -f /etc/nftables.conf",
+                "sudo nft -f /etc/nftables.conf",
+                # Remember what was applied so unchanged reconfigures skip this step
+                *record_ruleset_commands(),
                 # Enable persistence on reboot (service will load /etc/nftables.conf which includes *.nft)
                 "sudo systemctl enable nftables",
                 "sudo ufw disable || true",
-                # Do NOT restart nftables here: it would try to load /etc/nftables.conf again
-                # and might error if it re-runs 'add table' while live. We already applied above.
+                # Do NOT restart nftables here: the transaction above already replaced the live tables.
             ]
         )
         if not apply_res.success:
             self.notifications.error("\tLoading nft rules failed.")
             return apply_res.as_fail()
+        checksum_res = write_ruleset_checksum(self.file_system, rules)
+        if not checksum_res.success:
+            self.notifications.error("\tRecording the host-fw rules checksum failed.")
+            return checksum_res.as_fail()
         self.notifications.success("\tLoading nft rules succeeded.")
 
         self.notifications.success("\tNftables configured successfully (Docker-safe).")
         return OperationResult[bool].succeed(True)
+
+    def _rules_unchanged(self, rules: str) -> bool:
+        if not rules_checksum_matches(self.file_system, rules):
+            return False
+        snapshot_res = self.controller.run_raw_commands([snapshot_live_ruleset_command()])
+        return snapshot_res.success and live_ruleset_matches(self.file_system)
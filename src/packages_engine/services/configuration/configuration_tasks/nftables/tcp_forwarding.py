@@ -0,0 +1,120 @@
+"""Kernel forwarding of PostgreSQL and Git SSH from the VPN to the containers.
+
+In `kernel` mode the nginx stream relays are replaced by DNAT rules, so the
+bytes of long-running database sessions and Git transfers are forwarded by
+the kernel instead of being copied through nginx workers. The targets are
+fixed addresses on the `vpn-forward` Docker network; loopback published
+ports cannot be used because Docker runs without the userland proxy. Which
+clients may open forwarded connections is decided by the `client_policy`
+verdict map of the host_fw table, before the addresses are translated.
+"""
+
+from packages_engine.models.configuration import ConfigurationData
+
+TCP_FORWARDING_TABLE = "tcp_forwarding"
+FORWARD_NETWORK = "vpn-forward"
+FORWARD_SUBNET = "172.30.10.0/24"
+FORWARD_BRIDGE = "br-vpnfwd"
+POSTGRES_FORWARD_ADDRESS = "172.30.10.10"
+GITEA_FORWARD_ADDRESS = "172.30.10.12"
+GITEA_SSH_CONTAINER_PORT = 22
+FORWARDED_PORTS = "{ 5432, 2222 }"
+
+
+def forward_network_commands() -> list[str]:
+    """Commands creating the forwarding network and admitting translated VPN traffic.
+
+    Docker drops new connections into its bridges unless they target published
+    ports, so connections translated by the nat table are accepted in
+    DOCKER-USER. The rule is not persistent and is re-added on every start.
+
+    Returns:
+        list[str]: Idempotent shell commands.
+    """
+    rule = f"DOCKER-USER -i wg0 -o {FORWARD_BRIDGE} -m conntrack --ctstate DNAT -j ACCEPT"
+    return [
+        f"sudo docker network inspect {FORWARD_NETWORK} >/dev/null 2>&1 || "
+        f"sudo docker network create --driver bridge --subnet {FORWARD_SUBNET} "
+        f"-o com.docker.network.bridge.name={FORWARD_BRIDGE} {FORWARD_NETWORK}",
+        f"sudo iptables -C {rule} 2>/dev/null || sudo iptables -I {rule}",
+    ]
+
+
+def tcp_forwarding_rules(data: ConfigurationData) -> str:
+    """Build the nat table forwarding PostgreSQL and Git SSH to the containers.
+
+    Args:
+        data: Configuration data with the forwarding mode.
+
+    Returns:
+        str: nft transaction statements replacing the table in the `kernel` mode
+        and removing it in any other mode.
+    """
+    if data.tcp_forwarding_mode != "kernel":
+        # `add` first so the delete also succeeds when the table does not exist
+        return f"""
+add table ip {TCP_FORWARDING_TABLE}
+delete table ip {TCP_FORWARDING_TABLE}
+"""
+
+    gitea_ssh = f"{GITEA_FORWARD_ADDRESS}:{GITEA_SSH_CONTAINER_PORT}"
+    return f"""
+# PostgreSQL and Git SSH forwarded by the kernel (tcp_forwarding_mode = kernel)
+add table ip {TCP_FORWARDING_TABLE}
+flush table ip {TCP_FORWARDING_TABLE}
+
+table ip {TCP_FORWARDING_TABLE} {{
+  chain prerouting {{
+    type nat hook prerouting priority dstnat; policy accept;
+
+    # Clients were already checked against client_policy by the host_fw forward_policy chain
+    iifname "wg0" ip daddr 10.10.0.1 tcp dport 5432 dnat to {POSTGRES_FORWARD_ADDRESS}:5432
+    iifname "wg0" ip daddr 10.10.0.1 tcp dport 2222 dnat to {gitea_ssh}
+  }}
+
+  chain forward {{
+    type filter hook forward priority filter; policy accept;
+
+    # Only connections translated above may reach the forwarded containers from the VPN
+    iifname "wg0" oifname "{FORWARD_BRIDGE}" ct status dnat accept
+    iifname "wg0" oifname "{FORWARD_BRIDGE}" drop
+  }}
+}}
+"""
+
+
+def tcp_forwarding_policy_rules(data: ConfigurationData) -> str:
+    """Build the rules of the host_fw forward_policy chain.
+
+    The chain runs before the nat table, so the ports are still the ones the
+    client connected to and the policy chains of client_policy apply as they
+    do for the input hook. Only new connections are looked up.
+
+    Args:
+        data: Configuration data with the forwarding mode.
+
+    Returns:
+        str: Rules admitting the clients of client_policy to the forwarded ports
+        in the `kernel` mode, no rules in any other mode.
+    """
+    if data.tcp_forwarding_mode != "kernel":
+        return ""
+
+    match = f'iifname "wg0" ip daddr 10.10.0.1 tcp dport {FORWARDED_PORTS} ct state new'
+    return f"""    {match} ip saddr vmap @client_policy
+    {match} drop
+"""
+
+
+def render_tcp_forwarding(content: str, data: ConfigurationData) -> str:
+    """Replace the {{NFT_TCP_FORWARDING}} and {{NFT_TCP_FORWARDING_POLICY}} placeholders.
+
+    Args:
+        content: Template content.
+        data: Configuration data with the forwarding mode.
+
+    Returns:
+        str: Content with the placeholder replaced.
+    """
+    result = content.replace("{{NFT_TCP_FORWARDING_POLICY}}", tcp_forwarding_policy_rules(data))
+    return result.replace("{{NFT_TCP_FORWARDING}}", tcp_forwarding_rules(data))
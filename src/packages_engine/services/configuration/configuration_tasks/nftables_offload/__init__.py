@@ -0,0 +1,22 @@
+"""Nftables flowtable offload configuration tasks.
+
+Offloads established flows between WireGuard and the Docker bridges.
+"""
+
+from .flowtable import (
+    NFTABLES_OFFLOAD_PATH,
+    flowtable_devices,
+    remove_flowtable_command,
+    render_flowtable,
+)
+from .nftables_offload_ubuntu_configuration_task import NftablesOffloadUbuntuConfigurationTask
+from .nftables_offload_windows_configuration_task import NftablesOffloadWindowsConfigurationTask
+
+__all__ = [
+    "NFTABLES_OFFLOAD_PATH",
+    "flowtable_devices",
+    "remove_flowtable_command",
+    "render_flowtable",
+    "NftablesOffloadUbuntuConfigurationTask",
+    "NftablesOffloadWindowsConfigurationTask",
+]
@@ -0,0 +1,77 @@
+"""Flowtable offload of the traffic between WireGuard and the Docker bridges.
+
+Once conntrack has accepted a connection in both directions, its packets are
+moved to a flowtable and forwarded from the ingress hook, skipping the
+forward chains, conntrack lookups and NAT evaluation. The table lives in its
+own file outside /etc/nftables.d: the flowtable can only be created after
+Docker has created the bridges it binds to.
+"""
+
+NFTABLES_OFFLOAD_PATH = "/etc/nftables-offload.nft"
+OFFLOAD_TABLE = "vpn_offload"
+FLOWTABLE = "vpn_fastpath"
+WIREGUARD_INTERFACE = "wg0"
+# Docker names the bridges of user-defined networks br-<network id> unless told otherwise
+DOCKER_BRIDGE_PREFIX = "br-"
+
+
+def flowtable_devices(interfaces: list[str]) -> list[str]:
+    """Select the interfaces the flowtable binds to.
+
+    Args:
+        interfaces: Network interfaces present on the host.
+
+    Returns:
+        list[str]: wg0 followed by the Docker bridges, or an empty list when
+        either side is missing and there is nothing to offload.
+    """
+    bridges = sorted(name for name in interfaces if name.startswith(DOCKER_BRIDGE_PREFIX))
+    if WIREGUARD_INTERFACE not in interfaces or not bridges:
+        return []
+    return [WIREGUARD_INTERFACE, *bridges]
+
+
+def render_flowtable(devices: list[str]) -> str:
+    """Render the nft script replacing the offload table.
+
+    Args:
+        devices: Interfaces returned by flowtable_devices.
+
+    Returns:
+        str: nft script applied with `nft -f` as a single transaction.
+    """
+    bridges = ", ".join(f'"{device}"' for device in devices[1:])
+    established = "meta l4proto { tcp, udp } ct state established"
+    wireguard = f'"{WIREGUARD_INTERFACE}"'
+    return f"""#!/usr/sbin/nft -f
+# Generated by the configurator from the interfaces present at configure time; do not edit.
+add table inet {OFFLOAD_TABLE}
+delete table inet {OFFLOAD_TABLE}
+
+table inet {OFFLOAD_TABLE} {{
+  flowtable {FLOWTABLE} {{
+    hook ingress priority filter;
+    devices = {{ {", ".join(devices)} }};
+  }}
+
+  chain forward {{
+    # After the Docker and host filter chains, so only accepted connections are offloaded
+    type filter hook forward priority filter + 10; policy accept;
+
+    {established} iifname {wireguard} oifname {{ {bridges} }} flow add @{FLOWTABLE}
+    {established} iifname {{ {bridges} }} oifname {wireguard} flow add @{FLOWTABLE}
+  }}
+}}
+"""
+
+
+def remove_flowtable_command() -> str:
+    """Command removing the offload table, whether or not it exists.
+
+    Returns:
+        str: Shell command applying a one-transaction removal.
+    """
+    return (
+        f"printf 'add table inet {OFFLOAD_TABLE}\\ndelete table inet {OFFLOAD_TABLE}\\n' "
+        "| sudo nft -f -"
+    )
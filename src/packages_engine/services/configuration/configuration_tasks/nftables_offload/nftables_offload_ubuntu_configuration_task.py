@@ -0,0 +1,94 @@
+"""Nftables flowtable offload configuration task for Ubuntu systems."""
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.host_resources import HostResourcesServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.package_controller import PackageControllerServiceContract
+
+from .flowtable import (
+    NFTABLES_OFFLOAD_PATH,
+    flowtable_devices,
+    remove_flowtable_command,
+    render_flowtable,
+)
+
+
+class NftablesOffloadUbuntuConfigurationTask(ConfigurationTask):
+    """Offloads established VPN to container flows to an nftables flowtable.
+
+    Runs after Docker orchestration so the bridges of the stack exist and
+    can be discovered from the host interfaces.
+    """
+
+    def __init__(
+        self,
+        file_system: FileSystemServiceContract,
+        notifications: NotificationsServiceContract,
+        controller: PackageControllerServiceContract,
+        host_resources: HostResourcesServiceContract,
+    ):
+        """Initialize the flowtable offload task.
+
+        Args:
+            file_system: Service for file system operations.
+            notifications: Service for user notifications.
+            controller: Service for executing system commands.
+            host_resources: Service for discovering the network interfaces.
+        """
+        self.file_system = file_system
+        self.notifications = notifications
+        self.controller = controller
+        self.host_resources = host_resources
+
+    def configure(self, data: ConfigurationData) -> OperationResult[bool]:
+        """Bind a flowtable to wg0 and the Docker bridges, or remove it when disabled.
+
+        Args:
+            data: Configuration data with the flowtable option.
+
+        Returns:
+            OperationResult[bool]: Success if the offload table is in the desired state.
+        """
+        if not data.flowtable_enabled:
+            self.notifications.info("Flowtable offload is disabled. Removing it if present.")
+            return self._remove()
+
+        self.notifications.info("Discovering WireGuard and Docker bridge interfaces.")
+        devices = flowtable_devices(self.host_resources.network_interfaces())
+        if not devices:
+            self.notifications.warning(
+                "\tNo WireGuard or Docker bridge interface found. Flowtable offload skipped."
+            )
+            return self._remove()
+        self.notifications.success(f"\tFlowtable devices: {', '.join(devices)}.")
+
+        write_result = self.file_system.write_text(NFTABLES_OFFLOAD_PATH, render_flowtable(devices))
+        if not write_result.success:
+            self.notifications.error(f"\tWriting {NFTABLES_OFFLOAD_PATH} failed.")
+            return write_result.as_fail()
+
+        self.notifications.info("Loading flowtable offload.")
+        load_result = self.controller.run_raw_commands(
+            [
+                f"sudo nft -c -f {NFTABLES_OFFLOAD_PATH}",
+                f"sudo nft -f {NFTABLES_OFFLOAD_PATH}",
+            ]
+        )
+        if not load_result.success:
+            self.notifications.error("\tLoading flowtable offload failed.")
+            return load_result.as_fail()
+        self.notifications.success("\tLoading flowtable offload succeeded.")
+
+        return OperationResult[bool].succeed(True)
+
+    def _remove(self) -> OperationResult[bool]:
+        remove_result = self.controller.run_raw_commands(
+            [remove_flowtable_command(), f"sudo rm -f {NFTABLES_OFFLOAD_PATH}"]
+        )
+        if not remove_result.success:
+            self.notifications.error("\tRemoving flowtable offload failed.")
+            return remove_result.as_fail()
+        return OperationResult[bool].succeed(True)
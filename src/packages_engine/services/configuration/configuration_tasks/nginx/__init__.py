@@ -3,7 +3,26 @@
 Configures Nginx reverse proxy and web server settings.
 """
 
+from .nginx_cache import (
+    NGINX_CACHE_DIR,
+    NGINX_STATIC_DIR,
+    NginxCache,
+    compute_nginx_cache,
+    render_nginx_cache,
+)
+from .nginx_tuning import NginxTuning, compute_nginx_tuning, render_nginx_tuning
 from .nginx_ubuntu_configuration_task import NginxUbuntuConfigurationTask
 from .nginx_windows_configuration_task import NginxWindowsConfigurationTask
 
-__all__ = ["NginxUbuntuConfigurationTask", "NginxWindowsConfigurationTask"]
+__all__ = [
+    "NGINX_CACHE_DIR",
+    "NGINX_STATIC_DIR",
+    "NginxCache",
+    "compute_nginx_cache",
+    "render_nginx_cache",
+    "NginxTuning",
+    "compute_nginx_tuning",
+    "render_nginx_tuning",
+    "NginxUbuntuConfigurationTask",
+    "NginxWindowsConfigurationTask",
+]
@@ -0,0 +1,63 @@
+"""Nginx proxy cache sizing derived from the free disk space.
+
+The cache takes a small share of the free space of the filesystem holding
+it, so a busy Gitea instance never fills the disk with cached responses.
+The keys zone is sized for the number of entries the cache can hold, about
+8000 keys per megabyte.
+"""
+
+from dataclasses import dataclass
+
+NGINX_CACHE_DIR = "/var/cache/nginx/gitea"
+NGINX_STATIC_DIR = "/var/lib/nginx/gitea-static"
+NGINX_CACHE_DISK_SHARE = 0.05
+NGINX_CACHE_MIN_MIB = 256
+NGINX_CACHE_MAX_MIB = 4096
+NGINX_CACHE_KEYS_ZONE_MIN_MIB = 8
+
+
+@dataclass
+class NginxCache:
+    """Computed nginx proxy cache sizes.
+
+    Attributes:
+        max_size_mib: Maximum size of the cached responses on disk.
+        keys_zone_mib: Shared memory zone holding the cache keys.
+    """
+
+    max_size_mib: int
+    keys_zone_mib: int
+
+
+def compute_nginx_cache(disk_free_bytes: int) -> NginxCache:
+    """Compute the nginx proxy cache sizes.
+
+    Args:
+        disk_free_bytes: Free space of the filesystem holding the cache directory.
+
+    Returns:
+        NginxCache: Sizes to render into the nginx templates.
+    """
+    share_mib = int(disk_free_bytes * NGINX_CACHE_DISK_SHARE) // (1024 * 1024)
+    max_size_mib = max(NGINX_CACHE_MIN_MIB, min(share_mib, NGINX_CACHE_MAX_MIB))
+
+    return NginxCache(
+        max_size_mib=max_size_mib,
+        keys_zone_mib=max(NGINX_CACHE_KEYS_ZONE_MIN_MIB, max_size_mib // 128),
+    )
+
+
+def render_nginx_cache(content: str, cache: NginxCache) -> str:
+    """Replace the {{NGINX_CACHE_*}} placeholders.
+
+    Args:
+        content: Template content.
+        cache: Computed cache sizes.
+
+    Returns:
+        str: Content with the placeholders replaced.
+    """
+    result = content.replace("{{NGINX_CACHE_MAX_SIZE}}", f"{cache.max_size_mib}m")
+    result = result.replace("{{NGINX_CACHE_KEYS_ZONE}}", f"{cache.keys_zone_mib}m")
+
+    return result
@@ -0,0 +1,85 @@
+"""Nginx worker and connection limits derived from the host.
+
+Every proxied request needs two descriptors (client and upstream), so the
+worker connection count is derived from the file descriptor limit instead
+of the distribution default of 768. The TLS session cache is sized for
+every connection the workers can hold, at about 4000 sessions per megabyte.
+"""
+
+from dataclasses import dataclass
+
+NGINX_RLIMIT_NOFILE_MAX = 65536
+NGINX_WORKER_CONNECTIONS_MIN = 1024
+NGINX_WORKER_CONNECTIONS_MAX = 16384
+NGINX_SSL_SESSIONS_PER_MIB = 4000
+NGINX_SSL_SESSION_CACHE_MIN_MIB = 10
+NGINX_SSL_SESSION_CACHE_MAX_MIB = 128
+
+
+@dataclass
+class NginxTuning:
+    """Computed nginx limits.
+
+    Attributes:
+        worker_processes: Number of worker processes.
+        worker_connections: Maximum simultaneous connections per worker.
+        worker_rlimit_nofile: Open files limit of each worker.
+        upstream_keepalive: Idle keepalive connections kept per upstream and worker.
+        ssl_session_cache_mib: Size of the TLS session cache shared by the workers.
+    """
+
+    worker_processes: int
+    worker_connections: int
+    worker_rlimit_nofile: int
+    upstream_keepalive: int
+    ssl_session_cache_mib: int
+
+
+def compute_nginx_tuning(cpu_count: int, open_files_limit: int) -> NginxTuning:
+    """Compute nginx limits.
+
+    Args:
+        cpu_count: Number of logical host CPUs.
+        open_files_limit: Hard open files limit nginx may raise its workers to.
+
+    Returns:
+        NginxTuning: Limits to render into the nginx templates.
+    """
+    cpu_count = max(cpu_count, 1)
+    worker_rlimit_nofile = max(
+        NGINX_WORKER_CONNECTIONS_MIN * 2, min(open_files_limit, NGINX_RLIMIT_NOFILE_MAX)
+    )
+    worker_connections = max(
+        NGINX_WORKER_CONNECTIONS_MIN,
+        min(worker_rlimit_nofile // 2, NGINX_WORKER_CONNECTIONS_MAX),
+    )
+    sessions_mib = -(-cpu_count * worker_connections // NGINX_SSL_SESSIONS_PER_MIB)
+
+    return NginxTuning(
+        worker_processes=cpu_count,
+        worker_connections=worker_connections,
+        worker_rlimit_nofile=worker_rlimit_nofile,
+        upstream_keepalive=max(16, min(128, cpu_count * 16)),
+        ssl_session_cache_mib=max(
+            NGINX_SSL_SESSION_CACHE_MIN_MIB, min(sessions_mib, NGINX_SSL_SESSION_CACHE_MAX_MIB)
+        ),
+    )
+
+
+def render_nginx_tuning(content: str, tuning: NginxTuning) -> str:
+    """Replace the {{NGINX_*}} tuning placeholders.
+
+    Args:
+        content: Template content.
+        tuning: Computed limits.
+
+    Returns:
+        str: Content with the placeholders replaced.
+    """
+    result = content.replace("{{NGINX_WORKER_PROCESSES}}", str(tuning.worker_processes))
+    result = result.replace("{{NGINX_WORKER_CONNECTIONS}}", str(tuning.worker_connections))
+    result = result.replace("{{NGINX_WORKER_RLIMIT_NOFILE}}", str(tuning.worker_rlimit_nofile))
+    result = result.replace("{{NGINX_UPSTREAM_KEEPALIVE}}", str(tuning.upstream_keepalive))
+    result = result.replace("{{NGINX_SSL_SESSION_CACHE}}", f"{tuning.ssl_session_cache_mib}m")
+
+    return result
@@ -9,9 +9,23 @@ from packages_engine.services.configuration.configuration_content_reader import
 )
 from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
 from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.host_resources import HostResourcesServiceContract
 from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
 
+from .nginx_cache import (
+    NGINX_CACHE_DIR,
+    NGINX_STATIC_DIR,
+    NginxCache,
+    compute_nginx_cache,
+    render_nginx_cache,
+)
+from .nginx_tuning import NginxTuning, compute_nginx_tuning, render_nginx_tuning
+
+NGINX_TICKET_KEY = "/etc/nginx/tls/ticket.current.key"
+NGINX_PREVIOUS_TICKET_KEY = "/etc/nginx/tls/ticket.previous.key"
+NGINX_TCP_FORWARDING_CONF = "/etc/nginx/stream.d/tcp-forwarding.conf"
+
 
 class NginxUbuntuConfigurationTask(ConfigurationTask):
     """Configures Nginx by deploying site configs (gitea, postgresql) and main nginx.conf."""
@@ -22,6 +36,7 @@ class NginxUbuntuConfigurationTask(ConfigurationTask):
         file_system: FileSystemServiceContract,
         notifications: NotificationsServiceContract,
         controller: PackageControllerServiceContract,
+        host_resources: HostResourcesServiceContract,
     ):
         """Initialize the Nginx configuration task.
 
@@ -30,15 +45,25 @@ class NginxUbuntuConfigurationTask(ConfigurationTask):
             file_system: Service for file system operations
             notifications: Service for user notifications
             controller: Service for executing system commands
+            host_resources: Service for detecting CPUs, file descriptor limits and free disk space
         """
         self.reader = reader
         self.file_system = file_system
         self.notifications = notifications
         self.controller = controller
+        self.host_resources = host_resources
 
     def configure(self, data: ConfigurationData) -> OperationResult[bool]:
         """Configure Nginx by writing config files, enabling sites, validating, and reloading.
 
+        Worker processes, worker connections, the worker file descriptor limit
+        and upstream keepalive pools are sized from the host CPUs and open
+        files limit. The Gitea proxy cache is sized from the free disk space
+        and Gitea's static assets are extracted and precompressed so nginx
+        serves them from disk. TLS session ticket keys are created once and
+        rotated daily by a systemd timer. The PostgreSQL and Git SSH stream
+        relays are only installed in the `proxy` TCP forwarding mode.
+
         Args:
             data: Configuration data containing server settings and template paths
 
@@ -46,41 +71,89 @@ class NginxUbuntuConfigurationTask(ConfigurationTask):
             OperationResult[bool]: Success if Nginx is configured and reloaded, failure otherwise
         """
         self.notifications.info("Configuring Nginx.")
+        tuning = compute_nginx_tuning(
+            self.host_resources.cpu_count(), self.host_resources.open_files_limit()
+        )
+        cache = compute_nginx_cache(self.host_resources.disk_free_bytes(NGINX_CACHE_DIR))
+
+        sites = [
+            {
+                "template_path": f"/usr/local/share/{data.server_data_dir}/data/nginx/sites-available/gitea.app",
+                "destination_path": "/etc/nginx/sites-available/gitea.app",
+            },
+            {
+                "template_path": f"/usr/local/share/{data.server_data_dir}/data/nginx/sites-available/postgresql.app",
+                "destination_path": "/etc/nginx/sites-available/postgresql.app",
+            },
+            {
+                "template_path": f"/usr/local/share/{data.server_data_dir}/data/nginx/nginx.conf",
+                "destination_path": "/etc/nginx/nginx.conf",
+            },
+            {
+                "template_path": f"/usr/local/share/{data.server_data_dir}/data/systemd/nginx-ticket-keys.service",
+                "destination_path": "/etc/systemd/system/nginx-ticket-keys.service",
+            },
+            {
+                "template_path": f"/usr/local/share/{data.server_data_dir}/data/systemd/nginx-ticket-keys.timer",
+                "destination_path": "/etc/systemd/system/nginx-ticket-keys.timer",
+            },
+        ]
+        if data.tcp_forwarding_mode == "proxy":
+            sites.append(
+                {
+                    "template_path": f"/usr/local/share/{data.server_data_dir}/data/nginx/stream.d/tcp-forwarding.conf",
+                    "destination_path": NGINX_TCP_FORWARDING_CONF,
+                }
+            )
 
         self.notifications.info("Replacing Nginx configurations.")
-        store_result = self._store_configurations(
-            data,
-            [
-                {
-                    "template_path": f"/usr/local/share/{data.server_data_dir}/data/nginx/sites-available/gitea.app",
-                    "destination_path": "/etc/nginx/sites-available/gitea.app",
-                },
-                {
-                    "template_path": f"/usr/local/share/{data.server_data_dir}/data/nginx/sites-available/postgresql.app",
-                    "destination_path": "/etc/nginx/sites-available/postgresql.app",
-                },
-                {
-                    "template_path": f"/usr/local/share/{data.server_data_dir}/data/nginx/nginx.conf",
-                    "destination_path": "/etc/nginx/nginx.conf",
-                },
-            ],
-        )
+        store_result = self._store_configurations(data, tuning, cache, sites)
         if not store_result.success:
             self.notifications.error("Replacing Nginx configurations failed.")
             return store_result.as_fail()
 
         self.notifications.success("Replacing Nginx configurations successful.")
+
+        self.notifications.info(
+            f"Preparing Nginx cache directories ({cache.max_size_mib} MiB proxy cache)."
+        )
+        directories_result = self.controller.run_raw_commands(
+            [
+                f"sudo install -d -m 0700 -o www-data -g www-data {NGINX_CACHE_DIR}",
+                f"sudo install -d -m 0755 {NGINX_STATIC_DIR}",
+            ]
+        )
+        if not directories_result.success:
+            self.notifications.error("\tPreparing Nginx cache directories failed.")
+            return directories_result.as_fail()
+        self.notifications.success("\tPreparing Nginx cache directories succeeded.")
+
+        self._publish_static_assets()
+
         self.notifications.info("Restarting Nginx.")
 
         self.notifications.info("Enabling sites and validating Nginx config.")
+        # The kernel mode forwards the stream ports with nftables; drop the relays left by the proxy mode
+        stream_commands = (
+            []
+            if data.tcp_forwarding_mode == "proxy"
+            else [f"sudo rm -f {NGINX_TCP_FORWARDING_CONF}"]
+        )
         command_result = self.controller.run_raw_commands(
             [
                 "sudo install -d -m 0755 /etc/nginx/sites-enabled",
+                "sudo install -d -m 0755 /etc/nginx/stream.d",
+                *stream_commands,
                 "sudo rm -f /etc/nginx/sites-enabled/default",
                 "sudo ln -sf /etc/nginx/sites-available/gitea.app /etc/nginx/sites-enabled/gitea.app",
                 "sudo ln -sf /etc/nginx/sites-available/postgresql.app /etc/nginx/sites-enabled/postgresql.app",
+                "sudo install -d -m 0700 -o root -g root /etc/nginx/tls",
+                f"test -f {NGINX_TICKET_KEY} || sudo sh -c 'umask 077 && openssl rand -out {NGINX_TICKET_KEY} 80'",
+                f"test -f {NGINX_PREVIOUS_TICKET_KEY} || sudo cp -p {NGINX_TICKET_KEY} {NGINX_PREVIOUS_TICKET_KEY}",
                 "sudo nginx -t -q",
                 "sudo systemctl reload nginx || sudo systemctl restart nginx || sudo service nginx restart || sudo service nginx start",
+                "sudo systemctl daemon-reload",
+                "sudo systemctl enable --now nginx-ticket-keys.timer",
             ]
         )
 
@@ -91,18 +164,59 @@ class NginxUbuntuConfigurationTask(ConfigurationTask):
 
         return OperationResult[bool].succeed(True)
 
+    def _publish_static_assets(self) -> bool:
+        """Extract Gitea's static assets and precompress them for gzip_static.
+
+        The assets are copied out of the running Gitea container into a
+        staging directory, gzipped next to the originals and swapped into
+        place. A failure only leaves the previous assets (or none) behind;
+        nginx then keeps serving them through the proxy cache.
+
+        Returns:
+            bool: True if the assets were published.
+        """
+        staging_dir = f"{NGINX_STATIC_DIR}/assets.new"
+        self.notifications.info("Publishing Gitea static assets.")
+        publish_result = self.controller.run_raw_commands(
+            [
+                'sudo docker exec gitea sh -c "rm -rf /tmp/nginx-static && '
+                "gitea embedded extract --overwrite --destination /tmp/nginx-static "
+                "'public/assets/**'\" >/dev/null",
+                f"sudo rm -rf {staging_dir} && "
+                f"sudo docker cp gitea:/tmp/nginx-static/public/assets {staging_dir}",
+                f"sudo find {staging_dir} -type f "
+                "\\( -name '*.js' -o -name '*.css' -o -name '*.svg' -o -name '*.json' "
+                "-o -name '*.map' -o -name '*.txt' \\) -size +1k -exec gzip -kf9 {} +",
+                f"sudo chown -R root:root {staging_dir} && sudo chmod -R u=rwX,go=rX {staging_dir}",
+                f"sudo rm -rf {NGINX_STATIC_DIR}/assets && "
+                f"sudo mv {staging_dir} {NGINX_STATIC_DIR}/assets",
+                "sudo docker exec gitea rm -rf /tmp/nginx-static",
+            ]
+        )
+        if not publish_result.success:
+            self.notifications.warning(
+                "\tPublishing Gitea static assets failed. Assets stay proxied to Gitea."
+            )
+            return False
+        self.notifications.success("\tPublishing Gitea static assets succeeded.")
+        return True
+
     def _store_configurations(
-        self, data: ConfigurationData, sites: list[Any]
+        self,
+        data: ConfigurationData,
+        tuning: NginxTuning,
+        cache: NginxCache,
+        sites: list[Any],
     ) -> OperationResult[bool]:
         for site in sites:
-            store_result = self._store_configuration(data, site)
+            store_result = self._store_configuration(data, tuning, cache, site)
             if not store_result.success:
                 return store_result.as_fail()
 
         return OperationResult[bool].succeed(True)
 
     def _store_configuration(
-        self, data: ConfigurationData, site_config: Any
+        self, data: ConfigurationData, tuning: NginxTuning, cache: NginxCache, site_config: Any
     ) -> OperationResult[bool]:
         template_path = site_config["template_path"]
         destination_path = site_config["destination_path"]
@@ -122,8 +236,9 @@ class NginxUbuntuConfigurationTask(ConfigurationTask):
         self.notifications.success(f"Loading config template from '{template_path}' successful.")
 
         self.notifications.info(f"Saving config data to '{destination_path}'.")
+        content = render_nginx_tuning(config_template_read_result.data, tuning)
         config_save_result = self.file_system.write_text(
-            destination_path, config_template_read_result.data
+            destination_path, render_nginx_cache(content, cache)
         )
 
         if not config_save_result.success or config_save_result.data is None:
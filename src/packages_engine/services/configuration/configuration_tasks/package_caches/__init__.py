@@ -0,0 +1,12 @@
+"""Package caches configuration tasks.
+
+Manages the apt caching proxy and the Docker registry mirror shared by the servers on a LAN.
+"""
+
+from .package_caches_ubuntu_configuration_task import PackageCachesUbuntuConfigurationTask
+from .package_caches_windows_configuration_task import PackageCachesWindowsConfigurationTask
+
+__all__ = [
+    "PackageCachesUbuntuConfigurationTask",
+    "PackageCachesWindowsConfigurationTask",
+]
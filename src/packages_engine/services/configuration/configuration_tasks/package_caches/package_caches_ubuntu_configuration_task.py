@@ -0,0 +1,233 @@
+"""Ubuntu package caches configuration.
+
+Deploys the apt caching proxy and the Docker registry mirror as compose services
+and points apt and the Docker daemon at them.
+"""
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationContent, ConfigurationData
+from packages_engine.services.configuration.configuration_content_reader import (
+    ConfigurationContentReaderServiceContract,
+)
+from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+from packages_engine.services.configuration.configuration_tasks.docker_orchestration.docker_daemon_json import (
+    add_unique_value,
+    docker_daemon_json_commands,
+    merge_docker_daemon_json,
+    restart_docker_on_daemon_json_change_command,
+)
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.package_controller import PackageControllerServiceContract
+
+APT_PROXY_CONF = "/etc/apt/apt.conf.d/01-package-cache"
+APT_PROXY_DETECT = "/usr/local/sbin/apt-proxy-detect"
+CACHES_COMPOSE = "/srv/caches/docker-compose.yml"
+
+
+class PackageCachesUbuntuConfigurationTask(ConfigurationTask):
+    """Configures package caches on Ubuntu.
+
+    In "server" mode the caches run on this host, in "client" mode the host only uses
+    the caches of another host and in "off" mode everything the other modes set up is
+    removed: the apt proxy, the registry mirror in daemon.json and the caches stack.
+    """
+
+    def __init__(
+        self,
+        reader: ConfigurationContentReaderServiceContract,
+        file_system: FileSystemServiceContract,
+        notifications: NotificationsServiceContract,
+        controller: PackageControllerServiceContract,
+    ):
+        """Initialize package caches task.
+
+        Args:
+            reader: Service for reading configuration templates.
+            file_system: Service for file operations.
+            notifications: Service for user notifications.
+            controller: Service for executing system commands.
+        """
+        self.reader = reader
+        self.file_system = file_system
+        self.notifications = notifications
+        self.controller = controller
+
+    def configure(self, data: ConfigurationData) -> OperationResult[bool]:
+        """Configure package caches according to the selected mode.
+
+        Args:
+            data: Configuration data including package caches mode and host.
+
+        Returns:
+            OperationResult[bool]: Success if package caches are configured.
+        """
+        if data.package_cache_mode == "off":
+            return self._disable()
+
+        if data.package_cache_mode == "server":
+            deploy_result = self._deploy(data)
+            if not deploy_result.success:
+                return deploy_result
+
+        apt_result = self._configure_apt(data)
+        if not apt_result.success:
+            return apt_result
+
+        return self._configure_docker(data)
+
+    def _disable(self) -> OperationResult[bool]:
+        self.notifications.info("Package caches are disabled.")
+        installed = [
+            path
+            for path in (APT_PROXY_CONF, APT_PROXY_DETECT, CACHES_COMPOSE)
+            if self.file_system.path_exists(path)
+        ]
+        if not installed:
+            self.notifications.success("\tNo package cache configuration found.")
+            return OperationResult[bool].succeed(True)
+
+        for path in (APT_PROXY_CONF, APT_PROXY_DETECT):
+            if path not in installed:
+                continue
+            remove_result = self.file_system.remove_location(path)
+            if not remove_result.success:
+                self.notifications.error(f"\tRemoving {path} failed.")
+                return remove_result.as_fail()
+        self.notifications.success("\tRemoving apt proxy configuration succeeded.")
+
+        self.notifications.info("Stopping package caches and the registry mirror.")
+        daemon_result = merge_docker_daemon_json(
+            self.file_system,
+            lambda daemon: {
+                key: value
+                for key, value in daemon.items()
+                if key not in ("registry-mirrors", "insecure-registries")
+            },
+        )
+        if not daemon_result.success:
+            self.notifications.error("\tStopping package caches failed.")
+            return daemon_result.as_fail()
+        stop_result = self.controller.run_raw_commands(
+            [
+                # cached data in /srv/caches is kept for a later re-enable
+                f"test ! -f {CACHES_COMPOSE} || "
+                f"(cd /srv/caches && sudo docker compose down --remove-orphans)",
+                f"sudo rm -f {CACHES_COMPOSE}",
+                *(_restart_docker_commands() if daemon_result.data else []),
+            ]
+        )
+        if not stop_result.success:
+            self.notifications.error("\tStopping package caches failed.")
+            return stop_result.as_fail()
+        self.notifications.success("\tStopping package caches succeeded.")
+
+        return OperationResult[bool].succeed(True)
+
+    def _deploy(self, data: ConfigurationData) -> OperationResult[bool]:
+        self.notifications.info("Creating package caches folders if they do not exist.")
+        dirs_result = self.controller.run_raw_commands(
+            [
+                "sudo install -d -m 0755 /srv/caches",
+                "sudo install -d -m 0755 /srv/caches/apt-cacher-ng",
+                "sudo install -d -m 0755 /srv/caches/registry",
+            ]
+        )
+        if not dirs_result.success:
+            self.notifications.error("\tCreating package caches folders failed.")
+            return dirs_result.as_fail()
+        self.notifications.success("\tCreating package caches folders succeeded.")
+
+        write_result = self._write_template(
+            data, "caches/docker-compose.yml", CACHES_COMPOSE, "package caches services"
+        )
+        if not write_result.success:
+            return write_result
+
+        self.notifications.info("Starting package caches services.")
+        start_result = self.controller.run_raw_commands(
+            [
+                f"sudo chown root:root {CACHES_COMPOSE}",
+                f"sudo chmod 0644 {CACHES_COMPOSE}",
+                "cd /srv/caches && sudo docker compose up -d --remove-orphans",
+            ]
+        )
+        if not start_result.success:
+            self.notifications.error("\tStarting package caches services failed.")
+            return start_result.as_fail()
+        self.notifications.success("\tStarting package caches services succeeded.")
+
+        return OperationResult[bool].succeed(True)
+
+    def _configure_apt(self, data: ConfigurationData) -> OperationResult[bool]:
+        detect_result = self._write_template(
+            data, "caches/apt-proxy-detect", APT_PROXY_DETECT, "apt proxy detection script"
+        )
+        if not detect_result.success:
+            return detect_result
+
+        conf_result = self._write_template(
+            data, "caches/01-package-cache", APT_PROXY_CONF, "apt proxy configuration"
+        )
+        if not conf_result.success:
+            return conf_result
+
+        self.notifications.info("Fixing apt proxy permissions.")
+        perm_result = self.controller.run_raw_commands(
+            [
+                f"sudo chown root:root {APT_PROXY_DETECT} {APT_PROXY_CONF}",
+                f"sudo chmod 0755 {APT_PROXY_DETECT}",
+                f"sudo chmod 0644 {APT_PROXY_CONF}",
+            ]
+        )
+        if not perm_result.success:
+            self.notifications.error("\tFixing apt proxy permissions failed.")
+            return perm_result.as_fail()
+        self.notifications.success("\tFixing apt proxy permissions succeeded.")
+
+        return OperationResult[bool].succeed(True)
+
+    def _configure_docker(self, data: ConfigurationData) -> OperationResult[bool]:
+        self.notifications.info("Pointing Docker daemon at the registry mirror.")
+        registry = f"{data.package_cache_host}:5000"
+        docker_result = merge_docker_daemon_json(
+            self.file_system,
+            lambda daemon: add_unique_value(
+                add_unique_value(daemon, "registry-mirrors", f"http://{registry}"),
+                "insecure-registries",
+                registry,
+            ),
+        )
+        if docker_result.success and docker_result.data:
+            docker_result = self.controller.run_raw_commands(_restart_docker_commands())
+        if not docker_result.success:
+            self.notifications.error("\tPointing Docker daemon at the registry mirror failed.")
+            return docker_result.as_fail()
+        self.notifications.success("\tPointing Docker daemon at the registry mirror succeeded.")
+
+        return OperationResult[bool].succeed(True)
+
+    def _write_template(
+        self, data: ConfigurationData, template: str, destination: str, title: str
+    ) -> OperationResult[bool]:
+        self.notifications.info(f"Writing {title}.")
+        read_result = self.reader.read(
+            ConfigurationContent.RAW_STRING,
+            data,
+            f"/usr/local/share/{data.server_data_dir}/data/{template}",
+        )
+        if not read_result.success or read_result.data is None:
+            self.notifications.error(f"\tReading {title} template failed.")
+            return read_result.as_fail()
+
+        write_result = self.file_system.write_text(destination, read_result.data)
+        if not write_result.success:
+            self.notifications.error(f"\tWriting {title} failed.")
+            return write_result.as_fail()
+        self.notifications.success(f"\tWriting {title} succeeded.")
+
+        return OperationResult[bool].succeed(True)
+
+
+def _restart_docker_commands() -> list[str]:
+    return [*docker_daemon_json_commands(True), restart_docker_on_daemon_json_change_command()]
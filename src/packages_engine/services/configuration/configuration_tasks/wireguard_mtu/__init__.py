@@ -0,0 +1,15 @@
+"""WireGuard MTU discovery configuration tasks.
+
+Sizes the WireGuard MTU from the path MTU to the VPN endpoint.
+"""
+
+from .wireguard_mtu_ubuntu_configuration_task import WireguardMtuUbuntuConfigurationTask
+from .wireguard_mtu_windows_configuration_task import WireguardMtuWindowsConfigurationTask
+from .wireguard_overhead import wireguard_mtu, wireguard_overhead
+
+__all__ = [
+    "WireguardMtuUbuntuConfigurationTask",
+    "WireguardMtuWindowsConfigurationTask",
+    "wireguard_mtu",
+    "wireguard_overhead",
+]
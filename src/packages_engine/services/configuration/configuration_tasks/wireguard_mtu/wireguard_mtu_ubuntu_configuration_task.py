@@ -0,0 +1,103 @@
+"""WireGuard MTU discovery configuration task for Ubuntu systems."""
+
+import ipaddress
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_content_reader.content_readers.wireguard import (
+    DEFAULT_WIREGUARD_MTU,
+    SERVER_MTU_PATH,
+    client_mtu_path,
+    read_mtu,
+)
+from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.path_mtu import PathMtuServiceContract
+
+from .wireguard_overhead import wireguard_mtu
+
+
+class WireguardMtuUbuntuConfigurationTask(ConfigurationTask):
+    """Probes the path MTU towards the clients and stores the WireGuard MTU.
+
+    The probe targets MTU_PROBE_ADDRESS, a host on the clients' side such as
+    their ISP's gateway. The server's own endpoint or a local address would
+    only measure this host's link, so those keep the current MTU. The stored
+    MTU is rendered into wg0.conf and every client configuration.
+    Clients with an /etc/wireguard/clients/<name>.mtu override keep their own value.
+    """
+
+    def __init__(
+        self,
+        file_system: FileSystemServiceContract,
+        notifications: NotificationsServiceContract,
+        path_mtu: PathMtuServiceContract,
+    ):
+        """Initialize the WireGuard MTU task.
+
+        Args:
+            file_system: Service for file operations.
+            notifications: Service for user notifications.
+            path_mtu: Service probing the path MTU.
+        """
+        self.file_system = file_system
+        self.notifications = notifications
+        self.path_mtu = path_mtu
+
+    def configure(self, data: ConfigurationData) -> OperationResult[bool]:
+        """Discover the path MTU to MTU_PROBE_ADDRESS and store the tunnel MTU.
+
+        Args:
+            data: Configuration data with the probe and remote IP addresses and client names.
+
+        Returns:
+            OperationResult[bool]: Success unless the MTU cannot be stored.
+        """
+        target = data.mtu_probe_address
+        current = read_mtu(self.file_system, SERVER_MTU_PATH) or DEFAULT_WIREGUARD_MTU
+        if not target:
+            self.notifications.info(f"No path MTU probe address set. Keeping MTU {current}.")
+            return OperationResult[bool].succeed(True)
+        if _is_local(target, data.remote_ip_address):
+            self.notifications.warning(
+                f"Path MTU probe address {target} is this server. Keeping MTU {current}."
+            )
+            return OperationResult[bool].succeed(True)
+
+        self.notifications.info(f"Discovering the path MTU to {target}.")
+        discover_result = self.path_mtu.discover(target)
+        if not discover_result.success or discover_result.data is None:
+            self.notifications.warning(
+                f"\tPath MTU discovery failed: {discover_result.message}. Keeping MTU {current}."
+            )
+            return OperationResult[bool].succeed(True)
+
+        mtu = wireguard_mtu(discover_result.data)
+        self.notifications.success(
+            f"\tPath MTU is {discover_result.data} bytes. WireGuard MTU is {mtu}."
+        )
+
+        write_result = self.file_system.write_text(SERVER_MTU_PATH, str(mtu))
+        if not write_result.success:
+            self.notifications.error(f"\tWriting {SERVER_MTU_PATH} failed.")
+            return write_result.as_fail()
+
+        for client_name in data.wireguard_client_names:
+            client_mtu = read_mtu(self.file_system, client_mtu_path(client_name))
+            if client_mtu is not None:
+                self.notifications.info(
+                    f'\tClient "{client_name}" overrides the MTU with {client_mtu}.'
+                )
+
+        return OperationResult[bool].succeed(True)
+
+
+def _is_local(address: str, endpoint: str) -> bool:
+    if address == endpoint:
+        return True
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return address == "localhost"
+    return ip.is_loopback or ip.is_unspecified or ip.is_link_local
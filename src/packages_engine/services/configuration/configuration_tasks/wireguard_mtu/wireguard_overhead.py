@@ -0,0 +1,36 @@
+"""WireGuard MTU sizing from the discovered path MTU.
+
+Every WireGuard packet carries the outer IP header, a UDP header and 32
+bytes of WireGuard header and authentication tag. The overhead of an IPv6
+outer header is used for every endpoint, because clients can reach an IPv4
+endpoint over IPv6 too, and the result never exceeds wg-quick's default.
+"""
+
+from packages_engine.services.configuration.configuration_content_reader.content_readers.wireguard import (
+    DEFAULT_WIREGUARD_MTU,
+)
+
+UDP_HEADER_BYTES = 8
+WIREGUARD_HEADER_BYTES = 32
+IPV6_HEADER_BYTES = 40
+
+
+def wireguard_overhead() -> int:
+    """Compute the bytes WireGuard adds to each packet.
+
+    Returns:
+        int: 80, the overhead with an IPv6 outer header.
+    """
+    return IPV6_HEADER_BYTES + UDP_HEADER_BYTES + WIREGUARD_HEADER_BYTES
+
+
+def wireguard_mtu(path_mtu: int) -> int:
+    """Compute the tunnel MTU for a path.
+
+    Args:
+        path_mtu: Largest unfragmented packet on the path to the clients.
+
+    Returns:
+        int: Largest inner packet that fits in one outer packet, at most 1420.
+    """
+    return min(path_mtu - wireguard_overhead(), DEFAULT_WIREGUARD_MTU)
@@ -0,0 +1,13 @@
+"""Necessary imports for export."""
+
+from .dns_benchmark_service import DnsBenchmarkService
+from .dns_benchmark_service_contract import DnsBenchmarkServiceContract
+from .dns_wire import DnsResponse, decode_response, encode_query
+
+__all__ = [
+    "DnsBenchmarkService",
+    "DnsBenchmarkServiceContract",
+    "DnsResponse",
+    "decode_response",
+    "encode_query",
+]
@@ -0,0 +1,188 @@
+"""DNS Benchmark Service - asyncio UDP implementation of resolver latency measurement."""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    DnsBenchmarkPlan,
+    DnsBenchmarkReport,
+    DnsCategoryReport,
+    DnsQuery,
+    LatencySummary,
+)
+
+from .dns_benchmark_service_contract import DnsBenchmarkServiceContract
+from .dns_wire import RCODE_NAMES, decode_response, encode_query
+
+# Answers from dnsmasq's own records are the cache-speed baseline
+BASELINE_CATEGORY = "internal"
+# Half of the 16 bit ID space, so a free transaction ID is always found in a few draws
+MAX_IN_FLIGHT = 0x8000
+
+
+@dataclass
+class QueryOutcome:
+    """Result of one query."""
+
+    query: DnsQuery
+    latency_ms: float | None
+    error: str | None
+
+
+class _ResolverProtocol(asyncio.DatagramProtocol):
+    """Matches responses to pending queries by transaction ID and echoed question."""
+
+    def __init__(self):
+        self.pending: dict[int, tuple[asyncio.Future, DnsQuery]] = {}
+
+    def allocate_id(self) -> int:
+        """Draw a random transaction ID no pending query uses."""
+        while True:
+            query_id = random.randrange(0x10000)
+            if query_id not in self.pending:
+                return query_id
+
+    def datagram_received(self, data: bytes, addr):
+        try:
+            response = decode_response(data)
+        except ValueError:
+            return
+        entry = self.pending.get(response.query_id)
+        if entry is None:
+            return
+        future, query = entry
+        # A late or spoofed reply for another question must not answer this query
+        if not response.answers(query.name, query.qtype):
+            return
+        del self.pending[response.query_id]
+        if not future.done():
+            future.set_result(response)
+
+    def error_received(self, exc: Exception):
+        for future, _ in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
+
+class DnsBenchmarkService(DnsBenchmarkServiceContract):
+    """
+    DNS benchmark service implementation using asyncio UDP.
+
+    Every query of the plan is sent `rounds` times, interleaved so repeated
+    names hit a warm cache, with at most `concurrency` queries in flight. Each
+    in-flight query has its own random transaction ID, and a reply only answers
+    it when it echoes the same name and record type.
+    An answered query counts as a cache hit when it is not slower than the
+    p95 of the internal names (served from dnsmasq's own records) or the
+    plan's cache_hit_ms, whichever is larger.
+    """
+
+    def run(self, plan: DnsBenchmarkPlan) -> OperationResult[DnsBenchmarkReport]:
+        """
+        Run a DNS benchmark.
+
+        Args:
+            plan: Resolver, query mix and load settings.
+
+        Returns:
+            OperationResult[DnsBenchmarkReport]: Per category results, or failure if
+            the UDP socket cannot be opened.
+        """
+        if not plan.queries:
+            return OperationResult[DnsBenchmarkReport].fail("No queries to send")
+        try:
+            outcomes = asyncio.run(self._send_all(plan))
+        except OSError as error:
+            return OperationResult[DnsBenchmarkReport].fail(
+                f"Querying {plan.server} failed: {error}"
+            )
+        return OperationResult[DnsBenchmarkReport].succeed(summarize(plan, outcomes))
+
+    async def _send_all(self, plan: DnsBenchmarkPlan) -> list[QueryOutcome]:
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(
+            _ResolverProtocol, remote_addr=(plan.server, plan.port)
+        )
+        semaphore = asyncio.Semaphore(min(max(1, plan.concurrency), MAX_IN_FLIGHT))
+
+        async def send(query: DnsQuery) -> QueryOutcome:
+            async with semaphore:
+                future = loop.create_future()
+                query_id = protocol.allocate_id()
+                protocol.pending[query_id] = (future, query)
+                started = time.perf_counter()
+                try:
+                    transport.sendto(encode_query(query_id, query.name, query.qtype))
+                    response = await asyncio.wait_for(future, plan.timeout_seconds)
+                except asyncio.TimeoutError:
+                    return QueryOutcome(query, None, "timeout")
+                except OSError as error:
+                    return QueryOutcome(query, None, type(error).__name__)
+                finally:
+                    protocol.pending.pop(query_id, None)
+                latency_ms = (time.perf_counter() - started) * 1000
+                if response.rcode:
+                    return QueryOutcome(
+                        query, latency_ms, RCODE_NAMES.get(response.rcode, f"RCODE{response.rcode}")
+                    )
+                return QueryOutcome(query, latency_ms, None)
+
+        try:
+            schedule = [query for _ in range(plan.rounds) for query in plan.queries]
+            return await asyncio.gather(*(send(query) for query in schedule))
+        finally:
+            transport.close()
+
+
+def summarize(plan: DnsBenchmarkPlan, outcomes: list[QueryOutcome]) -> DnsBenchmarkReport:
+    """
+    Group query outcomes into per category reports.
+
+    Args:
+        plan: The plan the outcomes belong to.
+        outcomes: Result of every query sent.
+
+    Returns:
+        DnsBenchmarkReport: Report with categories in the order they appear in the plan.
+    """
+    categories: dict[str, list[QueryOutcome]] = {}
+    for query in plan.queries:
+        categories.setdefault(query.category, [])
+    for outcome in outcomes:
+        categories.setdefault(outcome.query.category, []).append(outcome)
+
+    baseline = LatencySummary.from_samples(
+        [
+            outcome.latency_ms
+            for outcome in categories.get(BASELINE_CATEGORY, [])
+            if outcome.error is None and outcome.latency_ms is not None
+        ]
+    )
+    threshold_ms = max(plan.cache_hit_ms, baseline.p95_ms)
+
+    reports = []
+    for category, category_outcomes in categories.items():
+        answered = [
+            outcome.latency_ms
+            for outcome in category_outcomes
+            if outcome.error is None and outcome.latency_ms is not None
+        ]
+        errors: dict[str, int] = {}
+        for outcome in category_outcomes:
+            if outcome.error is not None:
+                errors[outcome.error] = errors.get(outcome.error, 0) + 1
+        reports.append(
+            DnsCategoryReport(
+                category=category,
+                sent=len(category_outcomes),
+                failed=len(category_outcomes) - len(answered),
+                latency=LatencySummary.from_samples(answered),
+                cache_hits=sum(1 for latency in answered if latency <= threshold_ms),
+                errors=errors,
+            )
+        )
+    return DnsBenchmarkReport(plan.server, threshold_ms, reports)
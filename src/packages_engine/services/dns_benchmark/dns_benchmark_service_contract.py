@@ -0,0 +1,28 @@
+"""DNS Benchmark Service Contract - defines interface for resolver latency measurement."""
+
+from abc import ABC, abstractmethod
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import DnsBenchmarkPlan, DnsBenchmarkReport
+
+
+class DnsBenchmarkServiceContract(ABC):
+    """
+    Abstract base class defining the contract for DNS benchmarking.
+
+    Sends a mix of queries to a resolver and summarizes latency, failures
+    and estimated cache hits per query category.
+    """
+
+    @abstractmethod
+    def run(self, plan: DnsBenchmarkPlan) -> OperationResult[DnsBenchmarkReport]:
+        """
+        Run a DNS benchmark.
+
+        Args:
+            plan: Resolver, query mix and load settings.
+
+        Returns:
+            OperationResult[DnsBenchmarkReport]: Per category results, or failure if
+            the resolver cannot be queried at all.
+        """
@@ -0,0 +1,28 @@
+"""Mock DNS Benchmark Service - test double for resolver latency measurement."""
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import DnsBenchmarkPlan, DnsBenchmarkReport
+
+from .dns_benchmark_service_contract import DnsBenchmarkServiceContract
+
+
+class MockDnsBenchmarkService(DnsBenchmarkServiceContract):
+    """
+    Mock implementation of DnsBenchmarkService for testing purposes.
+
+    Attributes:
+        run_params: Plans passed to run.
+        run_result: Result returned by run.
+    """
+
+    def __init__(self):
+        """Initialize the mock with an empty report."""
+        self.run_params: list[DnsBenchmarkPlan] = []
+        self.run_result = OperationResult[DnsBenchmarkReport].succeed(
+            DnsBenchmarkReport("127.0.0.1", 2.0, [])
+        )
+
+    def run(self, plan: DnsBenchmarkPlan) -> OperationResult[DnsBenchmarkReport]:
+        """Record the plan and return the configured result."""
+        self.run_params.append(plan)
+        return self.run_result
@@ -0,0 +1,178 @@
+"""Minimal DNS wire format encoder and decoder (RFC 1035) for benchmark queries."""
+
+import struct
+from dataclasses import dataclass
+
+HEADER = struct.Struct("!HHHHHH")
+QUESTION_TAIL = struct.Struct("!HH")
+RECORD_TAIL = struct.Struct("!HHIH")
+FLAG_RESPONSE = 0x8000
+FLAG_RECURSION_DESIRED = 0x0100
+CLASS_IN = 1
+
+RCODE_NAMES = {1: "FORMERR", 2: "SERVFAIL", 3: "NXDOMAIN", 4: "NOTIMP", 5: "REFUSED"}
+# More pointers than a 255 byte name can hold means a compression loop
+MAX_POINTERS = 127
+
+
+@dataclass
+class DnsResponse:
+    """The parts of a DNS response the benchmark looks at.
+
+    `qname` and `qtype` are the echoed first question, None when there is none.
+    """
+
+    query_id: int
+    rcode: int
+    answer_count: int
+    min_ttl: int | None
+    qname: str | None = None
+    qtype: int | None = None
+
+    def answers(self, name: str, qtype: int) -> bool:
+        """
+        Check whether the response echoes the question of a query.
+
+        Args:
+            name: Name the query asked for.
+            qtype: Record type the query asked for.
+
+        Returns:
+            bool: True if the question matches, names compared case-insensitively.
+        """
+        if self.qname is None or self.qtype != qtype:
+            return False
+        try:
+            expected = b".".join(_labels(name)).decode("ascii")
+        except ValueError:
+            return False
+        return self.qname.lower() == expected.lower()
+
+
+def _labels(name: str) -> list[bytes]:
+    labels = []
+    for label in name.rstrip(".").split("."):
+        raw = label.encode("idna")
+        if not raw or len(raw) > 63:
+            raise ValueError(f"Invalid label in {name!r}")
+        labels.append(raw)
+    return labels
+
+
+def encode_name(name: str) -> bytes:
+    """
+    Encode a domain name as length prefixed labels.
+
+    Args:
+        name: Dotted domain name.
+
+    Returns:
+        bytes: Wire format name ending with the root label.
+
+    Raises:
+        ValueError: If a label is empty or longer than 63 bytes.
+    """
+    return b"".join(bytes([len(raw)]) + raw for raw in _labels(name)) + b"\x00"
+
+
+def encode_query(query_id: int, name: str, qtype: int = 1) -> bytes:
+    """
+    Encode a recursive query with one question.
+
+    Args:
+        query_id: 16 bit transaction ID.
+        name: Name to resolve.
+        qtype: Record type, 1 (A) by default.
+
+    Returns:
+        bytes: The query datagram.
+    """
+    header = HEADER.pack(query_id & 0xFFFF, FLAG_RECURSION_DESIRED, 1, 0, 0, 0)
+    return header + encode_name(name) + QUESTION_TAIL.pack(qtype, CLASS_IN)
+
+
+def _skip_name(data: bytes, offset: int) -> int:
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated name")
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            # A compression pointer ends the name
+            if offset + 2 > len(data):
+                raise ValueError("Truncated pointer")
+            return offset + 2
+        if length == 0:
+            return offset + 1
+        offset += 1 + length
+
+
+def _read_name(data: bytes, offset: int) -> tuple[str, int]:
+    labels: list[str] = []
+    end = None
+    pointers = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated name")
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if offset + 2 > len(data):
+                raise ValueError("Truncated pointer")
+            pointers += 1
+            if pointers > MAX_POINTERS:
+                raise ValueError("Compression loop")
+            if end is None:
+                end = offset + 2
+            offset = struct.unpack_from("!H", data, offset)[0] & 0x3FFF
+            continue
+        if length == 0:
+            return ".".join(labels), offset + 1 if end is None else end
+        if offset + 1 + length > len(data):
+            raise ValueError("Truncated label")
+        labels.append(data[offset + 1 : offset + 1 + length].decode("latin-1"))
+        offset += 1 + length
+
+
+def decode_response(data: bytes) -> DnsResponse:
+    """
+    Decode the header and answer TTLs of a response.
+
+    Args:
+        data: The response datagram.
+
+    Returns:
+        DnsResponse: Transaction ID, response code, answer count, lowest TTL and
+        the first question.
+
+    Raises:
+        ValueError: If the datagram is not a well formed DNS response.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Truncated header")
+    query_id, flags, qdcount, ancount, _, _ = HEADER.unpack_from(data)
+    if not flags & FLAG_RESPONSE:
+        raise ValueError("Not a response")
+
+    offset = HEADER.size
+    qname, qtype = None, None
+    for index in range(qdcount):
+        if index == 0:
+            qname, offset = _read_name(data, offset)
+            if offset + QUESTION_TAIL.size > len(data):
+                raise ValueError("Truncated question")
+            qtype = QUESTION_TAIL.unpack_from(data, offset)[0]
+        else:
+            offset = _skip_name(data, offset)
+        offset += QUESTION_TAIL.size
+
+    ttls: list[int] = []
+    for _ in range(ancount):
+        offset = _skip_name(data, offset)
+        if offset + RECORD_TAIL.size > len(data):
+            raise ValueError("Truncated record")
+        _, _, ttl, rdlength = RECORD_TAIL.unpack_from(data, offset)
+        offset += RECORD_TAIL.size + rdlength
+        if offset > len(data):
+            raise ValueError("Truncated record data")
+        ttls.append(ttl)
+
+    return DnsResponse(query_id, flags & 0x000F, ancount, min(ttls) if ttls else None, qname, qtype)
@@ -0,0 +1,14 @@
+"""Necessary imports for export."""
+
+from .dry_run_host import DryRunHost, DryRunOptions, create_dry_run_host, parse_dry_run_options
+from .plan_host import PLAN_FLAG, PlanHost, create_plan_host
+
+__all__ = [
+    "DryRunHost",
+    "DryRunOptions",
+    "create_dry_run_host",
+    "parse_dry_run_options",
+    "PLAN_FLAG",
+    "PlanHost",
+    "create_plan_host",
+]
@@ -0,0 +1,147 @@
+"""Dry run host - a simulated server the tools can run against instead of the real one."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from packages_engine.services.file_system import InMemoryFileSystemService
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.system_management_engine.engines import (
+    SimulatedEngineService,
+    SimulatedLatencyModel,
+)
+
+DRY_RUN_FLAG = "--dry-run"
+# Where self_deploy.pyz puts the tools and templates with the default server data directory
+DEPLOYED_DATA_DIR = "/usr/local/share/srv/data"
+DEPLOYED_TOOLS_DIR = "/usr/local/sbin"
+DEFAULT_MEMINFO = "MemTotal:        8167848 kB\n"
+
+
+@dataclass
+class DryRunOptions:
+    """
+    Settings of a dry run.
+
+    Attributes:
+        latency: Operation latencies of the simulated host.
+        time_scale: Real seconds slept per simulated second.
+        seed: Seed of the latency samples.
+    """
+
+    latency: SimulatedLatencyModel = field(default_factory=SimulatedLatencyModel)
+    time_scale: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class DryRunHost:
+    """
+    A simulated server held in memory.
+
+    Attributes:
+        engine: Engine that simulates commands and their latencies.
+        file_system: Files of the simulated server.
+    """
+
+    engine: SimulatedEngineService
+    file_system: InMemoryFileSystemService
+
+    def report(self, notifications: NotificationsServiceContract):
+        """
+        Show what the run would have done and how long it would have taken.
+
+        Args:
+            notifications: Service for user notifications.
+        """
+        notifications.info(
+            f"Dry run: {len(self.engine.commands)} commands, "
+            f"{self.engine.simulated_seconds:.1f} s simulated"
+        )
+        for kind, seconds in self.engine.seconds_by_kind().items():
+            notifications.info(f"\t{kind}: {seconds:.2f} s")
+
+
+def parse_dry_run_options(argv: list[str]) -> Optional[DryRunOptions]:
+    """
+    Read the dry run options of a tool's command line.
+
+    Recognizes `--dry-run`, `--latency=<json file>`, `--time-scale=<factor>`
+    and `--seed=<number>`. The latency file maps operation kinds to
+    `{"median_seconds": ..., "spread": ...}` and overrides the defaults.
+
+    Args:
+        argv: Command line arguments without the program name.
+
+    Returns:
+        Optional[DryRunOptions]: The options, or None when `--dry-run` is not given.
+
+    Raises:
+        ValueError: If an option value cannot be used.
+    """
+    if DRY_RUN_FLAG not in argv:
+        return None
+    options = DryRunOptions()
+    for arg in argv:
+        name, _, value = arg.partition("=")
+        try:
+            if name == "--latency":
+                latency_object = json.loads(Path(value).read_text(encoding="utf-8"))
+                options.latency = SimulatedLatencyModel.from_object(latency_object)
+            elif name == "--time-scale":
+                options.time_scale = float(value)
+            elif name == "--seed":
+                options.seed = int(value)
+        except (OSError, KeyError, TypeError, AttributeError, ValueError) as error:
+            raise ValueError(f"Invalid option {arg}: {error}") from error
+    return options
+
+
+def create_dry_run_host(options: DryRunOptions, working_dir: str = ".") -> DryRunHost:
+    """
+    Create a simulated server from the directory the tools run from.
+
+    The server starts as if self_deploy.pyz had run with the default server
+    data directory: the working directory's `data/` and tools are visible
+    both where they are and where they get deployed. Memory size comes from
+    this machine when it can be read. Nothing is installed or running.
+
+    Args:
+        options: Settings of the dry run.
+        working_dir: Directory holding `data/` and the built tools.
+
+    Returns:
+        DryRunHost: The simulated server.
+    """
+    root = Path(working_dir)
+    file_system = InMemoryFileSystemService()
+
+    data_dir = root / "data"
+    if data_dir.is_dir():
+        for path in sorted(data_dir.rglob("*")):
+            if not path.is_file():
+                continue
+            relative_path = path.relative_to(data_dir).as_posix()
+            text = path.read_text(encoding="utf-8", errors="replace")
+            file_system.write_text(f"/data/{relative_path}", text)
+            file_system.write_text(f"{DEPLOYED_DATA_DIR}/{relative_path}", text)
+
+    # Tools are binary zipapps, only their presence matters
+    for path in sorted(root.glob("*.pyz")):
+        file_system.write_text(f"/{path.name}", "")
+        file_system.write_text(f"{DEPLOYED_TOOLS_DIR}/{path.name}", "")
+
+    try:
+        meminfo = Path("/proc/meminfo").read_text(encoding="utf-8")
+    except OSError:
+        meminfo = DEFAULT_MEMINFO
+    file_system.write_text("/proc/meminfo", meminfo)
+
+    engine = SimulatedEngineService(
+        file_system=file_system,
+        latency=options.latency,
+        time_scale=options.time_scale,
+        seed=options.seed,
+    )
+    return DryRunHost(engine, file_system)
@@ -0,0 +1,105 @@
+"""Plan host - records what a run would change on a server without changing it."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from packages_engine.models.bundle import (
+    DEFAULT_MODE,
+    DEFAULT_OWNER,
+    BundleArtifact,
+    is_artifact_path,
+)
+from packages_engine.models.plan import ConfigurationPlan
+from packages_engine.services.file_system import (
+    FileSystemServiceContract,
+    OverlayFileSystemService,
+)
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.system_management_engine import SystemManagementEngineService
+from packages_engine.services.system_management_engine.engines import SimulatedEngineService
+
+PLAN_FLAG = "--plan"
+
+
+@dataclass
+class PlanHost:
+    """
+    A server seen through a copy-on-write overlay and a command recorder.
+
+    Attributes:
+        engine: Engine that records commands instead of running them.
+        file_system: Overlay that keeps every write in memory.
+    """
+
+    engine: SimulatedEngineService
+    file_system: OverlayFileSystemService
+
+    def plan(self) -> ConfigurationPlan:
+        """
+        Collect what the run has done so far.
+
+        Returns:
+            ConfigurationPlan: Changed files and recorded commands.
+        """
+        return ConfigurationPlan(self.file_system.changes(), list(self.engine.commands))
+
+    def artifacts(self) -> list[BundleArtifact]:
+        """
+        Collect the rendered configuration files the run has written so far.
+
+        Returns:
+            list[BundleArtifact]: Files with their modes and owners, by path.
+        """
+        return [
+            BundleArtifact(
+                path,
+                text,
+                self.file_system.modes.get(path, DEFAULT_MODE),
+                self.engine.owner_of(path) or DEFAULT_OWNER,
+            )
+            for path, text in sorted(self.file_system.files.items())
+            if is_artifact_path(path)
+        ]
+
+    def report(self, notifications: NotificationsServiceContract):
+        """
+        Show the diff of every changed file, the commands and the reloads they need.
+
+        Args:
+            notifications: Service for user notifications.
+        """
+        plan = self.plan()
+        for change in plan.changes:
+            notifications.info(change.diff().rstrip("\n"))
+            if change.mode is not None:
+                notifications.info(f"mode {change.mode:o} {change.path}")
+        notifications.info(f"Plan: {len(plan.changes)} files would change.")
+        notifications.info(f"Plan: {len(plan.commands)} commands would run:")
+        for command in plan.commands:
+            notifications.info(f"\t{command}")
+        reloads = plan.reloads()
+        notifications.info(f"Plan: reloads needed: {', '.join(reloads) or 'none'}")
+        redundant = plan.redundant_restarts()
+        if redundant:
+            notifications.warning(
+                f"Plan: restarted without a configuration change: {', '.join(redundant)}"
+            )
+
+
+def create_plan_host(
+    lower: FileSystemServiceContract, queries: Optional[SystemManagementEngineService] = None
+) -> PlanHost:
+    """
+    Create a plan host over a server's files and engine.
+
+    Args:
+        lower: Files of the server, only ever read.
+        queries: Engine of the server, only asked whether packages are installed
+            and units are running.
+
+    Returns:
+        PlanHost: The plan host.
+    """
+    file_system = OverlayFileSystemService(lower)
+    engine = SimulatedEngineService(file_system=file_system, queries=queries)
+    return PlanHost(engine, file_system)
@@ -0,0 +1,13 @@
+"""Necessary imports for export."""
+
+from .engine_benchmark_service import EngineBenchmarkService
+from .engine_benchmark_service_contract import EngineBenchmarkServiceContract
+from .engine_fixture import EngineFixture, build_engine_fixture, load_templates
+
+__all__ = [
+    "EngineBenchmarkService",
+    "EngineBenchmarkServiceContract",
+    "EngineFixture",
+    "build_engine_fixture",
+    "load_templates",
+]
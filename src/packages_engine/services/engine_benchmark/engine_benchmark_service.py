@@ -0,0 +1,217 @@
+"""Engine Benchmark Service - times the engine's hot paths on in-memory hosts."""
+
+import gc
+import math
+import platform
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+from packages_engine.commands.configure_command import ConfigureCommand
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    EngineBenchmarkCase,
+    EngineBenchmarkPlan,
+    EngineBenchmarkReport,
+)
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration import ConfigurationDataReaderService
+from packages_engine.services.configuration.configuration_content_reader import (
+    ConfigurationContentReaderService,
+)
+from packages_engine.services.configuration.configuration_content_reader.content_readers import (
+    RawStringContentReader,
+    WireguardServerConfigContentReader,
+    WireguardSharedConfigContentReader,
+)
+from packages_engine.services.configuration.configuration_tasks import ConfigurationTask
+from packages_engine.services.configuration.configuration_tasks.default_configuration_tasks import (
+    create_default_configuration_tasks,
+)
+from packages_engine.services.host_resources import HostResourcesService
+from packages_engine.services.input_collection import InputCollectionServiceContract
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.package_controller import PackageControllerService
+from packages_engine.services.path_mtu import PathMtuService
+from packages_engine.services.system_management import SystemManagementService
+
+from .engine_benchmark_service_contract import EngineBenchmarkServiceContract
+from .engine_fixture import EngineFixture, build_engine_fixture, load_templates
+
+# A case prepares its work on a fixture and returns it; only the returned call is measured.
+# The call returns whether the work completed.
+BenchmarkCase = Callable[[EngineFixture], Callable[[], bool]]
+
+
+class EngineBenchmarkService(EngineBenchmarkServiceContract):
+    """
+    Engine benchmark service implementation using in-memory hosts.
+
+    Every case runs on a fresh host per repeat. The reported time is the best
+    of the repeats, measured with the garbage collector paused like timeit
+    does, and the peak memory comes from one more run under tracemalloc so
+    tracing does not slow the timed runs down.
+    """
+
+    def __init__(self):
+        """Initialize the benchmark with the engine's hot paths."""
+        self.cases: dict[str, BenchmarkCase] = {
+            "raw_string_reader": _raw_string_reader,
+            "wireguard_server_reader": _wireguard_server_reader,
+            "wireguard_shared_reader": _wireguard_shared_reader,
+            "configuration_data_from_object": _configuration_data_from_object,
+            "configuration_data_as_object": _configuration_data_as_object,
+            "configure_command": _configure_command,
+        }
+
+    def run(self, plan: EngineBenchmarkPlan) -> OperationResult[EngineBenchmarkReport]:
+        try:
+            templates = load_templates(plan.data_dir)
+        except OSError as error:
+            return OperationResult[EngineBenchmarkReport].fail(
+                f"Failed to read templates from {plan.data_dir}: {error}"
+            )
+        if not templates:
+            return OperationResult[EngineBenchmarkReport].fail(
+                f"No templates found in {plan.data_dir}"
+            )
+
+        cases: list[EngineBenchmarkCase] = []
+        for name, case in self.cases.items():
+            for client_count in plan.client_counts:
+                measure_result = _measure(name, case, templates, client_count, plan.repeats)
+                if not measure_result.success or measure_result.data is None:
+                    return measure_result.as_fail()
+                cases.append(measure_result.data)
+
+        return OperationResult[EngineBenchmarkReport].succeed(
+            EngineBenchmarkReport(platform.python_version(), plan.repeats, cases)
+        )
+
+
+def _measure(
+    name: str, case: BenchmarkCase, templates: dict[str, str], client_count: int, repeats: int
+) -> OperationResult[EngineBenchmarkCase]:
+    best_seconds = math.inf
+    for _ in range(max(repeats, 1)):
+        work = case(build_engine_fixture(templates, client_count))
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            completed = work()
+            elapsed = time.perf_counter() - started
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if not completed:
+            return OperationResult[EngineBenchmarkCase].fail(
+                f"Case {name} did not complete with {client_count} clients"
+            )
+        best_seconds = min(best_seconds, elapsed)
+
+    work = case(build_engine_fixture(templates, client_count))
+    tracemalloc.start()
+    try:
+        work()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return OperationResult[EngineBenchmarkCase].succeed(
+        EngineBenchmarkCase(name, client_count, best_seconds, peak_bytes)
+    )
+
+
+def _raw_string_reader(fixture: EngineFixture) -> Callable[[], bool]:
+    reader = RawStringContentReader(fixture.file_system)
+    path = f"/usr/local/share/{fixture.config.server_data_dir}/data/docker-compose.yml"
+    return lambda: reader.read(fixture.config, path).success
+
+
+def _wireguard_server_reader(fixture: EngineFixture) -> Callable[[], bool]:
+    reader = WireguardServerConfigContentReader(fixture.file_system)
+    return lambda: reader.read(fixture.config).success
+
+
+def _wireguard_shared_reader(fixture: EngineFixture) -> Callable[[], bool]:
+    reader = WireguardSharedConfigContentReader(fixture.file_system)
+    return lambda: reader.read(fixture.config).success
+
+
+def _configuration_data_from_object(fixture: EngineFixture) -> Callable[[], bool]:
+    stored = fixture.config.as_object()
+    return lambda: ConfigurationData.from_object(stored) is not None
+
+
+def _configuration_data_as_object(fixture: EngineFixture) -> Callable[[], bool]:
+    return lambda: fixture.config.as_object() is not None
+
+
+def _configure_command(fixture: EngineFixture) -> Callable[[], bool]:
+    file_system = fixture.file_system
+    notifications = _SilentNotificationsService()
+    content_reader = ConfigurationContentReaderService(
+        file_system,
+        RawStringContentReader(file_system),
+        WireguardServerConfigContentReader(file_system),
+        WireguardSharedConfigContentReader(file_system),
+    )
+    controller = PackageControllerService(SystemManagementService(fixture.engine), notifications)
+    tasks = create_default_configuration_tasks(
+        content_reader,
+        file_system,
+        notifications,
+        controller,
+        HostResourcesService(file_system),
+        PathMtuService(ping=lambda host, size: True),
+    )
+    # ConfigureCommand stops silently at the first failed task, the probe tells if all ran
+    probe = _CompletionProbe()
+    command = ConfigureCommand(
+        ConfigurationDataReaderService(_UseStoredInputCollectionService(), file_system),
+        tasks + [probe],
+    )
+
+    def work() -> bool:
+        command.execute()
+        return probe.completed
+
+    return work
+
+
+class _CompletionProbe(ConfigurationTask):
+    """Last task of a benchmarked configure run."""
+
+    def __init__(self):
+        self.completed = False
+
+    def configure(self, data: ConfigurationData) -> OperationResult[bool]:
+        self.completed = True
+        return OperationResult[bool].succeed(True)
+
+
+class _SilentNotificationsService(NotificationsServiceContract):
+    """Drops notifications so printing does not dominate the timings."""
+
+    def info(self, text: str):
+        pass
+
+    def error(self, text: str):
+        pass
+
+    def success(self, text: str):
+        pass
+
+    def warning(self, text: str):
+        pass
+
+
+class _UseStoredInputCollectionService(InputCollectionServiceContract):
+    """Accepts the stored configuration and every default."""
+
+    def read_str(self, title: str, default_value: Optional[str] = None) -> str:
+        return "y"
+
+    def read_int(self, title: str, default_value: Optional[int] = None) -> int:
+        return default_value or 0
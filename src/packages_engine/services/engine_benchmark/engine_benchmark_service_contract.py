@@ -0,0 +1,29 @@
+"""Engine Benchmark Service Contract - defines interface for timing the engine's hot paths."""
+
+from abc import ABC, abstractmethod
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import EngineBenchmarkPlan, EngineBenchmarkReport
+
+
+class EngineBenchmarkServiceContract(ABC):
+    """
+    Abstract base class defining the contract for engine benchmarking.
+
+    Runs the content readers, the configuration data conversions and the
+    configure command against in-memory hosts with a growing number of
+    WireGuard clients, and reports time and peak memory per case.
+    """
+
+    @abstractmethod
+    def run(self, plan: EngineBenchmarkPlan) -> OperationResult[EngineBenchmarkReport]:
+        """
+        Run the engine benchmark.
+
+        Args:
+            plan: Template directory, client counts and repeats.
+
+        Returns:
+            OperationResult[EngineBenchmarkReport]: Results per case and client count, or
+            failure if the templates cannot be read or a case does not complete.
+        """
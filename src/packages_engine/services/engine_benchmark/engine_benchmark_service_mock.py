@@ -0,0 +1,28 @@
+"""Mock Engine Benchmark Service - test double for timing the engine's hot paths."""
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import EngineBenchmarkPlan, EngineBenchmarkReport
+
+from .engine_benchmark_service_contract import EngineBenchmarkServiceContract
+
+
+class MockEngineBenchmarkService(EngineBenchmarkServiceContract):
+    """
+    Mock implementation of EngineBenchmarkService for testing purposes.
+
+    Attributes:
+        run_params: Plans passed to run.
+        run_result: Result returned by run.
+    """
+
+    def __init__(self):
+        """Initialize the mock with an empty report."""
+        self.run_params: list[EngineBenchmarkPlan] = []
+        self.run_result = OperationResult[EngineBenchmarkReport].succeed(
+            EngineBenchmarkReport("3.12.1", 3, [])
+        )
+
+    def run(self, plan: EngineBenchmarkPlan) -> OperationResult[EngineBenchmarkReport]:
+        """Record the plan and return the configured result."""
+        self.run_params.append(plan)
+        return self.run_result
@@ -0,0 +1,90 @@
+"""Synthetic hosts for the engine benchmark."""
+
+import ipaddress
+from dataclasses import dataclass
+from pathlib import Path
+
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.file_system import InMemoryFileSystemService
+from packages_engine.services.system_management_engine.engines import SimulatedEngineService
+
+SERVER_DATA_DIR = "srv"
+STORED_CONFIGURATION_PATH = "/usr/local/share/args/configuration_data.json"
+FIRST_CLIENT_ADDRESS = ipaddress.IPv4Address("10.10.0.2")
+
+
+@dataclass
+class EngineFixture:
+    """A configured host with a number of WireGuard clients, held in memory."""
+
+    config: ConfigurationData
+    file_system: InMemoryFileSystemService
+    engine: SimulatedEngineService
+
+
+def load_templates(data_dir: str) -> dict[str, str]:
+    """
+    Read the template data directory.
+
+    Args:
+        data_dir: Local path of the data directory shipped with the tools.
+
+    Returns:
+        dict[str, str]: Template contents by path relative to the data directory.
+    """
+    root = Path(data_dir)
+    return {
+        path.relative_to(root).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def build_engine_fixture(templates: dict[str, str], client_count: int) -> EngineFixture:
+    """
+    Build a host that has been deployed and configured before.
+
+    Holds the templates under /usr/local/share/srv/data, the stored
+    configuration, server and client WireGuard keys and addresses, the
+    internal CA and the deployed tools, which is what the configuration
+    tasks read. Commands go to a simulated engine.
+
+    Args:
+        templates: Template contents by path relative to the data directory.
+        client_count: Number of WireGuard clients.
+
+    Returns:
+        EngineFixture: The configuration, file system and engine of the host.
+    """
+    config = ConfigurationData.default()
+    config.server_data_dir = SERVER_DATA_DIR
+    config.remote_ip_address = "203.0.113.10"
+    config.clients_data_dir = "/srv/clients"
+    config.num_wireguard_clients = client_count
+    config.wireguard_client_names = [f"client{index:05d}" for index in range(client_count)]
+
+    file_system = InMemoryFileSystemService(
+        {
+            f"/usr/local/share/{SERVER_DATA_DIR}/data/{path}": text
+            for path, text in templates.items()
+        }
+    )
+    file_system.write_json(STORED_CONFIGURATION_PATH, config.as_object())
+    file_system.write_text("/proc/meminfo", "MemTotal:        8167848 kB\n")
+    file_system.write_text("/etc/ssl/internal-pki/ca.crt", "-----BEGIN CERTIFICATE-----\n")
+    file_system.write_text("/usr/local/sbin/autostart.pyz", "")
+    file_system.write_text("/etc/wireguard/server.key", _key("server", 0))
+    file_system.write_text("/etc/wireguard/server.pub", _key("server-pub", 0))
+    file_system.write_text("/etc/wireguard/server.ip", "10.10.0.1")
+    for index, client_name in enumerate(config.wireguard_client_names):
+        client_path = f"/etc/wireguard/clients/{client_name}"
+        file_system.write_text(f"{client_path}.ip", str(FIRST_CLIENT_ADDRESS + index))
+        file_system.write_text(f"{client_path}.key", _key("client", index))
+        file_system.write_text(f"{client_path}.pub", _key("client-pub", index))
+
+    return EngineFixture(config, file_system, SimulatedEngineService())
+
+
+def _key(kind: str, index: int) -> str:
+    # Same length as a base64 WireGuard key
+    return f"{kind}-{index}".ljust(43, "A") + "="
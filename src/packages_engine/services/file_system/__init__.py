@@ -2,5 +2,12 @@
 
 from .file_system_service import FileSystemService
 from .file_system_service_contract import FileSystemServiceContract
+from .in_memory_file_system_service import InMemoryFileSystemService
+from .overlay_file_system_service import OverlayFileSystemService
 
-__all__ = ["FileSystemService", "FileSystemServiceContract"]
+__all__ = [
+    "FileSystemService",
+    "FileSystemServiceContract",
+    "InMemoryFileSystemService",
+    "OverlayFileSystemService",
+]
@@ -0,0 +1,137 @@
+"""In-memory File System Service - keeps files in a dictionary instead of on disk."""
+
+import json
+import posixpath
+from typing import Any, Optional
+
+from packages_engine.models import OperationResult
+
+from .file_system_service_contract import FileSystemServiceContract
+
+
+class InMemoryFileSystemService(FileSystemServiceContract):
+    """
+    File system service implementation backed by dictionaries.
+
+    Behaves like FileSystemService without touching the disk or running
+    commands, so engine code can be exercised at scale. JSON is stored as text
+    and parsed on every read, like a file would be. Parent directories of
+    files exist implicitly.
+
+    Attributes:
+        files: File contents by normalized absolute path.
+        directories: Directories created with make_dir or copy_path.
+        modes: Modes set with chmod.
+    """
+
+    def __init__(self, files: Optional[dict[str, str]] = None):
+        """
+        Initialize the file system.
+
+        Args:
+            files: Initial file contents by path.
+        """
+        self.files: dict[str, str] = {}
+        self.directories: set[str] = {"/"}
+        self.modes: dict[str, int] = {}
+        for path_location, text in (files or {}).items():
+            self.write_text(path_location, text)
+
+    def read_text(self, path_location: str) -> OperationResult[str]:
+        path = _normalize(path_location)
+        if path not in self.files:
+            if path in self.directories:
+                return OperationResult[str].fail(f"Path {path_location} is not a file")
+            return OperationResult[str].fail(f"Path {path_location} does not exist")
+        return OperationResult[str].succeed(self.files[path])
+
+    def write_text(self, path_location: str, text: str) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        if path in self.directories:
+            return OperationResult[bool].fail(f"Path {path_location} is not a file")
+        self._add_parents(path)
+        self.files[path] = text
+        return OperationResult[bool].succeed(True)
+
+    def read_json(self, path_location: str) -> OperationResult[Any]:
+        read_result = self.read_text(path_location)
+        if not read_result.success or read_result.data is None:
+            return read_result.as_fail()
+        try:
+            return OperationResult[Any].succeed(json.loads(read_result.data))
+        except json.JSONDecodeError:
+            return OperationResult[Any].fail(
+                f"Error: Failed to decode JSON from the file. Path: {path_location}"
+            )
+
+    def write_json(self, path_location: str, data: Any) -> OperationResult[bool]:
+        try:
+            text = json.dumps(data)
+        except TypeError:
+            return OperationResult[bool].fail(
+                f"Failed to save JSON data into the path: {path_location}"
+            )
+        return self.write_text(path_location, text)
+
+    def make_dir(self, path_location: str) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        if path in self.files:
+            return OperationResult[bool].fail(
+                f"Path {path_location} is file, so can not make the directory out of it."
+            )
+        self._add_parents(path)
+        self.directories.add(path)
+        return OperationResult[bool].succeed(True)
+
+    def chmod(self, path_location: str, chmod: int) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        if not self.path_exists(path):
+            return OperationResult[bool].fail(f"Path {path_location} does not exist.")
+        self.modes[path] = chmod
+        return OperationResult[bool].succeed(True)
+
+    def remove_location(self, path_location: str) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        prefix = path.rstrip("/") + "/"
+        self.files = {
+            key: text
+            for key, text in self.files.items()
+            if key != path and not key.startswith(prefix)
+        }
+        self.directories = {
+            key
+            for key in self.directories
+            if key == "/" or (key != path and not key.startswith(prefix))
+        }
+        return OperationResult[bool].succeed(True)
+
+    def path_exists(self, path_location: str) -> bool:
+        path = _normalize(path_location)
+        return path in self.files or path in self.directories
+
+    def copy_path(self, location_from: str, location_to: str) -> OperationResult[bool]:
+        source = _normalize(location_from)
+        target = _normalize(location_to)
+        if not self.path_exists(source):
+            return OperationResult[bool].fail(f'Path "{location_from}" does not exist')
+        self.remove_location(target)
+        if source in self.files:
+            return self.write_text(target, self.files[source])
+
+        prefix = source.rstrip("/") + "/"
+        for key in [key for key in self.directories if key == source or key.startswith(prefix)]:
+            self.make_dir(target + key[len(source) :])
+        copied = [(key, text) for key, text in self.files.items() if key.startswith(prefix)]
+        for key, text in copied:
+            self.write_text(target + key[len(source) :], text)
+        return OperationResult[bool].succeed(True)
+
+    def _add_parents(self, path: str):
+        parent = posixpath.dirname(path)
+        while parent not in self.directories:
+            self.directories.add(parent)
+            parent = posixpath.dirname(parent)
+
+
+def _normalize(path_location: str) -> str:
+    return posixpath.normpath(posixpath.join("/", path_location))
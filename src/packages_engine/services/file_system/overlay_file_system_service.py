@@ -0,0 +1,190 @@
+"""Overlay File System Service - copy-on-write layer over another file system."""
+
+import json
+import posixpath
+from typing import Any
+
+from packages_engine.models import OperationResult
+from packages_engine.models.plan import FileChange
+
+from .file_system_service_contract import FileSystemServiceContract
+
+
+class OverlayFileSystemService(FileSystemServiceContract):
+    """
+    File system service that reads through to another one and keeps writes in memory.
+
+    Reads see the overlay's own writes first and fall through to the lower
+    file system otherwise. Writes, directories, modes and removals never
+    reach the lower file system, so a full configuration run can be planned
+    against a live host and compared with it afterwards.
+
+    Attributes:
+        lower: File system the overlay reads through to.
+        files: Files written through the overlay by normalized absolute path.
+        directories: Directories created through the overlay.
+        modes: Modes set through the overlay.
+        removed: Paths removed through the overlay, hiding the lower paths below them.
+    """
+
+    def __init__(self, lower: FileSystemServiceContract):
+        """
+        Initialize the overlay.
+
+        Args:
+            lower: File system to read through to.
+        """
+        self.lower = lower
+        self.files: dict[str, str] = {}
+        self.directories: set[str] = set()
+        self.modes: dict[str, int] = {}
+        self.removed: set[str] = set()
+
+    def read_text(self, path_location: str) -> OperationResult[str]:
+        path = _normalize(path_location)
+        if path in self.files:
+            return OperationResult[str].succeed(self.files[path])
+        if path in self.directories:
+            return OperationResult[str].fail(f"Path {path_location} is not a file")
+        if self._is_removed(path):
+            return OperationResult[str].fail(f"Path {path_location} does not exist")
+        return self.lower.read_text(path)
+
+    def write_text(self, path_location: str, text: str) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        if path in self.directories:
+            return OperationResult[bool].fail(f"Path {path_location} is not a file")
+        self._add_parents(path)
+        self.removed.discard(path)
+        self.files[path] = text
+        return OperationResult[bool].succeed(True)
+
+    def read_json(self, path_location: str) -> OperationResult[Any]:
+        read_result = self.read_text(path_location)
+        if not read_result.success or read_result.data is None:
+            return read_result.as_fail()
+        try:
+            return OperationResult[Any].succeed(json.loads(read_result.data))
+        except json.JSONDecodeError:
+            return OperationResult[Any].fail(
+                f"Error: Failed to decode JSON from the file. Path: {path_location}"
+            )
+
+    def write_json(self, path_location: str, data: Any) -> OperationResult[bool]:
+        try:
+            text = json.dumps(data)
+        except TypeError:
+            return OperationResult[bool].fail(
+                f"Failed to save JSON data into the path: {path_location}"
+            )
+        return self.write_text(path_location, text)
+
+    def make_dir(self, path_location: str) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        if path in self.files:
+            return OperationResult[bool].fail(
+                f"Path {path_location} is file, so can not make the directory out of it."
+            )
+        self._add_parents(path)
+        self.removed.discard(path)
+        self.directories.add(path)
+        return OperationResult[bool].succeed(True)
+
+    def chmod(self, path_location: str, chmod: int) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        if not self.path_exists(path):
+            return OperationResult[bool].fail(f"Path {path_location} does not exist.")
+        self.modes[path] = chmod
+        return OperationResult[bool].succeed(True)
+
+    def remove_location(self, path_location: str) -> OperationResult[bool]:
+        path = _normalize(path_location)
+        prefix = path.rstrip("/") + "/"
+        self.files = {
+            key: text
+            for key, text in self.files.items()
+            if key != path and not key.startswith(prefix)
+        }
+        self.directories = {
+            key for key in self.directories if key != path and not key.startswith(prefix)
+        }
+        self.modes = {
+            key: mode
+            for key, mode in self.modes.items()
+            if key != path and not key.startswith(prefix)
+        }
+        self.removed.add(path)
+        return OperationResult[bool].succeed(True)
+
+    def path_exists(self, path_location: str) -> bool:
+        path = _normalize(path_location)
+        if path in self.files or path in self.directories:
+            return True
+        if self._is_removed(path):
+            return False
+        return self.lower.path_exists(path)
+
+    def copy_path(self, location_from: str, location_to: str) -> OperationResult[bool]:
+        source = _normalize(location_from)
+        target = _normalize(location_to)
+        if not self.path_exists(source):
+            return OperationResult[bool].fail(f'Path "{location_from}" does not exist')
+
+        read_result = self.read_text(source)
+        if read_result.success and read_result.data is not None:
+            self.remove_location(target)
+            return self.write_text(target, read_result.data)
+        if source not in self.directories:
+            # The contract cannot list directories, so only overlay directories can be copied
+            return OperationResult[bool].fail(
+                f'Copying directory "{location_from}" from the lower file system is not supported'
+            )
+
+        self.remove_location(target)
+        prefix = source.rstrip("/") + "/"
+        for key in [key for key in self.directories if key == source or key.startswith(prefix)]:
+            self.make_dir(target + key[len(source) :])
+        copied = [(key, text) for key, text in self.files.items() if key.startswith(prefix)]
+        for key, text in copied:
+            self.write_text(target + key[len(source) :], text)
+        return OperationResult[bool].succeed(True)
+
+    def changes(self) -> list[FileChange]:
+        """
+        Compare the overlay with the lower file system.
+
+        Returns:
+            list[FileChange]: Files that would be created, changed or removed, by path.
+        """
+        changes = []
+        for path in sorted(set(self.files) | self.removed):
+            before = self._lower_text(path)
+            after = self.files.get(path)
+            if after is None and (before is None or self.path_exists(path)):
+                continue
+            if before != after:
+                changes.append(FileChange(path, before, after, self.modes.get(path)))
+        return changes
+
+    def _lower_text(self, path: str) -> str | None:
+        if not self.lower.path_exists(path):
+            return None
+        read_result = self.lower.read_text(path)
+        return read_result.data if read_result.success else None
+
+    def _is_removed(self, path: str) -> bool:
+        return any(
+            path == removed or path.startswith(removed.rstrip("/") + "/")
+            for removed in self.removed
+        )
+
+    def _add_parents(self, path: str):
+        parent = posixpath.dirname(path)
+        while parent not in self.directories and parent != "/":
+            self.directories.add(parent)
+            self.removed.discard(parent)
+            parent = posixpath.dirname(parent)
+
+
+def _normalize(path_location: str) -> str:
+    return posixpath.abspath(path_location)
@@ -0,0 +1,6 @@
+"""Necessary imports for export."""
+
+from .host_resources_service import HostResourcesService
+from .host_resources_service_contract import HostResourcesServiceContract
+
+__all__ = ["HostResourcesService", "HostResourcesServiceContract"]
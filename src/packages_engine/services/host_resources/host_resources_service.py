@@ -0,0 +1,145 @@
+"""Host Resources Service - implementation reading host capacity from the system."""
+
+import os
+import resource
+import shutil
+from pathlib import Path
+
+from packages_engine.models import OperationResult
+from packages_engine.services.file_system import FileSystemServiceContract
+
+from .host_resources_service_contract import HostResourcesServiceContract
+
+MEMINFO_PATH = "/proc/meminfo"
+SYS_BLOCK_DIR = "/sys/block"
+SYS_CLASS_NET_DIR = "/sys/class/net"
+# Virtual block devices whose rotational flag says nothing about the storage.
+VIRTUAL_BLOCK_DEVICE_PREFIXES = ("loop", "ram", "zram", "sr", "fd", "nbd")
+
+
+class HostResourcesService(HostResourcesServiceContract):
+    """
+    Host resources service implementation for Linux hosts.
+
+    Reads memory figures from /proc/meminfo, the disk type from
+    /sys/block/*/queue/rotational and the CPU count and file descriptor
+    limit from the Python runtime, free disk space from the
+    filesystem holding a path and network interfaces from /sys/class/net.
+
+    Attributes:
+        file_system: Service used to read the kernel provided files.
+        sys_block_dir: Location of the block devices sysfs directory.
+        sys_class_net_dir: Location of the network interfaces sysfs directory.
+    """
+
+    def __init__(
+        self,
+        file_system: FileSystemServiceContract,
+        sys_block_dir: str = SYS_BLOCK_DIR,
+        sys_class_net_dir: str = SYS_CLASS_NET_DIR,
+    ):
+        """
+        Initialize the host resources service.
+
+        Args:
+            file_system: Service used to read the kernel provided files.
+            sys_block_dir: Location of the block devices sysfs directory.
+            sys_class_net_dir: Location of the network interfaces sysfs directory.
+        """
+        self.file_system = file_system
+        self.sys_block_dir = sys_block_dir
+        self.sys_class_net_dir = sys_class_net_dir
+
+    def memory_total_bytes(self) -> OperationResult[int]:
+        """
+        Read the MemTotal entry of /proc/meminfo.
+
+        Returns:
+            OperationResult[int]: Total memory in bytes, or failure if the entry is missing.
+        """
+        read_result = self.file_system.read_text(MEMINFO_PATH)
+        if not read_result.success or read_result.data is None:
+            return read_result.as_fail()
+
+        for line in read_result.data.splitlines():
+            key, _, value = line.partition(":")
+            if key.strip() != "MemTotal":
+                continue
+            parts = value.split()
+            if not parts or not parts[0].isdigit():
+                break
+            # /proc/meminfo reports kB (KiB)
+            return OperationResult[int].succeed(int(parts[0]) * 1024)
+
+        return OperationResult[int].fail(f"MemTotal not found in {MEMINFO_PATH}")
+
+    def cpu_count(self) -> int:
+        """
+        Get the number of logical CPUs of the host.
+
+        Returns:
+            int: Number of logical CPUs, at least 1.
+        """
+        return os.cpu_count() or 1
+
+    def storage_is_rotational(self) -> bool:
+        """
+        Check the rotational flag of every physical block device.
+
+        Returns:
+            bool: True if any physical disk is rotational, False for SSD/NVMe only hosts.
+        """
+        for flag_path in sorted(Path(self.sys_block_dir).glob("*/queue/rotational")):
+            device = flag_path.parent.parent.name
+            if device.startswith(VIRTUAL_BLOCK_DEVICE_PREFIXES):
+                continue
+            read_result = self.file_system.read_text(flag_path.as_posix())
+            if read_result.success and read_result.data is not None:
+                if read_result.data.strip() == "1":
+                    return True
+
+        return False
+
+    def open_files_limit(self) -> int:
+        """
+        Get the hard RLIMIT_NOFILE of the current process (`ulimit -Hn`).
+
+        Returns:
+            int: Hard open files limit, 1048576 when unlimited.
+        """
+        _, hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if hard_limit == resource.RLIM_INFINITY:
+            return 1048576
+        return hard_limit
+
+    def disk_free_bytes(self, path: str) -> int:
+        """
+        Get the free space of the filesystem holding a path.
+
+        The nearest existing parent is inspected when the path does not exist yet.
+
+        Args:
+            path: Path whose filesystem is inspected.
+
+        Returns:
+            int: Free bytes available to unprivileged users, 0 if it cannot be detected.
+        """
+        candidate = Path(path)
+        while not candidate.exists() and candidate != candidate.parent:
+            candidate = candidate.parent
+        try:
+            return shutil.disk_usage(candidate).free
+        except OSError:
+            return 0
+
+    def network_interfaces(self) -> list[str]:
+        """
+        List the entries of /sys/class/net.
+
+        Returns:
+            list[str]: Interface names sorted alphabetically, empty if they cannot be listed.
+        """
+        try:
+            return sorted(os.listdir(self.sys_class_net_dir))
+        except OSError:
+            return []
@@ -0,0 +1,71 @@
+"""Host Resources Service Contract - defines interface for host capacity detection."""
+
+from abc import ABC, abstractmethod
+
+from packages_engine.models import OperationResult
+
+
+class HostResourcesServiceContract(ABC):
+    """
+    Abstract base class defining the contract for host resources detection.
+
+    Provides the host capacity figures that configuration tasks use to size
+    services to the machine they are deployed on.
+    """
+
+    @abstractmethod
+    def memory_total_bytes(self) -> OperationResult[int]:
+        """
+        Read the total physical memory of the host.
+
+        Returns:
+            OperationResult[int]: Total memory in bytes, or failure if it cannot be detected.
+        """
+
+    @abstractmethod
+    def cpu_count(self) -> int:
+        """
+        Get the number of logical CPUs of the host.
+
+        Returns:
+            int: Number of logical CPUs, at least 1.
+        """
+
+    @abstractmethod
+    def storage_is_rotational(self) -> bool:
+        """
+        Check whether the host storage is made of rotational disks.
+
+        Returns:
+            bool: True if any physical disk reports itself as rotational.
+        """
+
+    @abstractmethod
+    def open_files_limit(self) -> int:
+        """
+        Get the maximum number of open files a process may raise its limit to.
+
+        Returns:
+            int: Hard RLIMIT_NOFILE of the current process.
+        """
+
+    @abstractmethod
+    def disk_free_bytes(self, path: str) -> int:
+        """
+        Get the free space of the filesystem holding a path.
+
+        Args:
+            path: Path whose filesystem is inspected; it does not need to exist yet.
+
+        Returns:
+            int: Free bytes, 0 if it cannot be detected.
+        """
+
+    @abstractmethod
+    def network_interfaces(self) -> list[str]:
+        """
+        List the network interfaces of the host.
+
+        Returns:
+            list[str]: Interface names sorted alphabetically, empty if they cannot be listed.
+        """
@@ -0,0 +1,80 @@
+"""Mock Host Resources Service - test double for host capacity detection."""
+
+from packages_engine.models import OperationResult
+
+from .host_resources_service_contract import HostResourcesServiceContract
+
+
+class MockHostResourcesService(HostResourcesServiceContract):
+    """
+    Mock implementation of HostResourcesService for testing purposes.
+
+    Attributes:
+        memory_total_bytes_calls: Number of memory_total_bytes calls.
+        memory_total_bytes_result: Result returned by memory_total_bytes.
+        cpu_count_calls: Number of cpu_count calls.
+        cpu_count_result: Result returned by cpu_count.
+        storage_is_rotational_calls: Number of storage_is_rotational calls.
+        storage_is_rotational_result: Result returned by storage_is_rotational.
+        open_files_limit_calls: Number of open_files_limit calls.
+        open_files_limit_result: Result returned by open_files_limit.
+        disk_free_bytes_params: Paths passed to disk_free_bytes.
+        disk_free_bytes_result: Result returned by disk_free_bytes.
+        network_interfaces_calls: Number of network_interfaces calls.
+        network_interfaces_result: Result returned by network_interfaces.
+    """
+
+    def __init__(self):
+        """Initialize the mock with a 4 GiB, 2 CPU host backed by a 20 GiB free SSD.
+
+        The host has an uplink, WireGuard and the Docker bridges of the stack.
+        """
+        self.memory_total_bytes_calls = 0
+        self.memory_total_bytes_result = OperationResult[int].succeed(4 * 1024**3)
+        self.cpu_count_calls = 0
+        self.cpu_count_result = 2
+        self.storage_is_rotational_calls = 0
+        self.storage_is_rotational_result = False
+        self.open_files_limit_calls = 0
+        self.open_files_limit_result = 524288
+        self.disk_free_bytes_params: list[str] = []
+        self.disk_free_bytes_result = 20 * 1024**3
+        self.network_interfaces_calls = 0
+        self.network_interfaces_result = [
+            "br-3f2a9c1d7e60",
+            "br-vpnfwd",
+            "docker0",
+            "eth0",
+            "lo",
+            "wg0",
+        ]
+
+    def memory_total_bytes(self) -> OperationResult[int]:
+        """Record the call and return the configured memory result."""
+        self.memory_total_bytes_calls += 1
+        return self.memory_total_bytes_result
+
+    def cpu_count(self) -> int:
+        """Record the call and return the configured CPU count."""
+        self.cpu_count_calls += 1
+        return self.cpu_count_result
+
+    def storage_is_rotational(self) -> bool:
+        """Record the call and return the configured storage type."""
+        self.storage_is_rotational_calls += 1
+        return self.storage_is_rotational_result
+
+    def open_files_limit(self) -> int:
+        """Record the call and return the configured open files limit."""
+        self.open_files_limit_calls += 1
+        return self.open_files_limit_result
+
+    def disk_free_bytes(self, path: str) -> int:
+        """Record the path and return the configured free space."""
+        self.disk_free_bytes_params.append(path)
+        return self.disk_free_bytes_result
+
+    def network_interfaces(self) -> list[str]:
+        """Record the call and return the configured interfaces."""
+        self.network_interfaces_calls += 1
+        return self.network_interfaces_result
@@ -0,0 +1,14 @@
+"""Necessary imports for export."""
+
+from .http_benchmark_service import HttpBenchmarkService
+from .http_benchmark_service_contract import HttpBenchmarkServiceContract
+from .http_wire import HttpResponse, build_request, parse_request_mix, request_schedule
+
+__all__ = [
+    "HttpBenchmarkService",
+    "HttpBenchmarkServiceContract",
+    "HttpResponse",
+    "build_request",
+    "parse_request_mix",
+    "request_schedule",
+]
@@ -0,0 +1,226 @@
+"""HTTP Benchmark Service - asyncio implementation of HTTP load generation."""
+
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    HttpBenchmarkPlan,
+    HttpBenchmarkReport,
+    HttpRequestReport,
+    HttpRequestSpec,
+    LatencyHistogram,
+    LatencySummary,
+)
+
+from .http_benchmark_service_contract import HttpBenchmarkServiceContract
+from .http_wire import build_request, read_response, request_schedule
+
+
+@dataclass
+class RequestOutcome:
+    """Result of one request."""
+
+    spec: HttpRequestSpec
+    latency_ms: Optional[float]
+    status: Optional[int]
+    body_bytes: int = 0
+    error: Optional[str] = None
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Name the kind of a transport error for the error breakdown.
+
+    Args:
+        error: Exception raised while sending or reading a request.
+
+    Returns:
+        str: Short error kind.
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(error, ssl.SSLError):
+        return "tls"
+    if isinstance(error, asyncio.IncompleteReadError):
+        return "incomplete_response"
+    if isinstance(error, (ValueError, asyncio.LimitOverrunError)):
+        return "protocol"
+    return type(error).__name__
+
+
+class HttpBenchmarkService(HttpBenchmarkServiceContract):
+    """
+    HTTP benchmark service implementation using asyncio streams.
+
+    Runs `concurrency` workers, each holding one HTTP/1.1 connection that is
+    reused for its next request when keep-alive is on and the server agrees.
+    The request mix is spread by weight. Latency is measured from the moment a
+    worker starts a request, including a connect when one is needed, until
+    the response body has been read.
+    """
+
+    def run(self, plan: HttpBenchmarkPlan) -> OperationResult[HttpBenchmarkReport]:
+        """
+        Run an HTTP benchmark.
+
+        Args:
+            plan: Target, request mix and load settings.
+
+        Returns:
+            OperationResult[HttpBenchmarkReport]: Run results, or failure if there is
+            nothing to send or the TLS context cannot be created.
+        """
+        if not plan.requests or plan.total_requests < 1:
+            return OperationResult[HttpBenchmarkReport].fail("No requests to send")
+
+        ssl_context = None
+        if plan.use_tls:
+            try:
+                ssl_context = ssl.create_default_context(cafile=plan.ca_file or None)
+            except (OSError, ssl.SSLError) as error:
+                return OperationResult[HttpBenchmarkReport].fail(
+                    f"Loading CA {plan.ca_file} failed: {error}"
+                )
+
+        started = time.perf_counter()
+        outcomes, connections = asyncio.run(self._run_workers(plan, ssl_context))
+        duration = time.perf_counter() - started
+        return OperationResult[HttpBenchmarkReport].succeed(
+            summarize(plan, outcomes, connections, duration)
+        )
+
+    async def _run_workers(
+        self, plan: HttpBenchmarkPlan, ssl_context: Optional[ssl.SSLContext]
+    ) -> tuple[list[RequestOutcome], int]:
+        jobs = iter(request_schedule(plan.requests, plan.total_requests))
+        default_port = 443 if plan.use_tls else 80
+        host_header = plan.host if plan.port == default_port else f"{plan.host}:{plan.port}"
+        outcomes: list[RequestOutcome] = []
+        connections = 0
+
+        async def worker():
+            nonlocal connections
+            reader: Optional[asyncio.StreamReader] = None
+            writer: Optional[asyncio.StreamWriter] = None
+            for spec in jobs:
+                started = time.perf_counter()
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.wait_for(
+                            asyncio.open_connection(
+                                plan.host,
+                                plan.port,
+                                ssl=ssl_context,
+                                server_hostname=plan.host if ssl_context else None,
+                            ),
+                            plan.timeout_seconds,
+                        )
+                        connections += 1
+                    assert reader is not None
+                    writer.write(build_request(spec, host_header, plan.keep_alive))
+                    await writer.drain()
+                    response = await asyncio.wait_for(
+                        read_response(reader, spec.method), plan.timeout_seconds
+                    )
+                except (
+                    OSError,
+                    ValueError,
+                    asyncio.TimeoutError,
+                    asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError,
+                ) as error:
+                    outcomes.append(RequestOutcome(spec, None, None, error=classify_error(error)))
+                    await _close(writer)
+                    reader, writer = None, None
+                    continue
+
+                latency_ms = (time.perf_counter() - started) * 1000
+                outcomes.append(
+                    RequestOutcome(spec, latency_ms, response.status, response.body_bytes)
+                )
+                if not (plan.keep_alive and response.keep_alive):
+                    await _close(writer)
+                    reader, writer = None, None
+            await _close(writer)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, plan.concurrency))))
+        return outcomes, connections
+
+
+async def _close(writer: Optional[asyncio.StreamWriter]):
+    if writer is None:
+        return
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (OSError, ssl.SSLError):
+        pass
+
+
+def summarize(
+    plan: HttpBenchmarkPlan, outcomes: list[RequestOutcome], connections: int, duration: float
+) -> HttpBenchmarkReport:
+    """
+    Build the report of a run.
+
+    Requests fail on transport errors and on 4xx or 5xx responses.
+
+    Args:
+        plan: The plan that was run.
+        outcomes: Result of every request.
+        connections: Number of connections opened.
+        duration: Wall time of the run in seconds.
+
+    Returns:
+        HttpBenchmarkReport: The run report.
+    """
+    histogram = LatencyHistogram()
+    status_counts: dict[str, int] = {}
+    errors: dict[str, int] = {}
+    for outcome in outcomes:
+        if outcome.latency_ms is not None:
+            histogram.record(outcome.latency_ms)
+        if outcome.status is not None:
+            status_counts[str(outcome.status)] = status_counts.get(str(outcome.status), 0) + 1
+        if outcome.error is not None:
+            errors[outcome.error] = errors.get(outcome.error, 0) + 1
+
+    per_request = []
+    for spec in plan.requests:
+        spec_outcomes = [outcome for outcome in outcomes if outcome.spec is spec]
+        per_request.append(
+            HttpRequestReport(
+                spec.method,
+                spec.path,
+                len(spec_outcomes),
+                sum(1 for outcome in spec_outcomes if _failed(outcome)),
+                LatencySummary.from_samples(
+                    [o.latency_ms for o in spec_outcomes if o.latency_ms is not None]
+                ),
+            )
+        )
+
+    scheme = "https" if plan.use_tls else "http"
+    return HttpBenchmarkReport(
+        target=f"{scheme}://{plan.host}:{plan.port}",
+        requests=len(outcomes),
+        failed=sum(1 for outcome in outcomes if _failed(outcome)),
+        duration_seconds=duration,
+        bytes_received=sum(outcome.body_bytes for outcome in outcomes),
+        connections_opened=connections,
+        latency=LatencySummary.from_samples(
+            [outcome.latency_ms for outcome in outcomes if outcome.latency_ms is not None]
+        ),
+        histogram=histogram,
+        per_request=per_request,
+        status_counts=dict(sorted(status_counts.items())),
+        errors=errors,
+    )
+
+
+def _failed(outcome: RequestOutcome) -> bool:
+    return outcome.error is not None or (outcome.status or 0) >= 400
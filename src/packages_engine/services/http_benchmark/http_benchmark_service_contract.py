@@ -0,0 +1,28 @@
+"""HTTP Benchmark Service Contract - defines interface for HTTP load generation."""
+
+from abc import ABC, abstractmethod
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import HttpBenchmarkPlan, HttpBenchmarkReport
+
+
+class HttpBenchmarkServiceContract(ABC):
+    """
+    Abstract base class defining the contract for HTTP load generation.
+
+    Sends a weighted request mix over a pool of connections and summarizes
+    throughput, latency and errors.
+    """
+
+    @abstractmethod
+    def run(self, plan: HttpBenchmarkPlan) -> OperationResult[HttpBenchmarkReport]:
+        """
+        Run an HTTP benchmark.
+
+        Args:
+            plan: Target, request mix and load settings.
+
+        Returns:
+            OperationResult[HttpBenchmarkReport]: Run results, or failure if the
+            run cannot be started.
+        """
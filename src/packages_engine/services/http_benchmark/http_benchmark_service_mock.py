@@ -0,0 +1,42 @@
+"""Mock HTTP Benchmark Service - test double for HTTP load generation."""
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    HttpBenchmarkPlan,
+    HttpBenchmarkReport,
+    LatencyHistogram,
+    LatencySummary,
+)
+
+from .http_benchmark_service_contract import HttpBenchmarkServiceContract
+
+
+class MockHttpBenchmarkService(HttpBenchmarkServiceContract):
+    """
+    Mock implementation of HttpBenchmarkService for testing purposes.
+
+    Attributes:
+        run_params: Plans passed to run.
+        run_result: Result returned by run.
+    """
+
+    def __init__(self):
+        """Initialize the mock with an empty one second run."""
+        self.run_params: list[HttpBenchmarkPlan] = []
+        self.run_result = OperationResult[HttpBenchmarkReport].succeed(
+            HttpBenchmarkReport(
+                "http://127.0.0.1:80",
+                0,
+                0,
+                1.0,
+                0,
+                0,
+                LatencySummary.from_samples([]),
+                LatencyHistogram(),
+            )
+        )
+
+    def run(self, plan: HttpBenchmarkPlan) -> OperationResult[HttpBenchmarkReport]:
+        """Record the plan and return the configured result."""
+        self.run_params.append(plan)
+        return self.run_result
@@ -0,0 +1,153 @@
+"""Minimal HTTP/1.1 client framing for benchmark requests."""
+
+import asyncio
+from dataclasses import dataclass
+
+from packages_engine.models.benchmark import HttpRequestSpec
+
+MAX_HEADER_BYTES = 64 * 1024
+BODYLESS_STATUSES = (204, 304)
+
+
+@dataclass
+class HttpResponse:
+    """Status, body size and reusability of a response."""
+
+    status: int
+    body_bytes: int
+    keep_alive: bool
+
+
+def build_request(spec: HttpRequestSpec, host_header: str, keep_alive: bool) -> bytes:
+    """
+    Build an HTTP/1.1 request without a body.
+
+    Args:
+        spec: Method and path of the request.
+        host_header: Value of the Host header.
+        keep_alive: Whether the connection should be kept open.
+
+    Returns:
+        bytes: The request bytes.
+    """
+    connection = "keep-alive" if keep_alive else "close"
+    return (
+        f"{spec.method} {spec.path} HTTP/1.1\r\n"
+        f"Host: {host_header}\r\n"
+        "User-Agent: http-benchmark\r\n"
+        "Accept: */*\r\n"
+        f"Connection: {connection}\r\n"
+        "\r\n"
+    ).encode("ascii")
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> int:
+    total = 0
+    while True:
+        size_line = await reader.readuntil(b"\r\n")
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # Trailers end with an empty line
+            while await reader.readuntil(b"\r\n") != b"\r\n":
+                pass
+            return total
+        await reader.readexactly(size + 2)
+        total += size
+
+
+async def read_response(reader: asyncio.StreamReader, method: str) -> HttpResponse:
+    """
+    Read one response and drain its body.
+
+    Args:
+        reader: Stream positioned at the start of a response.
+        method: Method of the request, HEAD responses have no body.
+
+    Returns:
+        HttpResponse: Status, body size and whether the connection can be reused.
+
+    Raises:
+        ValueError: If the response is not valid HTTP/1.x.
+        asyncio.IncompleteReadError: If the connection closes mid-response.
+    """
+    head = await reader.readuntil(b"\r\n\r\n")
+    if len(head) > MAX_HEADER_BYTES:
+        raise ValueError("Response header too large")
+    lines = head.decode("latin-1").split("\r\n")
+    parts = lines[0].split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/1.") or not parts[1].isdigit():
+        raise ValueError(f"Invalid status line {lines[0]!r}")
+    version, status = parts[0], int(parts[1])
+
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+    if method == "HEAD" or status in BODYLESS_STATUSES or 100 <= status < 200:
+        return HttpResponse(status, 0, keep_alive)
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        return HttpResponse(status, await _read_chunked(reader), keep_alive)
+    if "content-length" in headers:
+        length = int(headers["content-length"])
+        await reader.readexactly(length)
+        return HttpResponse(status, length, keep_alive)
+    # Body runs until the server closes the connection
+    body = await reader.read()
+    return HttpResponse(status, len(body), False)
+
+
+def request_schedule(specs: list[HttpRequestSpec], total: int) -> list[HttpRequestSpec]:
+    """
+    Spread the requests of a mix by weight with smooth weighted round robin.
+
+    Args:
+        specs: Requests of the mix.
+        total: Number of requests to schedule.
+
+    Returns:
+        list[HttpRequestSpec]: Requests in the order they are sent.
+    """
+    weights = [max(1, spec.weight) for spec in specs]
+    current = [0] * len(specs)
+    schedule = []
+    for _ in range(total if specs else 0):
+        for index, weight in enumerate(weights):
+            current[index] += weight
+        chosen = current.index(max(current))
+        current[chosen] -= sum(weights)
+        schedule.append(specs[chosen])
+    return schedule
+
+
+def parse_request_mix(text: str) -> list[HttpRequestSpec]:
+    """
+    Parse a request mix such as "GET /:5,HEAD /api/v1/version:1".
+
+    The method defaults to GET and the weight to 1.
+
+    Args:
+        text: Comma separated requests.
+
+    Returns:
+        list[HttpRequestSpec]: The parsed requests.
+
+    Raises:
+        ValueError: If a weight is not a positive integer or a path is missing.
+    """
+    specs = []
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        target, _, weight = item.rpartition(":") if ":" in item else (item, "", "1")
+        method, _, path = target.strip().rpartition(" ")
+        if not path.startswith("/") or not weight.isdigit() or int(weight) < 1:
+            raise ValueError(f"Invalid request {item!r}")
+        specs.append(HttpRequestSpec((method or "GET").upper(), path, int(weight)))
+    return specs
@@ -8,6 +8,7 @@ from .nginx import *
 from .dnsmasq import *
 from .setup import *
 from .post_install_check import *
+from .offline_bundle import *
 
 __all__ = [
     "InstallerTask",
@@ -18,5 +19,6 @@ __all__ = [
     "nginx",
     "dnsmasq",
     "setup",
-    "post_install_check"
+    "post_install_check",
+    "offline_bundle"
 ]
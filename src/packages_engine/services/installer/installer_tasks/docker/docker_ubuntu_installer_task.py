@@ -6,6 +6,8 @@ from packages_engine.services.notifications import NotificationsServiceContract
 from packages_engine.services.package_controller import PackageControllerServiceContract
 from packages_engine.services.system_management_engine import SystemManagementEngineService
 
+OFFLINE_BUNDLE_LIST = "/etc/apt/sources.list.d/offline-bundle.list"
+
 
 class DockerUbuntuInstallerTask(InstallerTask):
     """Docker Linux Ubuntu installation task implementation."""
@@ -32,12 +34,14 @@ class DockerUbuntuInstallerTask(InstallerTask):
                 # 0) Remove conflicting packages (safe to run even if none present)
                 "for pkg in docker.io docker-doc docker-compose docker-compose-v2 podman-docker "
                 "containerd runc; do sudo apt-get -y remove $pkg >/dev/null 2>&1 || true; done",
-                # 1) Keyring dir + official key (per docs)
+                # 1) Keyring dir + official key (per docs), the offline bundle ships the packages
                 "sudo install -m 0755 -d /etc/apt/keyrings",
+                f"test -f {OFFLINE_BUNDLE_LIST} || "
                 "test -f /etc/apt/keyrings/docker.asc || sudo curl -fsSL "
                 "https://download.docker.com/linux/ubuntu/gpg -o /etc/apt/keyrings/docker.asc",
-                "sudo chmod a+r /etc/apt/keyrings/docker.asc",
+                f"test -f {OFFLINE_BUNDLE_LIST} || sudo chmod a+r /etc/apt/keyrings/docker.asc",
                 # 2) Repo line (idempotent write)
+                f"test -f {OFFLINE_BUNDLE_LIST} || "
                 "grep -qs '^deb .*download.docker.com/linux/ubuntu' "
                 "/etc/apt/sources.list.d/docker.list || "
                 'echo "deb [arch=$(dpkg --print-architecture) signed-by=/etc/apt/keyrings/docker.asc] '
@@ -45,6 +49,7 @@ class DockerUbuntuInstallerTask(InstallerTask):
                 '$(. /etc/os-release && echo \\"${UBUNTU_CODENAME:-$VERSION_CODENAME}\\") stable" | '
                 "sudo tee /etc/apt/sources.list.d/docker.list >/dev/null",
                 # 3) Update indexes NOW that the repo exists
+                f"test -f {OFFLINE_BUNDLE_LIST} || "
                 "sudo DEBIAN_FRONTEND=noninteractive apt-get update",
                 # 4) Install Docker Engine + friends (no recommends keeps it lean)
                 "sudo DEBIAN_FRONTEND=noninteractive apt-get install -y --no-install-recommends "
@@ -0,0 +1,6 @@
+"""Necessary imports for export."""
+
+from .offline_bundle_ubuntu_installer_task import OfflineBundleUbuntuInstallerTask
+from .offline_bundle_windows_installer_task import OfflineBundleWindowsInstallerTask
+
+__all__ = ["OfflineBundleUbuntuInstallerTask", "OfflineBundleWindowsInstallerTask"]
@@ -0,0 +1,54 @@
+"""Modules necessary for the Offline Bundle installer task implementation."""
+
+from packages_engine.models import OperationResult
+from packages_engine.services.file_system import FileSystemServiceContract
+from packages_engine.services.installer.installer_tasks import InstallerTask
+from packages_engine.services.notifications import NotificationsServiceContract
+from packages_engine.services.package_controller import PackageControllerServiceContract
+
+BUNDLE_LOCATION = "/usr/local/share/bundle"
+BUNDLE_SOURCES_LIST = "/etc/apt/sources.list.d/offline-bundle.list"
+
+
+class OfflineBundleUbuntuInstallerTask(InstallerTask):
+    """Offline Bundle Installer Task implementation on Linux Ubuntu Server platform.
+
+    Registers the .deb closure shipped by "build.sh --bundle" as a local apt repository,
+    so the remaining installer tasks resolve their packages without reaching the internet.
+    """
+
+    def __init__(
+        self,
+        notifications: NotificationsServiceContract,
+        file_system: FileSystemServiceContract,
+        controller: PackageControllerServiceContract,
+    ):
+        self.notifications = notifications
+        self.file_system = file_system
+        self.controller = controller
+
+    def install(self) -> OperationResult[bool]:
+        self.notifications.info("Offline bundle will be registered if it is deployed.")
+        if not self.file_system.path_exists(f"{BUNDLE_LOCATION}/manifest.json"):
+            self.notifications.success(
+                "\tOffline bundle is not deployed. Packages will be downloaded."
+            )
+            return OperationResult[bool].succeed(True)
+
+        result = self.controller.run_raw_commands(
+            [
+                # Refuse partially copied bundles.
+                f"cd {BUNDLE_LOCATION} && sha256sum --quiet --strict -c SHA256SUMS",
+                f"echo 'deb [trusted=yes] file:{BUNDLE_LOCATION}/debs ./' | "
+                f"sudo tee {BUNDLE_SOURCES_LIST} >/dev/null",
+                # Index only the local repository, the box may not have any uplink.
+                "sudo DEBIAN_FRONTEND=noninteractive apt-get update "
+                f"-o Dir::Etc::sourcelist={BUNDLE_SOURCES_LIST} "
+                "-o Dir::Etc::sourceparts=- -o APT::Get::List-Cleanup=0",
+            ]
+        )
+
+        if not result.success:
+            self.notifications.error(f"Command failed. Message: {result.message}.")
+
+        return result
@@ -25,7 +25,7 @@ class SetupUbuntuInstallerTask(InstallerTask):
         result = self.controller.run_raw_commands(
             [
                 "sudo DEBIAN_FRONTEND=noninteractive apt-get update",
-                "sudo DEBIAN_FRONTEND=noninteractive apt-get install -y --no-install-recommends ca-certificates curl gnupg lsb-release jq",
+                "sudo DEBIAN_FRONTEND=noninteractive apt-get install -y --no-install-recommends ca-certificates curl gnupg lsb-release jq ethtool iputils-ping",
             ]
         )
 
@@ -0,0 +1,6 @@
+"""Necessary imports for export."""
+
+from .path_mtu_service import PathMtuService
+from .path_mtu_service_contract import PathMtuServiceContract
+
+__all__ = ["PathMtuService", "PathMtuServiceContract"]
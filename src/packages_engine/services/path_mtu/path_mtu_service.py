@@ -0,0 +1,88 @@
+"""Path MTU Service - implementation probing the path with DF-set pings."""
+
+import ipaddress
+import subprocess
+from typing import Callable
+
+from packages_engine.models import OperationResult
+
+from .path_mtu_service_contract import PathMtuServiceContract
+
+MIN_PROBE_MTU = 1280
+MAX_PROBE_MTU = 1500
+# IP plus ICMP echo headers that ping adds to the payload
+IPV4_PING_HEADER_BYTES = 28
+IPV6_PING_HEADER_BYTES = 48
+
+
+def df_ping(host: str, payload_bytes: int) -> bool:
+    """
+    Send one ping that must not be fragmented.
+
+    Args:
+        host: Address to ping.
+        payload_bytes: ICMP payload size.
+
+    Returns:
+        bool: True if a reply arrived.
+    """
+    try:
+        subprocess.run(
+            ["ping", "-M", "do", "-c", "1", "-W", "1", "-s", str(payload_bytes), host],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+class PathMtuService(PathMtuServiceContract):
+    """
+    Path MTU service implementation using DF-set pings.
+
+    Binary searches the packet size between 1280 and 1500 bytes. A probe
+    succeeds when a ping of that size with the don't fragment bit set is
+    answered.
+
+    Attributes:
+        ping: Callable sending one DF-set ping with a payload size.
+    """
+
+    def __init__(self, ping: Callable[[str, int], bool] = df_ping):
+        """
+        Initialize the path MTU service.
+
+        Args:
+            ping: Callable sending one DF-set ping with a payload size.
+        """
+        self.ping = ping
+
+    def discover(self, host: str) -> OperationResult[int]:
+        """
+        Binary search the largest packet size answered by the host.
+
+        Args:
+            host: IPv4 or IPv6 address of the probed host.
+
+        Returns:
+            OperationResult[int]: Path MTU in bytes, or failure if the host does not answer.
+        """
+        try:
+            version = ipaddress.ip_address(host).version
+        except ValueError:
+            return OperationResult[int].fail(f"{host} is not an IP address")
+        header_bytes = IPV6_PING_HEADER_BYTES if version == 6 else IPV4_PING_HEADER_BYTES
+
+        if not self.ping(host, MIN_PROBE_MTU - header_bytes):
+            return OperationResult[int].fail(f"{host} did not answer a {MIN_PROBE_MTU} byte probe")
+
+        low, high = MIN_PROBE_MTU, MAX_PROBE_MTU
+        while low < high:
+            size = (low + high + 1) // 2
+            if self.ping(host, size - header_bytes):
+                low = size
+            else:
+                high = size - 1
+        return OperationResult[int].succeed(low)
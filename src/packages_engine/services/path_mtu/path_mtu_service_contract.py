@@ -0,0 +1,27 @@
+"""Path MTU Service Contract - defines interface for path MTU discovery."""
+
+from abc import ABC, abstractmethod
+
+from packages_engine.models import OperationResult
+
+
+class PathMtuServiceContract(ABC):
+    """
+    Abstract base class defining the contract for path MTU discovery.
+
+    Finds the largest IP packet that reaches a host without being fragmented,
+    so tunnel MTUs can be sized to the real path instead of a guess.
+    """
+
+    @abstractmethod
+    def discover(self, host: str) -> OperationResult[int]:
+        """
+        Discover the path MTU to a host.
+
+        Args:
+            host: IPv4 or IPv6 address of the probed host.
+
+        Returns:
+            OperationResult[int]: Largest unfragmented IP packet size in bytes,
+            or failure if even the smallest probe gets no reply.
+        """
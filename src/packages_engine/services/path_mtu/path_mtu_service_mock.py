@@ -0,0 +1,25 @@
+"""Mock Path MTU Service - test double for path MTU discovery."""
+
+from packages_engine.models import OperationResult
+
+from .path_mtu_service_contract import PathMtuServiceContract
+
+
+class MockPathMtuService(PathMtuServiceContract):
+    """
+    Mock implementation of PathMtuService for testing purposes.
+
+    Attributes:
+        discover_params: Hosts passed to discover.
+        discover_result: Result returned by discover.
+    """
+
+    def __init__(self):
+        """Initialize the mock with a plain Ethernet path."""
+        self.discover_params: list[str] = []
+        self.discover_result = OperationResult[int].succeed(1500)
+
+    def discover(self, host: str) -> OperationResult[int]:
+        """Record the host and return the configured result."""
+        self.discover_params.append(host)
+        return self.discover_result
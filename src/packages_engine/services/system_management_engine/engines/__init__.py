@@ -1,5 +1,13 @@
 """Necessary imports for export."""
 
 from .linux_ubuntu_engine_service import LinuxUbuntuEngineService
+from .simulated_engine_service import SimulatedEngineService, SimulatedOperation
+from .simulated_latency import LatencyDistribution, SimulatedLatencyModel
 
-__all__ = ["LinuxUbuntuEngineService"]
+__all__ = [
+    "LatencyDistribution",
+    "LinuxUbuntuEngineService",
+    "SimulatedEngineService",
+    "SimulatedLatencyModel",
+    "SimulatedOperation",
+]
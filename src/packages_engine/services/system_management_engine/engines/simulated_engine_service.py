@@ -0,0 +1,402 @@
+"""Simulated Engine Service - system management engine that runs nothing."""
+
+import base64
+import hashlib
+import posixpath
+import random
+import re
+import shlex
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+from packages_engine.models.operation_result import OperationResult
+from packages_engine.services.system_management_engine.system_management_engine_service import (
+    SystemManagementEngineService,
+)
+
+from .simulated_latency import PACKAGE_QUERY, SPAWN, SYSTEMCTL, SimulatedLatencyModel
+
+if TYPE_CHECKING:
+    # The file system services import the engines through system management
+    from packages_engine.services.file_system import FileSystemServiceContract
+
+_LIST_SEPARATOR = re.compile(r"&&|\|\||;")
+_SKIP_IF_FILE_EXISTS = re.compile(r"^\s*test +-f +(\S+) *\|\|")
+_CONTAINER_NAME = re.compile(r"^\s*container_name:\s*[\"']?([\w.-]+)", re.MULTILINE)
+_SYSTEMCTL_STARTS = {"start", "restart", "reload", "reload-or-restart", "try-restart"}
+
+
+@dataclass
+class SimulatedOperation:
+    """One command run on the simulated host."""
+
+    command: str
+    kinds: list[str]
+    kind_seconds: list[float]
+
+    @property
+    def seconds(self) -> float:
+        """Duration of the whole command."""
+        return sum(self.kind_seconds)
+
+
+class SimulatedEngineService(SystemManagementEngineService):
+    """
+    System management engine that simulates a host instead of changing one.
+
+    Every command succeeds. The host keeps installed packages, unit states
+    and docker containers. When a file system is attached, it also gets the
+    files well known commands would create, such as WireGuard keys, openssl
+    outputs, directories from `install -d`, files from `install /dev/null`,
+    renames from `mv` and modes from `chmod`. Shell lines are not run, only
+    these recognized effects are applied.
+
+    Each operation takes a time drawn from the latency model. The time is
+    added to `simulated_seconds`, and with a non-zero `time_scale` the call
+    also sleeps for the scaled time, so concurrent callers overlap the way
+    they would on a real host.
+
+    Attributes:
+        installed: Packages installed so far.
+        running: Units started so far.
+        enabled: Units enabled so far.
+        containers: Docker containers up so far.
+        owners: Owners set with `chown` by path, directories changed recursively end with `/`.
+        file_system: Files of the host, when attached.
+        commands: Every command passed to the engine, in order.
+        operations: Every command with its operation kinds and duration, in order.
+        simulated_seconds: Total duration of all operations.
+    """
+
+    def __init__(
+        self,
+        installed: Optional[set[str]] = None,
+        running: Optional[set[str]] = None,
+        file_system: Optional["FileSystemServiceContract"] = None,
+        latency: Optional[SimulatedLatencyModel] = None,
+        time_scale: float = 0.0,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+        queries: Optional[SystemManagementEngineService] = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            installed: Packages that count as installed from the start.
+            running: Units that count as running from the start.
+            file_system: Files of the host, commands change no files without one.
+            latency: Operation latencies, every operation is instant without one.
+            time_scale: Real seconds slept per simulated second, 0 does not sleep.
+            seed: Seed of the latency samples, so runs can be repeated.
+            sleep: Sleeps the scaled time.
+            queries: Engine of a real host that answers package and unit queries
+                the simulation has no answer for, so plans match that host.
+        """
+        self.installed: set[str] = set(installed or ())
+        self.running: set[str] = set(running or ())
+        self.enabled: set[str] = set()
+        self.containers: set[str] = set()
+        self.owners: dict[str, str] = {}
+        self.file_system = file_system
+        self.latency = latency or SimulatedLatencyModel.instant()
+        self.time_scale = time_scale
+        self.commands: list[str] = []
+        self.operations: list[SimulatedOperation] = []
+        self.simulated_seconds = 0.0
+        self._sleep = sleep
+        self._queries = queries
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def is_installed(self, package: str) -> bool:
+        """
+        Check if a package was installed.
+
+        Args:
+            package: The name of the package to check.
+
+        Returns:
+            True if the package is installed, False otherwise.
+        """
+        self._record(f"dpkg -s {package}", [SPAWN, PACKAGE_QUERY], record_command=False)
+        if package in self.installed:
+            return True
+        return self._queries is not None and self._queries.is_installed(package)
+
+    def install(self, package: str) -> OperationResult[bool]:
+        """
+        Simulate a package installation.
+
+        Args:
+            package: The name of the package to install.
+
+        Returns:
+            OperationResult indicating success.
+        """
+        self._run(f"apt-get install -y {package}")
+        return OperationResult[bool].succeed(True)
+
+    def is_running(self, package: str) -> OperationResult[bool]:
+        """
+        Check if a unit was started.
+
+        Args:
+            package: The name of the unit to check.
+
+        Returns:
+            OperationResult containing True if running, False if not.
+        """
+        self._record(f"systemctl is-active {package}", [SPAWN, SYSTEMCTL], record_command=False)
+        if package in self.running or self._queries is None:
+            return OperationResult[bool].succeed(package in self.running)
+        return self._queries.is_running(package)
+
+    def start(self, package: str) -> OperationResult[bool]:
+        """
+        Simulate a unit start.
+
+        Args:
+            package: The name of the unit to start.
+
+        Returns:
+            OperationResult indicating success.
+        """
+        self._run(f"systemctl start {package}")
+        return OperationResult[bool].succeed(True)
+
+    def restart(self, package: str) -> OperationResult[bool]:
+        """
+        Simulate a unit restart.
+
+        Args:
+            package: The name of the unit to restart.
+
+        Returns:
+            OperationResult indicating success.
+        """
+        self._run(f"systemctl restart {package}")
+        return OperationResult[bool].succeed(True)
+
+    def execute_command(
+        self, command: list[str], directory: Optional[str] = None
+    ) -> OperationResult[bool]:
+        """
+        Simulate a command.
+
+        Args:
+            command: The command to execute as a list of arguments.
+            directory: Optional working directory for command execution.
+
+        Returns:
+            OperationResult indicating success.
+        """
+        line = shlex.join(command)
+        self._run(f"cd {shlex.quote(directory)} && {line}" if directory else line)
+        return OperationResult[bool].succeed(True)
+
+    def execute_raw_command(self, command: str) -> OperationResult[bool]:
+        """
+        Simulate a raw shell command.
+
+        Args:
+            command: The raw shell command string to execute.
+
+        Returns:
+            OperationResult indicating success.
+        """
+        self._run(command)
+        return OperationResult[bool].succeed(True)
+
+    def owner_of(self, path: str) -> Optional[str]:
+        """
+        Find the owner `chown` gave a path.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            Optional[str]: The owner as `user:group`, None if it was never set.
+        """
+        path = posixpath.normpath(path)
+        if path in self.owners:
+            return self.owners[path]
+        parent = posixpath.dirname(path)
+        while parent != posixpath.dirname(parent):
+            if parent + "/" in self.owners:
+                return self.owners[parent + "/"]
+            parent = posixpath.dirname(parent)
+        return None
+
+    def seconds_by_kind(self) -> dict[str, float]:
+        """
+        Split the simulated time by operation kind.
+
+        Returns:
+            dict[str, float]: Seconds per kind, in order of first use.
+        """
+        with self._lock:
+            totals: dict[str, float] = {}
+            for operation in self.operations:
+                for kind, seconds in zip(operation.kinds, operation.kind_seconds):
+                    totals[kind] = totals.get(kind, 0.0) + seconds
+            return totals
+
+    def _run(self, command: str):
+        self._record(command, self.latency.kinds(command), record_command=True)
+        self._apply(command)
+
+    def _record(self, command: str, kinds: list[str], record_command: bool):
+        with self._lock:
+            kind_seconds = [self.latency.sample(kind, self._rng) for kind in kinds]
+            operation = SimulatedOperation(command, kinds, kind_seconds)
+            self.operations.append(operation)
+            self.simulated_seconds += operation.seconds
+            if record_command:
+                self.commands.append(command)
+        if self.time_scale > 0 and operation.seconds > 0:
+            self._sleep(operation.seconds * self.time_scale)
+
+    def _apply(self, command: str):
+        skip = _SKIP_IF_FILE_EXISTS.match(command)
+        if skip and self.file_system is not None and self.file_system.path_exists(skip.group(1)):
+            return
+
+        directory: Optional[str] = None
+        for element in _LIST_SEPARATOR.split(command):
+            pipeline = [_words(part) for part in element.split("|")]
+            words = pipeline[0]
+            if words[:1] == ["cd"] and len(words) > 1:
+                directory = words[1]
+            elif any(part[:2] in (["wg", "genkey"], ["wg", "pubkey"]) for part in pipeline):
+                self._write_key(pipeline)
+            elif words:
+                self._apply_words(words[0], words[1:], directory)
+
+    def _apply_words(self, program: str, args: list[str], directory: Optional[str]):
+        if program in ("apt-get", "apt") and "install" in args:
+            self.installed.update(arg for arg in args[args.index("install") + 1 :] if arg[0] != "-")
+        elif program == "systemctl":
+            self._apply_systemctl(args)
+        elif program == "docker":
+            self._apply_docker(args, directory)
+        elif program == "chown" and len(_paths(args, ())) >= 2:
+            owner, *paths = _paths(args, ())
+            for path in paths:
+                path = posixpath.normpath(path)
+                self.owners[path] = owner
+                if "-R" in args:
+                    self.owners[path + "/"] = owner
+        elif self.file_system is None:
+            return
+        elif program == "install" and "-d" in args:
+            for path in _paths(args, ("-m", "-o", "-g")):
+                self.file_system.make_dir(path)
+        elif program == "install" and _paths(args, ("-m", "-o", "-g"))[:1] == ["/dev/null"]:
+            self._install_file(args)
+        elif program == "mv" and len(_paths(args, ())) == 2:
+            source, target = _paths(args, ())
+            self.file_system.copy_path(source, target)
+            self.file_system.remove_location(source)
+            if source in self.owners:
+                self.owners[target] = self.owners.pop(source)
+        elif program == "mkdir":
+            for path in _paths(args, ()):
+                self.file_system.make_dir(path)
+        elif program == "chmod" and len(args) >= 2 and re.fullmatch(r"[0-7]{3,4}", args[-2]):
+            self.file_system.chmod(args[-1], int(args[-2], 8))
+        elif program == "rm":
+            for path in _paths(args, ()):
+                self.file_system.remove_location(path)
+        elif program == "openssl":
+            for option in ("-out", "-keyout"):
+                if option in args[:-1]:
+                    self.file_system.write_text(args[args.index(option) + 1], _pem(option))
+        elif program == "cp" and len(_paths(args, ())) == 2:
+            source, target = _paths(args, ())
+            self.file_system.copy_path(source, target)
+
+    def _install_file(self, args: list[str]):
+        if self.file_system is None:
+            return
+        target = _paths(args, ("-m", "-o", "-g"))[-1]
+        if not self.file_system.path_exists(target):
+            self.file_system.write_text(target, "")
+        if "-m" in args[:-1]:
+            self.file_system.chmod(target, int(args[args.index("-m") + 1], 8))
+        if "-o" in args[:-1] and "-g" in args[:-1]:
+            self.owners[target] = f"{args[args.index('-o') + 1]}:{args[args.index('-g') + 1]}"
+
+    def _apply_systemctl(self, args: list[str]):
+        action = next((arg for arg in args if not arg.startswith("-")), None)
+        if action is None:
+            return
+        units = [arg for arg in args[args.index(action) + 1 :] if not arg.startswith("-")]
+        now = "--now" in args
+        if action in _SYSTEMCTL_STARTS or (action == "enable" and now):
+            self.running.update(units)
+        if action == "enable":
+            self.enabled.update(units)
+        if action == "disable":
+            self.enabled.difference_update(units)
+        if action == "stop" or (action == "disable" and now):
+            self.running.difference_update(units)
+
+    def _apply_docker(self, args: list[str], directory: Optional[str]):
+        if args[:1] == ["compose"]:
+            names = self._compose_containers(directory)
+            if "up" in args:
+                self.containers.update(names)
+            elif "down" in args:
+                self.containers.difference_update(names)
+        elif args[:1] == ["run"] and "--name" in args[:-1]:
+            self.containers.add(args[args.index("--name") + 1])
+        elif args[:1] == ["rm"]:
+            self.containers.difference_update(arg for arg in args[1:] if not arg.startswith("-"))
+
+    def _compose_containers(self, directory: Optional[str]) -> list[str]:
+        if self.file_system is None or directory is None:
+            return []
+        read_result = self.file_system.read_text(f"{directory}/docker-compose.yml")
+        if not read_result.success or read_result.data is None:
+            return []
+        return _CONTAINER_NAME.findall(read_result.data)
+
+    def _write_key(self, pipeline: list[list[str]]):
+        if self.file_system is None:
+            return
+        target = next((words[-1] for words in pipeline[1:] if words[:1] == ["tee"]), None)
+        if target is None:
+            return
+        digest = hashlib.sha256(target.encode("utf-8")).digest()
+        self.file_system.write_text(target, base64.b64encode(digest).decode("ascii") + "\n")
+
+
+def _words(part: str) -> list[str]:
+    try:
+        words = shlex.split(part.replace("(", " ").replace(")", " "))
+    except ValueError:
+        return []
+    while words and (words[0] == "sudo" or words[0] == "umask"):
+        words = words[2:] if words[0] == "umask" else words[1:]
+    return [word for word in words if not word.startswith(">") and not word.startswith("2>")]
+
+
+def _pem(option: str) -> str:
+    label = "PRIVATE KEY" if option == "-keyout" else "CERTIFICATE"
+    return f"-----BEGIN {label}-----\nc2ltdWxhdGVk\n-----END {label}-----\n"
+
+
+def _paths(args: list[str], valued_options: tuple[str, ...]) -> list[str]:
+    paths = []
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+        elif arg in valued_options:
+            skip_next = True
+        elif not arg.startswith("-"):
+            paths.append(arg)
+    return paths
@@ -0,0 +1,148 @@
+"""Latency models of the simulated engine."""
+
+import math
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+# Operation kinds a simulated command can cost
+SPAWN = "spawn"
+PACKAGE_QUERY = "package_query"
+APT_INSTALL = "apt_install"
+SYSTEMCTL = "systemctl"
+DOCKER = "docker"
+DOCKER_COMPOSE_UP = "docker_compose_up"
+NFT = "nft"
+WG = "wg"
+
+# Shell command lines are costed per pipeline or list element
+_SEGMENT_SEPARATOR = re.compile(r"&&|\|\||;|\|")
+_PROGRAM = re.compile(r"(?<![\w./-])(apt-get|apt|dpkg|docker|systemctl|nft|wg-quick|wg)(?![\w.-])")
+
+
+@dataclass
+class LatencyDistribution:
+    """
+    Log-normal latency of one kind of operation.
+
+    Attributes:
+        median_seconds: Typical duration.
+        spread: Standard deviation of the logarithm, 0 makes every sample the median.
+    """
+
+    median_seconds: float
+    spread: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        Draw one duration.
+
+        Args:
+            rng: Random source, seeded by the caller for repeatable runs.
+
+        Returns:
+            float: Duration in seconds.
+        """
+        if self.spread <= 0:
+            return self.median_seconds
+        return self.median_seconds * math.exp(rng.gauss(0.0, self.spread))
+
+
+@dataclass
+class SimulatedLatencyModel:
+    """
+    Latency per operation kind of a simulated host.
+
+    Every command pays for a process spawn. Shell command lines also pay for
+    each program they run that has a kind of its own, so a line with two
+    systemctl calls costs two systemctl latencies.
+
+    Attributes:
+        latencies: Distribution by operation kind.
+    """
+
+    latencies: dict[str, LatencyDistribution] = field(
+        default_factory=lambda: {
+            SPAWN: LatencyDistribution(0.005, 0.3),
+            PACKAGE_QUERY: LatencyDistribution(0.03, 0.3),
+            APT_INSTALL: LatencyDistribution(20.0, 0.5),
+            SYSTEMCTL: LatencyDistribution(0.05, 0.5),
+            DOCKER: LatencyDistribution(0.3, 0.5),
+            DOCKER_COMPOSE_UP: LatencyDistribution(15.0, 0.5),
+            NFT: LatencyDistribution(0.02, 0.3),
+            WG: LatencyDistribution(0.01, 0.3),
+        }
+    )
+
+    @classmethod
+    def instant(cls) -> "SimulatedLatencyModel":
+        """Model in which every operation takes no time."""
+        return cls({})
+
+    def kinds(self, command: str) -> list[str]:
+        """
+        Operation kinds a command line costs.
+
+        Args:
+            command: Command line as a shell would run it.
+
+        Returns:
+            list[str]: The spawn kind followed by one kind per program found.
+        """
+        kinds = [SPAWN]
+        for segment in _SEGMENT_SEPARATOR.split(command):
+            kind = _segment_kind(segment)
+            if kind:
+                kinds.append(kind)
+        return kinds
+
+    def sample(self, kind: str, rng: random.Random) -> float:
+        """
+        Draw the duration of one operation.
+
+        Args:
+            kind: Operation kind, kinds without a distribution take no time.
+            rng: Random source.
+
+        Returns:
+            float: Duration in seconds.
+        """
+        distribution = self.latencies.get(kind)
+        return distribution.sample(rng) if distribution else 0.0
+
+    def as_object(self) -> Any:
+        """Converts class to object"""
+        return {
+            kind: {"median_seconds": latency.median_seconds, "spread": latency.spread}
+            for kind, latency in self.latencies.items()
+        }
+
+    @classmethod
+    def from_object(cls, obj: Any) -> "SimulatedLatencyModel":
+        """Converts object to the class"""
+        model = cls()
+        for kind, latency in obj.items():
+            model.latencies[kind] = LatencyDistribution(
+                float(latency["median_seconds"]), float(latency.get("spread", 0.0))
+            )
+        return model
+
+
+def _segment_kind(segment: str) -> str | None:
+    match = _PROGRAM.search(segment)
+    if match is None:
+        return None
+    program = match.group(1)
+    words = segment[match.end() :].split()
+    if program in ("apt-get", "apt"):
+        return APT_INSTALL if "install" in words else None
+    if program == "dpkg":
+        return PACKAGE_QUERY
+    if program == "docker":
+        return DOCKER_COMPOSE_UP if words[:1] == ["compose"] and "up" in words else DOCKER
+    if program == "systemctl":
+        return SYSTEMCTL
+    if program == "nft":
+        return NFT
+    return WG
@@ -0,0 +1,14 @@
+"""Necessary imports for export."""
+
+from .vpn_throughput_service import VpnThroughputService
+from .vpn_throughput_service_contract import Recorder, VpnThroughputServiceContract
+from .vpn_wire import UdpStreamStats, decode_datagram, encode_datagram
+
+__all__ = [
+    "Recorder",
+    "UdpStreamStats",
+    "VpnThroughputService",
+    "VpnThroughputServiceContract",
+    "decode_datagram",
+    "encode_datagram",
+]
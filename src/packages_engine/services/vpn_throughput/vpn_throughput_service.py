@@ -0,0 +1,324 @@
+"""VPN Throughput Service - asyncio implementation of VPN throughput runs."""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from typing import Any, Optional
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    LatencySummary,
+    VpnStreamReport,
+    VpnThroughputPlan,
+    VpnThroughputReport,
+)
+
+from .vpn_throughput_service_contract import Recorder, VpnThroughputServiceContract
+from .vpn_wire import (
+    HELLO,
+    MAX_RECORD_BYTES,
+    MODE_ECHO,
+    MODE_RECORD,
+    MODE_SINK,
+    MODE_UDP_STATS,
+    PEER_LENGTH,
+    PROBE,
+    RECORD_LENGTH,
+    SINK_RESULT,
+    UDP_STATS,
+    UdpStreamStats,
+    decode_datagram,
+    decode_hello,
+    encode_datagram,
+    encode_hello,
+)
+
+TCP_CHUNK_BYTES = 128 * 1024
+IDLE_PROBE_INTERVAL_SECONDS = 0.01
+# Time for the last datagrams of a UDP stream to arrive before asking for stats
+UDP_SETTLE_SECONDS = 0.25
+PACING_INTERVAL_SECONDS = 0.001
+
+TRANSPORT_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError)
+
+
+class UdpSink(asyncio.DatagramProtocol):
+    """Counts test datagrams per run token and stream."""
+
+    def __init__(self, stats: dict[tuple[int, int], UdpStreamStats]):
+        self.stats = stats
+
+    def datagram_received(self, data: bytes, addr: Any):
+        decoded = decode_datagram(data)
+        if decoded is None:
+            return
+        token, stream, sequence, sent_ns = decoded
+        stream_stats = self.stats.setdefault((token, stream), UdpStreamStats())
+        stream_stats.record(sequence, sent_ns, time.perf_counter_ns(), len(data))
+
+
+class VpnThroughputService(VpnThroughputServiceContract):
+    """
+    VPN throughput service implementation using asyncio streams and datagrams.
+
+    The client first takes RTT probes over an idle echo connection, then
+    runs the TCP or UDP streams while probing again to see how much the load
+    queues up. Rates are the bytes the server received over the time it took
+    to receive them, so data buffered on the client side is not counted.
+    The finished report is sent to the server to be recorded.
+    """
+
+    def run_client(self, plan: VpnThroughputPlan) -> OperationResult[VpnThroughputReport]:
+        """
+        Measure throughput and RTT to a server.
+
+        Args:
+            plan: Server address, protocol and load settings.
+
+        Returns:
+            OperationResult[VpnThroughputReport]: Run results, or failure if the
+            plan is invalid or a stream cannot reach the server.
+        """
+        if plan.protocol not in ("tcp", "udp"):
+            return OperationResult[VpnThroughputReport].fail(
+                f"Unsupported protocol {plan.protocol}"
+            )
+        if plan.streams < 1 or plan.duration_seconds <= 0:
+            return OperationResult[VpnThroughputReport].fail("Nothing to send")
+        try:
+            report = asyncio.run(self._run_client(plan))
+        except TRANSPORT_ERRORS as error:
+            return OperationResult[VpnThroughputReport].fail(
+                f"Connecting to {plan.host}:{plan.port} failed: {error!r}"
+            )
+        return OperationResult[VpnThroughputReport].succeed(report)
+
+    def serve(
+        self,
+        host: str,
+        port: int,
+        recorder: Recorder,
+        stop: Optional[threading.Event] = None,
+        ready: Optional[threading.Event] = None,
+    ) -> OperationResult[bool]:
+        """
+        Answer clients until stopped or interrupted.
+
+        Args:
+            host: Address to listen on over TCP and UDP.
+            port: Port to listen on over TCP and UDP.
+            recorder: Records the reports clients send.
+            stop: Stops the server once set.
+            ready: Set once the server is listening.
+
+        Returns:
+            OperationResult[bool]: Success once stopped, or failure if the port
+            cannot be bound.
+        """
+        try:
+            asyncio.run(self._serve(host, port, recorder, stop, ready))
+        except OSError as error:
+            return OperationResult[bool].fail(f"Listening on {host}:{port} failed: {error}")
+        except KeyboardInterrupt:
+            pass
+        return OperationResult[bool].succeed(True)
+
+    async def _run_client(self, plan: VpnThroughputPlan) -> VpnThroughputReport:
+        token = random.getrandbits(32)
+        idle_samples, rtt_errors = await self._probe_rtt(
+            plan, plan.rtt_samples, IDLE_PROBE_INTERVAL_SECONDS
+        )
+
+        stream_numbers = range(1, plan.streams + 1)
+        if plan.protocol == "tcp":
+            stream_runs = [self._tcp_stream(plan, stream, token) for stream in stream_numbers]
+        else:
+            stream_runs = [self._udp_stream(plan, stream, token) for stream in stream_numbers]
+        loaded_interval = plan.duration_seconds / max(1, plan.rtt_samples + 1)
+        loaded_probe = self._probe_rtt(plan, plan.rtt_samples, loaded_interval)
+        *streams, (loaded_samples, loaded_errors) = await asyncio.gather(*stream_runs, loaded_probe)
+        for name, count in loaded_errors.items():
+            rtt_errors[name] = rtt_errors.get(name, 0) + count
+
+        report = VpnThroughputReport(
+            f"{plan.host}:{plan.port}",
+            plan.protocol,
+            list(streams),
+            LatencySummary.from_samples(idle_samples),
+            LatencySummary.from_samples(loaded_samples),
+            rtt_errors=rtt_errors,
+        )
+        report.peer = await self._record(plan, report)
+        return report
+
+    async def _open(
+        self, plan: VpnThroughputPlan, mode: int, stream: int = 0, token: int = 0
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(plan.host, plan.port), plan.timeout_seconds
+        )
+        writer.write(encode_hello(mode, stream, token))
+        return reader, writer
+
+    async def _probe_rtt(
+        self, plan: VpnThroughputPlan, samples: int, interval: float
+    ) -> tuple[list[float], dict[str, int]]:
+        rtts: list[float] = []
+        errors: dict[str, int] = {}
+        if samples < 1:
+            return rtts, errors
+        try:
+            reader, writer = await self._open(plan, MODE_ECHO)
+        except TRANSPORT_ERRORS as error:
+            return rtts, {type(error).__name__: samples}
+        try:
+            for index in range(samples):
+                await asyncio.sleep(interval)
+                started = time.perf_counter_ns()
+                writer.write(PROBE.pack(index))
+                try:
+                    await asyncio.wait_for(reader.readexactly(PROBE.size), plan.timeout_seconds)
+                except asyncio.TimeoutError:
+                    # A late echo would be mistaken for the next one
+                    errors["timeout"] = samples - index
+                    break
+                rtts.append((time.perf_counter_ns() - started) / 1_000_000)
+        except (OSError, asyncio.IncompleteReadError) as error:
+            errors[type(error).__name__] = samples - len(rtts)
+        finally:
+            writer.close()
+        return rtts, errors
+
+    async def _tcp_stream(self, plan: VpnThroughputPlan, stream: int, token: int):
+        reader, writer = await self._open(plan, MODE_SINK, stream, token)
+        try:
+            chunk = bytes(TCP_CHUNK_BYTES)
+            deadline = time.monotonic() + plan.duration_seconds
+            while time.monotonic() < deadline:
+                writer.write(chunk)
+                await asyncio.wait_for(writer.drain(), plan.timeout_seconds)
+            writer.write_eof()
+            received, elapsed_ns = SINK_RESULT.unpack(
+                await asyncio.wait_for(reader.readexactly(SINK_RESULT.size), plan.timeout_seconds)
+            )
+        finally:
+            writer.close()
+        return VpnStreamReport(stream, received, elapsed_ns / 1_000_000_000)
+
+    async def _udp_stream(self, plan: VpnThroughputPlan, stream: int, token: int):
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=(plan.host, plan.port)
+        )
+        packets_per_second = plan.udp_bitrate_mbps * 1_000_000 / 8 / plan.udp_payload_bytes
+        packets_per_second /= plan.streams
+        sent = 0
+        started = time.monotonic()
+        try:
+            while (elapsed := time.monotonic() - started) < plan.duration_seconds:
+                while sent < int(elapsed * packets_per_second) + 1:
+                    transport.sendto(
+                        encode_datagram(
+                            token, stream, sent, time.perf_counter_ns(), plan.udp_payload_bytes
+                        )
+                    )
+                    sent += 1
+                await asyncio.sleep(PACING_INTERVAL_SECONDS)
+        finally:
+            transport.close()
+
+        await asyncio.sleep(UDP_SETTLE_SECONDS)
+        reader, writer = await self._open(plan, MODE_UDP_STATS, stream, token)
+        try:
+            packets, received, out_of_order, elapsed_ns, jitter_ms = UDP_STATS.unpack(
+                await asyncio.wait_for(reader.readexactly(UDP_STATS.size), plan.timeout_seconds)
+            )
+        finally:
+            writer.close()
+        seconds = elapsed_ns / 1_000_000_000 if elapsed_ns else plan.duration_seconds
+        return VpnStreamReport(stream, received, seconds, sent, packets, out_of_order, jitter_ms)
+
+    async def _record(self, plan: VpnThroughputPlan, report: VpnThroughputReport) -> str:
+        payload = json.dumps(report.as_object()).encode("utf-8")
+        try:
+            reader, writer = await self._open(plan, MODE_RECORD)
+        except TRANSPORT_ERRORS:
+            return ""
+        try:
+            writer.write(RECORD_LENGTH.pack(len(payload)) + payload)
+            length = PEER_LENGTH.unpack(
+                await asyncio.wait_for(reader.readexactly(PEER_LENGTH.size), plan.timeout_seconds)
+            )[0]
+            peer = await asyncio.wait_for(reader.readexactly(length), plan.timeout_seconds)
+            return peer.decode("utf-8")
+        except TRANSPORT_ERRORS:
+            return ""
+        finally:
+            writer.close()
+
+    async def _serve(
+        self,
+        host: str,
+        port: int,
+        recorder: Recorder,
+        stop: Optional[threading.Event],
+        ready: Optional[threading.Event],
+    ):
+        udp_stats: dict[tuple[int, int], UdpStreamStats] = {}
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            try:
+                await self._handle(reader, writer, udp_stats, recorder)
+            except (*TRANSPORT_ERRORS, ValueError):
+                pass
+            finally:
+                writer.close()
+
+        loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(handle, host, port)
+        try:
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: UdpSink(udp_stats), local_addr=(host, port)
+            )
+        except OSError:
+            server.close()
+            raise
+        if ready is not None:
+            ready.set()
+        try:
+            while stop is None or not stop.is_set():
+                await asyncio.sleep(0.1)
+        finally:
+            transport.close()
+            server.close()
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        udp_stats: dict[tuple[int, int], UdpStreamStats],
+        recorder: Recorder,
+    ):
+        mode, stream, token = decode_hello(await reader.readexactly(HELLO.size))
+        if mode == MODE_SINK:
+            started = time.perf_counter_ns()
+            received = 0
+            while chunk := await reader.read(TCP_CHUNK_BYTES):
+                received += len(chunk)
+            writer.write(SINK_RESULT.pack(received, time.perf_counter_ns() - started))
+        elif mode == MODE_ECHO:
+            while data := await reader.read(4096):
+                writer.write(data)
+                await writer.drain()
+        elif mode == MODE_UDP_STATS:
+            writer.write(udp_stats.pop((token, stream), UdpStreamStats()).encode())
+        elif mode == MODE_RECORD:
+            length = RECORD_LENGTH.unpack(await reader.readexactly(RECORD_LENGTH.size))[0]
+            if length > MAX_RECORD_BYTES:
+                raise ValueError("Record too large")
+            report = json.loads(await reader.readexactly(length))
+            peer = recorder(writer.get_extra_info("peername")[0], report).encode("utf-8")
+            writer.write(PEER_LENGTH.pack(len(peer)) + peer)
+        await writer.drain()
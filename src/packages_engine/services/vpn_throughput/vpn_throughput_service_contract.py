@@ -0,0 +1,57 @@
+"""VPN Throughput Service Contract - defines interface for VPN throughput runs."""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import VpnThroughputPlan, VpnThroughputReport
+
+Recorder = Callable[[str, Any], str]
+"""Records a client report. Called with the client address and the report object,
+returns the peer name the report was recorded under."""
+
+
+class VpnThroughputServiceContract(ABC):
+    """
+    Abstract base class defining the contract for VPN throughput measurement.
+
+    The server runs on the VPN host, the client on any peer.
+    """
+
+    @abstractmethod
+    def run_client(self, plan: VpnThroughputPlan) -> OperationResult[VpnThroughputReport]:
+        """
+        Measure throughput and RTT to a server.
+
+        Args:
+            plan: Server address, protocol and load settings.
+
+        Returns:
+            OperationResult[VpnThroughputReport]: Run results, or failure if the
+            server cannot be reached.
+        """
+
+    @abstractmethod
+    def serve(
+        self,
+        host: str,
+        port: int,
+        recorder: Recorder,
+        stop: Optional[threading.Event] = None,
+        ready: Optional[threading.Event] = None,
+    ) -> OperationResult[bool]:
+        """
+        Answer clients until stopped or interrupted.
+
+        Args:
+            host: Address to listen on over TCP and UDP.
+            port: Port to listen on over TCP and UDP.
+            recorder: Records the reports clients send.
+            stop: Stops the server once set.
+            ready: Set once the server is listening.
+
+        Returns:
+            OperationResult[bool]: Success once stopped, or failure if the port
+            cannot be bound.
+        """
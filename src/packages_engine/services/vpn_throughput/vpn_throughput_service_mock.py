@@ -0,0 +1,67 @@
+"""Mock VPN Throughput Service - test double for VPN throughput runs."""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    LatencySummary,
+    VpnThroughputPlan,
+    VpnThroughputReport,
+)
+
+from .vpn_throughput_service_contract import Recorder, VpnThroughputServiceContract
+
+
+@dataclass
+class ServeParams:
+    """Params of the serve method."""
+
+    host: str
+    port: int
+    recorder: Recorder
+
+
+class MockVpnThroughputService(VpnThroughputServiceContract):
+    """
+    Mock implementation of VpnThroughputService for testing purposes.
+
+    Attributes:
+        run_client_params: Plans passed to run_client.
+        run_client_result: Result returned by run_client.
+        serve_params: Arguments passed to serve, the recorder can be called by tests.
+        serve_result: Result returned by serve.
+    """
+
+    def __init__(self):
+        """Initialize the mock with an empty TCP run and a successful serve."""
+        self.run_client_params: list[VpnThroughputPlan] = []
+        self.run_client_result = OperationResult[VpnThroughputReport].succeed(
+            VpnThroughputReport(
+                "10.10.0.1:5201",
+                "tcp",
+                [],
+                LatencySummary.from_samples([]),
+                LatencySummary.from_samples([]),
+            )
+        )
+        self.serve_params: list[ServeParams] = []
+        self.serve_result = OperationResult[bool].succeed(True)
+
+    def run_client(self, plan: VpnThroughputPlan) -> OperationResult[VpnThroughputReport]:
+        """Record the plan and return the configured result."""
+        self.run_client_params.append(plan)
+        return self.run_client_result
+
+    def serve(
+        self,
+        host: str,
+        port: int,
+        recorder: Recorder,
+        stop: Optional[threading.Event] = None,
+        ready: Optional[threading.Event] = None,
+    ) -> OperationResult[bool]:
+        """Record the arguments and return the configured result."""
+        self.serve_params.append(ServeParams(host, port, recorder))
+        return self.serve_result
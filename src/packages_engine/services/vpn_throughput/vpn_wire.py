@@ -0,0 +1,149 @@
+"""Wire format shared by the VPN throughput client and server.
+
+Every TCP connection starts with a hello naming its mode:
+
+- sink: the client sends data until it shuts down its side, the server
+  answers with the bytes it received and how long that took
+- echo: the server echoes everything back, used for RTT probes
+- UDP stats: the server answers with what it received on a UDP stream
+- record: the client sends its JSON report, the server records it and
+  answers with the peer name it was recorded under
+
+UDP datagrams carry the run token, stream, sequence number and send time.
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Optional
+
+MAGIC = b"VPNT"
+VERSION = 1
+MODE_SINK = ord("S")
+MODE_ECHO = ord("E")
+MODE_UDP_STATS = ord("U")
+MODE_RECORD = ord("R")
+
+HELLO = struct.Struct("!4sBBHI")
+SINK_RESULT = struct.Struct("!QQ")
+UDP_STATS = struct.Struct("!QQQQd")
+DATAGRAM = struct.Struct("!4sIHIQ")
+PROBE = struct.Struct("!Q")
+RECORD_LENGTH = struct.Struct("!I")
+PEER_LENGTH = struct.Struct("!H")
+MAX_RECORD_BYTES = 1024 * 1024
+
+
+def encode_hello(mode: int, stream: int, token: int) -> bytes:
+    """
+    Encode the hello that starts a TCP connection.
+
+    Args:
+        mode: One of the MODE_* constants.
+        stream: Stream number within the run.
+        token: Random number identifying the run.
+
+    Returns:
+        bytes: The hello bytes.
+    """
+    return HELLO.pack(MAGIC, VERSION, mode, stream, token)
+
+
+def decode_hello(data: bytes) -> tuple[int, int, int]:
+    """
+    Decode a hello.
+
+    Args:
+        data: HELLO.size bytes.
+
+    Returns:
+        tuple[int, int, int]: Mode, stream and token.
+
+    Raises:
+        ValueError: If the magic or version does not match.
+    """
+    magic, version, mode, stream, token = HELLO.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a VPN throughput hello")
+    return mode, stream, token
+
+
+def encode_datagram(token: int, stream: int, sequence: int, sent_ns: int, size: int) -> bytes:
+    """
+    Encode a UDP test datagram padded to a payload size.
+
+    Args:
+        token: Random number identifying the run.
+        stream: Stream number within the run.
+        sequence: Sequence number within the stream.
+        sent_ns: Monotonic send time of the sender in nanoseconds.
+        size: Payload size, at least DATAGRAM.size.
+
+    Returns:
+        bytes: The datagram payload.
+    """
+    header = DATAGRAM.pack(MAGIC, token, stream, sequence, sent_ns)
+    return header + bytes(max(0, size - DATAGRAM.size))
+
+
+def decode_datagram(data: bytes) -> Optional[tuple[int, int, int, int]]:
+    """
+    Decode a UDP test datagram.
+
+    Args:
+        data: Received payload.
+
+    Returns:
+        Optional[tuple[int, int, int, int]]: Token, stream, sequence and send time,
+        or None for anything that is not a test datagram.
+    """
+    if len(data) < DATAGRAM.size:
+        return None
+    magic, token, stream, sequence, sent_ns = DATAGRAM.unpack_from(data)
+    if magic != MAGIC:
+        return None
+    return token, stream, sequence, sent_ns
+
+
+@dataclass
+class UdpStreamStats:
+    """What the server received on one UDP stream.
+
+    Jitter is the smoothed transit time variation of RFC 3550. It only
+    uses differences between transit times, so the sender and receiver
+    clocks do not need to agree.
+    """
+
+    packets: int = 0
+    bytes_received: int = 0
+    out_of_order: int = 0
+    highest_sequence: int = -1
+    first_arrival_ns: int = 0
+    last_arrival_ns: int = 0
+    jitter_ns: float = 0.0
+    last_transit_ns: Optional[int] = None
+
+    def record(self, sequence: int, sent_ns: int, arrival_ns: int, size: int):
+        """Count one datagram."""
+        if not self.packets:
+            self.first_arrival_ns = arrival_ns
+        self.packets += 1
+        self.bytes_received += size
+        self.last_arrival_ns = arrival_ns
+        if sequence < self.highest_sequence:
+            self.out_of_order += 1
+        else:
+            self.highest_sequence = sequence
+        transit = arrival_ns - sent_ns
+        if self.last_transit_ns is not None:
+            self.jitter_ns += (abs(transit - self.last_transit_ns) - self.jitter_ns) / 16
+        self.last_transit_ns = transit
+
+    def encode(self) -> bytes:
+        """Encode the answer to a UDP stats request."""
+        return UDP_STATS.pack(
+            self.packets,
+            self.bytes_received,
+            self.out_of_order,
+            self.last_arrival_ns - self.first_arrival_ns,
+            self.jitter_ns / 1_000_000,
+        )
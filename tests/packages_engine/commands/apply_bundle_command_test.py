@@ -0,0 +1,113 @@
+import unittest
+
+from packages_engine.commands import ApplyBundleCommand
+from packages_engine.models import OperationResult
+from packages_engine.models.bundle import BundleArtifact
+from packages_engine.models.plan import ConfigurationPlan, FileChange
+from packages_engine.services.config_bundle.config_bundle_service_mock import (
+    MockConfigBundleService,
+    ReadParams,
+)
+from packages_engine.services.input_collection.input_collection_service_mock import (
+    MockInputCollectionService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+
+
+class TestApplyBundleCommand(unittest.TestCase):
+    def setUp(self):
+        self.answers: dict[str, str] = {}
+        self.input_collection = MockInputCollectionService()
+        self.input_collection.read_str_result_fn = lambda order, title, default: self.answers.get(
+            title, default or ""
+        )
+        self.notifications = MockNotificationsService()
+        self.config_bundle = MockConfigBundleService()
+        self.artifacts = [
+            BundleArtifact("/etc/nginx/nginx.conf", "workers 4;\n"),
+            BundleArtifact("/etc/dnsmasq.d/internal.conf", "port=53\n"),
+        ]
+        self.config_bundle.read_result = OperationResult[list[BundleArtifact]].succeed(
+            self.artifacts
+        )
+        self.config_bundle.apply_result = OperationResult[ConfigurationPlan].succeed(
+            ConfigurationPlan(
+                [FileChange("/etc/nginx/nginx.conf", "workers 1;\n", "workers 4;\n")],
+                ["sudo nginx -t -q && sudo systemctl reload nginx"],
+            )
+        )
+        self.command = ApplyBundleCommand(
+            self.input_collection, self.notifications, self.config_bundle
+        )
+        self.maxDiff = None
+
+    def test_applies_the_verified_bundle(self):
+        # Arrange
+        self.answers["Bundle file"] = "/tmp/config_bundle.tar.gz"
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(
+            self.config_bundle.read_params, [ReadParams("/tmp/config_bundle.tar.gz", "bundle.key")]
+        )
+        self.assertEqual(self.config_bundle.apply_params, [self.artifacts])
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {
+                    "text": "Bundle /tmp/config_bundle.tar.gz holds 2 verified files.",
+                    "type": "info",
+                },
+                {"text": "\tInstalled /etc/nginx/nginx.conf", "type": "info"},
+                {"text": "\tRan sudo nginx -t -q && sudo systemctl reload nginx", "type": "info"},
+                {"text": "Applied 1 changed files of 2, reloaded: nginx.", "type": "success"},
+            ],
+        )
+
+    def test_unverified_bundle_is_not_applied(self):
+        # Arrange
+        self.config_bundle.read_result = OperationResult[list[BundleArtifact]].fail(
+            "Bundle config_bundle.tar.gz is not signed with the key bundle.key"
+        )
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(self.config_bundle.apply_params, [])
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {
+                    "text": "\tBundle config_bundle.tar.gz is not signed with the key bundle.key",
+                    "type": "error",
+                }
+            ],
+        )
+
+    def test_failed_apply_fails(self):
+        # Arrange
+        self.config_bundle.apply_result = OperationResult[ConfigurationPlan].fail("nginx -t failed")
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(
+            self.notifications.params[-1],
+            {
+                "text": "\tApplying bundle config_bundle.tar.gz failed: nginx -t failed",
+                "type": "error",
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
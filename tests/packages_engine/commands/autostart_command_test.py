@@ -28,8 +28,9 @@ class TestAutostartCommand(unittest.TestCase):
                     "sudo systemctl daemon-reload",
                     # --- Core services (idempotent)
                     "sudo systemctl enable --now nftables",
-                    # Ensure our host_fw table exists (only load if missing)
-                    'sudo nft list tables | grep -q "table inet host_fw" || sudo nft -f /etc/nftables.d/10-host-fw.nft',
+                    # Ensure our host_fw table and its client elements exist (only load if missing)
+                    'sudo nft list tables | grep -q "table inet host_fw" || '
+                    "(sudo nft -f /etc/nftables.d/10-host-fw.nft && sudo nft -f /etc/nftables.d/20-host-fw-clients.nft)",
                     "sudo systemctl enable --now wg-quick@wg0",
                     "sudo systemctl enable --now dnsmasq",
                     # Split-DNS drop-in might be present; reload if so
@@ -39,6 +40,13 @@ class TestAutostartCommand(unittest.TestCase):
                     # --- Ensure docker network exists (idempotent)
                     "sudo docker network inspect vpn-internal >/dev/null 2>&1 || "
                     "sudo docker network create --driver bridge --attachable vpn-internal",
+                    # --- Forwarding network and DOCKER-USER accept (rule does not survive reboots)
+                    "sudo docker network inspect vpn-forward >/dev/null 2>&1 || "
+                    "sudo docker network create --driver bridge --subnet 172.30.10.0/24 "
+                    "-o com.docker.network.bridge.name=br-vpnfwd vpn-forward",
+                    "sudo iptables -C DOCKER-USER -i wg0 -o br-vpnfwd -m conntrack --ctstate DNAT -j ACCEPT "
+                    "2>/dev/null || "
+                    "sudo iptables -I DOCKER-USER -i wg0 -o br-vpnfwd -m conntrack --ctstate DNAT -j ACCEPT",
                     # --- Make sure data dirs exist with correct owners (safe if already set)
                     "sudo install -d -m 0700 -o 999  -g 999  /srv/postgres/data",
                     "sudo install -d -m 0750 -o 1000 -g 1000 /srv/gitea/data",
@@ -47,6 +55,8 @@ class TestAutostartCommand(unittest.TestCase):
                     # --- Bring the compose stack up (no pull on boot; avoid offline hang)
                     "cd /srv/stack && sudo docker compose config -q",
                     "cd /srv/stack && sudo docker compose up -d --remove-orphans",
+                    # --- Flowtable offload binds to the Docker bridges, so it loads after the stack
+                    "test ! -f /etc/nftables-offload.nft || sudo nft -f /etc/nftables-offload.nft || true",
                     # --- Short, bounded readiness gates so we don't stall boot:
                     # Wait up to ~90s for Postgres healthy
                     "timeout 90 bash -lc '"
@@ -0,0 +1,110 @@
+import unittest
+
+from packages_engine.commands import CompileBundleCommand, ConfigureCommand
+from packages_engine.models import OperationResult
+from packages_engine.models.bundle import BundleArtifact
+from packages_engine.services.config_bundle.config_bundle_service_mock import (
+    MockConfigBundleService,
+    WriteParams,
+)
+from packages_engine.services.configuration.configuration_data_reader.configuration_data_reader_service_mock import (
+    MockConfigurationDataReaderService,
+)
+from packages_engine.services.configuration.configuration_tasks.configuration_task_mock import (
+    MockConfigurationTask,
+)
+from packages_engine.services.dry_run import create_plan_host
+from packages_engine.services.file_system import InMemoryFileSystemService
+from packages_engine.services.input_collection.input_collection_service_mock import (
+    MockInputCollectionService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+
+
+class TestCompileBundleCommand(unittest.TestCase):
+    def setUp(self):
+        self.input_collection = MockInputCollectionService()
+        self.input_collection.read_str_result_fn = lambda order, title, default: default or ""
+        self.notifications = MockNotificationsService()
+        self.config_bundle = MockConfigBundleService()
+        self.plan_host = create_plan_host(InMemoryFileSystemService())
+        self.task = MockConfigurationTask()
+        self.configure_command = ConfigureCommand(MockConfigurationDataReaderService(), [self.task])
+        self.command = CompileBundleCommand(
+            self.input_collection,
+            self.notifications,
+            self.config_bundle,
+            self.configure_command,
+            self.plan_host,
+        )
+        self.maxDiff = None
+
+    def test_writes_rendered_files_into_a_bundle(self):
+        # Arrange
+        self.plan_host.file_system.write_text("/etc/nginx/nginx.conf", "workers 4;\n")
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(
+            self.config_bundle.write_params,
+            [
+                WriteParams(
+                    "config_bundle.tar.gz",
+                    "bundle.key",
+                    [BundleArtifact("/etc/nginx/nginx.conf", "workers 4;\n")],
+                )
+            ],
+        )
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "Compiled 1 files into config_bundle.tar.gz.", "type": "success"},
+        )
+
+    def test_failed_configuration_writes_no_bundle(self):
+        # Arrange
+        self.plan_host.file_system.write_text("/etc/nginx/nginx.conf", "workers 4;\n")
+        self.task.configure_result = OperationResult[bool].fail("Failure")
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(self.config_bundle.write_params, [])
+
+    def test_no_rendered_files_writes_no_bundle(self):
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(
+            self.notifications.params,
+            [{"text": "\tConfiguration rendered no files to compile.", "type": "error"}],
+        )
+
+    def test_failed_write_fails(self):
+        # Arrange
+        self.plan_host.file_system.write_text("/etc/nginx/nginx.conf", "workers 4;\n")
+        self.config_bundle.write_result = OperationResult[bool].fail(
+            "Bundle key bundle.key could not be read"
+        )
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(
+            self.notifications.params,
+            [{"text": "\tBundle key bundle.key could not be read", "type": "error"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
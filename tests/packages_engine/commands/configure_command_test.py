@@ -30,9 +30,10 @@ class TestConfigureCommand(unittest.TestCase):
     def test_happy_path(self):
         """Happy path."""
         # Act
-        self.command.execute()
+        result = self.command.execute()
 
         # Assert
+        self.assertTrue(result)
         self.assertEqual(self.task_one.configure_params, [self.reader.read_result])
         self.assertEqual(self.task_two.configure_params, [self.reader.read_result])
 
@@ -42,9 +43,10 @@ class TestConfigureCommand(unittest.TestCase):
         self.task_one.configure_result = OperationResult[bool].fail("Failure")
 
         # Act
-        self.command.execute()
+        result = self.command.execute()
 
         # Assert
+        self.assertFalse(result)
         self.assertEqual(self.task_one.configure_params, [self.reader.read_result])
         self.assertEqual(self.task_two.configure_params, [])
 
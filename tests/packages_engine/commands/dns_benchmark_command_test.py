@@ -0,0 +1,122 @@
+import unittest
+
+from packages_engine.commands import DnsBenchmarkCommand
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    DnsBenchmarkPlan,
+    DnsBenchmarkReport,
+    DnsCategoryReport,
+    DnsQuery,
+    LatencySummary,
+)
+from packages_engine.services.dns_benchmark.dns_benchmark_service_mock import (
+    MockDnsBenchmarkService,
+)
+from packages_engine.services.input_collection.input_collection_service_mock import (
+    MockInputCollectionService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+
+
+class TestDnsBenchmarkCommand(unittest.TestCase):
+    input_collection: MockInputCollectionService
+    notifications: MockNotificationsService
+    dns_benchmark: MockDnsBenchmarkService
+    command: DnsBenchmarkCommand
+
+    def setUp(self):
+        self.input_collection = MockInputCollectionService()
+        self.input_collection.read_str_result_fn = lambda order, title, default: default or ""
+        self.input_collection.read_int_result_fn = lambda order, title, default: default or 0
+        self.notifications = MockNotificationsService()
+        self.dns_benchmark = MockDnsBenchmarkService()
+        self.command = DnsBenchmarkCommand(
+            self.input_collection, self.notifications, self.dns_benchmark
+        )
+        self.maxDiff = None
+
+    def test_plan_mixes_internal_and_upstream_names(self):
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.dns_benchmark.run_params,
+            [
+                DnsBenchmarkPlan(
+                    "10.10.0.1",
+                    [
+                        DnsQuery("ssh.internal.app", "internal"),
+                        DnsQuery("gitea.internal.app", "internal"),
+                        DnsQuery("postgresql.internal.app", "internal"),
+                        DnsQuery("example.com", "upstream"),
+                        DnsQuery("wikipedia.org", "upstream"),
+                        DnsQuery("ubuntu.com", "upstream"),
+                    ],
+                    rounds=20,
+                    concurrency=10,
+                )
+            ],
+        )
+
+    def test_reports_categories(self):
+        # Arrange
+        self.dns_benchmark.run_result = OperationResult[DnsBenchmarkReport].succeed(
+            DnsBenchmarkReport(
+                "10.10.0.1",
+                0.8,
+                [
+                    DnsCategoryReport(
+                        "internal", 60, 0, LatencySummary(60, 0.4, 0.7, 0.8, 0.9), 60
+                    ),
+                    DnsCategoryReport(
+                        "upstream",
+                        60,
+                        2,
+                        LatencySummary(58, 0.5, 18.0, 25.0, 30.0),
+                        55,
+                        {"timeout": 2},
+                    ),
+                ],
+            )
+        )
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params[1:],
+            [
+                {
+                    "text": "\tinternal: 60 queries, p50 0.40 ms, p95 0.70 ms, p99 0.80 ms, "
+                    "failures 0.0%, cache hits 100.0%",
+                    "type": "info",
+                },
+                {
+                    "text": "\tupstream: 60 queries, p50 0.50 ms, p95 18.00 ms, p99 25.00 ms, "
+                    "failures 3.3%, cache hits 94.8%",
+                    "type": "info",
+                },
+                {"text": "\tupstream errors: timeout=2", "type": "warning"},
+                {
+                    "text": "DNS benchmark finished. Answers within 0.80 ms count as cache hits.",
+                    "type": "success",
+                },
+            ],
+        )
+
+    def test_failure_is_reported(self):
+        # Arrange
+        self.dns_benchmark.run_result = OperationResult[DnsBenchmarkReport].fail("Network down")
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tDNS benchmark failed: Network down", "type": "error"},
+        )
@@ -0,0 +1,153 @@
+import unittest
+
+from packages_engine.commands import EngineBenchmarkCommand
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    EngineBenchmarkCase,
+    EngineBenchmarkPlan,
+    EngineBenchmarkReport,
+)
+from packages_engine.services.engine_benchmark.engine_benchmark_service_mock import (
+    MockEngineBenchmarkService,
+)
+from packages_engine.services.file_system.file_system_service_mock import (
+    MockFileSystemService,
+    WriteJsonParams,
+)
+from packages_engine.services.input_collection.input_collection_service_mock import (
+    MockInputCollectionService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+
+
+class TestEngineBenchmarkCommand(unittest.TestCase):
+    input_collection: MockInputCollectionService
+    notifications: MockNotificationsService
+    file_system: MockFileSystemService
+    engine_benchmark: MockEngineBenchmarkService
+    command: EngineBenchmarkCommand
+
+    def setUp(self):
+        self.answers: dict[str, str] = {}
+        self.input_collection = MockInputCollectionService()
+        self.input_collection.read_str_result_fn = lambda order, title, default: self.answers.get(
+            title, default or ""
+        )
+        self.input_collection.read_int_result_fn = lambda order, title, default: default or 0
+        self.notifications = MockNotificationsService()
+        self.file_system = MockFileSystemService()
+        self.engine_benchmark = MockEngineBenchmarkService()
+        self.report = EngineBenchmarkReport(
+            "3.12.1",
+            3,
+            [
+                EngineBenchmarkCase("configure_command", 100, 0.01, 100_000),
+                EngineBenchmarkCase("configure_command", 1000, 0.1, 1_000_000),
+            ],
+        )
+        self.engine_benchmark.run_result = OperationResult[EngineBenchmarkReport].succeed(
+            self.report
+        )
+        self.command = EngineBenchmarkCommand(
+            self.input_collection, self.notifications, self.file_system, self.engine_benchmark
+        )
+        self.maxDiff = None
+
+    def test_runs_plan_and_saves_results(self):
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            [result, self.engine_benchmark.run_params, self.file_system.write_json_params],
+            [
+                True,
+                [EngineBenchmarkPlan("data", [10, 100, 1000, 10000], 3)],
+                [WriteJsonParams("engine_benchmark.json", self.report.as_object())],
+            ],
+        )
+        self.assertIn(
+            {"text": "\tconfigure_command scaling exponents: 1.00", "type": "info"},
+            self.notifications.params,
+        )
+
+    def test_rejects_invalid_client_counts(self):
+        # Arrange
+        self.answers["Client counts (comma separated)"] = "10,many"
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertEqual([result, self.engine_benchmark.run_params], [False, []])
+
+    def test_fails_when_benchmark_fails(self):
+        # Arrange
+        self.engine_benchmark.run_result = OperationResult[EngineBenchmarkReport].fail(
+            "No templates found in data"
+        )
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            [result, self.notifications.params[-1]],
+            [
+                False,
+                {"text": "\tEngine benchmark failed: No templates found in data", "type": "error"},
+            ],
+        )
+
+    def test_regressions_against_baseline_fail(self):
+        # Arrange
+        self.answers["Baseline results file (optional)"] = "baseline.json"
+        baseline = EngineBenchmarkReport(
+            "3.12.1",
+            3,
+            [
+                EngineBenchmarkCase("configure_command", 100, 0.01, 100_000),
+                EngineBenchmarkCase("configure_command", 1000, 0.05, 1_000_000),
+            ],
+        )
+        self.file_system.read_json_result = OperationResult[object].succeed(baseline.as_object())
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            [result, self.notifications.params[-2:]],
+            [
+                False,
+                [
+                    {
+                        "text": "\tconfigure_command/1000 seconds grew from 0.05 to 0.1 (2.00x).",
+                        "type": "error",
+                    },
+                    {
+                        "text": "\t1 regressions over 20% against baseline.json.",
+                        "type": "error",
+                    },
+                ],
+            ],
+        )
+
+    def test_unreadable_baseline_is_skipped(self):
+        # Arrange
+        self.answers["Baseline results file (optional)"] = "baseline.json"
+        self.file_system.read_json_result = OperationResult[object].succeed({"rps": 1})
+
+        # Act
+        result = self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            [result, self.notifications.params[-2]],
+            [
+                True,
+                {"text": "\tBaseline baseline.json is not an engine benchmark.", "type": "warning"},
+            ],
+        )
@@ -0,0 +1,189 @@
+import unittest
+
+from packages_engine.commands import HttpBenchmarkCommand
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    HttpBenchmarkPlan,
+    HttpBenchmarkReport,
+    HttpRequestReport,
+    HttpRequestSpec,
+    LatencyHistogram,
+    LatencySummary,
+)
+from packages_engine.services.file_system.file_system_service_mock import (
+    MockFileSystemService,
+    WriteJsonParams,
+)
+from packages_engine.services.http_benchmark.http_benchmark_service_mock import (
+    MockHttpBenchmarkService,
+)
+from packages_engine.services.input_collection.input_collection_service_mock import (
+    MockInputCollectionService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+
+
+class TestHttpBenchmarkCommand(unittest.TestCase):
+    input_collection: MockInputCollectionService
+    notifications: MockNotificationsService
+    file_system: MockFileSystemService
+    http_benchmark: MockHttpBenchmarkService
+    command: HttpBenchmarkCommand
+
+    def setUp(self):
+        self.answers: dict[str, str] = {}
+        self.input_collection = MockInputCollectionService()
+        self.input_collection.read_str_result_fn = lambda order, title, default: self.answers.get(
+            title, default or ""
+        )
+        self.input_collection.read_int_result_fn = lambda order, title, default: default or 0
+        self.notifications = MockNotificationsService()
+        self.file_system = MockFileSystemService()
+        self.http_benchmark = MockHttpBenchmarkService()
+        self.http_benchmark.run_result = OperationResult[HttpBenchmarkReport].succeed(
+            HttpBenchmarkReport(
+                "https://gitea.internal.app:443",
+                2000,
+                3,
+                4.0,
+                120000,
+                20,
+                LatencySummary(1997, 8.0, 30.0, 55.0, 90.0),
+                LatencyHistogram(),
+                [
+                    HttpRequestReport(
+                        "GET", "/", 2000, 3, LatencySummary(1997, 8.0, 30.0, 55.0, 90.0)
+                    )
+                ],
+                {"200": 1995, "502": 2},
+                {"timeout": 3},
+            )
+        )
+        self.command = HttpBenchmarkCommand(
+            self.input_collection, self.notifications, self.file_system, self.http_benchmark
+        )
+        self.maxDiff = None
+
+    def test_plan_from_defaults(self):
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.http_benchmark.run_params,
+            [
+                HttpBenchmarkPlan(
+                    "gitea.internal.app",
+                    443,
+                    [
+                        HttpRequestSpec("GET", "/", 5),
+                        HttpRequestSpec("GET", "/explore/repos", 3),
+                        HttpRequestSpec("GET", "/api/v1/version", 2),
+                    ],
+                    use_tls=True,
+                    ca_file=None,
+                    concurrency=20,
+                    total_requests=2000,
+                    keep_alive=True,
+                )
+            ],
+        )
+
+    def test_plain_http_target_with_port_and_no_keep_alive(self):
+        # Arrange
+        self.answers["Target URL"] = "http://10.10.0.1:3000"
+        self.answers["CA file (empty for system CAs)"] = "/etc/ssl/internal-ca.pem"
+        self.answers["Reuse connections (y/n)"] = "n"
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        plan = self.http_benchmark.run_params[0]
+        self.assertEqual(
+            [plan.host, plan.port, plan.use_tls, plan.ca_file, plan.keep_alive],
+            ["10.10.0.1", 3000, False, "/etc/ssl/internal-ca.pem", False],
+        )
+
+    def test_reports_and_saves_results(self):
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params[1:],
+            [
+                {
+                    "text": "\t2000 requests in 4.00 s, 500.0 req/s, 20 connections, 3 failed",
+                    "type": "info",
+                },
+                {
+                    "text": "\tLatency p50 8.00 ms, p95 30.00 ms, p99 55.00 ms, max 90.00 ms",
+                    "type": "info",
+                },
+                {"text": "\tGET /: 2000 requests, p95 30.00 ms, 3 failed", "type": "info"},
+                {"text": "\tStatuses: 200=1995, 502=2", "type": "info"},
+                {"text": "\tErrors: timeout=3", "type": "warning"},
+                {
+                    "text": "HTTP benchmark finished. Results saved to http_benchmark.json.",
+                    "type": "success",
+                },
+            ],
+        )
+        assert self.http_benchmark.run_result.data is not None
+        self.assertEqual(
+            self.file_system.write_json_params,
+            [
+                WriteJsonParams(
+                    "http_benchmark.json", self.http_benchmark.run_result.data.as_object()
+                )
+            ],
+        )
+
+    def test_baseline_regressions_are_flagged(self):
+        # Arrange
+        self.answers["Baseline results file (optional)"] = "baseline.json"
+        self.file_system.read_json_result = OperationResult[dict].succeed(
+            {"throughput_rps": 800.0, "latency": {"p95_ms": 20.0}}
+        )
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params[6:9],
+            [
+                {"text": "\tBaseline 800.0 req/s, p95 20.00 ms", "type": "info"},
+                {"text": "\tThroughput dropped from 800.0 to 500.0 req/s.", "type": "warning"},
+                {"text": "\tp95 latency grew from 20.00 to 30.00 ms.", "type": "warning"},
+            ],
+        )
+
+    def test_invalid_request_mix_is_rejected(self):
+        # Arrange
+        self.answers["Request mix (METHOD /path:weight, comma separated)"] = "GET /:zero"
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            [self.http_benchmark.run_params, self.notifications.params],
+            [[], [{"text": "\tInvalid request 'GET /:zero'.", "type": "error"}]],
+        )
+
+    def test_failure_is_reported(self):
+        # Arrange
+        self.http_benchmark.run_result = OperationResult[HttpBenchmarkReport].fail("Bad CA")
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            [self.notifications.params[-1], self.file_system.write_json_params],
+            [{"text": "\tHTTP benchmark failed: Bad CA", "type": "error"}, []],
+        )
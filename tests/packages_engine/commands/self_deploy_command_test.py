@@ -29,6 +29,7 @@ class TestSelfDeployCommand(unittest.TestCase):
             self.file_system, self.input_collection, self.notifications
         )
         self.input_collection.read_str_result = "srv"
+        self.file_system.path_exists_result_map["bundle"] = False
         self.maxDiff = None
 
     def test_happy_path_has_correct_notifications(self):
@@ -83,7 +84,7 @@ class TestSelfDeployCommand(unittest.TestCase):
         # Assert
         self.assertEqual(
             self.file_system.path_exists_params,
-            ["data", "autostart.pyz", "configurator.pyz", "installer.pyz"],
+            ["data", "autostart.pyz", "configurator.pyz", "installer.pyz", "bundle"],
         )
 
     def test_copies_paths(self):
@@ -107,6 +108,44 @@ class TestSelfDeployCommand(unittest.TestCase):
             ],
         )
 
+    def test_copies_bundle_when_it_exists(self):
+        # Arrange
+        self.file_system.path_exists_result_map["bundle"] = True
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.file_system.copy_path_params[-1],
+            CopyPathParams(location_from="bundle/.", location_to="/usr/local/share/bundle"),
+        )
+        self.assertEqual(
+            self.notifications.params[-2:],
+            [
+                {"text": 'Copying from "bundle/." to "/usr/local/share/bundle"', "type": "info"},
+                {
+                    "text": '\tCopying from "bundle/." to "/usr/local/share/bundle" successful',
+                    "type": "success",
+                },
+            ],
+        )
+
+    def test_does_not_check_bundle_when_copy_fails(self):
+        # Arrange
+        self.file_system.copy_path_result_map["installer.pyz->/usr/local/sbin/installer.pyz"] = (
+            OperationResult[bool].fail("Failure")
+        )
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.file_system.path_exists_params,
+            ["data", "autostart.pyz", "configurator.pyz", "installer.pyz"],
+        )
+
     def test_reads_server_data_directory(self):
         # Act
         self.command.execute()
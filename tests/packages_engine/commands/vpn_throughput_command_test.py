@@ -0,0 +1,217 @@
+import unittest
+
+from packages_engine.commands import VpnThroughputCommand
+from packages_engine.models import OperationResult
+from packages_engine.models.benchmark import (
+    LatencySummary,
+    VpnStreamReport,
+    VpnThroughputPlan,
+    VpnThroughputReport,
+)
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_data_reader.configuration_data_reader_service_mock import (
+    MockConfigurationDataReaderService,
+)
+from packages_engine.services.file_system.file_system_service_mock import MockFileSystemService
+from packages_engine.services.input_collection.input_collection_service_mock import (
+    MockInputCollectionService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.vpn_throughput.vpn_throughput_service_mock import (
+    MockVpnThroughputService,
+)
+
+
+class TestVpnThroughputCommand(unittest.TestCase):
+    input_collection: MockInputCollectionService
+    notifications: MockNotificationsService
+    file_system: MockFileSystemService
+    config_data_reader: MockConfigurationDataReaderService
+    vpn_throughput: MockVpnThroughputService
+    command: VpnThroughputCommand
+
+    def setUp(self):
+        self.answers: dict[str, str] = {}
+        self.input_collection = MockInputCollectionService()
+        self.input_collection.read_str_result_fn = lambda order, title, default: self.answers.get(
+            title, default or ""
+        )
+        self.input_collection.read_int_result_fn = lambda order, title, default: default or 0
+        self.notifications = MockNotificationsService()
+        self.file_system = MockFileSystemService()
+        self.config_data_reader = MockConfigurationDataReaderService()
+        self.vpn_throughput = MockVpnThroughputService()
+        self.command = VpnThroughputCommand(
+            self.input_collection,
+            self.notifications,
+            self.file_system,
+            self.config_data_reader,
+            self.vpn_throughput,
+        )
+        self.maxDiff = None
+
+    def test_client_plan_from_defaults(self):
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.vpn_throughput.run_client_params,
+            [
+                VpnThroughputPlan(
+                    "10.10.0.1",
+                    5201,
+                    "tcp",
+                    streams=4,
+                    duration_seconds=10.0,
+                    udp_bitrate_mbps=100.0,
+                    rtt_samples=20,
+                )
+            ],
+        )
+
+    def test_client_reports_udp_run_and_saves_results(self):
+        # Arrange
+        self.answers["Protocol (tcp, udp)"] = "udp"
+        report = VpnThroughputReport(
+            "10.10.0.1:5201",
+            "udp",
+            [VpnStreamReport(1, 12_500_000, 2.0, 1000, 990, 2, 0.4)],
+            LatencySummary(20, 12.0, 14.0, 15.0, 15.5),
+            LatencySummary(20, 30.0, 48.0, 50.0, 51.0),
+            "alice",
+            {"timeout": 1},
+        )
+        self.vpn_throughput.run_client_result = OperationResult[VpnThroughputReport].succeed(report)
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {
+                    "text": "Measuring udp throughput to 10.10.0.1:5201 with 4 streams for 10 s.",
+                    "type": "info",
+                },
+                {
+                    "text": "\tStream 1: 50.00 Mbit/s, lost 10/1000, jitter 0.400 ms, "
+                    "out of order 2",
+                    "type": "info",
+                },
+                {"text": "\tAggregate: 50.00 Mbit/s", "type": "info"},
+                {"text": "\tUDP loss 1.00%, jitter 0.400 ms", "type": "info"},
+                {"text": "\tIdle RTT p50 12.00 ms, p95 14.00 ms, max 15.50 ms", "type": "info"},
+                {
+                    "text": "\tLoaded RTT p50 30.00 ms, p95 48.00 ms, max 51.00 ms",
+                    "type": "info",
+                },
+                {"text": "\tRTT probe errors: timeout=1", "type": "warning"},
+                {"text": "\tRecorded on the server as alice.", "type": "info"},
+                {
+                    "text": "VPN throughput run finished. Results saved to vpn_throughput.json.",
+                    "type": "success",
+                },
+            ],
+        )
+        self.assertEqual(
+            [(p.path_location, p.data) for p in self.file_system.write_json_params],
+            [("vpn_throughput.json", report.as_object())],
+        )
+
+    def test_client_failure_is_reported(self):
+        # Arrange
+        self.vpn_throughput.run_client_result = OperationResult[VpnThroughputReport].fail(
+            "Connecting to 10.10.0.1:5201 failed"
+        )
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            [self.notifications.params[-1], self.file_system.write_json_params],
+            [
+                {
+                    "text": "\tVPN throughput run failed: Connecting to 10.10.0.1:5201 failed",
+                    "type": "error",
+                },
+                [],
+            ],
+        )
+
+    def test_server_records_runs_under_registry_peer_names(self):
+        # Arrange
+        self.answers["Mode (server, client)"] = "server"
+        stored = ConfigurationData.default()
+        stored.wireguard_client_names = ["alice", "bob"]
+        self.config_data_reader.load_stored_result = stored
+        self.file_system.read_text_result_map = {
+            "/etc/wireguard/clients/alice.ip": OperationResult[str].succeed("10.10.0.2\n"),
+            "/etc/wireguard/clients/bob.ip": OperationResult[str].succeed("10.10.0.3"),
+        }
+        self.file_system.read_json_result = OperationResult[list].succeed([{"peer": "bob"}])
+
+        # Act
+        self.command.execute()
+        recorder = self.vpn_throughput.serve_params[0].recorder
+        names = [
+            recorder("10.10.0.2", {"protocol": "tcp", "aggregate_mbps": 310.5, "peer": ""}),
+            recorder("192.168.1.20", {"protocol": "udp", "aggregate_mbps": 95.0, "peer": ""}),
+        ]
+
+        # Assert
+        last_records = self.file_system.write_json_params[-1].data
+        self.assertEqual(
+            [
+                names,
+                self.vpn_throughput.serve_params[0].host,
+                self.vpn_throughput.serve_params[0].port,
+                [p.path_location for p in self.file_system.write_json_params],
+                [
+                    {key: value for key, value in record.items() if key != "recorded_at"}
+                    for record in last_records
+                ],
+                all("recorded_at" in record for record in last_records[1:]),
+            ],
+            [
+                ["alice", "192.168.1.20"],
+                "10.10.0.1",
+                5201,
+                ["/var/log/vpn_throughput.json", "/var/log/vpn_throughput.json"],
+                [
+                    {"peer": "bob"},
+                    {
+                        "protocol": "udp",
+                        "aggregate_mbps": 95.0,
+                        "peer": "192.168.1.20",
+                        "address": "192.168.1.20",
+                    },
+                ],
+                True,
+            ],
+        )
+        self.assertEqual(
+            self.notifications.params[0]["text"],
+            "Listening on 10.10.0.1:5201 over TCP and UDP for 2 known peers. "
+            "Press Ctrl+C to stop.",
+        )
+
+    def test_server_bind_failure_is_reported(self):
+        # Arrange
+        self.answers["Mode (server, client)"] = "server"
+        self.vpn_throughput.serve_result = OperationResult[bool].fail(
+            "Listening on 10.10.0.1:5201 failed"
+        )
+
+        # Act
+        self.command.execute()
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tListening on 10.10.0.1:5201 failed", "type": "error"},
+        )
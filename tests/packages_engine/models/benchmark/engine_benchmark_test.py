@@ -0,0 +1,84 @@
+"""Tests for the engine benchmark data models."""
+
+import unittest
+
+from packages_engine.models.benchmark import (
+    EngineBenchmarkCase,
+    EngineBenchmarkRegression,
+    EngineBenchmarkReport,
+    find_regressions,
+    scaling_exponents,
+)
+
+
+class TestEngineBenchmark(unittest.TestCase):
+    """Test suite for the engine benchmark report, regressions and scaling."""
+
+    def setUp(self):
+        self.baseline = EngineBenchmarkReport(
+            "3.12.1",
+            3,
+            [
+                EngineBenchmarkCase("configure_command", 100, 0.010, 100_000),
+                EngineBenchmarkCase("configure_command", 1000, 0.100, 1_000_000),
+                EngineBenchmarkCase("configuration_data_as_object", 100, 0.0000050, 1_000),
+            ],
+        )
+        self.maxDiff = None
+
+    def test_report_round_trip(self):
+        """Verifies a report survives conversion to and from an object."""
+        # Act
+        result = EngineBenchmarkReport.from_object(self.baseline.as_object())
+
+        # Assert
+        self.assertEqual(result, self.baseline)
+
+    def test_find_regressions(self):
+        """Verifies time and memory over the threshold are reported."""
+        # Arrange
+        current = EngineBenchmarkReport(
+            "3.12.1",
+            3,
+            [
+                EngineBenchmarkCase("configure_command", 100, 0.011, 100_000),
+                EngineBenchmarkCase("configure_command", 1000, 0.300, 1_500_000),
+                EngineBenchmarkCase("configuration_data_as_object", 100, 0.0000500, 1_000),
+                EngineBenchmarkCase("configure_command", 10000, 9.0, 10_000_000),
+            ],
+        )
+
+        # Act
+        result = find_regressions(current, self.baseline, 0.2)
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                EngineBenchmarkRegression("configure_command/1000", "seconds", 0.100, 0.300),
+                EngineBenchmarkRegression(
+                    "configure_command/1000", "peak_bytes", 1_000_000, 1_500_000
+                ),
+            ],
+        )
+        self.assertAlmostEqual(result[0].ratio, 3.0)
+
+    def test_scaling_exponents(self):
+        """Verifies linear and quadratic growth between client counts."""
+        # Arrange
+        cases = [
+            EngineBenchmarkCase("linear", 1000, 1.0, 0),
+            EngineBenchmarkCase("linear", 10, 0.01, 0),
+            EngineBenchmarkCase("linear", 100, 0.1, 0),
+            EngineBenchmarkCase("quadratic", 10, 0.01, 0),
+            EngineBenchmarkCase("quadratic", 100, 1.0, 0),
+        ]
+
+        # Act
+        result = scaling_exponents(cases)
+
+        # Assert
+        self.assertEqual(
+            {name: [round(value, 6) for value in values] for name, values in result.items()},
+            {"linear": [1.0, 1.0], "quadratic": [2.0]},
+        )
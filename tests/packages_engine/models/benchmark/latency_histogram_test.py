@@ -0,0 +1,76 @@
+"""Tests for the LatencyHistogram data model."""
+
+import unittest
+
+from packages_engine.models.benchmark import LatencyHistogram
+from packages_engine.models.benchmark.latency_histogram import bucket_lower_us, bucket_upper_us
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test suite for LatencyHistogram."""
+
+    def test_buckets_keep_five_significant_bits(self):
+        """Verifies small values are exact and large values share buckets at most 6% wide."""
+        # Act
+        result = [
+            (bucket_lower_us(value), bucket_upper_us(bucket_lower_us(value)))
+            for value in [0, 31, 32, 33, 1000, 1_000_000]
+        ]
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                (0, 1),
+                (31, 32),
+                (32, 34),
+                (32, 34),
+                (992, 1024),
+                (983040, 1015808),
+            ],
+        )
+
+    def test_percentile_returns_bucket_upper_bound(self):
+        """Verifies percentiles are the upper bound of the bucket holding the rank."""
+        # Arrange
+        histogram = LatencyHistogram()
+        for latency_ms in [0.010] * 90 + [1.0] * 9 + [50.0]:
+            histogram.record(latency_ms)
+
+        # Act
+        result = [histogram.percentile_ms(p) for p in (50, 95, 99, 100)]
+
+        # Assert
+        self.assertEqual(result, [0.011, 1.024, 1.024, 51.2])
+
+    def test_merge_and_as_object(self):
+        """Verifies merged counts are added and serialized in bucket order."""
+        # Arrange
+        first = LatencyHistogram()
+        first.record(2.0)
+        second = LatencyHistogram()
+        second.record(2.0)
+        second.record(0.005)
+
+        # Act
+        first.merge(second)
+
+        # Assert
+        self.assertEqual(
+            [first.total, first.as_object()],
+            [
+                3,
+                [
+                    {"from_ms": 0.005, "to_ms": 0.006, "count": 1},
+                    {"from_ms": 1.984, "to_ms": 2.048, "count": 2},
+                ],
+            ],
+        )
+
+    def test_empty_percentile(self):
+        """Verifies an empty histogram reports zero."""
+        # Act
+        result = LatencyHistogram().percentile_ms(99)
+
+        # Assert
+        self.assertEqual(result, 0.0)
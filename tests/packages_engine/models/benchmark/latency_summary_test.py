@@ -0,0 +1,35 @@
+"""Tests for the LatencySummary data model."""
+
+import unittest
+
+from packages_engine.models.benchmark import LatencySummary, latency_percentile
+
+
+class TestLatencySummary(unittest.TestCase):
+    """Test suite for LatencySummary."""
+
+    def test_nearest_rank_percentiles(self):
+        """Verifies percentiles use the nearest rank of the sorted samples."""
+        # Act
+        result = LatencySummary.from_samples([float(value) for value in range(100, 0, -1)])
+
+        # Assert
+        self.assertEqual(result, LatencySummary(100, 50.0, 95.0, 99.0, 100.0))
+
+    def test_empty_samples(self):
+        """Verifies no samples summarize to zeros."""
+        # Act
+        result = [LatencySummary.from_samples([]), latency_percentile([], 50)]
+
+        # Assert
+        self.assertEqual(result, [LatencySummary(0, 0.0, 0.0, 0.0, 0.0), 0.0])
+
+    def test_as_object_rounds_to_microseconds(self):
+        """Verifies serialized latencies are rounded to three decimals."""
+        # Act
+        result = LatencySummary.from_samples([1.23456]).as_object()
+
+        # Assert
+        self.assertEqual(
+            result, {"count": 1, "p50_ms": 1.235, "p95_ms": 1.235, "p99_ms": 1.235, "max_ms": 1.235}
+        )
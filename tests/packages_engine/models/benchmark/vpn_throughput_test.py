@@ -0,0 +1,88 @@
+"""Tests for the VPN throughput data models."""
+
+import unittest
+
+from packages_engine.models.benchmark import LatencySummary, VpnStreamReport, VpnThroughputReport
+
+
+class TestVpnThroughputReport(unittest.TestCase):
+    """Test suite for VpnThroughputReport."""
+
+    def setUp(self):
+        self.report = VpnThroughputReport(
+            "10.10.0.1:5201",
+            "udp",
+            [
+                VpnStreamReport(1, 12_500_000, 2.0, 1000, 990, 2, 0.4),
+                VpnStreamReport(2, 12_500_000, 2.5, 1000, 1000, 0, 0.9),
+            ],
+            LatencySummary(10, 1.0, 1.5, 1.5, 1.6),
+            LatencySummary(10, 4.0, 9.0, 9.0, 9.5),
+            "alice",
+        )
+        self.maxDiff = None
+
+    def test_aggregates(self):
+        """Verifies the aggregate rate spans the slowest stream and loss is over all packets."""
+        # Act
+        result = [self.report.aggregate_mbps, self.report.loss_ratio, self.report.jitter_ms]
+
+        # Assert
+        self.assertEqual(result, [80.0, 0.005, 0.9])
+
+    def test_as_object(self):
+        """Verifies the serialized report includes aggregates and per stream results."""
+        # Act
+        result = self.report.as_object()
+
+        # Assert
+        self.assertEqual(
+            result,
+            {
+                "target": "10.10.0.1:5201",
+                "protocol": "udp",
+                "peer": "alice",
+                "aggregate_mbps": 80.0,
+                "loss_ratio": 0.005,
+                "jitter_ms": 0.9,
+                "idle_rtt": {
+                    "count": 10,
+                    "p50_ms": 1.0,
+                    "p95_ms": 1.5,
+                    "p99_ms": 1.5,
+                    "max_ms": 1.6,
+                },
+                "loaded_rtt": {
+                    "count": 10,
+                    "p50_ms": 4.0,
+                    "p95_ms": 9.0,
+                    "p99_ms": 9.0,
+                    "max_ms": 9.5,
+                },
+                "rtt_errors": {},
+                "streams": [
+                    {
+                        "stream": 1,
+                        "bytes_received": 12500000,
+                        "seconds": 2.0,
+                        "rate_mbps": 50.0,
+                        "packets_sent": 1000,
+                        "packets_received": 990,
+                        "packets_lost": 10,
+                        "out_of_order": 2,
+                        "jitter_ms": 0.4,
+                    },
+                    {
+                        "stream": 2,
+                        "bytes_received": 12500000,
+                        "seconds": 2.5,
+                        "rate_mbps": 40.0,
+                        "packets_sent": 1000,
+                        "packets_received": 1000,
+                        "packets_lost": 0,
+                        "out_of_order": 0,
+                        "jitter_ms": 0.9,
+                    },
+                ],
+            },
+        )
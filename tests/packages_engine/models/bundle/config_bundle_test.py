@@ -0,0 +1,84 @@
+"""Tests for the configuration bundle models."""
+
+import unittest
+
+from packages_engine.models.bundle import BundleArtifact, is_artifact_path
+
+
+class TestConfigBundle(unittest.TestCase):
+    """Test suite for BundleArtifact and the artifact paths."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_artifact_paths_leave_secrets_on_the_server(self):
+        """Verifies rendered configuration is compiled and generated secrets are not."""
+        # Act
+        result = [
+            is_artifact_path(path)
+            for path in (
+                "/etc/nginx/nginx.conf",
+                "/etc/systemd/resolved.conf.d/10-wg-split-dns.conf",
+                "/srv/postgres/conf/postgresql.conf",
+                "/srv/gitea/config/app.ini",
+                "/etc/nginx/tls/ticket.current.key",
+                "/etc/wireguard/server.key",
+                "/usr/local/share/args/configuration_data.json",
+            )
+        ]
+
+        # Assert
+        self.assertEqual(result, [True, True, True, False, False, False, False])
+
+    def test_artifact_paths_must_be_normalized(self):
+        """Verifies relative segments cannot step out of the configuration paths."""
+        # Act
+        result = [
+            is_artifact_path(path)
+            for path in (
+                "/etc/nginx/../../root/.ssh/authorized_keys",
+                "/etc/nginx/./nginx.conf",
+                "/etc/nginx//nginx.conf",
+                "etc/nginx/nginx.conf",
+            )
+        ]
+
+        # Assert
+        self.assertEqual(result, [False, False, False, False])
+
+    def test_permissions_must_fit_chmod_and_chown(self):
+        """Verifies modes above 07777 and owners other than `user:group` are invalid."""
+        # Act
+        result = [
+            BundleArtifact("/etc/nginx/nginx.conf", "", mode, owner).has_valid_permissions()
+            for mode, owner in (
+                (0o644, "root:root"),
+                (0o2750, "999:www-data"),
+                (0o10644, "root:root"),
+                (0o644, "root"),
+                (0o644, "root:root /etc/shadow"),
+            )
+        ]
+
+        # Assert
+        self.assertEqual(result, [True, True, False, False, False])
+
+    def test_round_trip(self):
+        """Verifies manifest entries convert back to the artifact."""
+        # Arrange
+        artifact = BundleArtifact(
+            "/srv/postgres/conf/postgresql.conf", "port = 5432\n", 0o640, "999:999"
+        )
+
+        # Act
+        result = BundleArtifact.from_object(artifact.as_object(), "port = 5432\n")
+
+        # Assert
+        self.assertEqual(
+            [result, artifact.as_object()["mode"], artifact.as_object()["sha256"][:12]],
+            [artifact, "0640", "c0efd349f9da"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
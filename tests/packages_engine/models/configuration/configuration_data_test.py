@@ -29,6 +29,15 @@ class TestConfigurationData(unittest.TestCase):
             num_wireguard_clients=2,
             wireguard_client_names=["limitless", "viewer"],
             clients_data_dir="/usr/local/share/clients",
+            package_cache_mode="client",
+            package_cache_host="192.168.1.10",
+            pgbouncer_enabled=True,
+            gitea_redis_enabled=True,
+            certificate_profile="ecdsa",
+            certificate_renew_days=30,
+            tcp_forwarding_mode="kernel",
+            flowtable_enabled=True,
+            mtu_probe_address="198.51.100.7",
         )
         self.data_obj = {
             "server_data_dir": "srv",
@@ -46,6 +55,15 @@ class TestConfigurationData(unittest.TestCase):
             "num_wireguard_clients": 2,
             "wireguard_client_names": ["limitless", "viewer"],
             "clients_data_dir": "/usr/local/share/clients",
+            "package_cache_mode": "client",
+            "package_cache_host": "192.168.1.10",
+            "pgbouncer_enabled": True,
+            "gitea_redis_enabled": True,
+            "certificate_profile": "ecdsa",
+            "certificate_renew_days": 30,
+            "tcp_forwarding_mode": "kernel",
+            "flowtable_enabled": True,
+            "mtu_probe_address": "198.51.100.7",
         }
 
     def test_converts_to_object_representation(self):
@@ -0,0 +1,158 @@
+"""Tests for the configuration plan models."""
+
+import unittest
+
+from packages_engine.models.plan import ConfigurationPlan, FileChange
+
+
+class TestConfigurationPlan(unittest.TestCase):
+    """Test suite for FileChange and ConfigurationPlan."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_diff_of_a_changed_file(self):
+        """Verifies changes are shown as unified diffs of the two contents."""
+        # Arrange
+        change = FileChange(
+            "/etc/nginx/nginx.conf", "user www;\nworkers 1;\n", "user www;\nworkers 4;"
+        )
+
+        # Act
+        result = change.diff()
+
+        # Assert
+        self.assertEqual(
+            result,
+            "--- a/etc/nginx/nginx.conf\n"
+            "+++ b/etc/nginx/nginx.conf\n"
+            "@@ -1,2 +1,2 @@\n"
+            " user www;\n"
+            "-workers 1;\n"
+            "+workers 4;\n",
+        )
+
+    def test_diff_of_created_and_removed_files(self):
+        """Verifies missing sides are shown as /dev/null."""
+        # Act
+        result = [
+            FileChange("/etc/wireguard/wg0.conf", None, "[Interface]\n").diff().splitlines()[:2],
+            FileChange("/etc/dnsmasq.d/old.conf", "port=53\n", None).diff().splitlines()[:2],
+        ]
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                ["--- /dev/null", "+++ b/etc/wireguard/wg0.conf"],
+                ["--- a/etc/dnsmasq.d/old.conf", "+++ /dev/null"],
+            ],
+        )
+
+    def test_reloads_follow_the_changed_paths(self):
+        """Verifies each changed path maps to what has to be reloaded, once."""
+        # Arrange
+        plan = ConfigurationPlan(
+            [
+                FileChange("/etc/systemd/system/autostart.service", None, "[Unit]\n"),
+                FileChange("/etc/nginx/nginx.conf", "a\n", "b\n"),
+                FileChange("/etc/nginx/stream.d/tcp-forwarding.conf", None, "stream {}\n"),
+                FileChange("/srv/stack/docker-compose.yml", "a\n", "b\n"),
+                FileChange("/home/user/notes.txt", None, "text\n"),
+            ]
+        )
+
+        # Act
+        result = plan.reloads()
+
+        # Assert
+        self.assertEqual(result, ["nginx", "daemon-reload", "compose:/srv/stack", "autostart"])
+
+    def test_watched_dnsmasq_records_need_no_reload(self):
+        """Verifies record changes picked up by dnsmasq's hostsdir do not restart it."""
+        # Arrange
+        plan = ConfigurationPlan(
+            [FileChange("/etc/dnsmasq.hosts.d/internal.hosts", "a\n", "b\n")],
+            ["sudo systemctl reload-or-restart dnsmasq"],
+        )
+
+        # Act
+        result = [plan.reloads(), plan.reload_commands(), plan.redundant_restarts()]
+
+        # Assert
+        self.assertEqual(result, [[], [], ["dnsmasq"]])
+
+    def test_reload_commands_reload_unit_files_first(self):
+        """Verifies systemd rereads unit files before anything is reloaded."""
+        # Arrange
+        plan = ConfigurationPlan(
+            [
+                FileChange("/etc/nginx/nginx.conf", "a\n", "b\n"),
+                FileChange("/etc/systemd/system/autostart.service", None, "[Unit]\n"),
+            ]
+        )
+
+        # Act
+        result = plan.reload_commands()
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                "sudo systemctl daemon-reload",
+                "sudo nginx -t -q && sudo systemctl reload nginx",
+                "! sudo systemctl is-enabled --quiet autostart || sudo systemctl restart autostart",
+            ],
+        )
+
+    def test_changed_unit_files_restart_their_units(self):
+        """Verifies oneshot services run again and timers are rescheduled, drop-ins included."""
+        # Arrange
+        plan = ConfigurationPlan(
+            [
+                FileChange("/etc/systemd/system/udp-gro-forwarding.service", "a\n", "b\n"),
+                FileChange("/etc/systemd/system/backup.timer", None, "[Timer]\n"),
+                FileChange("/etc/systemd/system/dnsmasq.service.d/10-after-wg0.conf", None, "a\n"),
+                FileChange("/etc/systemd/system/multi-user.target.wants/backup.timer", None, ""),
+            ]
+        )
+
+        # Act
+        result = [plan.reloads(), plan.reload_commands()[1:3]]
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                ["daemon-reload", "udp-gro-forwarding", "backup.timer", "dnsmasq"],
+                [
+                    "! sudo systemctl is-enabled --quiet udp-gro-forwarding "
+                    "|| sudo systemctl restart udp-gro-forwarding",
+                    "! sudo systemctl is-enabled --quiet backup.timer "
+                    "|| sudo systemctl restart backup.timer",
+                ],
+            ],
+        )
+
+    def test_redundant_restarts_ignore_units_with_changed_files(self):
+        """Verifies only restarts without a configuration change are reported."""
+        # Arrange
+        plan = ConfigurationPlan(
+            [FileChange("/etc/nginx/nginx.conf", "a\n", "b\n")],
+            [
+                "sudo systemctl reload nginx || sudo systemctl restart nginx",
+                "sudo systemctl reload-or-restart dnsmasq",
+                "systemctl restart dnsmasq.service",
+                "systemctl enable --now nftables",
+            ],
+        )
+
+        # Act
+        result = plan.redundant_restarts()
+
+        # Assert
+        self.assertEqual(result, ["dnsmasq"])
+
+
+if __name__ == "__main__":
+    unittest.main()
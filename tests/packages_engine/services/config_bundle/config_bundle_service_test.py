@@ -0,0 +1,338 @@
+"""Tests for the ConfigBundleService class."""
+
+import io
+import json
+import os
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+
+from packages_engine.models.bundle import BundleArtifact
+from packages_engine.models.operation_result import OperationResult
+from packages_engine.services.config_bundle import ConfigBundleService
+from packages_engine.services.file_system import InMemoryFileSystemService
+from packages_engine.services.system_management import SystemManagementService
+from packages_engine.services.system_management.system_management_service_mock import (
+    MockSystemManagementService,
+)
+from packages_engine.services.system_management_engine.engines import SimulatedEngineService
+
+
+class TestConfigBundleService(unittest.TestCase):
+    """Test suite for ConfigBundleService."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.bundle_path = (self.root / "config_bundle.tar.gz").as_posix()
+        self.key_path = (self.root / "bundle.key").as_posix()
+        Path(self.key_path).write_text("0123456789abcdef\n", encoding="utf-8")
+        self.file_system = InMemoryFileSystemService(
+            {
+                "/etc/nginx/nginx.conf": "workers 4;\n",
+                "/etc/dnsmasq.d/internal.conf": "port=53\n",
+            }
+        )
+        self.engine = SimulatedEngineService(file_system=self.file_system)
+        self.service = ConfigBundleService(self.file_system, SystemManagementService(self.engine))
+        self.artifacts = [
+            BundleArtifact("/etc/nginx/nginx.conf", "workers 4;\n"),
+            BundleArtifact("/etc/dnsmasq.d/internal.conf", "port=5353\n"),
+            BundleArtifact("/srv/postgres/conf/postgresql.conf", "port = 5432\n", 0o640, "999:999"),
+        ]
+        self.maxDiff = None
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_and_read_round_trip(self):
+        """Verifies artifacts come back from a bundle with their modes and owners."""
+        # Arrange
+        self.service.write(self.bundle_path, self.key_path, self.artifacts)
+
+        # Act
+        result = self.service.read(self.bundle_path, self.key_path)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.data, os.stat(self.bundle_path).st_mode & 0o777],
+            [True, self.artifacts, 0o600],
+        )
+
+    def test_write_replaces_a_bundle_with_a_private_file(self):
+        """Verifies an existing bundle is replaced by a file created without access for others."""
+        # Arrange
+        Path(self.bundle_path).write_text("old", encoding="utf-8")
+        os.chmod(self.bundle_path, 0o644)
+        umask = os.umask(0)
+
+        # Act
+        try:
+            result = self.service.write(self.bundle_path, self.key_path, self.artifacts)
+        finally:
+            os.umask(umask)
+
+        # Assert
+        self.assertEqual(
+            [
+                result.success,
+                os.stat(self.bundle_path).st_mode & 0o777,
+                self.service.read(self.bundle_path, self.key_path).data,
+            ],
+            [True, 0o600, self.artifacts],
+        )
+
+    def test_write_requires_a_key(self):
+        """Verifies bundles are not written unsigned."""
+        # Act
+        result = self.service.write(self.bundle_path, "/missing/bundle.key", self.artifacts)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message, Path(self.bundle_path).exists()],
+            [False, "Bundle key /missing/bundle.key could not be read", False],
+        )
+
+    def test_read_rejects_another_key(self):
+        """Verifies bundles signed with another key are refused."""
+        # Arrange
+        self.service.write(self.bundle_path, self.key_path, self.artifacts)
+        Path(self.key_path).write_text("fedcba9876543210\n", encoding="utf-8")
+
+        # Act
+        result = self.service.read(self.bundle_path, self.key_path)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message],
+            [False, f"Bundle {self.bundle_path} is not signed with the key {self.key_path}"],
+        )
+
+    def test_read_rejects_altered_files(self):
+        """Verifies files that do not match their manifest hash are refused."""
+        # Arrange
+        self.service.write(self.bundle_path, self.key_path, self.artifacts)
+        with tarfile.open(self.bundle_path, "r:gz") as archive:
+            members = {
+                member.name: archive.extractfile(member).read()  # type: ignore[union-attr]
+                for member in archive.getmembers()
+            }
+        members["files/etc/nginx/nginx.conf"] = b"workers 1;\n"
+        with tarfile.open(self.bundle_path, "w:gz") as archive:
+            for name, data in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+        # Act
+        result = self.service.read(self.bundle_path, self.key_path)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message],
+            [False, f"Bundle {self.bundle_path} has a corrupted file /etc/nginx/nginx.conf"],
+        )
+
+    def test_read_rejects_files_outside_the_configuration_paths(self):
+        """Verifies a signed bundle still cannot write anywhere on the server."""
+        # Arrange
+        self.service.write(
+            self.bundle_path, self.key_path, [BundleArtifact("/root/.ssh/authorized_keys", "")]
+        )
+
+        # Act
+        result = self.service.read(self.bundle_path, self.key_path)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message],
+            [
+                False,
+                f"Bundle {self.bundle_path} has a file outside the configuration paths "
+                "/root/.ssh/authorized_keys",
+            ],
+        )
+
+    def test_read_rejects_invalid_owners(self):
+        """Verifies a signed bundle cannot smuggle arguments into chown."""
+        # Arrange
+        self.service.write(
+            self.bundle_path,
+            self.key_path,
+            [BundleArtifact("/etc/nginx/nginx.conf", "", 0o644, "root:root /etc/shadow")],
+        )
+
+        # Act
+        result = self.service.read(self.bundle_path, self.key_path)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message],
+            [
+                False,
+                f"Bundle {self.bundle_path} has an invalid mode or owner for "
+                "/etc/nginx/nginx.conf",
+            ],
+        )
+
+    def test_manifest_lists_paths_modes_owners_and_hashes(self):
+        """Verifies the manifest describes every artifact."""
+        # Act
+        self.service.write(self.bundle_path, self.key_path, self.artifacts[2:])
+
+        # Assert
+        with tarfile.open(self.bundle_path, "r:gz") as archive:
+            manifest = json.loads(archive.extractfile("manifest.json").read())  # type: ignore
+        self.assertEqual(
+            manifest,
+            {
+                "version": 1,
+                "artifacts": [
+                    {
+                        "path": "/srv/postgres/conf/postgresql.conf",
+                        "mode": "0640",
+                        "owner": "999:999",
+                        "sha256": self.artifacts[2].sha256,
+                    }
+                ],
+            },
+        )
+
+    def test_apply_installs_only_changed_files_and_reloads_them(self):
+        """Verifies changed files are staged, renamed into place and reloaded."""
+        # Act
+        result = self.service.apply(self.artifacts)
+
+        # Assert
+        self.assertEqual(
+            [
+                [change.path for change in result.data.changes] if result.data else None,
+                self.file_system.read_text("/etc/dnsmasq.d/internal.conf").data,
+                self.file_system.read_text("/srv/postgres/conf/postgresql.conf").data,
+                sorted(self.file_system.files),
+                self.engine.owners,
+                self.engine.commands,
+            ],
+            [
+                ["/etc/dnsmasq.d/internal.conf", "/srv/postgres/conf/postgresql.conf"],
+                "port=5353\n",
+                "port = 5432\n",
+                [
+                    "/etc/dnsmasq.d/internal.conf",
+                    "/etc/nginx/nginx.conf",
+                    "/srv/postgres/conf/postgresql.conf",
+                ],
+                {
+                    "/etc/dnsmasq.d/internal.conf": "root:root",
+                    "/srv/postgres/conf/postgresql.conf": "999:999",
+                },
+                [
+                    "sudo install -D -m 0644 -o root -g root /dev/null "
+                    "/etc/dnsmasq.d/.internal.conf.bundle-new "
+                    "&& sudo install -D -m 0640 -o 999 -g 999 /dev/null "
+                    "/srv/postgres/conf/.postgresql.conf.bundle-new",
+                    "sudo cp -a /etc/dnsmasq.d/internal.conf "
+                    "/etc/dnsmasq.d/.internal.conf.bundle-old "
+                    "&& sudo mv -f /etc/dnsmasq.d/.internal.conf.bundle-new "
+                    "/etc/dnsmasq.d/internal.conf",
+                    "sudo mv -f /srv/postgres/conf/.postgresql.conf.bundle-new "
+                    "/srv/postgres/conf/postgresql.conf",
+                    "sudo rm -f /etc/dnsmasq.d/.internal.conf.bundle-old",
+                    "sudo systemctl reload-or-restart dnsmasq",
+                    "sudo docker restart postgres",
+                ],
+            ],
+        )
+
+    def test_apply_of_an_applied_bundle_runs_nothing(self):
+        """Verifies applying the same bundle twice changes nothing the second time."""
+        # Arrange
+        self.service.apply(self.artifacts)
+        self.engine.commands = []
+
+        # Act
+        result = self.service.apply(self.artifacts)
+
+        # Assert
+        self.assertEqual([result.success, self.engine.commands], [True, []])
+
+    def test_apply_installs_nothing_when_staging_fails(self):
+        """Verifies no file is replaced unless every file could be staged."""
+        # Arrange
+        system_management = MockSystemManagementService()
+        system_management.execute_raw_command_result_fn = lambda command: (
+            OperationResult[bool].fail("Disk full")
+            if command.startswith("sudo install")
+            else OperationResult[bool].succeed(True)
+        )
+        service = ConfigBundleService(self.file_system, system_management)
+
+        # Act
+        result = service.apply(self.artifacts)
+
+        # Assert
+        self.assertEqual(
+            [result.success, system_management.execute_raw_command_params[1:]],
+            [
+                False,
+                [
+                    "sudo rm -f /etc/dnsmasq.d/.internal.conf.bundle-new "
+                    "/srv/postgres/conf/.postgresql.conf.bundle-new"
+                ],
+            ],
+        )
+
+    def test_apply_restores_installed_files_when_an_install_fails(self):
+        """Verifies a failed rename puts back the files installed before it."""
+        # Arrange
+        system_management = MockSystemManagementService()
+        system_management.execute_raw_command_result_fn = lambda command: (
+            OperationResult[bool].fail("Read-only")
+            if "/srv/postgres/conf/postgresql.conf" in command and " mv " in command
+            else OperationResult[bool].succeed(True)
+        )
+        service = ConfigBundleService(self.file_system, system_management)
+
+        # Act
+        result = service.apply(self.artifacts)
+
+        # Assert
+        self.assertEqual(
+            [result.success, system_management.execute_raw_command_params[3:]],
+            [
+                False,
+                [
+                    "sudo mv -f /etc/dnsmasq.d/.internal.conf.bundle-old "
+                    "/etc/dnsmasq.d/internal.conf",
+                    "sudo rm -f /etc/dnsmasq.d/.internal.conf.bundle-new "
+                    "/srv/postgres/conf/.postgresql.conf.bundle-new "
+                    "/etc/dnsmasq.d/.internal.conf.bundle-old "
+                    "/srv/postgres/conf/.postgresql.conf.bundle-old",
+                ],
+            ],
+        )
+
+    def test_apply_stops_at_a_failed_reload(self):
+        """Verifies a failed reload command fails the apply."""
+        # Arrange
+        system_management = MockSystemManagementService()
+        system_management.execute_raw_command_result_fn = lambda command: (
+            OperationResult[bool].fail("Failed")
+            if "dnsmasq" in command and "systemctl" in command
+            else OperationResult[bool].succeed(True)
+        )
+        service = ConfigBundleService(self.file_system, system_management)
+
+        # Act
+        result = service.apply(self.artifacts)
+
+        # Assert
+        self.assertEqual(
+            [result.success, system_management.execute_raw_command_params[-1]],
+            [False, "sudo systemctl reload-or-restart dnsmasq"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -181,6 +181,45 @@ bar=me@sample.com
         expected_config = self._config_result(self.config.pg_admin_password)
         self.assertEqual(result, expected_config)
 
+    def test_config_package_cache_host_is_set(self):
+        """Test that PACKAGE_CACHE_HOST placeholder is replaced with configured value."""
+        # Arrange
+        self.file_system.read_text_result = self._config_tpl("PACKAGE_CACHE_HOST")
+        self.config.package_cache_host = "192.168.1.10"
+
+        # Act
+        result = self.reader.read(self.config, "/path")
+
+        # Assert
+        expected_config = self._config_result(self.config.package_cache_host)
+        self.assertEqual(result, expected_config)
+
+    def test_config_gitea_db_host_uses_pgbouncer(self):
+        """Test that GITEA_DB_HOST placeholder points to PgBouncer when pooling is enabled."""
+        # Arrange
+        self.file_system.read_text_result = self._config_tpl("GITEA_DB_HOST")
+        self.config.pgbouncer_enabled = True
+
+        # Act
+        result = self.reader.read(self.config, "/path")
+
+        # Assert
+        expected_config = self._config_result("pgbouncer:6432")
+        self.assertEqual(result, expected_config)
+
+    def test_config_gitea_db_host_uses_postgres(self):
+        """Test that GITEA_DB_HOST placeholder points to PostgreSQL when pooling is disabled."""
+        # Arrange
+        self.file_system.read_text_result = self._config_tpl("GITEA_DB_HOST")
+        self.config.pgbouncer_enabled = False
+
+        # Act
+        result = self.reader.read(self.config, "/path")
+
+        # Assert
+        expected_config = self._config_result("postgres:5432")
+        self.assertEqual(result, expected_config)
+
     def _config_tpl(self, key: str) -> OperationResult[str]:
         """
         Create a template with placeholder for testing.
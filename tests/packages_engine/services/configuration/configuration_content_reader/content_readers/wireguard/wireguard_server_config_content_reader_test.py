@@ -45,8 +45,10 @@ class TestWireguardServerConfigContentReader(unittest.TestCase):
                 """[Interface]
  PrivateKey = {{SERVER_KEY}}
 Address = 10.10.0.1/24
+MTU = {{WIREGUARD_MTU}}
 ListenPort = 51820"""
             ),
+            "/etc/wireguard/server.mtu": OperationResult[str].succeed("1432\n"),
             f"/usr/local/share/{self.config.server_data_dir}/data/wireguard/wg0.client.conf": OperationResult[
                 str
             ].succeed(
@@ -80,6 +82,7 @@ AllowedIPs = {{CLIENT_IP_ADDRESS}}/32"""
             """[Interface]
  PrivateKey = private_server_key_value
 Address = 10.10.0.1/24
+MTU = 1432
 ListenPort = 51820
 
 [Peer]
@@ -98,6 +101,19 @@ PublicKey = operator_public_key_value
 AllowedIPs = 10.10.0.4/32""",
         )
 
+    def test_default_mtu_when_not_discovered(self):
+        """Test that wg-quick's default MTU is rendered when no MTU has been discovered."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/wireguard/server.mtu"] = OperationResult[
+            str
+        ].fail("No such file")
+
+        # Act
+        result = self.reader.read(self.config)
+
+        # Assert
+        self.assertIn("MTU = 1420\n", result.data or "")
+
     def test_fails_when_server_private_key_not_read(self):
         """Test that read fails when server private key file cannot be read."""
         self._failed_path_test("/etc/wireguard/server.key")
@@ -48,6 +48,7 @@ class TestWireguardSharedConfigContentReader(unittest.TestCase):
 PrivateKey = {{CLIENT_PRIVATE_KEY}}
 Address = {{CLIENT_IP_ADDRESS}}/24
 DNS = 10.10.0.1
+MTU = {{WIREGUARD_MTU}}
 
 [Peer]
 PublicKey = {{SERVER_PUBLIC_KEY}}
@@ -55,6 +56,7 @@ AllowedIPs = 10.10.0.1/32
 Endpoint = {{REMOTE_IP_ADDRESS}}:51820
 PersistentKeepalive = 25"""
             ),
+            "/etc/wireguard/server.mtu": OperationResult[str].succeed("1440"),
             "/etc/wireguard/clients/developer.ip": OperationResult[str].succeed("10.10.0.2"),
             "/etc/wireguard/clients/developer.key": OperationResult[str].succeed(
                 "developer_private_key_value"
@@ -67,6 +69,7 @@ PersistentKeepalive = 25"""
             "/etc/wireguard/clients/operator.key": OperationResult[str].succeed(
                 "operator_private_key_value"
             ),
+            "/etc/wireguard/clients/viewer.mtu": OperationResult[str].succeed("1380\n"),
         }
 
     def test_happy_path_configuration(self):
@@ -82,6 +85,7 @@ PersistentKeepalive = 25"""
 PrivateKey = developer_private_key_value
 Address = 10.10.0.2/24
 DNS = 10.10.0.1
+MTU = 1440
 
 [Peer]
 PublicKey = public_server_key_value
@@ -96,6 +100,7 @@ PersistentKeepalive = 25
 PrivateKey = viewer_private_key_value
 Address = 10.10.0.3/24
 DNS = 10.10.0.1
+MTU = 1380
 
 [Peer]
 PublicKey = public_server_key_value
@@ -110,6 +115,7 @@ PersistentKeepalive = 25
 PrivateKey = operator_private_key_value
 Address = 10.10.0.4/24
 DNS = 10.10.0.1
+MTU = 1440
 
 [Peer]
 PublicKey = public_server_key_value
@@ -118,6 +124,19 @@ Endpoint = 127.0.0.1:51820
 PersistentKeepalive = 25""",
         )
 
+    def test_invalid_override_uses_server_mtu(self):
+        """Test that an unusable client MTU override falls back to the server MTU."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/wireguard/clients/viewer.mtu"] = (
+            OperationResult[str].succeed("auto")
+        )
+
+        # Act
+        result = self.reader.read(self.config)
+
+        # Assert
+        self.assertEqual((result.data or "").count("MTU = 1440\n"), 3)
+
     def test_fails_when_server_public_key_not_read(self):
         """Test that read fails when server public key file cannot be read."""
         self._failed_path_test("/etc/wireguard/server.pub")
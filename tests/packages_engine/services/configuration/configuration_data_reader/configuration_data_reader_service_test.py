@@ -34,6 +34,15 @@ _str_values = [
     "foo",
     "bar",
     "/mount/usb",
+    "client",
+    "192.168.1.10",
+    "y",
+    "y",
+    "ecdsa",
+    "",
+    "kernel",
+    "y",
+    "198.51.100.7",
 ]
 _str_values_with_option = [
     "",
@@ -53,6 +62,15 @@ _str_values_with_option = [
     "foo",
     "bar",
     "/mount/usb",
+    "client",
+    "192.168.1.10",
+    "y",
+    "y",
+    "ecdsa",
+    "",
+    "kernel",
+    "y",
+    "198.51.100.7",
 ]
 
 
@@ -78,6 +96,15 @@ def _read_str_result_with_option(call_order: int, title: str, default_value: Opt
     return _str_values_with_option[call_order - 1]
 
 
+def _read_str_result_with_cache_mode(mode: str):
+    def _read(call_order: int, title: str, default_value: Optional[str]) -> str:
+        if title == "Package caches mode (off, server, client)":
+            return mode
+        return _read_str_result(call_order, title, default_value)
+
+    return _read
+
+
 def _read_int_result(call_order: int, title: str, default_value: Optional[int]) -> int:
     # pylint: disable=unused-argument
     return 2
@@ -112,6 +139,15 @@ class TestConfigurationDataReaderService(unittest.TestCase):
             num_wireguard_clients=2,
             wireguard_client_names=["limitless", "viewer"],
             clients_data_dir="/usr/local/share/clients",
+            package_cache_mode="off",
+            package_cache_host="",
+            pgbouncer_enabled=False,
+            gitea_redis_enabled=False,
+            certificate_profile="rsa",
+            certificate_renew_days=30,
+            tcp_forwarding_mode="proxy",
+            flowtable_enabled=False,
+            mtu_probe_address="",
         )
         self.input_data = ConfigurationData(
             server_data_dir="s",
@@ -129,6 +165,15 @@ class TestConfigurationDataReaderService(unittest.TestCase):
             num_wireguard_clients=2,
             wireguard_client_names=["foo", "bar"],
             clients_data_dir="/mount/usb",
+            package_cache_mode="client",
+            package_cache_host="192.168.1.10",
+            pgbouncer_enabled=True,
+            gitea_redis_enabled=True,
+            certificate_profile="ecdsa",
+            certificate_renew_days=2,
+            tcp_forwarding_mode="kernel",
+            flowtable_enabled=True,
+            mtu_probe_address="198.51.100.7",
         )
         ConfigurationDataReaderServiceTestData.stored_data_option = "y"
 
@@ -162,15 +207,142 @@ class TestConfigurationDataReaderService(unittest.TestCase):
                 ReadParams[str]("Name of the Server Client #1", None, 14),
                 ReadParams[str]("Name of the Server Client #2", None, 15),
                 ReadParams[str]("Mounted directory for the Clients Configuration", None, 16),
+                ReadParams[str]("Package caches mode (off, server, client)", "off", 17),
+                ReadParams[str]("Package caches host address", None, 18),
+                ReadParams[str](
+                    "Type 'y' to pool Gitea database connections through PgBouncer.", "y", 19
+                ),
+                ReadParams[str](
+                    "Type 'y' to run a Redis-compatible cache, session and queue store for Gitea.",
+                    "y",
+                    20,
+                ),
+                ReadParams[str]("Certificate key profile (ecdsa, rsa)", "ecdsa", 21),
+                ReadParams[str](
+                    "TCP forwarding for PostgreSQL and Git SSH (proxy, kernel)", "proxy", 23
+                ),
+                ReadParams[str](
+                    "Type 'y' to offload VPN to container forwarding with an nftables flowtable.",
+                    "y",
+                    24,
+                ),
+                ReadParams[str](
+                    "Path MTU probe address on the clients' side (empty to skip)", "", 25
+                ),
             ],
         )
         self.assertEqual(
             int_params,
             [
                 ReadParams[int]("Number of Server Clients", 2, 13),
+                ReadParams[int](
+                    "Renew the server certificate this many days before it expires", 30, 22
+                ),
             ],
         )
 
+    def test_package_caches_host_is_local_in_server_mode(self):
+        """Package caches host is local in server mode."""
+        # Arrange
+        self.input_collection.read_str_result_fn = _read_str_result_with_cache_mode("server")
+        self.input_collection.read_int_result_fn = _read_int_result
+
+        # Act
+        result = self.service.read()
+
+        # Assert
+        self.assertEqual(result.package_cache_mode, "server")
+        self.assertEqual(result.package_cache_host, "127.0.0.1")
+        self.assertNotIn(
+            "Package caches host address",
+            [params.title for params in self.input_collection.read_str_params],
+        )
+
+    def test_package_caches_are_off_for_unknown_mode(self):
+        """Package caches are off for unknown mode."""
+        # Arrange
+        self.input_collection.read_str_result_fn = _read_str_result_with_cache_mode("maybe")
+        self.input_collection.read_int_result_fn = _read_int_result
+
+        # Act
+        result = self.service.read()
+
+        # Assert
+        self.assertEqual(result.package_cache_mode, "off")
+        self.assertEqual(result.package_cache_host, "")
+
+    def test_pgbouncer_is_disabled_unless_confirmed(self):
+        """PgBouncer is disabled unless confirmed."""
+
+        # Arrange
+        def _read(call_order: int, title: str, default_value: Optional[str]) -> str:
+            if title == "Type 'y' to pool Gitea database connections through PgBouncer.":
+                return "n"
+            return _read_str_result(call_order, title, default_value)
+
+        self.input_collection.read_str_result_fn = _read
+        self.input_collection.read_int_result_fn = _read_int_result
+
+        # Act
+        result = self.service.read()
+
+        # Assert
+        self.assertFalse(result.pgbouncer_enabled)
+
+    def test_gitea_redis_is_disabled_unless_confirmed(self):
+        """Gitea Redis is disabled unless confirmed."""
+
+        # Arrange
+        def _read(call_order: int, title: str, default_value: Optional[str]) -> str:
+            if title.startswith("Type 'y' to run a Redis-compatible"):
+                return "no"
+            return _read_str_result(call_order, title, default_value)
+
+        self.input_collection.read_str_result_fn = _read
+        self.input_collection.read_int_result_fn = _read_int_result
+
+        # Act
+        result = self.service.read()
+
+        # Assert
+        self.assertFalse(result.gitea_redis_enabled)
+
+    def test_unknown_certificate_profile_falls_back_to_ecdsa(self):
+        """Unknown certificate profiles fall back to ECDSA."""
+
+        # Arrange
+        def _read(call_order: int, title: str, default_value: Optional[str]) -> str:
+            if title == "Certificate key profile (ecdsa, rsa)":
+                return "dsa"
+            return _read_str_result(call_order, title, default_value)
+
+        self.input_collection.read_str_result_fn = _read
+        self.input_collection.read_int_result_fn = _read_int_result
+
+        # Act
+        result = self.service.read()
+
+        # Assert
+        self.assertEqual(result.certificate_profile, "ecdsa")
+
+    def test_unknown_tcp_forwarding_mode_falls_back_to_proxy(self):
+        """Unknown TCP forwarding modes fall back to the nginx stream proxy."""
+
+        # Arrange
+        def _read(call_order: int, title: str, default_value: Optional[str]) -> str:
+            if title == "TCP forwarding for PostgreSQL and Git SSH (proxy, kernel)":
+                return "userspace"
+            return _read_str_result(call_order, title, default_value)
+
+        self.input_collection.read_str_result_fn = _read
+        self.input_collection.read_int_result_fn = _read_int_result
+
+        # Act
+        result = self.service.read()
+
+        # Assert
+        self.assertEqual(result.tcp_forwarding_mode, "proxy")
+
     def test_configuration_is_read_correctly(self):
         """Configuration is read correctly."""
         # Arrange
@@ -241,12 +413,37 @@ class TestConfigurationDataReaderService(unittest.TestCase):
                 ReadParams[str]("Name of the Server Client #1", None, 15),
                 ReadParams[str]("Name of the Server Client #2", None, 16),
                 ReadParams[str]("Mounted directory for the Clients Configuration", None, 17),
+                ReadParams[str]("Package caches mode (off, server, client)", "off", 18),
+                ReadParams[str]("Package caches host address", None, 19),
+                ReadParams[str](
+                    "Type 'y' to pool Gitea database connections through PgBouncer.", "y", 20
+                ),
+                ReadParams[str](
+                    "Type 'y' to run a Redis-compatible cache, session and queue store for Gitea.",
+                    "y",
+                    21,
+                ),
+                ReadParams[str]("Certificate key profile (ecdsa, rsa)", "ecdsa", 22),
+                ReadParams[str](
+                    "TCP forwarding for PostgreSQL and Git SSH (proxy, kernel)", "proxy", 24
+                ),
+                ReadParams[str](
+                    "Type 'y' to offload VPN to container forwarding with an nftables flowtable.",
+                    "y",
+                    25,
+                ),
+                ReadParams[str](
+                    "Path MTU probe address on the clients' side (empty to skip)", "", 26
+                ),
             ],
         )
         self.assertEqual(
             int_params,
             [
                 ReadParams[int]("Number of Server Clients", 2, 14),
+                ReadParams[int](
+                    "Renew the server certificate this many days before it expires", 30, 23
+                ),
             ],
         )
 
@@ -0,0 +1,28 @@
+"""Tests for the certificate profiles."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.certificates import (
+    CERTIFICATE_PROFILES,
+    certificate_profile,
+)
+
+
+class TestCertificateProfile(unittest.TestCase):
+    """Test suite for certificate_profile."""
+
+    def test_known_profiles_are_returned(self):
+        """Verifies known profiles are looked up by name."""
+        # Act
+        result = [certificate_profile("ecdsa").name, certificate_profile("rsa").name]
+
+        # Assert
+        self.assertEqual(result, ["ecdsa", "rsa"])
+
+    def test_unknown_profile_falls_back_to_ecdsa(self):
+        """Verifies unknown profile names fall back to ECDSA."""
+        # Act
+        result = certificate_profile("dsa")
+
+        # Assert
+        self.assertEqual(result, CERTIFICATE_PROFILES["ecdsa"])
@@ -0,0 +1,36 @@
+"""Tests for the certificate rotation script rendering."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.certificates import (
+    certificate_profile,
+    render_certificate_rotation,
+)
+
+
+class TestCertificateRotation(unittest.TestCase):
+    """Test suite for render_certificate_rotation."""
+
+    def test_render_replaces_placeholders(self):
+        """Verifies the renewal window, lifetime and RSA key settings are rendered."""
+        # Act
+        result = render_certificate_rotation(
+            "{{CERT_RENEW_DAYS}} {{CERT_DAYS}} '{{CERT_KEY_MARKER}}' "
+            "openssl {{CERT_SERVER_GENKEY}}",
+            certificate_profile("rsa"),
+            14,
+        )
+
+        # Assert
+        self.assertEqual(result, "14 825 'modulus:' openssl genrsa -out \"$NAME.key.new\" 2048")
+
+    def test_renewal_window_is_limited(self):
+        """Verifies the renewal window stays between one day and half the lifetime."""
+        # Act
+        result = [
+            render_certificate_rotation("{{CERT_RENEW_DAYS}}", certificate_profile("ecdsa"), days)
+            for days in (0, 5000)
+        ]
+
+        # Assert
+        self.assertEqual(result, ["1", "412"])
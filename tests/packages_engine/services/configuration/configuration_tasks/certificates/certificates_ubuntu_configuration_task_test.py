@@ -83,8 +83,16 @@ class TestCertificatesUbuntuConfigurationTask(unittest.TestCase):
                 {"text": "(Re)writing SAN template successful.", "type": "success"},
                 {"text": "Creating CA if missing (idempotent).", "type": "info"},
                 {"text": "Creating CA succeeded.", "type": "success"},
-                {"text": "Creating server key/cert if missing (idempotent).", "type": "info"},
-                {"text": "Creating server key/cert succeeded.", "type": "success"},
+                {"text": "Installing server certificate rotation.", "type": "info"},
+                {
+                    "text": "\tInstalling server certificate rotation succeeded.",
+                    "type": "success",
+                },
+                {
+                    "text": "Issuing server key/cert if missing or expiring within 30 days.",
+                    "type": "info",
+                },
+                {"text": "Issuing server key/cert succeeded.", "type": "success"},
                 {"text": "\tCertificates ready.", "type": "success"},
             ],
         )
@@ -100,7 +108,22 @@ class TestCertificatesUbuntuConfigurationTask(unittest.TestCase):
             [
                 ReadParams(
                     ConfigurationContent.RAW_STRING, self.data, "/usr/local/share/srv/data/ssl.conf"
-                )
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/certificates/internal-cert-rotate.sh",
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/systemd/internal-cert-rotate.service",
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/systemd/internal-cert-rotate.timer",
+                ),
             ],
         )
 
@@ -158,24 +181,86 @@ class TestCertificatesUbuntuConfigurationTask(unittest.TestCase):
                     "sudo chmod 600 /etc/ssl/internal-pki/ca.key",
                 ],
                 [
-                    "test -f /etc/ssl/internal-pki/.key || (umask 077 && openssl genrsa -out "
-                    "/etc/ssl/internal-pki/.key 2048)",
-                    "test -f /etc/ssl/internal-pki/.csr || openssl req -new -key "
-                    "/etc/ssl/internal-pki/.key -out /etc/ssl/internal-pki/.csr -config "
-                    "/etc/ssl/internal-pki/san.cnf",
-                    "test -f /etc/ssl/internal-pki/.crt || openssl x509 -req -in "
-                    "/etc/ssl/internal-pki/.csr -CA /etc/ssl/internal-pki/ca.crt -CAkey "
-                    "/etc/ssl/internal-pki/ca.key -CAcreateserial -out "
-                    "/etc/ssl/internal-pki/.crt -days 825 -sha256 -extensions req_ext -extfile "
-                    "/etc/ssl/internal-pki/san.cnf",
-                    "sudo install -m 0644 -o root -g root /etc/ssl/internal-pki/.crt "
-                    "/etc/ssl/certs/internal.crt",
-                    "sudo install -m 0600 -o root -g root /etc/ssl/internal-pki/.key "
-                    "/etc/ssl/private/internal.key",
+                    "sudo chown root:root /usr/local/sbin/internal-cert-rotate",
+                    "sudo chmod 0755 /usr/local/sbin/internal-cert-rotate",
+                    "sudo chmod 0644 /etc/systemd/system/internal-cert-rotate.service "
+                    "/etc/systemd/system/internal-cert-rotate.timer",
+                    "sudo systemctl daemon-reload",
+                    "sudo systemctl enable --now internal-cert-rotate.timer",
                 ],
+                ["sudo /usr/local/sbin/internal-cert-rotate"],
             ],
         )
 
+    def test_ecdsa_profile_generates_p256_keys(self):
+        """Verify the ECDSA profile generates a P-256 CA key and renders the rotation script."""
+        # Arrange
+        self.data.certificate_profile = "ecdsa"
+        self.reader.read_result_map = {
+            "/usr/local/share/srv/data/certificates/internal-cert-rotate.sh": OperationResult[
+                str
+            ].succeed("{{CERT_RENEW_DAYS}}|{{CERT_KEY_MARKER}}|openssl {{CERT_SERVER_GENKEY}}"),
+        }
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.controller.run_raw_commands_params[1][0],
+            "test -f /etc/ssl/internal-pki/ca.key || (umask 077 && openssl genpkey -algorithm EC "
+            "-pkeyopt ec_paramgen_curve:P-256 -pkeyopt ec_param_enc:named_curve "
+            "-out /etc/ssl/internal-pki/ca.key)",
+        )
+        self.assertIn(
+            WriteTextParams(
+                "/usr/local/sbin/internal-cert-rotate",
+                "30|ASN1 OID: prime256v1|openssl genpkey -algorithm EC "
+                "-pkeyopt ec_paramgen_curve:P-256 -pkeyopt ec_param_enc:named_curve "
+                '-out "$NAME.key.new"',
+            ),
+            self.file_system.write_text_params,
+        )
+
+    def test_failure_to_read_rotation_script_results_in_failure(self):
+        """Verify task fails when the rotation script template cannot be read."""
+        # Arrange
+        failure_result = OperationResult[str].fail("Failure")
+        self.reader.read_result_map = {
+            "/usr/local/share/srv/data/certificates/internal-cert-rotate.sh": failure_result,
+        }
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(
+            self.notifications.params[-1],
+            {
+                "text": "\tFailed to read certificates/internal-cert-rotate.sh template.",
+                "type": "error",
+            },
+        )
+
+    def test_failure_to_install_rotation_timer_results_in_failure(self):
+        """Verify task fails when the rotation timer cannot be enabled."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.controller.run_raw_commands_result_regex_map["internal-cert-rotate.timer"] = (
+            failure_result
+        )
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tInstalling server certificate rotation failed.", "type": "error"},
+        )
+
     def test_pki_folders_ensurance_command_failure_results_in_failure(self):
         """Verify task fails when PKI folder creation fails."""
         # Arrange
@@ -258,9 +343,9 @@ class TestCertificatesUbuntuConfigurationTask(unittest.TestCase):
         """Verify task fails when server certificate generation fails."""
         # Arrange
         failure_result = OperationResult[bool].fail("Failure")
-        self.controller.run_raw_commands_result_regex_map["test -f /etc/ssl/internal-pki/.key"] = (
-            failure_result
-        )
+        self.controller.run_raw_commands_result_regex_map[
+            "sudo /usr/local/sbin/internal-cert-rotate"
+        ] = failure_result
 
         # Act
         result = self.task.configure(self.data)
@@ -272,9 +357,9 @@ class TestCertificatesUbuntuConfigurationTask(unittest.TestCase):
         """Verify error notifications when server certificate generation fails."""
         # Arrange
         failure_result = OperationResult[bool].fail("Failure")
-        self.controller.run_raw_commands_result_regex_map["test -f /etc/ssl/internal-pki/.key"] = (
-            failure_result
-        )
+        self.controller.run_raw_commands_result_regex_map[
+            "sudo /usr/local/sbin/internal-cert-rotate"
+        ] = failure_result
 
         # Act
         self.task.configure(self.data)
@@ -292,8 +377,16 @@ class TestCertificatesUbuntuConfigurationTask(unittest.TestCase):
                 {"text": "(Re)writing SAN template successful.", "type": "success"},
                 {"text": "Creating CA if missing (idempotent).", "type": "info"},
                 {"text": "Creating CA succeeded.", "type": "success"},
-                {"text": "Creating server key/cert if missing (idempotent).", "type": "info"},
-                {"text": "Creating server key/cert failed.", "type": "error"},
+                {"text": "Installing server certificate rotation.", "type": "info"},
+                {
+                    "text": "\tInstalling server certificate rotation succeeded.",
+                    "type": "success",
+                },
+                {
+                    "text": "Issuing server key/cert if missing or expiring within 30 days.",
+                    "type": "info",
+                },
+                {"text": "Issuing server key/cert failed.", "type": "error"},
             ],
         )
 
@@ -304,8 +397,23 @@ class TestCertificatesUbuntuConfigurationTask(unittest.TestCase):
 
         # Assert
         self.assertEqual(
-            self.file_system.write_text_params,
-            [WriteTextParams("/etc/ssl/internal-pki/san.cnf", "ssl-configuration")],
+            self.file_system.write_text_params[0],
+            WriteTextParams("/etc/ssl/internal-pki/san.cnf", "ssl-configuration"),
+        )
+
+    def test_stores_rotation_script_and_units(self):
+        """Verify the rotation script and its systemd units are written."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [params.path_location for params in self.file_system.write_text_params[1:]],
+            [
+                "/usr/local/sbin/internal-cert-rotate",
+                "/etc/systemd/system/internal-cert-rotate.service",
+                "/etc/systemd/system/internal-cert-rotate.timer",
+            ],
         )
 
     def test_failure_to_store_san_template_results_in_failure(self):
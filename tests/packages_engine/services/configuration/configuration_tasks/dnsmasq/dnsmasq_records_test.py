@@ -0,0 +1,42 @@
+"""Tests for the dnsmasq cache sizing and internal records."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.dnsmasq import (
+    dnsmasq_cache_size,
+    render_dnsmasq_cache,
+    render_internal_hosts,
+)
+
+
+class TestDnsmasqRecords(unittest.TestCase):
+    """Test suite for the dnsmasq helpers."""
+
+    def test_cache_size_grows_with_clients_and_is_capped(self):
+        """Verifies the cache grows by 500 entries per client up to 10000."""
+        # Act
+        result = [dnsmasq_cache_size(0), dnsmasq_cache_size(2), dnsmasq_cache_size(100)]
+
+        # Assert
+        self.assertEqual(result, [1000, 2000, 10000])
+
+    def test_render_dnsmasq_cache(self):
+        """Verifies the cache size placeholder is replaced."""
+        # Act
+        result = render_dnsmasq_cache("cache-size={{DNSMASQ_CACHE_SIZE}}\n", 2)
+
+        # Assert
+        self.assertEqual(result, "cache-size=2000\n")
+
+    def test_internal_hosts_point_services_at_the_vpn_gateway(self):
+        """Verifies every internal service name resolves to the WireGuard server."""
+        # Act
+        result = render_internal_hosts("example.internal")
+
+        # Assert
+        self.assertEqual(
+            result,
+            "10.10.0.1 ssh.example.internal\n"
+            "10.10.0.1 gitea.example.internal\n"
+            "10.10.0.1 postgresql.example.internal\n",
+        )
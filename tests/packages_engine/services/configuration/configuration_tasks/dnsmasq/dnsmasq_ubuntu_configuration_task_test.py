@@ -49,7 +49,9 @@ class TestDnsmasqUbuntuConfigurationTask(unittest.TestCase):
         )
         self.data = ConfigurationData.default()
         self.data.server_data_dir = "srv"
+        self.data.domain_name = "internal.test"
         self.reader.read_result = OperationResult[str].succeed("dnsmasq-config-result")
+        self.file_system.path_exists_result_map = {"/run/dnsmasq-conf.changed": False}
         self.maxDiff = None
 
     def test_happy_path(self):
@@ -145,7 +147,104 @@ class TestDnsmasqUbuntuConfigurationTask(unittest.TestCase):
         # Assert
         self.assertEqual(
             self.file_system.write_text_params,
-            [WriteTextParams("/etc/dnsmasq.d/internal.conf", "dnsmasq-config-result")],
+            [
+                WriteTextParams(
+                    "/etc/dnsmasq.hosts.d/internal.hosts",
+                    "10.10.0.1 ssh.internal.test\n"
+                    "10.10.0.1 gitea.internal.test\n"
+                    "10.10.0.1 postgresql.internal.test\n",
+                ),
+                WriteTextParams("/etc/dnsmasq.d/internal.conf", "dnsmasq-config-result"),
+            ],
+        )
+
+    def test_cache_size_follows_client_count(self):
+        """Verify the cache-size placeholder is sized from the client count."""
+        # Arrange
+        self.data.num_wireguard_clients = 4
+        self.reader.read_result = OperationResult[str].succeed("cache-size={{DNSMASQ_CACHE_SIZE}}")
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[-1],
+            WriteTextParams("/etc/dnsmasq.d/internal.conf", "cache-size=3000"),
+        )
+
+    def test_unchanged_config_keeps_dnsmasq_running(self):
+        """Verify an unchanged config only refreshes the records and does not restart."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/dnsmasq.d/internal.conf"] = OperationResult[
+            str
+        ].succeed("dnsmasq-config-result")
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(
+            [params.path_location for params in self.file_system.write_text_params],
+            ["/etc/dnsmasq.hosts.d/internal.hosts"],
+        )
+        self.assertEqual(
+            self.controller.run_raw_commands_params,
+            [
+                ["sudo install -d -m 0755 /etc/dnsmasq.d /etc/dnsmasq.hosts.d"],
+                ["sudo systemctl enable --now dnsmasq"],
+            ],
+        )
+        self.assertEqual(
+            self.notifications.params[-1],
+            {
+                "text": "\tDnsmasq configuration is unchanged. "
+                "Internal records were updated in place.",
+                "type": "success",
+            },
+        )
+
+    def test_unchanged_config_of_a_failed_run_is_validated_and_restarted(self):
+        """Verify a config written by a run that failed before the restart is applied again."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/dnsmasq.d/internal.conf"] = OperationResult[
+            str
+        ].succeed("dnsmasq-config-result")
+        self.file_system.path_exists_result_map = {}
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [
+                self.controller.find_first_raw_commands_group("dnsmasq --test"),
+                self.controller.run_raw_commands_params[-1][-2:],
+            ],
+            [
+                ["sudo dnsmasq --test"],
+                [
+                    "sudo systemctl reload-or-restart dnsmasq",
+                    "sudo rm -f /run/dnsmasq-conf.changed",
+                ],
+            ],
+        )
+
+    def test_failed_validation_leaves_the_change_marker(self):
+        """Verify the marker is not removed when the new config does not pass the test."""
+        # Arrange
+        self.controller.run_raw_commands_result_regex_map = {
+            "dnsmasq --test": OperationResult[bool].fail("Failure")
+        }
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [result.success, self.controller.find_first_raw_commands_group("rm -f")],
+            [False, None],
         )
 
     def test_write_failure_result_in_task_failure(self):
@@ -182,7 +281,7 @@ class TestDnsmasqUbuntuConfigurationTask(unittest.TestCase):
                     "type": "info",
                 },
                 {"text": "Writing Dnsmasq Config data.", "type": "info"},
-                {"text": "\tWriting Dnsmasq Config data failed.", "type": "error"},
+                {"text": "\tWriting Dnsmasq internal records failed.", "type": "error"},
             ],
         )
 
@@ -195,11 +294,13 @@ class TestDnsmasqUbuntuConfigurationTask(unittest.TestCase):
         self.assertEqual(
             self.controller.run_raw_commands_params,
             [
-                ["sudo install -d -m 0755 /etc/dnsmasq.d"],
+                ["sudo install -d -m 0755 /etc/dnsmasq.d /etc/dnsmasq.hosts.d"],
+                ["sudo touch /run/dnsmasq-conf.changed"],
                 ["sudo dnsmasq --test"],
                 [
-                    "sudo chown root:root /etc/dnsmasq.d/internal.conf",
-                    "sudo chmod 0644 /etc/dnsmasq.d/internal.conf",
+                    "sudo chown root:root /etc/dnsmasq.d/internal.conf "
+                    "/etc/dnsmasq.hosts.d/internal.hosts",
+                    "sudo chmod 0644 /etc/dnsmasq.d/internal.conf /etc/dnsmasq.hosts.d/internal.hosts",
                     "sudo systemctl reset-failed dnsmasq || true",
                     "sudo systemctl enable --now dnsmasq",
                     "sudo install -d -m 0755 /etc/systemd/system/dnsmasq.service.d",
@@ -211,6 +312,7 @@ class TestDnsmasqUbuntuConfigurationTask(unittest.TestCase):
                     "EOF'",
                     "sudo systemctl daemon-reload",
                     "sudo systemctl reload-or-restart dnsmasq",
+                    "sudo rm -f /run/dnsmasq-conf.changed",
                 ],
             ],
         )
@@ -0,0 +1,155 @@
+"""Tests for the Docker daemon.json merge."""
+
+import json
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.docker_orchestration import (
+    DOCKER_DAEMON_PROFILE,
+    add_unique_value,
+    docker_daemon_json_commands,
+    merge_docker_daemon_json,
+    merge_docker_daemon_profile,
+    restart_docker_on_daemon_json_change_command,
+)
+from packages_engine.services.file_system import InMemoryFileSystemService
+
+
+class TestDockerDaemonJson(unittest.TestCase):
+    """Test suite for the Docker daemon.json merge."""
+
+    def setUp(self):
+        self.file_system = InMemoryFileSystemService(
+            {"/etc/docker/daemon.json": '{"dns": ["1.1.1.1"], "debug": true}\n'}
+        )
+        self.maxDiff = None
+
+    def test_merge_writes_the_merged_document(self):
+        """Verifies the file is rewritten with the merged keys and keeps the others."""
+        # Act
+        result = merge_docker_daemon_json(
+            self.file_system, lambda daemon: add_unique_value(daemon, "dns", "10.10.0.1")
+        )
+
+        # Assert
+        self.assertEqual(
+            [result.data, json.loads(self.file_system.files["/etc/docker/daemon.json"])],
+            [True, {"dns": ["1.1.1.1", "10.10.0.1"], "debug": True}],
+        )
+
+    def test_merge_creates_a_missing_file(self):
+        """Verifies a missing file is merged as an empty document."""
+        # Arrange
+        self.file_system.remove_location("/etc/docker/daemon.json")
+
+        # Act
+        result = merge_docker_daemon_json(
+            self.file_system, lambda daemon: add_unique_value(daemon, "dns", "10.10.0.1")
+        )
+
+        # Assert
+        self.assertEqual(
+            [result.data, self.file_system.files["/etc/docker/daemon.json"]],
+            [True, '{\n  "dns": [\n    "10.10.0.1"\n  ]\n}\n'],
+        )
+
+    def test_merge_keeps_a_semantically_equal_file(self):
+        """Verifies formatting and key order alone do not rewrite the file."""
+        # Arrange
+        content = '{"debug":true,"dns":["1.1.1.1"]}'
+        self.file_system.write_text("/etc/docker/daemon.json", content)
+
+        # Act
+        result = merge_docker_daemon_json(
+            self.file_system, lambda daemon: add_unique_value(daemon, "dns", "1.1.1.1")
+        )
+
+        # Assert
+        self.assertEqual(
+            [result.data, self.file_system.files["/etc/docker/daemon.json"]], [False, content]
+        )
+
+    def test_merge_reports_a_pending_restart_of_an_earlier_run(self):
+        """Verifies a change marker left by an interrupted run still asks for a restart."""
+        # Arrange
+        self.file_system.write_text("/run/docker-daemon-json.changed", "")
+
+        # Act
+        result = merge_docker_daemon_json(self.file_system, lambda daemon: daemon)
+
+        # Assert
+        self.assertEqual(result.data, True)
+
+    def test_merge_refuses_invalid_json(self):
+        """Verifies a broken file is not overwritten."""
+        # Arrange
+        self.file_system.write_text("/etc/docker/daemon.json", "{")
+
+        # Act
+        result = merge_docker_daemon_json(self.file_system, lambda daemon: daemon)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message, self.file_system.files["/etc/docker/daemon.json"]],
+            [False, "/etc/docker/daemon.json is not valid JSON", "{"],
+        )
+
+    def test_profile_merges_objects_recursively(self):
+        """Verifies profile values win and other nested keys are kept."""
+        # Act
+        result = merge_docker_daemon_profile(
+            {"log-driver": "json-file", "log-opts": {"max-size": "1m", "labels": "a"}}
+        )
+
+        # Assert
+        self.assertEqual(
+            result,
+            {
+                **DOCKER_DAEMON_PROFILE,
+                "log-opts": {"max-size": "20m", "max-file": "5", "labels": "a"},
+            },
+        )
+
+    def test_unique_values_are_sorted_without_duplicates(self):
+        """Verifies lists stay sorted and deduplicated like jq unique."""
+        # Act
+        result = add_unique_value({"dns": ["10.10.0.1", "1.1.1.1"]}, "dns", "10.10.0.1")
+
+        # Assert
+        self.assertEqual(result, {"dns": ["1.1.1.1", "10.10.0.1"]})
+
+    def test_profile_settings(self):
+        """Verifies the daemon profile settings."""
+        # Assert
+        self.assertEqual(DOCKER_DAEMON_PROFILE["log-driver"], "local")
+        self.assertEqual(DOCKER_DAEMON_PROFILE["userland-proxy"], False)
+        self.assertEqual(DOCKER_DAEMON_PROFILE["live-restore"], True)
+
+    def test_commands_fix_permissions_and_leave_the_marker(self):
+        """Verifies a rewrite is finished by commands and nothing runs without one."""
+        # Act
+        result = [docker_daemon_json_commands(True), docker_daemon_json_commands(False)]
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                [
+                    "sudo chown root:root /etc/docker/daemon.json "
+                    "&& sudo chmod 0644 /etc/docker/daemon.json",
+                    "sudo touch /run/docker-daemon-json.changed",
+                ],
+                [],
+            ],
+        )
+
+    def test_restart_command_depends_on_change_marker(self):
+        """Verifies Docker is restarted only when the change marker exists."""
+        # Act
+        result = restart_docker_on_daemon_json_change_command()
+
+        # Assert
+        self.assertEqual(
+            result,
+            "test ! -f /run/docker-daemon-json.changed || "
+            "(sudo systemctl restart docker && sudo rm -f /run/docker-daemon-json.changed)",
+        )
@@ -1,5 +1,6 @@
 """Tests for DockerOrchestrationUbuntuConfigurationTask. Validates Docker network, DNS, and compose orchestration on Ubuntu."""
 
+import json
 import unittest
 
 from packages_engine.models import OperationResult
@@ -8,6 +9,7 @@ from packages_engine.services.configuration.configuration_content_reader.configu
     MockConfigurationContentReaderService,
 )
 from packages_engine.services.configuration.configuration_tasks.docker_orchestration import (
+    DOCKER_DAEMON_PROFILE,
     DockerOrchestrationUbuntuConfigurationTask,
 )
 from packages_engine.services.file_system.file_system_service_mock import (
@@ -41,6 +43,7 @@ class TestDockerOrchestrationUbuntuConfigurationTask(unittest.TestCase):
         )
         self.data = ConfigurationData.default()
         self.data.domain_name = "internal.app"
+        self.file_system.path_exists_result_map = {"/run/docker-daemon-json.changed": False}
         self.maxDiff = None
 
     def test_happy_path(self):
@@ -78,25 +81,41 @@ class TestDockerOrchestrationUbuntuConfigurationTask(unittest.TestCase):
                     # network (only create if missing)
                     "sudo docker network inspect vpn-internal >/dev/null 2>&1 || "
                     "sudo docker network create --driver bridge --attachable vpn-internal",
-                    # daemon.json must exist first
-                    "sudo install -d -m 0755 /etc/docker",
-                    "test -f /etc/docker/daemon.json || echo '{}' | sudo tee /etc/docker/daemon.json >/dev/null",
-                    # merge DNS & search domain (idempotent & deduped)
-                    f"sudo jq --arg dns '10.10.0.1' --arg search '{self.data.domain_name}' "
-                    '\'.dns = ((.dns // []) + [$dns] | unique) | ."dns-search" = ((."dns-search" // []) + [$search] | unique)\' '
-                    "/etc/docker/daemon.json | sudo tee /etc/docker/daemon.json.tmp >/dev/null && "
-                    "sudo mv /etc/docker/daemon.json.tmp /etc/docker/daemon.json && "
-                    "sudo chown root:root /etc/docker/daemon.json && sudo chmod 0644 /etc/docker/daemon.json",
+                    "sudo chown root:root /etc/docker/daemon.json "
+                    "&& sudo chmod 0644 /etc/docker/daemon.json",
+                    "sudo touch /run/docker-daemon-json.changed",
                     # optionally ensure docker starts after wg0 so 10.10.0.1 DNS is up on boot
                     "sudo install -d -m 0755 /etc/systemd/system/docker.service.d",
                     "sudo bash -lc 'cat > /etc/systemd/system/docker.service.d/10-after-wg0.conf <<EOF\n[Unit]\nAfter=wg-quick@wg0.service\nWants=wg-quick@wg0.service\nEOF'",
                     "sudo systemctl daemon-reload",
                     "sudo systemctl enable docker",
-                    "sudo systemctl restart docker",
+                    "sudo systemctl start docker",
+                    # restart only when the effective daemon configuration changed
+                    "test ! -f /run/docker-daemon-json.changed || "
+                    "(sudo systemctl restart docker && sudo rm -f /run/docker-daemon-json.changed)",
+                    # fixed-address network targeted by the kernel TCP forwarding mode
+                    "sudo docker network inspect vpn-forward >/dev/null 2>&1 || "
+                    "sudo docker network create --driver bridge --subnet 172.30.10.0/24 "
+                    "-o com.docker.network.bridge.name=br-vpnfwd vpn-forward",
+                    "sudo iptables -C DOCKER-USER -i wg0 -o br-vpnfwd -m conntrack --ctstate DNAT -j ACCEPT "
+                    "2>/dev/null || "
+                    "sudo iptables -I DOCKER-USER -i wg0 -o br-vpnfwd -m conntrack --ctstate DNAT -j ACCEPT",
+                    # offline bundle: load image archives in parallel instead of pulling them
+                    "test ! -d /usr/local/share/bundle/images || "
+                    "find /usr/local/share/bundle/images -name '*.tar.gz' -print0 | "
+                    "xargs -0 -r -P 4 -I{} sh -c 'gzip -dc \"$1\" | sudo docker load -q' _ {}",
                     # compose: pull updated images and up with --remove-orphans
-                    "cd /srv/stack && sudo docker compose pull --quiet || true",
+                    "test -d /usr/local/share/bundle/images || "
+                    "(cd /srv/stack && sudo docker compose pull --quiet) || true",
                     "cd /srv/stack && sudo docker compose config -q",
                     "cd /srv/stack && sudo docker compose up -d --remove-orphans",
+                    "cd /srv/stack && sudo docker compose --profile pgbouncer rm -sf pgbouncer",
+                    "cd /srv/stack && sudo docker compose --profile redis rm -sf redis",
+                    "for marker in /run/container-restart/*; do "
+                    'test -f "$marker" || continue; name=$(basename "$marker"); '
+                    'if [ -n "$(sudo docker ps -q --filter "name=^${name}$")" ]; then '
+                    'sudo docker restart "$name" >/dev/null || exit 1; fi; '
+                    'sudo rm -f "$marker"; done',
                     # wait for healthchecks so subsequent tasks can rely on services being ready
                     "cd /srv/stack && sudo docker compose ps",
                     "timeout 120 bash -lc '"
@@ -119,6 +138,90 @@ class TestDockerOrchestrationUbuntuConfigurationTask(unittest.TestCase):
             ],
         )
 
+    def test_merges_the_daemon_profile_dns_and_search_domain(self):
+        """Verifies daemon.json is written through the file system with the merged keys."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/docker/daemon.json"] = OperationResult[
+            str
+        ].succeed('{"dns": ["1.1.1.1"], "log-opts": {"labels": "app"}}')
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [
+                (params.path_location, json.loads(params.text))
+                for params in self.file_system.write_text_params
+            ],
+            [
+                (
+                    "/etc/docker/daemon.json",
+                    {
+                        **DOCKER_DAEMON_PROFILE,
+                        "log-opts": {"labels": "app", "max-size": "20m", "max-file": "5"},
+                        "dns": ["1.1.1.1", "10.10.0.1"],
+                        "dns-search": ["internal.app"],
+                    },
+                )
+            ],
+        )
+
+    def test_unchanged_daemon_json_does_not_restart_docker(self):
+        """Verifies Docker is neither restarted nor daemon.json rewritten without a change."""
+        # Arrange
+        daemon = {**DOCKER_DAEMON_PROFILE, "dns": ["10.10.0.1"], "dns-search": ["internal.app"]}
+        self.file_system.read_text_result_map["/etc/docker/daemon.json"] = OperationResult[
+            str
+        ].succeed(json.dumps(daemon))
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        commands = self.controller.run_raw_commands_params[0]
+        self.assertEqual(
+            [
+                self.file_system.write_text_params,
+                [command for command in commands if "docker-daemon-json" in command],
+            ],
+            [[], []],
+        )
+
+    def test_failure_to_merge_daemon_json_results_in_failure(self):
+        """Verifies an unreadable daemon.json stops the orchestration before any command."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/docker/daemon.json"] = OperationResult[
+            str
+        ].succeed("{")
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message, self.controller.run_raw_commands_params],
+            [False, "/etc/docker/daemon.json is not valid JSON", []],
+        )
+
+    def test_removes_only_services_of_disabled_profiles(self):
+        """Verifies services of enabled profiles are kept and the others removed."""
+        # Arrange
+        self.data.pgbouncer_enabled = True
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [
+                command
+                for command in self.controller.run_raw_commands_params[0]
+                if " rm -sf " in command
+            ],
+            ["cd /srv/stack && sudo docker compose --profile redis rm -sf redis"],
+        )
+
     def test_failure_to_run_commands_results_in_failure(self):
         """Verifies command execution failure propagates as failed result."""
         # Arrange
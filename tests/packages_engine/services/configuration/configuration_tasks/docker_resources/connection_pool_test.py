@@ -0,0 +1,49 @@
+"""Tests for the connection pool sizing."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.docker_resources import (
+    ConnectionPool,
+    compute_connection_pool,
+    render_connection_pool,
+)
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test suite for compute_connection_pool and render_connection_pool."""
+
+    def test_pool_with_pgbouncer(self):
+        """Verifies Gitea may open more client connections than the server pool."""
+        # Act
+        result = compute_connection_pool(100, 2, True)
+
+        # Assert
+        self.assertEqual(result, ConnectionPool(10, 2, 12, 500, 40, 20, "5m"))
+
+    def test_pool_without_pgbouncer(self):
+        """Verifies Gitea keeps its pool of direct connections open."""
+        # Act
+        result = compute_connection_pool(100, 2, False)
+
+        # Assert
+        self.assertEqual(result, ConnectionPool(10, 2, 12, 500, 10, 10, "30m"))
+
+    def test_pool_stays_within_max_connections(self):
+        """Verifies the server pool never exceeds max_connections minus the reserved ones."""
+        # Act
+        result = compute_connection_pool(40, 64, True)
+
+        # Assert
+        self.assertEqual(result.default_pool_size, 20)
+        self.assertLessEqual(result.max_db_connections, 30)
+
+    def test_render_replaces_placeholders(self):
+        """Verifies PgBouncer placeholders are replaced."""
+        # Act
+        result = render_connection_pool(
+            "{{PGBOUNCER_DEFAULT_POOL_SIZE}}/{{PGBOUNCER_MAX_CLIENT_CONN}}",
+            compute_connection_pool(100, 8, True),
+        )
+
+        # Assert
+        self.assertEqual(result, "32/500")
@@ -0,0 +1,108 @@
+"""Tests for the container resource limits calculation."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.docker_resources import (
+    ContainerResourceLimits,
+    ContainerResourceWeight,
+    compute_container_resource_limits,
+    render_container_resource_limits,
+)
+
+GIB = 1024**3
+
+
+class TestContainerResourceLimits(unittest.TestCase):
+    """Test suite for compute_container_resource_limits and render_container_resource_limits."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_default_weights_on_small_host(self):
+        """Verifies default weighting on a 4 GiB, 2 CPU host."""
+        # Act
+        result = compute_container_resource_limits(4 * GIB, 2)
+
+        # Assert
+        self.assertEqual(
+            result,
+            {
+                "postgres": ContainerResourceLimits(1629, 1629, 2.0, 512),
+                "gitea": ContainerResourceLimits(1140, 570, 1.0, 1024),
+                "pgadmin": ContainerResourceLimits(488, 122, 0.5, 256),
+                "pgbouncer": ContainerResourceLimits(128, 64, 0.5, 64),
+                "redis": ContainerResourceLimits(260, 130, 0.5, 64),
+            },
+        )
+
+    def test_disabled_services_take_no_share(self):
+        """Verifies services of disabled profiles get the minimums and leave the split as is."""
+        # Act
+        result = compute_container_resource_limits(4 * GIB, 2, disabled=["pgbouncer", "redis"])
+
+        # Assert
+        self.assertEqual(
+            result,
+            {
+                "postgres": ContainerResourceLimits(1792, 1792, 2.0, 512),
+                "gitea": ContainerResourceLimits(1254, 627, 1.0, 1024),
+                "pgadmin": ContainerResourceLimits(537, 134, 0.5, 256),
+                "pgbouncer": ContainerResourceLimits(128, 64, 0.25, 64),
+                "redis": ContainerResourceLimits(128, 64, 0.25, 64),
+            },
+        )
+
+    def test_host_reserve_scales_with_memory(self):
+        """Verifies an eighth of a large host memory is left to the host."""
+        # Act
+        result = compute_container_resource_limits(
+            32 * GIB, 8, {"postgres": ContainerResourceWeight(1.0, 1.0, 1.0, 512)}
+        )
+
+        # Assert
+        self.assertEqual(result["postgres"].mem_limit_mib, 28672)
+
+    def test_tiny_host_uses_minimums(self):
+        """Verifies memory and CPU minimums on a host smaller than the reserve."""
+        # Act
+        result = compute_container_resource_limits(256 * 1024 * 1024, 1)
+
+        # Assert
+        self.assertEqual(result["pgadmin"], ContainerResourceLimits(128, 32, 0.25, 256))
+
+    def test_cpus_never_exceed_host(self):
+        """Verifies CPU limit is capped by the host CPU count."""
+        # Act
+        result = compute_container_resource_limits(
+            4 * GIB, 2, {"gitea": ContainerResourceWeight(1.0, 3.0, 1.0, 64)}
+        )
+
+        # Assert
+        self.assertEqual(result["gitea"].cpus, 2.0)
+
+    def test_render_replaces_placeholders(self):
+        """Verifies all four placeholders of a service are replaced."""
+        # Arrange
+        content = (
+            "{{GITEA_MEM_LIMIT}} {{GITEA_MEM_RESERVATION}} {{GITEA_CPUS}} "
+            "{{GITEA_PIDS_LIMIT}} {{POSTGRES_CPUS}}"
+        )
+
+        # Act
+        result = render_container_resource_limits(
+            content, {"gitea": ContainerResourceLimits(1024, 512, 1.5, 1024)}
+        )
+
+        # Assert
+        self.assertEqual(result, "1024m 512m 1.5 1024 {{POSTGRES_CPUS}}")
+
+    def test_render_keeps_the_redis_dataset_below_its_limit(self):
+        """Verifies Valkey's maxmemory is three quarters of the container limit."""
+        # Act
+        result = render_container_resource_limits(
+            "--maxmemory {{REDIS_MAXMEMORY}} mem_limit: {{REDIS_MEM_LIMIT}}",
+            {"redis": ContainerResourceLimits(260, 130, 0.5, 64)},
+        )
+
+        # Assert
+        self.assertEqual(result, "--maxmemory 195mb mem_limit: 260m")
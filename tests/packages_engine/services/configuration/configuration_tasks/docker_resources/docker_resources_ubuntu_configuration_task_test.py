@@ -9,12 +9,16 @@ from packages_engine.services.configuration.configuration_content_reader.configu
     ReadParams,
 )
 from packages_engine.services.configuration.configuration_tasks.docker_resources import (
+    ContainerResourceWeight,
     DockerResourcesUbuntuConfigurationTask,
 )
 from packages_engine.services.file_system.file_system_service_mock import (
     MockFileSystemService,
     WriteTextParams,
 )
+from packages_engine.services.host_resources.host_resources_service_mock import (
+    MockHostResourcesService,
+)
 from packages_engine.services.notifications.notifications_service_mock import (
     MockNotificationsService,
 )
@@ -29,6 +33,7 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
     file_system: MockFileSystemService
     notifications: MockNotificationsService
     controller: MockPackageControllerService
+    host_resources: MockHostResourcesService
     task: DockerResourcesUbuntuConfigurationTask
     data: ConfigurationData
 
@@ -37,8 +42,13 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
         self.file_system = MockFileSystemService()
         self.notifications = MockNotificationsService()
         self.controller = MockPackageControllerService()
+        self.host_resources = MockHostResourcesService()
         self.task = DockerResourcesUbuntuConfigurationTask(
-            self.reader, self.file_system, self.notifications, self.controller
+            self.reader,
+            self.file_system,
+            self.notifications,
+            self.controller,
+            self.host_resources,
         )
         self.data = ConfigurationData.default()
         self.data.server_data_dir = "srv"
@@ -46,8 +56,10 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
         self.file_system.write_text_result_map = {
             "/srv/stack/docker-compose.yml": OperationResult[bool].succeed(True),
         }
+        self.file_system.path_exists_result_map = {"/srv/postgres/conf/postgresql.conf": False}
 
         self.reader.read_result = OperationResult[str].succeed("docker-compose-content")
+        self.postgres_template = "/usr/local/share/srv/data/postgres/postgresql.conf"
         self.maxDiff = None
 
     def test_happy_path(self):
@@ -71,8 +83,19 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
                 {"text": "Creating Docker folders successful.", "type": "success"},
                 {"text": "Reading Docker Config template data.", "type": "info"},
                 {"text": "\tReading Docker Config template data succeeded.", "type": "success"},
+                {"text": "Detecting host capacity.", "type": "info"},
+                {"text": "\tDetected 4096 MiB of memory, 2 CPUs and SSD storage.", "type": "success"},
                 {"text": "Writing Docker configuration.", "type": "info"},
                 {"text": "\tWriting Docker configuration succeeded.", "type": "success"},
+                {"text": "Writing Docker Compose profiles.", "type": "info"},
+                {"text": "\tWriting Docker Compose profiles succeeded.", "type": "success"},
+                {"text": "Reading PostgreSQL tuning template data.", "type": "info"},
+                {
+                    "text": "\tReading PostgreSQL tuning template data succeeded.",
+                    "type": "success",
+                },
+                {"text": "Writing PostgreSQL tuning.", "type": "info"},
+                {"text": "\tWriting PostgreSQL tuning succeeded.", "type": "success"},
                 {"text": "Fixing Docker configuration permissions.", "type": "info"},
                 {"text": "Fixing Docker configuration permissions successful.", "type": "success"},
             ],
@@ -90,13 +113,19 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
                 [
                     "sudo install -d -m 0755 /srv/stack",
                     "sudo install -d -m 0700 -o 999 -g 999 /srv/postgres/data",
+                    "sudo install -d -m 0755 /srv/postgres/conf",
                     "sudo install -d -m 0750 -o 1000 -g 1000 /srv/gitea/data",
                     "sudo install -d -m 0750 -o 1000 -g 1000 /srv/gitea/config",
                     "sudo install -d -m 0750 -o 5050 -g 5050 /srv/pgadmin/data",
+                    "sudo install -d -m 0750 -o 999 -g 1000 /srv/redis/data",
                 ],
                 [
                     "sudo chown root:root /srv/stack/docker-compose.yml",
                     "sudo chmod 0644 /srv/stack/docker-compose.yml",
+                    "sudo chown root:root /srv/stack/.env",
+                    "sudo chmod 0600 /srv/stack/.env",
+                    "sudo chown root:root /srv/postgres/conf/postgresql.conf",
+                    "sudo chmod 0644 /srv/postgres/conf/postgresql.conf",
                 ],
             ],
         )
@@ -164,8 +193,19 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
                 {"text": "Creating Docker folders successful.", "type": "success"},
                 {"text": "Reading Docker Config template data.", "type": "info"},
                 {"text": "\tReading Docker Config template data succeeded.", "type": "success"},
+                {"text": "Detecting host capacity.", "type": "info"},
+                {"text": "\tDetected 4096 MiB of memory, 2 CPUs and SSD storage.", "type": "success"},
                 {"text": "Writing Docker configuration.", "type": "info"},
                 {"text": "\tWriting Docker configuration succeeded.", "type": "success"},
+                {"text": "Writing Docker Compose profiles.", "type": "info"},
+                {"text": "\tWriting Docker Compose profiles succeeded.", "type": "success"},
+                {"text": "Reading PostgreSQL tuning template data.", "type": "info"},
+                {
+                    "text": "\tReading PostgreSQL tuning template data succeeded.",
+                    "type": "success",
+                },
+                {"text": "Writing PostgreSQL tuning.", "type": "info"},
+                {"text": "\tWriting PostgreSQL tuning succeeded.", "type": "success"},
                 {"text": "Fixing Docker configuration permissions.", "type": "info"},
                 {"text": "Fixing Docker configuration permissions failed.", "type": "error"},
             ],
@@ -184,7 +224,12 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
                     ConfigurationContent.RAW_STRING,
                     self.data,
                     "/usr/local/share/srv/data/docker-compose.yml",
-                )
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/postgres/postgresql.conf",
+                ),
             ],
         )
 
@@ -230,7 +275,11 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
         # Assert
         self.assertEqual(
             self.file_system.write_text_params,
-            [WriteTextParams("/srv/stack/docker-compose.yml", "docker-compose-content")],
+            [
+                WriteTextParams("/srv/stack/docker-compose.yml", "docker-compose-content"),
+                WriteTextParams("/srv/stack/.env", "COMPOSE_PROFILES=\n"),
+                WriteTextParams("/srv/postgres/conf/postgresql.conf", "docker-compose-content"),
+            ],
         )
 
     def test_failure_to_store_config_on_server_result_in_failure(self):
@@ -262,7 +311,322 @@ class TestDockerResourcesUbuntuConfigurationTask(unittest.TestCase):
                 {"text": "Creating Docker folders successful.", "type": "success"},
                 {"text": "Reading Docker Config template data.", "type": "info"},
                 {"text": "\tReading Docker Config template data succeeded.", "type": "success"},
+                {"text": "Detecting host capacity.", "type": "info"},
+                {"text": "\tDetected 4096 MiB of memory, 2 CPUs and SSD storage.", "type": "success"},
                 {"text": "Writing Docker configuration.", "type": "info"},
                 {"text": "\tWriting Docker configuration failed.", "type": "error"},
             ],
         )
+
+    def test_docker_config_contains_limits_sized_to_host(self):
+        """Verifies resource placeholders are replaced with limits computed from the host capacity."""
+        # Arrange
+        self.reader.read_result = OperationResult[str].succeed(
+            "mem_limit: {{POSTGRES_MEM_LIMIT}}\n"
+            "mem_reservation: {{POSTGRES_MEM_RESERVATION}}\n"
+            "cpus: {{GITEA_CPUS}}\n"
+            "pids_limit: {{PGADMIN_PIDS_LIMIT}}\n"
+        )
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[0],
+            WriteTextParams(
+                "/srv/stack/docker-compose.yml",
+                "mem_limit: 1792m\nmem_reservation: 1792m\ncpus: 1\npids_limit: 256\n",
+            ),
+        )
+
+    def test_enabled_profiles_share_the_memory(self):
+        """Verifies PgBouncer and Valkey are sized from the host once their profiles are on."""
+        # Arrange
+        self.data.pgbouncer_enabled = True
+        self.data.gitea_redis_enabled = True
+        self.reader.read_result = OperationResult[str].succeed(
+            "postgres: {{POSTGRES_MEM_LIMIT}}\n"
+            "pgbouncer: {{PGBOUNCER_MEM_LIMIT}} {{PGBOUNCER_CPUS}}\n"
+            "redis: {{REDIS_MEM_LIMIT}} --maxmemory {{REDIS_MAXMEMORY}}\n"
+        )
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[0],
+            WriteTextParams(
+                "/srv/stack/docker-compose.yml",
+                "postgres: 1629m\npgbouncer: 128m 0.5\nredis: 260m --maxmemory 195mb\n",
+            ),
+        )
+
+    def test_custom_weights_are_used(self):
+        """Verifies configured weighting replaces the default one."""
+        # Arrange
+        self.task = DockerResourcesUbuntuConfigurationTask(
+            self.reader,
+            self.file_system,
+            self.notifications,
+            self.controller,
+            self.host_resources,
+            {"postgres": ContainerResourceWeight(memory=1.0, cpu=0.5, reservation=0.5, pids_limit=64)},
+        )
+        self.reader.read_result = OperationResult[str].succeed(
+            "{{POSTGRES_MEM_LIMIT}} {{POSTGRES_MEM_RESERVATION}} {{POSTGRES_CPUS}} {{POSTGRES_PIDS_LIMIT}}"
+        )
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[0],
+            WriteTextParams("/srv/stack/docker-compose.yml", "3584m 1792m 1 64"),
+        )
+
+    def test_host_capacity_detection_failure_results_in_failure(self):
+        """Verifies memory detection failure propagates as failed result."""
+        # Arrange
+        failure_result = OperationResult[int].fail("Failure")
+        self.host_resources.memory_total_bytes_result = failure_result
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(self.file_system.write_text_params, [])
+
+    def test_host_capacity_detection_failure_notifications_flow(self):
+        """Verifies error notifications are sent when memory detection fails."""
+        # Arrange
+        self.host_resources.memory_total_bytes_result = OperationResult[int].fail("Failure")
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {"text": "Creating Docker folders if they do not exist.", "type": "info"},
+                {"text": "Creating Docker folders successful.", "type": "success"},
+                {"text": "Reading Docker Config template data.", "type": "info"},
+                {"text": "\tReading Docker Config template data succeeded.", "type": "success"},
+                {"text": "Detecting host capacity.", "type": "info"},
+                {"text": "\tDetecting host capacity failed.", "type": "error"},
+            ],
+        )
+
+    def test_postgres_tuning_is_rendered_into_compose_and_config(self):
+        """Verifies shm_size and postgresql.conf are rendered from the PostgreSQL limits."""
+        # Arrange
+        self.reader.read_result_map = {
+            "/usr/local/share/srv/data/docker-compose.yml": OperationResult[str].succeed(
+                "shm_size: {{POSTGRES_SHM_SIZE}}"
+            ),
+            self.postgres_template: OperationResult[str].succeed(
+                "shared_buffers = {{POSTGRES_SHARED_BUFFERS}}\n"
+                "random_page_cost = {{POSTGRES_RANDOM_PAGE_COST}}\n"
+            ),
+        }
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [
+                WriteTextParams("/srv/stack/docker-compose.yml", "shm_size: 448m"),
+                WriteTextParams("/srv/stack/.env", "COMPOSE_PROFILES=\n"),
+                WriteTextParams(
+                    "/srv/postgres/conf/postgresql.conf",
+                    "shared_buffers = 448MB\nrandom_page_cost = 1.1\n",
+                ),
+            ],
+        )
+
+    def test_postgres_tuning_uses_storage_type(self):
+        """Verifies rotational storage switches the planner to HDD costs."""
+        # Arrange
+        self.host_resources.storage_is_rotational_result = True
+        self.reader.read_result_map = {
+            self.postgres_template: OperationResult[str].succeed(
+                "{{POSTGRES_RANDOM_PAGE_COST}} {{POSTGRES_EFFECTIVE_IO_CONCURRENCY}}"
+            ),
+        }
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[2],
+            WriteTextParams("/srv/postgres/conf/postgresql.conf", "4 2"),
+        )
+
+    def test_postgres_template_read_failure_results_in_failure(self):
+        """Verifies PostgreSQL template read failure propagates as failed result."""
+        # Arrange
+        failure_result = OperationResult[str].fail("Failure")
+        self.reader.read_result_map = {self.postgres_template: failure_result}
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(
+            self.notifications.params[-2:],
+            [
+                {"text": "Reading PostgreSQL tuning template data.", "type": "info"},
+                {"text": "\tReading PostgreSQL tuning template data failed.", "type": "error"},
+            ],
+        )
+
+    def test_postgres_config_write_failure_results_in_failure(self):
+        """Verifies PostgreSQL config write failure propagates as failed result."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.file_system.write_text_result_map["/srv/postgres/conf/postgresql.conf"] = (
+            failure_result
+        )
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(
+            self.notifications.params[-2:],
+            [
+                {"text": "Writing PostgreSQL tuning.", "type": "info"},
+                {"text": "\tWriting PostgreSQL tuning failed.", "type": "error"},
+            ],
+        )
+
+    def test_pgbouncer_profile_and_pool_are_rendered_when_enabled(self):
+        """Verifies the pgbouncer Compose profile is enabled and its pool is sized."""
+        # Arrange
+        self.data.pgbouncer_enabled = True
+        self.reader.read_result_map = {
+            "/usr/local/share/srv/data/docker-compose.yml": OperationResult[str].succeed(
+                "{{PGBOUNCER_DEFAULT_POOL_SIZE}} {{PGBOUNCER_RESERVE_POOL_SIZE}} "
+                "{{PGBOUNCER_MAX_DB_CONNECTIONS}} {{PGBOUNCER_MAX_CLIENT_CONN}}"
+            ),
+        }
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[:2],
+            [
+                WriteTextParams("/srv/stack/docker-compose.yml", "10 2 12 500"),
+                WriteTextParams("/srv/stack/.env", "COMPOSE_PROFILES=pgbouncer\n"),
+            ],
+        )
+
+    def test_all_optional_profiles_are_enabled(self):
+        """Verifies every enabled optional service is listed in the Compose profiles."""
+        # Arrange
+        self.data.pgbouncer_enabled = True
+        self.data.gitea_redis_enabled = True
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[1],
+            WriteTextParams("/srv/stack/.env", "COMPOSE_PROFILES=pgbouncer,redis\n"),
+        )
+
+    def test_compose_profiles_write_failure_results_in_failure(self):
+        """Verifies Compose profiles write failure propagates as failed result."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.file_system.write_text_result_map["/srv/stack/.env"] = failure_result
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(
+            self.notifications.params[-2:],
+            [
+                {"text": "Writing Docker Compose profiles.", "type": "info"},
+                {"text": "\tWriting Docker Compose profiles failed.", "type": "error"},
+            ],
+        )
+
+    def test_changed_postgres_config_restarts_postgres_after_the_stack_is_up(self):
+        """Verifies a retuned postgresql.conf marks PostgreSQL for a restart."""
+        # Arrange
+        self.file_system.path_exists_result_map = {"/srv/postgres/conf/postgresql.conf": True}
+        self.file_system.read_text_result_map = {
+            "/srv/postgres/conf/postgresql.conf": OperationResult[str].succeed("old-content")
+        }
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [
+                result,
+                self.controller.run_raw_commands_params[-1],
+                self.notifications.params[-1],
+            ],
+            [
+                OperationResult[bool].succeed(True),
+                [
+                    "sudo mkdir -p /run/container-restart "
+                    "&& sudo touch /run/container-restart/postgres"
+                ],
+                {"text": "Will restart PostgreSQL once the stack is up.", "type": "info"},
+            ],
+        )
+
+    def test_unchanged_postgres_config_keeps_postgres_running(self):
+        """Verifies PostgreSQL is not restarted when its settings are unchanged."""
+        # Arrange
+        self.file_system.path_exists_result_map = {"/srv/postgres/conf/postgresql.conf": True}
+        self.file_system.read_text_result_map = {
+            "/srv/postgres/conf/postgresql.conf": OperationResult[str].succeed(
+                "docker-compose-content"
+            )
+        }
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(len(self.controller.run_raw_commands_params), 2)
+
+    def test_postgres_restart_request_failure_results_in_failure(self):
+        """Verifies a failed restart request fails the task."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.file_system.path_exists_result_map = {"/srv/postgres/conf/postgresql.conf": True}
+        self.controller.run_raw_commands_result_regex_map["/run/container-restart"] = (
+            failure_result
+        )
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [result, self.notifications.params[-1]],
+            [
+                failure_result,
+                {"text": "\tRequesting the PostgreSQL restart failed.", "type": "error"},
+            ],
+        )
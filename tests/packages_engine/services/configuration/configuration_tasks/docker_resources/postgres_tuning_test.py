@@ -0,0 +1,90 @@
+"""Tests for the PostgreSQL tuning calculation."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.docker_resources import (
+    PostgresTuning,
+    compute_postgres_tuning,
+    render_postgres_tuning,
+)
+
+
+class TestPostgresTuning(unittest.TestCase):
+    """Test suite for compute_postgres_tuning and render_postgres_tuning."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_small_host_on_ssd(self):
+        """Verifies settings for a 1792 MiB, 2 CPU PostgreSQL on SSD."""
+        # Act
+        result = compute_postgres_tuning(1792, 2, False)
+
+        # Assert
+        self.assertEqual(
+            result,
+            PostgresTuning(
+                max_connections=100,
+                shared_buffers_mib=448,
+                effective_cache_size_mib=1344,
+                work_mem_mib=4,
+                maintenance_work_mem_mib=112,
+                min_wal_size_mib=256,
+                max_wal_size_mib=1024,
+                random_page_cost=1.1,
+                effective_io_concurrency=200,
+                max_worker_processes=8,
+                max_parallel_workers=2,
+                max_parallel_workers_per_gather=1,
+                max_parallel_maintenance_workers=1,
+                autovacuum_max_workers=3,
+                autovacuum_vacuum_cost_limit=1000,
+                shm_size_mib=448,
+            ),
+        )
+
+    def test_large_host_on_hdd(self):
+        """Verifies settings for a 16 GiB, 16 CPU PostgreSQL on rotational disks."""
+        # Act
+        result = compute_postgres_tuning(16384, 16, True)
+
+        # Assert
+        self.assertEqual(result.shared_buffers_mib, 4096)
+        self.assertEqual(result.effective_cache_size_mib, 12288)
+        self.assertEqual(result.work_mem_mib, 40)
+        self.assertEqual(result.maintenance_work_mem_mib, 1024)
+        self.assertEqual(result.max_wal_size_mib, 4096)
+        self.assertEqual(result.random_page_cost, 4.0)
+        self.assertEqual(result.effective_io_concurrency, 2)
+        self.assertEqual(result.max_parallel_workers_per_gather, 4)
+        self.assertEqual(result.autovacuum_max_workers, 6)
+        self.assertEqual(result.autovacuum_vacuum_cost_limit, 200)
+        self.assertEqual(result.shm_size_mib, 4096)
+
+    def test_tiny_host_uses_minimums(self):
+        """Verifies minimums for a PostgreSQL with very little memory."""
+        # Act
+        result = compute_postgres_tuning(256, 1, False)
+
+        # Assert
+        self.assertEqual(result.shared_buffers_mib, 128)
+        self.assertEqual(result.effective_cache_size_mib, 256)
+        self.assertEqual(result.maintenance_work_mem_mib, 64)
+        self.assertEqual(result.shm_size_mib, 256)
+        self.assertEqual(result.max_parallel_workers, 1)
+
+    def test_render_replaces_placeholders(self):
+        """Verifies memory settings use PostgreSQL units and shm_size uses compose units."""
+        # Arrange
+        tuning = compute_postgres_tuning(1792, 2, False)
+
+        # Act
+        result = render_postgres_tuning(
+            "{{POSTGRES_SHARED_BUFFERS}} {{POSTGRES_MAX_PARALLEL_WORKERS}} "
+            "{{POSTGRES_MAX_PARALLEL_WORKERS_PER_GATHER}} {{POSTGRES_SHM_SIZE}} "
+            "{{POSTGRES_RANDOM_PAGE_COST}} {{POSTGRES_MEM_LIMIT}}",
+            tuning,
+        )
+
+        # Assert
+        self.assertEqual(result, "448MB 2 1 448m 1.1 {{POSTGRES_MEM_LIMIT}}")
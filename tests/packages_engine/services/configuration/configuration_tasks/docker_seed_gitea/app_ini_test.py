@@ -0,0 +1,69 @@
+"""Tests for the app.ini update helpers."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.docker_seed_gitea import (
+    set_ini_values,
+)
+
+
+class TestSetIniValues(unittest.TestCase):
+    """Test suite for set_ini_values."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_existing_keys_are_replaced_in_place(self):
+        """Verifies existing keys are rewritten without touching other lines."""
+        # Arrange
+        content = "[database]\nHOST     = postgres:5432\nNAME = gitea\n\n[server]\nHOST = x\n"
+
+        # Act
+        result = set_ini_values(content, "database", {"HOST": "pgbouncer:6432"})
+
+        # Assert
+        self.assertEqual(
+            result, "[database]\nHOST = pgbouncer:6432\nNAME = gitea\n\n[server]\nHOST = x\n"
+        )
+
+    def test_missing_keys_are_appended_to_section(self):
+        """Verifies missing keys are added at the end of the section before blank lines."""
+        # Arrange
+        content = "[database]\nNAME = gitea\n\n[server]\nPORT = 1\n"
+
+        # Act
+        result = set_ini_values(content, "database", {"MAX_OPEN_CONNS": "40"})
+
+        # Assert
+        self.assertEqual(
+            result, "[database]\nNAME = gitea\nMAX_OPEN_CONNS = 40\n\n[server]\nPORT = 1\n"
+        )
+
+    def test_keys_are_matched_case_insensitively(self):
+        """Verifies keys written in another case are replaced instead of duplicated."""
+        # Act
+        result = set_ini_values(
+            "[database]\nmax_idle_conns=2\n", "database", {"MAX_IDLE_CONNS": "20"}
+        )
+
+        # Assert
+        self.assertEqual(result, "[database]\nMAX_IDLE_CONNS = 20\n")
+
+    def test_missing_section_is_appended(self):
+        """Verifies a missing section is appended at the end."""
+        # Act
+        result = set_ini_values("APP_NAME = Gitea\n", "cache", {"ADAPTER": "redis"})
+
+        # Assert
+        self.assertEqual(result, "APP_NAME = Gitea\n\n[cache]\nADAPTER = redis\n")
+
+    def test_unchanged_content_is_stable(self):
+        """Verifies applying the same values twice is idempotent."""
+        # Arrange
+        content = set_ini_values("[database]\nNAME = gitea\n", "database", {"HOST": "a"})
+
+        # Act
+        result = set_ini_values(content, "database", {"HOST": "a"})
+
+        # Assert
+        self.assertEqual(result, content)
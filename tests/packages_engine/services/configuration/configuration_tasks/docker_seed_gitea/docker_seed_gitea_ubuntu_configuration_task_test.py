@@ -13,11 +13,16 @@ from packages_engine.services.configuration.configuration_content_reader.configu
 )
 from packages_engine.services.configuration.configuration_tasks.docker_seed_gitea import (
     DockerSeedGiteaUbuntuConfigurationTask,
+    gitea_performance_profile,
+    set_ini_values,
 )
 from packages_engine.services.file_system.file_system_service_mock import (
     MockFileSystemService,
     WriteTextParams,
 )
+from packages_engine.services.host_resources.host_resources_service_mock import (
+    MockHostResourcesService,
+)
 from packages_engine.services.notifications.notifications_service_mock import (
     MockNotificationsService,
 )
@@ -25,6 +30,25 @@ from packages_engine.services.package_controller.package_controller_service_mock
     MockPackageControllerService,
 )
 
+_DATABASE_SETTINGS = {
+    "HOST": "postgres:5432",
+    "MAX_OPEN_CONNS": "10",
+    "MAX_IDLE_CONNS": "10",
+    "CONN_MAX_LIFETIME": "30m",
+}
+
+
+def _with_managed_settings(content: str, redis_enabled: bool = False) -> str:
+    result = set_ini_values(content, "database", _DATABASE_SETTINGS)
+    for section, values in gitea_performance_profile(redis_enabled).items():
+        result = set_ini_values(result, section, values)
+    return result
+
+
+_CURRENT_CONFIG = _with_managed_settings(
+    "[database]\nDB_TYPE  = postgres\nHOST = postgres:5432\n\n[security]\nINSTALL_LOCK = true\n"
+)
+
 
 class TestDockerSeedGiteaUbuntuConfigurationTask(unittest.TestCase):
     """Test suite for DockerSeedGiteaUbuntuConfigurationTask.
@@ -32,10 +56,12 @@ class TestDockerSeedGiteaUbuntuConfigurationTask(unittest.TestCase):
     Tests Gitea config seeding including template reading, file writing,
     directory creation, and permission setup.
     """
+
     reader: MockConfigurationContentReaderService
     file_system: MockFileSystemService
     notifications: MockNotificationsService
     controller: MockPackageControllerService
+    host_resources: MockHostResourcesService
     task: DockerSeedGiteaUbuntuConfigurationTask
     data: ConfigurationData
 
@@ -44,8 +70,13 @@ class TestDockerSeedGiteaUbuntuConfigurationTask(unittest.TestCase):
         self.file_system = MockFileSystemService()
         self.notifications = MockNotificationsService()
         self.controller = MockPackageControllerService()
+        self.host_resources = MockHostResourcesService()
         self.task = DockerSeedGiteaUbuntuConfigurationTask(
-            self.reader, self.file_system, self.notifications, self.controller
+            self.reader,
+            self.file_system,
+            self.notifications,
+            self.controller,
+            self.host_resources,
         )
         self.data = ConfigurationData.default()
         self.data.server_data_dir = "srv"
@@ -57,6 +88,9 @@ class TestDockerSeedGiteaUbuntuConfigurationTask(unittest.TestCase):
         self.file_system.path_exists_result_map = {"/srv/gitea/config/app.ini": False}
 
         self.reader.read_result = OperationResult[str].succeed("gitea-config-content")
+        self.file_system.read_text_result_map = {
+            "/srv/gitea/config/app.ini": OperationResult[str].succeed(_CURRENT_CONFIG)
+        }
         self.maxDiff = None
 
     def test_happy_path(self):
@@ -209,7 +243,12 @@ class TestDockerSeedGiteaUbuntuConfigurationTask(unittest.TestCase):
         # Assert
         self.assertEqual(
             self.file_system.write_text_params,
-            [WriteTextParams("/srv/gitea/config/app.ini", "gitea-config-content")],
+            [
+                WriteTextParams(
+                    "/srv/gitea/config/app.ini",
+                    _with_managed_settings("gitea-config-content"),
+                )
+            ],
         )
 
     def test_write_failure_results_in_operation_failure(self):
@@ -333,3 +372,143 @@ class TestDockerSeedGiteaUbuntuConfigurationTask(unittest.TestCase):
                 {"text": "\tProcessing failed.", "type": "error"},
             ],
         )
+
+    def test_existing_config_is_rewired_to_pgbouncer(self):
+        """Verifies an existing config gets the PgBouncer host and pool limits merged in."""
+        # Arrange
+        self.file_system.path_exists_result_map = {"/srv/gitea/config/app.ini": True}
+        self.data.pgbouncer_enabled = True
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [
+                WriteTextParams(
+                    "/srv/gitea/config/app.ini",
+                    _CURRENT_CONFIG.replace("postgres:5432", "pgbouncer:6432")
+                    .replace("MAX_OPEN_CONNS = 10", "MAX_OPEN_CONNS = 40")
+                    .replace("MAX_IDLE_CONNS = 10", "MAX_IDLE_CONNS = 20")
+                    .replace("30m", "5m"),
+                )
+            ],
+        )
+        self.assertEqual(
+            self.controller.run_raw_commands_params,
+            [
+                [
+                    "sudo chown 1000:1000 /srv/gitea/config/app.ini && sudo chmod 0640 "
+                    "/srv/gitea/config/app.ini"
+                ],
+                [
+                    "sudo mkdir -p /run/container-restart "
+                    "&& sudo touch /run/container-restart/gitea"
+                ],
+            ],
+        )
+        self.assertIn(
+            {"text": "Gitea configuration exists. Will update managed settings.", "type": "info"},
+            self.notifications.params,
+        )
+
+    def test_existing_config_read_failure_results_in_failure(self):
+        """Verifies failure to read the existing config propagates as failed result."""
+        # Arrange
+        failure_result = OperationResult[str].fail("Fail")
+        self.file_system.path_exists_result_map = {"/srv/gitea/config/app.ini": True}
+        self.file_system.read_text_result_map = {"/srv/gitea/config/app.ini": failure_result}
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tFailed to read existing Gitea configuration.", "type": "error"},
+        )
+
+    def test_written_config_contains_performance_profile(self):
+        """Verifies the template gets the database settings and the performance profile."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        written = self.file_system.write_text_params[0].text
+        self.assertTrue(
+            written.startswith("gitea-config-content\n\n[database]\nHOST = postgres:5432\n")
+        )
+        self.assertIn("[cache]\nADAPTER = twoqueue\n", written)
+        self.assertIn("[queue]\nTYPE = level\n", written)
+        self.assertIn("[indexer]\nISSUE_INDEXER_TYPE = bleve\n", written)
+        self.assertIn("[git.timeout]\nDEFAULT = 360\n", written)
+        self.assertIn("[cron.archive_cleanup]\nENABLED = true\n", written)
+
+    def test_existing_config_is_switched_to_redis(self):
+        """Verifies enabling Redis rewrites cache, session and queue backends in place."""
+        # Arrange
+        self.file_system.path_exists_result_map = {"/srv/gitea/config/app.ini": True}
+        self.data.gitea_redis_enabled = True
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [
+                WriteTextParams(
+                    "/srv/gitea/config/app.ini",
+                    _with_managed_settings(_CURRENT_CONFIG, redis_enabled=True),
+                )
+            ],
+        )
+        written = self.file_system.write_text_params[0].text
+        self.assertIn("ADAPTER = redis\n", written)
+        self.assertIn("PROVIDER = redis\n", written)
+        self.assertIn("CONN_STR = redis://redis:6379/2\n", written)
+        self.assertNotIn("twoqueue", written)
+
+    def test_changed_config_restarts_gitea_after_the_stack_is_up(self):
+        """Verifies a rewritten app.ini marks Gitea for a restart by the orchestration."""
+        # Arrange
+        self.file_system.path_exists_result_map = {"/srv/gitea/config/app.ini": True}
+        self.data.gitea_redis_enabled = True
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [self.controller.run_raw_commands_params[-1], self.notifications.params[-1]],
+            [
+                [
+                    "sudo mkdir -p /run/container-restart "
+                    "&& sudo touch /run/container-restart/gitea"
+                ],
+                {"text": "Will restart Gitea once the stack is up.", "type": "info"},
+            ],
+        )
+
+    def test_restart_request_failure_results_in_failure(self):
+        """Verifies a failed restart request fails the task."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.file_system.path_exists_result_map = {"/srv/gitea/config/app.ini": True}
+        self.data.gitea_redis_enabled = True
+        self.controller.run_raw_commands_result_regex_map["/run/container-restart"] = failure_result
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [result, self.notifications.params[-1]],
+            [
+                failure_result,
+                {"text": "\tRequesting the Gitea restart failed.", "type": "error"},
+            ],
+        )
@@ -0,0 +1,111 @@
+"""Tests for the network tuning profile helpers."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.network_tuning import (
+    compute_network_tuning,
+    default_route_interface,
+    render_sysctl_profile,
+    render_udp_gro_forwarding,
+    sysctl_proc_path,
+    sysctl_value_differs,
+)
+
+GIB = 1024**3
+ROUTE_TABLE = (
+    "Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\n"
+    "wg0\t00000A0A\t00000000\t0001\t0\t0\t0\t00FFFFFF\t0\t0\t0\n"
+    "eth0\t00000000\t0101A8C0\t0003\t0\t0\t100\t00000000\t0\t0\t0\n"
+)
+
+
+class TestNetworkTuning(unittest.TestCase):
+    """Test suite for the network tuning helpers."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_profile_for_small_host(self):
+        """Verifies buffers and conntrack are sized from memory and peers."""
+        # Act
+        result = compute_network_tuning(4 * GIB, 10)
+
+        # Assert
+        self.assertEqual(
+            result,
+            {
+                "net.core.rmem_max": "16777216",
+                "net.core.wmem_max": "16777216",
+                "net.ipv4.tcp_rmem": "4096 131072 16777216",
+                "net.ipv4.tcp_wmem": "4096 16384 16777216",
+                "net.core.netdev_max_backlog": "16384",
+                "net.core.default_qdisc": "fq",
+                "net.ipv4.tcp_congestion_control": "bbr",
+                "net.ipv4.tcp_mtu_probing": "1",
+                "net.ipv4.tcp_slow_start_after_idle": "0",
+                "net.netfilter.nf_conntrack_max": "163840",
+                "net.netfilter.nf_conntrack_buckets": "40960",
+                "net.netfilter.nf_conntrack_tcp_timeout_established": "86400",
+                "net.netfilter.nf_conntrack_tcp_timeout_time_wait": "30",
+            },
+        )
+
+    def test_profile_is_clamped(self):
+        """Verifies buffers stay within bounds and conntrack is capped by memory."""
+        # Act
+        small = compute_network_tuning(512 * 1024**2, 0)
+        large = compute_network_tuning(64 * GIB, 1000)
+
+        # Assert
+        self.assertEqual(
+            [
+                small["net.core.rmem_max"],
+                small["net.netfilter.nf_conntrack_max"],
+                large["net.core.rmem_max"],
+                large["net.netfilter.nf_conntrack_max"],
+            ],
+            ["4194304", "65536", "67108864", "4194304"],
+        )
+
+    def test_render_sysctl_profile(self):
+        """Verifies the profile lists one key per line."""
+        # Act
+        result = render_sysctl_profile(
+            {"net.core.default_qdisc": "fq", "net.ipv4.tcp_rmem": "1 2 3"}
+        )
+
+        # Assert
+        self.assertEqual(
+            result,
+            "# Network tuning for WireGuard throughput; generated by the configurator.\n"
+            "net.core.default_qdisc = fq\n"
+            "net.ipv4.tcp_rmem = 1 2 3\n",
+        )
+
+    def test_live_values_are_compared_by_fields(self):
+        """Verifies tab separated /proc/sys values match their space separated form."""
+        # Act
+        result = [
+            sysctl_proc_path("net.ipv4.tcp_rmem"),
+            sysctl_value_differs("4096\t131072\t6291456\n", "4096 131072 6291456"),
+            sysctl_value_differs("cubic\n", "bbr"),
+        ]
+
+        # Assert
+        self.assertEqual(result, ["/proc/sys/net/ipv4/tcp_rmem", False, True])
+
+    def test_default_route_interface(self):
+        """Verifies the uplink is the interface of the IPv4 default route."""
+        # Act
+        result = [default_route_interface(ROUTE_TABLE), default_route_interface(ROUTE_TABLE[:150])]
+
+        # Assert
+        self.assertEqual(result, ["eth0", ""])
+
+    def test_render_udp_gro_forwarding(self):
+        """Verifies the uplink placeholder is replaced."""
+        # Act
+        result = render_udp_gro_forwarding("ethtool -K {{NETWORK_UPLINK}} on", "eth0")
+
+        # Assert
+        self.assertEqual(result, "ethtool -K eth0 on")
@@ -0,0 +1,235 @@
+"""Tests for NetworkTuningUbuntuConfigurationTask.
+
+Verifies the tuning profile is written and only the changed keys are applied.
+"""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationContent, ConfigurationData
+from packages_engine.services.configuration.configuration_content_reader.configuration_content_reader_service_mock import (
+    MockConfigurationContentReaderService,
+    ReadParams,
+)
+from packages_engine.services.configuration.configuration_tasks.network_tuning import (
+    NetworkTuningUbuntuConfigurationTask,
+    compute_network_tuning,
+    render_sysctl_profile,
+    sysctl_proc_path,
+)
+from packages_engine.services.file_system.file_system_service_mock import (
+    MockFileSystemService,
+    WriteTextParams,
+)
+from packages_engine.services.host_resources.host_resources_service_mock import (
+    MockHostResourcesService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.package_controller.package_controller_service_mock import (
+    MockPackageControllerService,
+)
+
+ROUTE_TABLE = (
+    "Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\n"
+    "eth0\t00000000\t0101A8C0\t0003\t0\t0\t100\t00000000\t0\t0\t0\n"
+)
+MODULE_COMMANDS = [
+    "sudo modprobe tcp_bbr || true",
+    "sudo modprobe sch_fq || true",
+    "sudo modprobe nf_conntrack || true",
+]
+UNIT_COMMANDS = [
+    "sudo systemctl daemon-reload",
+    "sudo systemctl enable udp-gro-forwarding.service",
+    "sudo systemctl restart udp-gro-forwarding.service",
+]
+
+
+class TestNetworkTuningUbuntuConfigurationTask(unittest.TestCase):
+    """Test suite for NetworkTuningUbuntuConfigurationTask."""
+
+    reader: MockConfigurationContentReaderService
+    file_system: MockFileSystemService
+    notifications: MockNotificationsService
+    controller: MockPackageControllerService
+    host_resources: MockHostResourcesService
+    task: NetworkTuningUbuntuConfigurationTask
+    data: ConfigurationData
+    settings: dict[str, str]
+
+    def setUp(self):
+        self.reader = MockConfigurationContentReaderService()
+        self.reader.read_result = OperationResult[str].succeed(
+            "ExecStart=-/usr/sbin/ethtool -K {{NETWORK_UPLINK}} rx-udp-gro-forwarding on"
+        )
+        self.file_system = MockFileSystemService()
+        self.file_system.read_text_result_map["/proc/net/route"] = OperationResult[str].succeed(
+            ROUTE_TABLE
+        )
+        self.notifications = MockNotificationsService()
+        self.controller = MockPackageControllerService()
+        self.host_resources = MockHostResourcesService()
+        self.task = NetworkTuningUbuntuConfigurationTask(
+            self.reader, self.file_system, self.notifications, self.controller, self.host_resources
+        )
+        self.data = ConfigurationData.default()
+        self.data.server_data_dir = "server-management-tools"
+        self.data.num_wireguard_clients = 2
+        self.settings = compute_network_tuning(4 * 1024**3, 2)
+        self.maxDiff = None
+
+    def set_live(self, settings: dict[str, str]):
+        """Make the given keys report their desired value in /proc/sys."""
+        for key, value in settings.items():
+            self.file_system.read_text_result_map[sysctl_proc_path(key)] = OperationResult[
+                str
+            ].succeed(value.replace(" ", "\t") + "\n")
+
+    def test_happy_path(self):
+        """Verify profile, modules, changed keys and the UDP GRO unit are applied."""
+        # Arrange
+        self.set_live(
+            {k: v for k, v in self.settings.items() if k != "net.ipv4.tcp_congestion_control"}
+        )
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [
+                WriteTextParams(
+                    "/etc/sysctl.d/60-network-tuning.conf", render_sysctl_profile(self.settings)
+                ),
+                WriteTextParams(
+                    "/etc/modules-load.d/network-tuning.conf", "tcp_bbr\nsch_fq\nnf_conntrack\n"
+                ),
+                WriteTextParams(
+                    "/etc/systemd/system/udp-gro-forwarding.service",
+                    "ExecStart=-/usr/sbin/ethtool -K eth0 rx-udp-gro-forwarding on",
+                ),
+            ],
+        )
+        self.assertEqual(
+            self.controller.run_raw_commands_params,
+            [
+                MODULE_COMMANDS,
+                ["sudo sysctl -q -w 'net.ipv4.tcp_congestion_control=bbr'"],
+                UNIT_COMMANDS,
+            ],
+        )
+        self.assertEqual(
+            self.reader.read_params,
+            [
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/server-management-tools/data/systemd/"
+                    "udp-gro-forwarding.service",
+                )
+            ],
+        )
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {"text": "Tuning the network stack for WireGuard throughput.", "type": "info"},
+                {"text": "\tSized for 4096 MiB of memory and 2 peers.", "type": "success"},
+                {"text": "Loading network tuning modules.", "type": "info"},
+                {"text": "\tLoading network tuning modules succeeded.", "type": "success"},
+                {"text": "Applying 1 of 13 network settings.", "type": "info"},
+                {"text": "\tApplying network settings succeeded.", "type": "success"},
+                {"text": "Enabling UDP GRO forwarding on eth0.", "type": "info"},
+                {"text": "\tEnabling UDP GRO forwarding succeeded.", "type": "success"},
+            ],
+        )
+
+    def test_live_settings_are_not_reapplied(self):
+        """Verify no sysctl command runs when every key is already live."""
+        # Arrange
+        self.set_live(self.settings)
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.controller.run_raw_commands_params, [MODULE_COMMANDS, UNIT_COMMANDS])
+        self.assertIn(
+            {"text": "\tAll 13 network settings are already live.", "type": "success"},
+            self.notifications.params,
+        )
+
+    def test_unreadable_keys_are_applied(self):
+        """Verify keys whose /proc/sys file cannot be read are applied."""
+        # Arrange
+        self.set_live(self.settings)
+        self.file_system.read_text_result_map[
+            sysctl_proc_path("net.netfilter.nf_conntrack_max")
+        ] = OperationResult[str].fail("No such file")
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        conntrack_max = self.settings["net.netfilter.nf_conntrack_max"]
+        self.assertEqual(
+            self.controller.run_raw_commands_params[1],
+            [f"sudo sysctl -q -w 'net.netfilter.nf_conntrack_max={conntrack_max}'"],
+        )
+
+    def test_no_default_route_skips_udp_gro(self):
+        """Verify UDP GRO forwarding is skipped with a warning without an uplink."""
+        # Arrange
+        self.set_live(self.settings)
+        self.file_system.read_text_result_map["/proc/net/route"] = OperationResult[str].succeed(
+            ROUTE_TABLE.splitlines()[0]
+        )
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.controller.run_raw_commands_params, [MODULE_COMMANDS])
+        self.assertEqual(self.reader.read_params, [])
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tNo default route found. UDP GRO forwarding skipped.", "type": "warning"},
+        )
+
+    def test_memory_detection_failure(self):
+        """Verify failure when the host memory cannot be detected."""
+        # Arrange
+        self.host_resources.memory_total_bytes_result = OperationResult[int].fail("No meminfo")
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("No meminfo"))
+        self.assertEqual(self.file_system.write_text_params, [])
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tDetecting host memory failed.", "type": "error"},
+        )
+
+    def test_sysctl_failure(self):
+        """Verify failure when applying the settings fails."""
+        # Arrange
+        self.controller.run_raw_commands_result_regex_map["sysctl -q -w"] = OperationResult[
+            bool
+        ].fail("Invalid argument")
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Invalid argument"))
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tApplying network settings failed.", "type": "error"},
+        )
@@ -0,0 +1,31 @@
+"""Tests for NetworkTuningWindowsConfigurationTask.
+
+Verifies Windows network tuning configuration returns unsupported status.
+"""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.network_tuning import (
+    NetworkTuningWindowsConfigurationTask,
+)
+
+
+class TestNetworkTuningWindowsConfigurationTask(unittest.TestCase):
+    """Test suite for NetworkTuningWindowsConfigurationTask."""
+
+    task: NetworkTuningWindowsConfigurationTask
+    data: ConfigurationData
+
+    def setUp(self):
+        self.task = NetworkTuningWindowsConfigurationTask()
+        self.data = ConfigurationData.default()
+
+    def test_returns_unsupported_error(self):
+        """Verify task returns 'Not supported' error."""
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Not supported"))
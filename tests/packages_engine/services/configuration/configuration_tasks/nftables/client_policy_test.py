@@ -0,0 +1,43 @@
+"""Tests for the per-client firewall policy generation."""
+
+import unittest
+
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.nftables import (
+    ClientPolicy,
+    client_policies,
+    render_client_elements,
+)
+
+
+class TestClientPolicy(unittest.TestCase):
+    """Test suite for client_policies and render_client_elements."""
+
+    def test_first_client_is_admin(self):
+        """Verifies addresses follow the peer generation and only the first client is admin."""
+        # Arrange
+        data = ConfigurationData.default()
+        data.wireguard_client_names = ["laptop", "phone", "tablet"]
+
+        # Act
+        result = client_policies(data)
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                ClientPolicy("laptop", "10.10.0.2", "admin"),
+                ClientPolicy("phone", "10.10.0.3", "member"),
+                ClientPolicy("tablet", "10.10.0.4", "member"),
+            ],
+        )
+
+    def test_render_without_clients_only_flushes(self):
+        """Verifies no empty element lists are rendered when there are no clients."""
+        # Act
+        result = render_client_elements([])
+
+        # Assert
+        self.assertNotIn("add element", result)
+        self.assertIn("flush set inet host_fw wg_clients\n", result)
+        self.assertIn("flush map inet host_fw client_policy\n", result)
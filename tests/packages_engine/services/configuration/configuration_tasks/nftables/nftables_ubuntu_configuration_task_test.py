@@ -14,6 +14,9 @@ from packages_engine.services.configuration.configuration_content_reader.configu
 from packages_engine.services.configuration.configuration_tasks.nftables import (
     NftablesUbuntuConfigurationTask,
 )
+from packages_engine.services.configuration.configuration_tasks.nftables.host_fw_state import (
+    rules_checksum,
+)
 from packages_engine.services.file_system.file_system_service_mock import (
     MockFileSystemService,
     WriteTextParams,
@@ -52,6 +55,16 @@ class TestNftablesUbuntuConfigurationTask(unittest.TestCase):
         self.reader.read_result = OperationResult[str].succeed("nftables-config-result")
         self.maxDiff = None
 
+    def given_applied_rules(self, live_snapshot: str):
+        """Record the rendered rules as applied, with the given live table snapshot."""
+        self.file_system.read_text_result_map = {
+            "/var/lib/host-fw/applied.sha256": OperationResult[str].succeed(
+                f"{rules_checksum('nftables-config-result')}  /etc/nftables.d/10-host-fw.nft\n"
+            ),
+            "/var/lib/host-fw/applied.json": OperationResult[str].succeed('[{"table": {}}]\n'),
+            "/run/host-fw/live.json": OperationResult[str].succeed(live_snapshot),
+        }
+
     def test_happy_path(self):
         """Verify successful nftables configuration."""
         # Act
@@ -73,6 +86,8 @@ class TestNftablesUbuntuConfigurationTask(unittest.TestCase):
                 {"text": "\tHost-fw rules read successfully.", "type": "success"},
                 {"text": "Writing nftables configuration files.", "type": "info"},
                 {"text": "\tNftables files written.", "type": "success"},
+                {"text": "Comparing host-fw rules with the live ruleset.", "type": "info"},
+                {"text": "\tHost-fw rules changed. Will apply them.", "type": "info"},
                 {"text": "Applying sysctl/module settings.", "type": "info"},
                 {"text": "\tApplying sysctl/module settings succeeded.", "type": "success"},
                 {"text": "Setting iptables alternatives.", "type": "info"},
@@ -146,9 +161,119 @@ class TestNftablesUbuntuConfigurationTask(unittest.TestCase):
                 WriteTextParams(
                     path_location="/etc/nftables.d/10-host-fw.nft", text="nftables-config-result"
                 ),
+                WriteTextParams(
+                    path_location="/etc/nftables.d/20-host-fw-clients.nft",
+                    text="#!/usr/sbin/nft -f\n"
+                    "# Generated from the configured WireGuard clients; do not edit.\n"
+                    "flush set inet host_fw wg_clients\n"
+                    "flush map inet host_fw client_policy\n",
+                ),
+                WriteTextParams(
+                    path_location="/var/lib/host-fw/applied.sha256",
+                    text=f"{rules_checksum('nftables-config-result')}  "
+                    "/etc/nftables.d/10-host-fw.nft\n",
+                ),
+            ],
+        )
+
+    def test_writes_client_elements(self):
+        """Verify the client set and verdict map are filled from the WireGuard clients."""
+        # Arrange
+        self.data.wireguard_client_names = ["laptop", "phone"]
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params[2].text.splitlines()[-2:],
+            [
+                "add element inet host_fw wg_clients { 10.10.0.2, 10.10.0.3 }",
+                "add element inet host_fw client_policy "
+                "{ 10.10.0.2 : jump admin_client, 10.10.0.3 : jump member_client }",
+            ],
+        )
+
+    def test_unchanged_rules_only_update_client_elements(self):
+        """Verify sysctl, alternatives and the rules reload are skipped when the rules are live."""
+        # Arrange
+        self.given_applied_rules('[{"table": {}}]\n')
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(
+            self.controller.run_raw_commands_params[1:],
+            [
+                [
+                    "sudo install -d -m 0700 /run/host-fw && "
+                    "{ sudo nft -j list table inet host_fw 2>/dev/null | jq -S "
+                    '\'[.nftables[] | select(has("metainfo") | not) '
+                    '| if has("set") then .set |= del(.elem) '
+                    'elif has("map") then .map |= del(.elem) else . end] '
+                    '| walk(if type == "object" then del(.handle) else . end)\' '
+                    "| sudo tee /run/host-fw/live.json >/dev/null; } || true"
+                ],
+                ["sudo nft -f /etc/nftables.d/20-host-fw-clients.nft"],
             ],
         )
 
+    def test_changed_live_table_reloads_the_rules(self):
+        """Verify rules edited outside the configurator are loaded again."""
+        # Arrange
+        self.given_applied_rules('[{"table": {"flags": "dormant"}}]\n')
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.controller.run_raw_commands_params[-1][:2],
+            ["sudo nft -c -f /etc/nftables.conf", "sudo nft -f /etc/nftables.conf"],
+        )
+
+    def test_missing_checksum_reloads_the_rules_without_a_live_snapshot(self):
+        """Verify a host without recorded state reads as changed without querying nft."""
+        # Arrange
+        self.file_system.path_exists_result_map = {"/var/lib/host-fw/applied.sha256": False}
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [
+                self.controller.find_first_raw_commands_group("/run/host-fw/live.json"),
+                self.file_system.find_write_text_params("applied.sha256"),
+            ],
+            [
+                None,
+                [
+                    WriteTextParams(
+                        path_location="/var/lib/host-fw/applied.sha256",
+                        text=f"{rules_checksum('nftables-config-result')}  "
+                        "/etc/nftables.d/10-host-fw.nft\n",
+                    )
+                ],
+            ],
+        )
+
+    def test_kernel_forwarding_rules_are_rendered(self):
+        """Verify the kernel TCP forwarding mode adds the nat table to the rules."""
+        # Arrange
+        self.data.tcp_forwarding_mode = "kernel"
+        self.reader.read_result = OperationResult[str].succeed("host_fw\n{{NFT_TCP_FORWARDING}}")
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        rules = self.file_system.write_text_params[1].text
+        self.assertTrue(rules.startswith("host_fw\n"))
+        self.assertIn("table ip tcp_forwarding {", rules)
+
     def test_write_failure_result_in_task_failure(self):
         """Verify task fails when config file write fails."""
         # Arrange
@@ -210,10 +335,15 @@ class TestNftablesUbuntuConfigurationTask(unittest.TestCase):
                     "sudo update-alternatives --set ebtables   /usr/sbin/ebtables-nft",
                 ],
                 [
-                    'sudo nft list tables | grep -q "table inet host_fw" && sudo nft delete '
-                    "table inet host_fw || true",
-                    "sudo nft -c -f /etc/nftables.d/10-host-fw.nft",
-                    "sudo nft -f /etc/nftables.d/10-host-fw.nft",
+                    "sudo nft -c -f /etc/nftables.conf",
+                    "sudo nft -f /etc/nftables.conf",
+                    "sudo install -d -m 0700 /var/lib/host-fw",
+                    "sudo nft -j list table inet host_fw 2>/dev/null | jq -S "
+                    '\'[.nftables[] | select(has("metainfo") | not) '
+                    '| if has("set") then .set |= del(.elem) '
+                    'elif has("map") then .map |= del(.elem) else . end] '
+                    '| walk(if type == "object" then del(.handle) else . end)\' '
+                    "| sudo tee /var/lib/host-fw/applied.json >/dev/null",
                     "sudo systemctl enable nftables",
                     "sudo ufw disable || true",
                 ],
@@ -0,0 +1,108 @@
+"""Tests for the kernel TCP forwarding rules rendering."""
+
+import unittest
+
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.nftables import (
+    forward_network_commands,
+    render_tcp_forwarding,
+    tcp_forwarding_policy_rules,
+    tcp_forwarding_rules,
+)
+
+
+class TestTcpForwarding(unittest.TestCase):
+    """Test suite for the tcp_forwarding helpers."""
+
+    data: ConfigurationData
+
+    def setUp(self):
+        self.data = ConfigurationData.default()
+        self.data.tcp_forwarding_mode = "kernel"
+
+    def test_proxy_mode_removes_table(self):
+        """Verifies the nat table is removed in the same transaction when nginx relays the ports."""
+        # Arrange
+        self.data.tcp_forwarding_mode = "proxy"
+
+        # Act
+        result = render_tcp_forwarding(
+            "before\n{{NFT_TCP_FORWARDING_POLICY}}{{NFT_TCP_FORWARDING}}\nafter", self.data
+        )
+
+        # Assert
+        self.assertEqual(
+            result,
+            "before\n\nadd table ip tcp_forwarding\ndelete table ip tcp_forwarding\n\nafter",
+        )
+
+    def test_kernel_mode_forwards_postgres_and_git_ssh(self):
+        """Verifies PostgreSQL and Git SSH are translated to their containers."""
+
+        # Act
+        result = tcp_forwarding_rules(self.data)
+
+        # Assert
+        self.assertIn("add table ip tcp_forwarding\nflush table ip tcp_forwarding\n", result)
+        self.assertIn("table ip tcp_forwarding {", result)
+        self.assertIn(
+            'iifname "wg0" ip daddr 10.10.0.1 tcp dport 5432 dnat to 172.30.10.10:5432', result
+        )
+        self.assertIn(
+            'iifname "wg0" ip daddr 10.10.0.1 tcp dport 2222 dnat to 172.30.10.12:22', result
+        )
+        self.assertIn('iifname "wg0" oifname "br-vpnfwd" ct status dnat accept', result)
+
+    def test_kernel_mode_admits_clients_through_the_client_policy(self):
+        """Verifies new forwarded connections are looked up in client_policy before the DNAT."""
+        # Act
+        result = render_tcp_forwarding("{{NFT_TCP_FORWARDING_POLICY}}", self.data)
+
+        # Assert
+        self.assertEqual(
+            result,
+            '    iifname "wg0" ip daddr 10.10.0.1 tcp dport { 5432, 2222 } ct state new '
+            "ip saddr vmap @client_policy\n"
+            '    iifname "wg0" ip daddr 10.10.0.1 tcp dport { 5432, 2222 } ct state new drop\n',
+        )
+
+    def test_proxy_mode_leaves_the_policy_chain_empty(self):
+        """Verifies nginx keeps deciding which clients reach the relayed ports."""
+        # Arrange
+        self.data.tcp_forwarding_mode = "proxy"
+
+        # Act
+        result = tcp_forwarding_policy_rules(self.data)
+
+        # Assert
+        self.assertEqual(result, "")
+
+    def test_kernel_mode_bypasses_pgbouncer(self):
+        """Verifies VPN clients reach Postgres even when Gitea goes through PgBouncer."""
+        # Arrange
+        self.data.pgbouncer_enabled = True
+
+        # Act
+        result = tcp_forwarding_rules(self.data)
+
+        # Assert
+        self.assertIn("tcp dport 5432 dnat to 172.30.10.10:5432", result)
+
+    def test_forward_network_commands(self):
+        """Verifies the network is created with a fixed subnet and bridge name."""
+        # Act
+        result = forward_network_commands()
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                "sudo docker network inspect vpn-forward >/dev/null 2>&1 || "
+                "sudo docker network create --driver bridge --subnet 172.30.10.0/24 "
+                "-o com.docker.network.bridge.name=br-vpnfwd vpn-forward",
+                "sudo iptables -C DOCKER-USER -i wg0 -o br-vpnfwd -m conntrack --ctstate DNAT "
+                "-j ACCEPT 2>/dev/null || "
+                "sudo iptables -I DOCKER-USER -i wg0 -o br-vpnfwd -m conntrack --ctstate DNAT "
+                "-j ACCEPT",
+            ],
+        )
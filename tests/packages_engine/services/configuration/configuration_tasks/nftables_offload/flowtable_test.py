@@ -0,0 +1,46 @@
+"""Tests for the flowtable offload rendering."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.nftables_offload import (
+    flowtable_devices,
+    render_flowtable,
+)
+
+
+class TestFlowtable(unittest.TestCase):
+    """Test suite for flowtable_devices and render_flowtable."""
+
+    def test_devices_are_wireguard_and_docker_bridges(self):
+        """Verifies only wg0 and the user-defined Docker bridges are selected."""
+        # Act
+        result = flowtable_devices(["lo", "eth0", "docker0", "wg0", "br-vpnfwd", "br-3f2a9c1d7e60"])
+
+        # Assert
+        self.assertEqual(result, ["wg0", "br-3f2a9c1d7e60", "br-vpnfwd"])
+
+    def test_no_devices_without_wireguard_or_bridges(self):
+        """Verifies nothing is offloaded when one side of the forwarding is missing."""
+        # Act
+        result = [flowtable_devices(["eth0", "br-vpnfwd"]), flowtable_devices(["eth0", "wg0"])]
+
+        # Assert
+        self.assertEqual(result, [[], []])
+
+    def test_render_binds_devices_and_offloads_both_directions(self):
+        """Verifies the flowtable devices and the forward chain offload rules."""
+        # Act
+        result = render_flowtable(["wg0", "br-a", "br-b"])
+
+        # Assert
+        self.assertIn("add table inet vpn_offload\ndelete table inet vpn_offload\n", result)
+        self.assertIn("devices = { wg0, br-a, br-b };", result)
+        self.assertIn("type filter hook forward priority filter + 10; policy accept;", result)
+        self.assertIn(
+            'ct state established iifname "wg0" oifname { "br-a", "br-b" } flow add @vpn_fastpath',
+            result,
+        )
+        self.assertIn(
+            'ct state established iifname { "br-a", "br-b" } oifname "wg0" flow add @vpn_fastpath',
+            result,
+        )
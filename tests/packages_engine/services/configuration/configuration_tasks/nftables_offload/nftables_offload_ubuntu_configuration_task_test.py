@@ -0,0 +1,169 @@
+"""Tests for NftablesOffloadUbuntuConfigurationTask.
+
+Verifies the flowtable offload is loaded for the discovered interfaces.
+"""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.nftables_offload import (
+    NftablesOffloadUbuntuConfigurationTask,
+    render_flowtable,
+)
+from packages_engine.services.file_system.file_system_service_mock import (
+    MockFileSystemService,
+    WriteTextParams,
+)
+from packages_engine.services.host_resources.host_resources_service_mock import (
+    MockHostResourcesService,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.package_controller.package_controller_service_mock import (
+    MockPackageControllerService,
+)
+
+REMOVE_COMMANDS = [
+    "printf 'add table inet vpn_offload\\ndelete table inet vpn_offload\\n' | sudo nft -f -",
+    "sudo rm -f /etc/nftables-offload.nft",
+]
+
+
+class TestNftablesOffloadUbuntuConfigurationTask(unittest.TestCase):
+    """Test suite for NftablesOffloadUbuntuConfigurationTask."""
+
+    file_system: MockFileSystemService
+    notifications: MockNotificationsService
+    controller: MockPackageControllerService
+    host_resources: MockHostResourcesService
+    task: NftablesOffloadUbuntuConfigurationTask
+    data: ConfigurationData
+
+    def setUp(self):
+        self.file_system = MockFileSystemService()
+        self.notifications = MockNotificationsService()
+        self.controller = MockPackageControllerService()
+        self.host_resources = MockHostResourcesService()
+        self.task = NftablesOffloadUbuntuConfigurationTask(
+            self.file_system, self.notifications, self.controller, self.host_resources
+        )
+        self.data = ConfigurationData.default()
+        self.data.flowtable_enabled = True
+        self.maxDiff = None
+
+    def test_happy_path(self):
+        """Verify successful flowtable configuration."""
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+
+    def test_happy_path_results_in_correct_notifications_flow(self):
+        """Verify correct notification sequence on success."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {"text": "Discovering WireGuard and Docker bridge interfaces.", "type": "info"},
+                {
+                    "text": "\tFlowtable devices: wg0, br-3f2a9c1d7e60, br-vpnfwd.",
+                    "type": "success",
+                },
+                {"text": "Loading flowtable offload.", "type": "info"},
+                {"text": "\tLoading flowtable offload succeeded.", "type": "success"},
+            ],
+        )
+
+    def test_writes_and_loads_discovered_devices(self):
+        """Verify the offload table is rendered for the discovered devices and loaded."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [
+                WriteTextParams(
+                    "/etc/nftables-offload.nft",
+                    render_flowtable(["wg0", "br-3f2a9c1d7e60", "br-vpnfwd"]),
+                )
+            ],
+        )
+        self.assertEqual(
+            self.controller.run_raw_commands_params,
+            [
+                [
+                    "sudo nft -c -f /etc/nftables-offload.nft",
+                    "sudo nft -f /etc/nftables-offload.nft",
+                ]
+            ],
+        )
+
+    def test_disabled_removes_offload(self):
+        """Verify a disabled flowtable is removed without discovering interfaces."""
+        # Arrange
+        self.data.flowtable_enabled = False
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.host_resources.network_interfaces_calls, 0)
+        self.assertEqual(self.controller.run_raw_commands_params, [REMOVE_COMMANDS])
+
+    def test_missing_interfaces_skip_offload(self):
+        """Verify the offload is removed with a warning when there is nothing to bind to."""
+        # Arrange
+        self.host_resources.network_interfaces_result = ["eth0", "lo"]
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.file_system.write_text_params, [])
+        self.assertEqual(self.controller.run_raw_commands_params, [REMOVE_COMMANDS])
+        self.assertIn(
+            {
+                "text": "\tNo WireGuard or Docker bridge interface found. "
+                "Flowtable offload skipped.",
+                "type": "warning",
+            },
+            self.notifications.params,
+        )
+
+    def test_write_failure_results_in_failure(self):
+        """Verify task fails when the offload rules cannot be written."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.file_system.write_text_result = failure_result
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(self.controller.run_raw_commands_params, [])
+
+    def test_load_failure_results_in_failure(self):
+        """Verify task fails when nft rejects the offload rules."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.controller.run_raw_commands_result = failure_result
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertIn(
+            {"text": "\tLoading flowtable offload failed.", "type": "error"},
+            self.notifications.params,
+        )
@@ -0,0 +1,31 @@
+"""Tests for NftablesOffloadWindowsConfigurationTask.
+
+Verifies Windows flowtable offload configuration returns unsupported status.
+"""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.nftables_offload import (
+    NftablesOffloadWindowsConfigurationTask,
+)
+
+
+class TestNftablesOffloadWindowsConfigurationTask(unittest.TestCase):
+    """Test suite for NftablesOffloadWindowsConfigurationTask."""
+
+    task: NftablesOffloadWindowsConfigurationTask
+    data: ConfigurationData
+
+    def setUp(self):
+        self.task = NftablesOffloadWindowsConfigurationTask()
+        self.data = ConfigurationData.default()
+
+    def test_returns_unsupported_error(self):
+        """Verify task returns 'Not supported' error."""
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Not supported"))
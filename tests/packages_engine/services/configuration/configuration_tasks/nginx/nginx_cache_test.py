@@ -0,0 +1,48 @@
+"""Tests for the nginx proxy cache sizing."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.nginx import (
+    NginxCache,
+    compute_nginx_cache,
+    render_nginx_cache,
+)
+
+
+class TestNginxCache(unittest.TestCase):
+    """Test suite for compute_nginx_cache and render_nginx_cache."""
+
+    def test_cache_takes_share_of_free_space(self):
+        """Verifies the cache takes five percent of the free disk space."""
+        # Act
+        result = compute_nginx_cache(40 * 1024**3)
+
+        # Assert
+        self.assertEqual(result, NginxCache(2048, 16))
+
+    def test_small_disk_keeps_minimums(self):
+        """Verifies minimum sizes are kept on nearly full disks."""
+        # Act
+        result = compute_nginx_cache(0)
+
+        # Assert
+        self.assertEqual(result, NginxCache(256, 8))
+
+    def test_large_disk_is_capped(self):
+        """Verifies the cache size is capped on large disks."""
+        # Act
+        result = compute_nginx_cache(2 * 1024**4)
+
+        # Assert
+        self.assertEqual(result, NginxCache(4096, 32))
+
+    def test_render_replaces_placeholders(self):
+        """Verifies the cache placeholders are replaced with megabyte sizes."""
+        # Act
+        result = render_nginx_cache(
+            "keys_zone=gitea_cache:{{NGINX_CACHE_KEYS_ZONE}} max_size={{NGINX_CACHE_MAX_SIZE}}",
+            NginxCache(512, 8),
+        )
+
+        # Assert
+        self.assertEqual(result, "keys_zone=gitea_cache:8m max_size=512m")
@@ -0,0 +1,61 @@
+"""Tests for the nginx tuning calculation."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.nginx import (
+    NginxTuning,
+    compute_nginx_tuning,
+    render_nginx_tuning,
+)
+
+
+class TestNginxTuning(unittest.TestCase):
+    """Test suite for compute_nginx_tuning and render_nginx_tuning."""
+
+    def test_large_limit_is_capped(self):
+        """Verifies descriptor and connection limits are capped on generous hosts."""
+        # Act
+        result = compute_nginx_tuning(2, 1048576)
+
+        # Assert
+        self.assertEqual(result, NginxTuning(2, 16384, 65536, 32, 10))
+
+    def test_small_limit_keeps_minimums(self):
+        """Verifies minimums are kept when the open files limit is tiny."""
+        # Act
+        result = compute_nginx_tuning(1, 1024)
+
+        # Assert
+        self.assertEqual(result, NginxTuning(1, 1024, 2048, 16, 10))
+
+    def test_connections_leave_room_for_upstream_descriptors(self):
+        """Verifies each connection is budgeted two descriptors."""
+        # Act
+        result = compute_nginx_tuning(16, 20000)
+
+        # Assert
+        self.assertEqual(result.worker_connections, 10000)
+        self.assertEqual(result.upstream_keepalive, 128)
+        self.assertEqual(result.ssl_session_cache_mib, 40)
+
+    def test_session_cache_is_capped(self):
+        """Verifies the TLS session cache is capped on hosts with many workers."""
+        # Act
+        result = compute_nginx_tuning(64, 1048576)
+
+        # Assert
+        self.assertEqual(result.ssl_session_cache_mib, 128)
+
+    def test_render_replaces_placeholders(self):
+        """Verifies all nginx placeholders are replaced."""
+        # Act
+        result = render_nginx_tuning(
+            "worker_processes {{NGINX_WORKER_PROCESSES}}; keepalive {{NGINX_UPSTREAM_KEEPALIVE}}; "
+            "ssl_session_cache shared:SSL:{{NGINX_SSL_SESSION_CACHE}};",
+            NginxTuning(2, 4096, 8192, 32, 10),
+        )
+
+        # Assert
+        self.assertEqual(
+            result, "worker_processes 2; keepalive 32; ssl_session_cache shared:SSL:10m;"
+        )
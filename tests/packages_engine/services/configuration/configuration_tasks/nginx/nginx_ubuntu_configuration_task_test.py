@@ -13,6 +13,10 @@ from packages_engine.services.configuration.configuration_tasks.nginx import (
 )
 from packages_engine.services.file_system.file_system_service_mock import (
     MockFileSystemService,
+    WriteTextParams,
+)
+from packages_engine.services.host_resources.host_resources_service_mock import (
+    MockHostResourcesService,
 )
 from packages_engine.services.notifications.notifications_service_mock import (
     MockNotificationsService,
@@ -28,6 +32,7 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
     file_system: MockFileSystemService
     notifications: MockNotificationsService
     controller: MockPackageControllerService
+    host_resources: MockHostResourcesService
     task: NginxUbuntuConfigurationTask
     data: ConfigurationData
 
@@ -36,8 +41,13 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
         self.file_system = MockFileSystemService()
         self.notifications = MockNotificationsService()
         self.controller = MockPackageControllerService()
+        self.host_resources = MockHostResourcesService()
         self.task = NginxUbuntuConfigurationTask(
-            self.reader, self.file_system, self.notifications, self.controller
+            self.reader,
+            self.file_system,
+            self.notifications,
+            self.controller,
+            self.host_resources,
         )
         self.data = ConfigurationData.default()
         self.data.server_data_dir = "srv"
@@ -51,11 +61,23 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
             "/usr/local/share/srv/data/nginx/nginx.conf": OperationResult[str].succeed(
                 "nginx.conf config template"
             ),
+            "/usr/local/share/srv/data/systemd/nginx-ticket-keys.service": OperationResult[
+                str
+            ].succeed("ticket keys service template"),
+            "/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer": OperationResult[
+                str
+            ].succeed("ticket keys timer template"),
+            "/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf": OperationResult[
+                str
+            ].succeed("tcp forwarding template"),
         }
         self.file_system.write_text_result_map = {
             "/etc/nginx/sites-available/gitea.app": OperationResult[bool].succeed(True),
             "/etc/nginx/sites-available/postgresql.app": OperationResult[bool].succeed(True),
             "/etc/nginx/nginx.conf": OperationResult[bool].succeed(True),
+            "/etc/systemd/system/nginx-ticket-keys.service": OperationResult[bool].succeed(True),
+            "/etc/systemd/system/nginx-ticket-keys.timer": OperationResult[bool].succeed(True),
+            "/etc/nginx/stream.d/tcp-forwarding.conf": OperationResult[bool].succeed(True),
         }
         self.maxDiff = None
 
@@ -151,7 +173,82 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
                     "text": "Saving config data to '/etc/nginx/nginx.conf' successful.",
                     "type": "success",
                 },
+                {
+                    "text": "Saving configuration from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.service' to "
+                    "'/etc/systemd/system/nginx-ticket-keys.service'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.service'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.service' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.service'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.service' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving configuration from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer' to "
+                    "'/etc/systemd/system/nginx-ticket-keys.timer'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.timer'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.timer' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving configuration from '/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf' to '/etc/nginx/stream.d/tcp-forwarding.conf'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from '/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from '/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving config data to '/etc/nginx/stream.d/tcp-forwarding.conf'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Saving config data to '/etc/nginx/stream.d/tcp-forwarding.conf' successful.",
+                    "type": "success",
+                },
                 {"text": "Replacing Nginx configurations successful.", "type": "success"},
+                {
+                    "text": "Preparing Nginx cache directories (1024 MiB proxy cache).",
+                    "type": "info",
+                },
+                {"text": "\tPreparing Nginx cache directories succeeded.", "type": "success"},
+                {"text": "Publishing Gitea static assets.", "type": "info"},
+                {"text": "\tPublishing Gitea static assets succeeded.", "type": "success"},
                 {"text": "Restarting Nginx.", "type": "info"},
                 {"text": "Enabling sites and validating Nginx config.", "type": "info"},
                 {"text": "Loading Nginx configuration successful.", "type": "success"},
@@ -182,6 +279,21 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
                     self.data,
                     "/usr/local/share/srv/data/nginx/nginx.conf",
                 ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/systemd/nginx-ticket-keys.service",
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer",
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf",
+                ),
             ],
         )
 
@@ -503,13 +615,42 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
         self.assertEqual(
             self.controller.run_raw_commands_params,
             [
+                [
+                    "sudo install -d -m 0700 -o www-data -g www-data /var/cache/nginx/gitea",
+                    "sudo install -d -m 0755 /var/lib/nginx/gitea-static",
+                ],
+                [
+                    'sudo docker exec gitea sh -c "rm -rf /tmp/nginx-static && '
+                    "gitea embedded extract --overwrite --destination /tmp/nginx-static "
+                    "'public/assets/**'\" >/dev/null",
+                    "sudo rm -rf /var/lib/nginx/gitea-static/assets.new && "
+                    "sudo docker cp gitea:/tmp/nginx-static/public/assets "
+                    "/var/lib/nginx/gitea-static/assets.new",
+                    "sudo find /var/lib/nginx/gitea-static/assets.new -type f "
+                    "\\( -name '*.js' -o -name '*.css' -o -name '*.svg' -o -name '*.json' "
+                    "-o -name '*.map' -o -name '*.txt' \\) -size +1k -exec gzip -kf9 {} +",
+                    "sudo chown -R root:root /var/lib/nginx/gitea-static/assets.new && "
+                    "sudo chmod -R u=rwX,go=rX /var/lib/nginx/gitea-static/assets.new",
+                    "sudo rm -rf /var/lib/nginx/gitea-static/assets && "
+                    "sudo mv /var/lib/nginx/gitea-static/assets.new "
+                    "/var/lib/nginx/gitea-static/assets",
+                    "sudo docker exec gitea rm -rf /tmp/nginx-static",
+                ],
                 [
                     "sudo install -d -m 0755 /etc/nginx/sites-enabled",
+                    "sudo install -d -m 0755 /etc/nginx/stream.d",
                     "sudo rm -f /etc/nginx/sites-enabled/default",
                     "sudo ln -sf /etc/nginx/sites-available/gitea.app /etc/nginx/sites-enabled/gitea.app",
                     "sudo ln -sf /etc/nginx/sites-available/postgresql.app /etc/nginx/sites-enabled/postgresql.app",
+                    "sudo install -d -m 0700 -o root -g root /etc/nginx/tls",
+                    "test -f /etc/nginx/tls/ticket.current.key || sudo sh -c 'umask 077 && "
+                    "openssl rand -out /etc/nginx/tls/ticket.current.key 80'",
+                    "test -f /etc/nginx/tls/ticket.previous.key || sudo cp -p "
+                    "/etc/nginx/tls/ticket.current.key /etc/nginx/tls/ticket.previous.key",
                     "sudo nginx -t -q",
                     "sudo systemctl reload nginx || sudo systemctl restart nginx || sudo service nginx restart || sudo service nginx start",
+                    "sudo systemctl daemon-reload",
+                    "sudo systemctl enable --now nginx-ticket-keys.timer",
                 ]
             ],
         )
@@ -518,7 +659,7 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
         """Verifies failure when configuration commands cannot be executed."""
         # Arrange
         failure_result = OperationResult[bool].fail("Failure")
-        self.controller.run_raw_commands_result = failure_result
+        self.controller.run_raw_commands_result_regex_map = {"nginx -t": failure_result}
 
         # Act
         result = self.task.configure(self.data)
@@ -530,7 +671,7 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
         """Verifies correct error notifications when command execution fails."""
         # Arrange
         failure_result = OperationResult[bool].fail("Failure")
-        self.controller.run_raw_commands_result = failure_result
+        self.controller.run_raw_commands_result_regex_map = {"nginx -t": failure_result}
 
         # Act
         self.task.configure(self.data)
@@ -614,9 +755,186 @@ class TestNginxUbuntuConfigurationTask(unittest.TestCase):
                     "text": "Saving config data to '/etc/nginx/nginx.conf' successful.",
                     "type": "success",
                 },
+                {
+                    "text": "Saving configuration from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.service' to "
+                    "'/etc/systemd/system/nginx-ticket-keys.service'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.service'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.service' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.service'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.service' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving configuration from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer' to "
+                    "'/etc/systemd/system/nginx-ticket-keys.timer'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from "
+                    "'/usr/local/share/srv/data/systemd/nginx-ticket-keys.timer' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.timer'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Saving config data to '/etc/systemd/system/nginx-ticket-keys.timer' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving configuration from '/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf' to '/etc/nginx/stream.d/tcp-forwarding.conf'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from '/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Loading config template from '/usr/local/share/srv/data/nginx/stream.d/tcp-forwarding.conf' successful.",
+                    "type": "success",
+                },
+                {
+                    "text": "Saving config data to '/etc/nginx/stream.d/tcp-forwarding.conf'.",
+                    "type": "info",
+                },
+                {
+                    "text": "Saving config data to '/etc/nginx/stream.d/tcp-forwarding.conf' successful.",
+                    "type": "success",
+                },
                 {"text": "Replacing Nginx configurations successful.", "type": "success"},
+                {
+                    "text": "Preparing Nginx cache directories (1024 MiB proxy cache).",
+                    "type": "info",
+                },
+                {"text": "\tPreparing Nginx cache directories succeeded.", "type": "success"},
+                {"text": "Publishing Gitea static assets.", "type": "info"},
+                {"text": "\tPublishing Gitea static assets succeeded.", "type": "success"},
                 {"text": "Restarting Nginx.", "type": "info"},
                 {"text": "Enabling sites and validating Nginx config.", "type": "info"},
                 {"text": "Loading Nginx configuration  Nginx failed.", "type": "error"},
             ],
         )
+
+    def test_tuning_is_rendered_from_host_resources(self):
+        """Verifies worker limits and keepalive pools are sized from CPUs and the open files limit."""
+        # Arrange
+        self.host_resources.cpu_count_result = 4
+        self.host_resources.open_files_limit_result = 8192
+        self.reader.read_result_map["/usr/local/share/srv/data/nginx/nginx.conf"] = OperationResult[
+            str
+        ].succeed(
+            "{{NGINX_WORKER_PROCESSES}} {{NGINX_WORKER_RLIMIT_NOFILE}} "
+            "{{NGINX_WORKER_CONNECTIONS}} {{NGINX_UPSTREAM_KEEPALIVE}}"
+        )
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertIn(
+            WriteTextParams("/etc/nginx/nginx.conf", "4 8192 4096 64"),
+            self.file_system.write_text_params,
+        )
+
+    def test_cache_is_sized_from_free_disk_space(self):
+        """Verifies the proxy cache is sized from the free space of the cache filesystem."""
+        # Arrange
+        self.host_resources.disk_free_bytes_result = 200 * 1024**3
+        self.reader.read_result_map["/usr/local/share/srv/data/nginx/nginx.conf"] = OperationResult[
+            str
+        ].succeed("keys_zone=gitea_cache:{{NGINX_CACHE_KEYS_ZONE}} max_size={{NGINX_CACHE_MAX_SIZE}}")
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(self.host_resources.disk_free_bytes_params, ["/var/cache/nginx/gitea"])
+        self.assertIn(
+            WriteTextParams("/etc/nginx/nginx.conf", "keys_zone=gitea_cache:32m max_size=4096m"),
+            self.file_system.write_text_params,
+        )
+
+    def test_failure_to_prepare_cache_directories_results_in_failure(self):
+        """Verifies failure when the cache directories cannot be created."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.controller.run_raw_commands_result_regex_map = {"/var/cache/nginx": failure_result}
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, failure_result)
+        self.assertEqual(len(self.controller.run_raw_commands_params), 1)
+
+    def test_failure_to_publish_static_assets_is_not_fatal(self):
+        """Verifies nginx is still configured when the static assets cannot be published."""
+        # Arrange
+        self.controller.run_raw_commands_result_regex_map = {
+            "embedded extract": OperationResult[bool].fail("Failure")
+        }
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertIn(
+            {
+                "text": "\tPublishing Gitea static assets failed. Assets stay proxied to Gitea.",
+                "type": "warning",
+            },
+            self.notifications.params,
+        )
+
+    def test_proxy_mode_stores_stream_relays(self):
+        """Verifies the nginx stream relays are stored in the proxy forwarding mode."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertIn(
+            WriteTextParams("/etc/nginx/stream.d/tcp-forwarding.conf", "tcp forwarding template"),
+            self.file_system.write_text_params,
+        )
+
+    def test_kernel_mode_removes_stream_relays(self):
+        """Verifies the stream relays are removed when the kernel forwards the ports."""
+        # Arrange
+        self.data.tcp_forwarding_mode = "kernel"
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertNotIn(
+            "/etc/nginx/stream.d/tcp-forwarding.conf",
+            [params.path_location for params in self.file_system.write_text_params],
+        )
+        self.assertIn(
+            "sudo rm -f /etc/nginx/stream.d/tcp-forwarding.conf",
+            self.controller.run_raw_commands_params[-1],
+        )
@@ -0,0 +1,330 @@
+"""Tests for PackageCachesUbuntuConfigurationTask.
+
+Verifies apt proxy and registry mirror configuration in every package caches mode.
+"""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationContent, ConfigurationData
+from packages_engine.services.configuration.configuration_content_reader.configuration_content_reader_service_mock import (
+    MockConfigurationContentReaderService,
+    ReadParams,
+)
+from packages_engine.services.configuration.configuration_tasks.package_caches import (
+    PackageCachesUbuntuConfigurationTask,
+)
+from packages_engine.services.file_system.file_system_service_mock import (
+    MockFileSystemService,
+    WriteTextParams,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.package_controller.package_controller_service_mock import (
+    MockPackageControllerService,
+)
+
+
+class TestPackageCachesUbuntuConfigurationTask(unittest.TestCase):
+    """Test suite for PackageCachesUbuntuConfigurationTask."""
+
+    reader: MockConfigurationContentReaderService
+    file_system: MockFileSystemService
+    notifications: MockNotificationsService
+    controller: MockPackageControllerService
+    task: PackageCachesUbuntuConfigurationTask
+    data: ConfigurationData
+
+    def setUp(self):
+        self.reader = MockConfigurationContentReaderService()
+        self.file_system = MockFileSystemService()
+        self.notifications = MockNotificationsService()
+        self.controller = MockPackageControllerService()
+        self.task = PackageCachesUbuntuConfigurationTask(
+            self.reader, self.file_system, self.notifications, self.controller
+        )
+        self.data = ConfigurationData.default()
+        self.data.server_data_dir = "srv"
+        self.data.package_cache_mode = "server"
+        self.data.package_cache_host = "127.0.0.1"
+        self.reader.read_result_map = {
+            "/usr/local/share/srv/data/caches/docker-compose.yml": OperationResult[str].succeed(
+                "compose"
+            ),
+            "/usr/local/share/srv/data/caches/apt-proxy-detect": OperationResult[str].succeed(
+                "detect"
+            ),
+            "/usr/local/share/srv/data/caches/01-package-cache": OperationResult[str].succeed(
+                "conf"
+            ),
+        }
+        self.file_system.path_exists_result_map = {"/run/docker-daemon-json.changed": False}
+        self.maxDiff = None
+
+    def test_happy_path(self):
+        """Verifies successful configuration returns success result."""
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+
+    def test_reads_templates_in_server_mode(self):
+        """Verifies all templates are read in server mode."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.reader.read_params,
+            [
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/caches/docker-compose.yml",
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/caches/apt-proxy-detect",
+                ),
+                ReadParams(
+                    ConfigurationContent.RAW_STRING,
+                    self.data,
+                    "/usr/local/share/srv/data/caches/01-package-cache",
+                ),
+            ],
+        )
+
+    def test_writes_files_in_server_mode(self):
+        """Verifies compose file and apt proxy files are written in server mode."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [
+                WriteTextParams("/srv/caches/docker-compose.yml", "compose"),
+                WriteTextParams("/usr/local/sbin/apt-proxy-detect", "detect"),
+                WriteTextParams("/etc/apt/apt.conf.d/01-package-cache", "conf"),
+                WriteTextParams(
+                    "/etc/docker/daemon.json",
+                    '{\n  "registry-mirrors": [\n    "http://127.0.0.1:5000"\n  ],\n'
+                    '  "insecure-registries": [\n    "127.0.0.1:5000"\n  ]\n}\n',
+                ),
+            ],
+        )
+
+    def test_runs_commands_in_server_mode(self):
+        """Verifies caches are started and Docker is pointed at the local mirror."""
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.controller.run_raw_commands_params,
+            [
+                [
+                    "sudo install -d -m 0755 /srv/caches",
+                    "sudo install -d -m 0755 /srv/caches/apt-cacher-ng",
+                    "sudo install -d -m 0755 /srv/caches/registry",
+                ],
+                [
+                    "sudo chown root:root /srv/caches/docker-compose.yml",
+                    "sudo chmod 0644 /srv/caches/docker-compose.yml",
+                    "cd /srv/caches && sudo docker compose up -d --remove-orphans",
+                ],
+                [
+                    "sudo chown root:root /usr/local/sbin/apt-proxy-detect "
+                    "/etc/apt/apt.conf.d/01-package-cache",
+                    "sudo chmod 0755 /usr/local/sbin/apt-proxy-detect",
+                    "sudo chmod 0644 /etc/apt/apt.conf.d/01-package-cache",
+                ],
+                [
+                    "sudo chown root:root /etc/docker/daemon.json "
+                    "&& sudo chmod 0644 /etc/docker/daemon.json",
+                    "sudo touch /run/docker-daemon-json.changed",
+                    "test ! -f /run/docker-daemon-json.changed || "
+                    "(sudo systemctl restart docker && sudo rm -f /run/docker-daemon-json.changed)",
+                ],
+            ],
+        )
+
+    def test_client_mode_does_not_deploy_caches(self):
+        """Verifies client mode only points apt and Docker at the remote caches."""
+        # Arrange
+        self.data.package_cache_mode = "client"
+        self.data.package_cache_host = "192.168.1.10"
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [
+                WriteTextParams("/usr/local/sbin/apt-proxy-detect", "detect"),
+                WriteTextParams("/etc/apt/apt.conf.d/01-package-cache", "conf"),
+                WriteTextParams(
+                    "/etc/docker/daemon.json",
+                    '{\n  "registry-mirrors": [\n    "http://192.168.1.10:5000"\n  ],\n'
+                    '  "insecure-registries": [\n    "192.168.1.10:5000"\n  ]\n}\n',
+                ),
+            ],
+        )
+        self.assertIsNone(self.controller.find_first_raw_commands_group("docker compose up"))
+
+    def test_unchanged_daemon_json_does_not_restart_docker(self):
+        """Verifies Docker is left running when the registry mirror is already configured."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/docker/daemon.json"] = OperationResult[
+            str
+        ].succeed(
+            '{"insecure-registries": ["127.0.0.1:5000"], '
+            '"registry-mirrors": ["http://127.0.0.1:5000"]}'
+        )
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [
+                self.file_system.find_write_text_params("daemon.json"),
+                self.controller.find_first_raw_commands_group("systemctl restart docker"),
+            ],
+            [[], None],
+        )
+
+    def test_off_mode_removes_everything_the_caches_set_up(self):
+        """Verifies off mode removes the apt proxy, the registry mirror and the caches stack."""
+        # Arrange
+        self.data.package_cache_mode = "off"
+        self.file_system.read_text_result_map["/etc/docker/daemon.json"] = OperationResult[
+            str
+        ].succeed('{"dns": ["10.10.0.1"], "registry-mirrors": ["http://127.0.0.1:5000"]}')
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(
+            self.file_system.remove_location_params,
+            ["/etc/apt/apt.conf.d/01-package-cache", "/usr/local/sbin/apt-proxy-detect"],
+        )
+        self.assertEqual(
+            self.file_system.find_write_text_params("daemon.json"),
+            [
+                WriteTextParams(
+                    "/etc/docker/daemon.json", '{\n  "dns": [\n    "10.10.0.1"\n  ]\n}\n'
+                )
+            ],
+        )
+        self.assertEqual(
+            self.controller.run_raw_commands_params,
+            [
+                [
+                    "test ! -f /srv/caches/docker-compose.yml || "
+                    "(cd /srv/caches && sudo docker compose down --remove-orphans)",
+                    "sudo rm -f /srv/caches/docker-compose.yml",
+                    "sudo chown root:root /etc/docker/daemon.json "
+                    "&& sudo chmod 0644 /etc/docker/daemon.json",
+                    "sudo touch /run/docker-daemon-json.changed",
+                    "test ! -f /run/docker-daemon-json.changed || "
+                    "(sudo systemctl restart docker && sudo rm -f /run/docker-daemon-json.changed)",
+                ]
+            ],
+        )
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {"text": "Package caches are disabled.", "type": "info"},
+                {"text": "\tRemoving apt proxy configuration succeeded.", "type": "success"},
+                {"text": "Stopping package caches and the registry mirror.", "type": "info"},
+                {"text": "\tStopping package caches succeeded.", "type": "success"},
+            ],
+        )
+
+    def test_off_mode_failure_to_stop_caches_results_in_failure(self):
+        """Verifies a failed stop of the caches fails the task."""
+        # Arrange
+        failure_result = OperationResult[bool].fail("Failure")
+        self.data.package_cache_mode = "off"
+        self.controller.run_raw_commands_result = failure_result
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [result, self.notifications.params[-1]],
+            [failure_result, {"text": "\tStopping package caches failed.", "type": "error"}],
+        )
+
+    def test_off_mode_without_apt_proxy_configuration_does_nothing(self):
+        """Verifies off mode does nothing when apt proxy is not configured."""
+        # Arrange
+        self.data.package_cache_mode = "off"
+        self.file_system.path_exists_result = False
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.file_system.remove_location_params, [])
+        self.assertEqual(self.controller.run_raw_commands_params, [])
+
+    def test_failure_to_read_template_results_in_failure(self):
+        """Verifies template read failure propagates."""
+        # Arrange
+        self.reader.read_result_map["/usr/local/share/srv/data/caches/apt-proxy-detect"] = (
+            OperationResult[str].fail("Failure")
+        )
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Failure"))
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tReading apt proxy detection script template failed.", "type": "error"},
+        )
+
+    def test_failure_to_start_caches_results_in_failure(self):
+        """Verifies compose failure stops the task before touching apt."""
+        # Arrange
+        self.controller.run_raw_commands_result_regex_map = {
+            "docker compose up": OperationResult[bool].fail("Failure")
+        }
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Failure"))
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [WriteTextParams("/srv/caches/docker-compose.yml", "compose")],
+        )
+
+    def test_failure_to_configure_docker_results_in_failure(self):
+        """Verifies Docker daemon update failure propagates."""
+        # Arrange
+        self.file_system.write_text_result_map["/etc/docker/daemon.json"] = OperationResult[
+            bool
+        ].fail("Failure")
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Failure"))
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tPointing Docker daemon at the registry mirror failed.", "type": "error"},
+        )
@@ -0,0 +1,28 @@
+"""Tests for PackageCachesWindowsConfigurationTask. Validates Windows returns not supported."""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.package_caches import (
+    PackageCachesWindowsConfigurationTask,
+)
+
+
+class TestPackageCachesWindowsConfigurationTask(unittest.TestCase):
+    """Test suite for PackageCachesWindowsConfigurationTask."""
+
+    task: PackageCachesWindowsConfigurationTask
+    data: ConfigurationData
+
+    def setUp(self):
+        self.task = PackageCachesWindowsConfigurationTask()
+        self.data = ConfigurationData.default()
+
+    def test_not_supported(self):
+        """Verifies Windows configuration returns not supported failure."""
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Not supported"))
@@ -0,0 +1,173 @@
+"""Tests for WireguardMtuUbuntuConfigurationTask.
+
+Verifies the WireGuard MTU is derived from the probed path MTU.
+"""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.wireguard_mtu import (
+    WireguardMtuUbuntuConfigurationTask,
+)
+from packages_engine.services.file_system.file_system_service_mock import (
+    MockFileSystemService,
+    WriteTextParams,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.path_mtu.path_mtu_service_mock import MockPathMtuService
+
+
+class TestWireguardMtuUbuntuConfigurationTask(unittest.TestCase):
+    """Test suite for WireguardMtuUbuntuConfigurationTask."""
+
+    file_system: MockFileSystemService
+    notifications: MockNotificationsService
+    path_mtu: MockPathMtuService
+    task: WireguardMtuUbuntuConfigurationTask
+    data: ConfigurationData
+
+    def setUp(self):
+        self.file_system = MockFileSystemService()
+        self.notifications = MockNotificationsService()
+        self.path_mtu = MockPathMtuService()
+        self.path_mtu.discover_result = OperationResult[int].succeed(1492)
+        self.task = WireguardMtuUbuntuConfigurationTask(
+            self.file_system, self.notifications, self.path_mtu
+        )
+        self.data = ConfigurationData.default()
+        self.data.remote_ip_address = "203.0.113.10"
+        self.data.mtu_probe_address = "198.51.100.1"
+        self.data.wireguard_client_names = ["laptop", "phone"]
+        self.maxDiff = None
+
+    def test_happy_path(self):
+        """Verify the MTU of a PPPoE path is stored for the server."""
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.path_mtu.discover_params, ["198.51.100.1"])
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [WriteTextParams("/etc/wireguard/server.mtu", "1412")],
+        )
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {"text": "Discovering the path MTU to 198.51.100.1.", "type": "info"},
+                {"text": "\tPath MTU is 1492 bytes. WireGuard MTU is 1412.", "type": "success"},
+            ],
+        )
+
+    def test_mtu_never_exceeds_the_default(self):
+        """Verify an Ethernet path keeps wg-quick's default MTU."""
+        # Arrange
+        self.path_mtu.discover_result = OperationResult[int].succeed(1500)
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.file_system.write_text_params,
+            [WriteTextParams("/etc/wireguard/server.mtu", "1420")],
+        )
+
+    def test_empty_probe_address_keeps_current_mtu(self):
+        """Verify nothing is probed without a probe address."""
+        # Arrange
+        self.data.mtu_probe_address = ""
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            [result, self.path_mtu.discover_params, self.file_system.write_text_params],
+            [OperationResult[bool].succeed(True), [], []],
+        )
+        self.assertEqual(
+            self.notifications.params,
+            [{"text": "No path MTU probe address set. Keeping MTU 1420.", "type": "info"}],
+        )
+
+    def test_local_probe_address_keeps_current_mtu(self):
+        """Verify the server's own and loopback addresses are not probed."""
+        # Arrange
+        probed = []
+        for address in ["203.0.113.10", "127.0.0.1", "::1", "fe80::1", "localhost"]:
+            self.data.mtu_probe_address = address
+
+            # Act
+            result = self.task.configure(self.data)
+            probed.append(result.success)
+
+        # Assert
+        self.assertEqual(
+            [probed, self.path_mtu.discover_params, self.file_system.write_text_params],
+            [[True] * 5, [], []],
+        )
+        self.assertEqual(
+            self.notifications.params[0],
+            {
+                "text": "Path MTU probe address 203.0.113.10 is this server. Keeping MTU 1420.",
+                "type": "warning",
+            },
+        )
+
+    def test_client_overrides_are_reported(self):
+        """Verify clients with their own MTU are listed."""
+        # Arrange
+        self.file_system.read_text_result_map["/etc/wireguard/clients/phone.mtu"] = OperationResult[
+            str
+        ].succeed("1280\n")
+
+        # Act
+        self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": '\tClient "phone" overrides the MTU with 1280.', "type": "info"},
+        )
+
+    def test_discovery_failure_keeps_current_mtu(self):
+        """Verify a failed probe keeps the stored MTU instead of failing the run."""
+        # Arrange
+        self.path_mtu.discover_result = OperationResult[int].fail("No reply")
+        self.file_system.read_text_result_map["/etc/wireguard/server.mtu"] = OperationResult[
+            str
+        ].succeed("1400")
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.file_system.write_text_params, [])
+        self.assertEqual(
+            self.notifications.params[-1],
+            {
+                "text": "\tPath MTU discovery failed: No reply. Keeping MTU 1400.",
+                "type": "warning",
+            },
+        )
+
+    def test_write_failure(self):
+        """Verify failure when the MTU cannot be stored."""
+        # Arrange
+        self.file_system.write_text_result = OperationResult[bool].fail("Read-only")
+
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Read-only"))
+        self.assertEqual(
+            self.notifications.params[-1],
+            {"text": "\tWriting /etc/wireguard/server.mtu failed.", "type": "error"},
+        )
@@ -0,0 +1,31 @@
+"""Tests for WireguardMtuWindowsConfigurationTask.
+
+Verifies Windows WireGuard MTU discovery returns unsupported status.
+"""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.models.configuration import ConfigurationData
+from packages_engine.services.configuration.configuration_tasks.wireguard_mtu import (
+    WireguardMtuWindowsConfigurationTask,
+)
+
+
+class TestWireguardMtuWindowsConfigurationTask(unittest.TestCase):
+    """Test suite for WireguardMtuWindowsConfigurationTask."""
+
+    task: WireguardMtuWindowsConfigurationTask
+    data: ConfigurationData
+
+    def setUp(self):
+        self.task = WireguardMtuWindowsConfigurationTask()
+        self.data = ConfigurationData.default()
+
+    def test_returns_unsupported_error(self):
+        """Verify task returns 'Not supported' error."""
+        # Act
+        result = self.task.configure(self.data)
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Not supported"))
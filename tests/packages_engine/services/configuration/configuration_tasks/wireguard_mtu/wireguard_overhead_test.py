@@ -0,0 +1,28 @@
+"""Tests for the WireGuard MTU sizing."""
+
+import unittest
+
+from packages_engine.services.configuration.configuration_tasks.wireguard_mtu import (
+    wireguard_mtu,
+    wireguard_overhead,
+)
+
+
+class TestWireguardOverhead(unittest.TestCase):
+    """Test suite for wireguard_overhead and wireguard_mtu."""
+
+    def test_overhead_assumes_an_ipv6_outer_header(self):
+        """Verifies the overhead covers IPv6 clients of any endpoint."""
+        # Act
+        result = wireguard_overhead()
+
+        # Assert
+        self.assertEqual(result, 80)
+
+    def test_mtu_for_common_paths(self):
+        """Verifies PPPoE and mobile paths shrink the MTU and Ethernet paths keep 1420."""
+        # Act
+        result = [wireguard_mtu(path_mtu) for path_mtu in [1500, 9000, 1492, 1400]]
+
+        # Assert
+        self.assertEqual(result, [1420, 1420, 1412, 1320])
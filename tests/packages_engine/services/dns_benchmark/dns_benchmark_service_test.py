@@ -0,0 +1,162 @@
+"""Tests for DnsBenchmarkService against a local stand-in resolver."""
+
+import socket
+import struct
+import threading
+import unittest
+
+from packages_engine.models.benchmark import DnsBenchmarkPlan, DnsQuery
+from packages_engine.services.dns_benchmark import DnsBenchmarkService
+
+
+class StandInResolver:
+    """UDP responder on 127.0.0.1 answering A queries from a table.
+
+    Names in `nxdomain` get NXDOMAIN, names in `silent` are never answered and
+    names in `misdirected` get a reply with their ID but another question.
+    """
+
+    def __init__(
+        self,
+        nxdomain: tuple[str, ...] = (),
+        silent: tuple[str, ...] = (),
+        misdirected: tuple[str, ...] = (),
+    ):
+        self.nxdomain = nxdomain
+        self.silent = silent
+        self.misdirected = misdirected
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.05)
+        self.port = self.sock.getsockname()[1]
+        self.received = 0
+        self.running = True
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.running = False
+        self.thread.join()
+        self.sock.close()
+
+    def _serve(self):
+        while self.running:
+            try:
+                query, addr = self.sock.recvfrom(512)
+            except socket.timeout:
+                continue
+            self.received += 1
+            name = self._question_name(query)
+            if name in self.silent:
+                continue
+            rcode = 3 if name in self.nxdomain else 0
+            answers = 0 if rcode else 1
+            query_id = struct.unpack_from("!H", query)[0]
+            header = struct.pack("!HHHHHH", query_id, 0x8180 | rcode, 1, answers, 0, 0)
+            answer = b"\xc0\x0c" + struct.pack("!HHIH", 1, 1, 300, 4) + bytes([10, 10, 0, 1])
+            question = query[12:]
+            if name in self.misdirected:
+                question = b"\x05other\x03app\x00" + question[-4:]
+            self.sock.sendto(header + question + (answer if answers else b""), addr)
+
+    @staticmethod
+    def _question_name(query: bytes) -> str:
+        labels, offset = [], 12
+        while query[offset]:
+            length = query[offset]
+            labels.append(query[offset + 1 : offset + 1 + length].decode())
+            offset += 1 + length
+        return ".".join(labels)
+
+
+class TestDnsBenchmarkService(unittest.TestCase):
+    """Test suite for DnsBenchmarkService."""
+
+    def test_reports_per_category(self):
+        """Verifies every query is sent and summarized under its category."""
+        # Arrange
+        service = DnsBenchmarkService()
+        with StandInResolver() as resolver:
+            plan = DnsBenchmarkPlan(
+                "127.0.0.1",
+                [DnsQuery("gitea.internal.app", "internal"), DnsQuery("example.com", "upstream")],
+                port=resolver.port,
+                rounds=5,
+                concurrency=4,
+                cache_hit_ms=1000.0,
+            )
+
+            # Act
+            result = service.run(plan)
+
+        # Assert
+        self.assertTrue(result.success)
+        report = result.data
+        self.assertEqual(resolver.received, 10)
+        self.assertEqual(
+            [
+                (category.category, category.sent, category.failed, category.cache_hits)
+                for category in report.categories
+            ],
+            [("internal", 5, 0, 5), ("upstream", 5, 0, 5)],
+        )
+        self.assertEqual(report.categories[1].cache_hit_ratio, 1.0)
+
+    def test_failures_are_broken_down(self):
+        """Verifies NXDOMAIN answers and timeouts count as failures by kind."""
+        # Arrange
+        service = DnsBenchmarkService()
+        with StandInResolver(nxdomain=("missing.app",), silent=("slow.app",)) as resolver:
+            plan = DnsBenchmarkPlan(
+                "127.0.0.1",
+                [
+                    DnsQuery("example.com", "upstream"),
+                    DnsQuery("missing.app", "upstream"),
+                    DnsQuery("slow.app", "upstream"),
+                ],
+                port=resolver.port,
+                rounds=2,
+                timeout_seconds=0.2,
+            )
+
+            # Act
+            result = service.run(plan)
+
+        # Assert
+        upstream = result.data.categories[0]
+        self.assertEqual(
+            (upstream.sent, upstream.failed, upstream.errors),
+            (6, 4, {"NXDOMAIN": 2, "timeout": 2}),
+        )
+        self.assertAlmostEqual(upstream.failure_rate, 4 / 6)
+
+    def test_replies_for_another_question_are_ignored(self):
+        """Verifies a reply with a matching ID but another name does not answer a query."""
+        # Arrange
+        service = DnsBenchmarkService()
+        with StandInResolver(misdirected=("spoofed.app",)) as resolver:
+            plan = DnsBenchmarkPlan(
+                "127.0.0.1",
+                [DnsQuery("example.com", "upstream"), DnsQuery("spoofed.app", "upstream")],
+                port=resolver.port,
+                rounds=2,
+                timeout_seconds=0.2,
+            )
+
+            # Act
+            result = service.run(plan)
+
+        # Assert
+        upstream = result.data.categories[0]
+        self.assertEqual((upstream.sent, upstream.failed, upstream.errors), (4, 2, {"timeout": 2}))
+
+    def test_empty_plan_fails(self):
+        """Verifies a plan without queries is rejected."""
+        # Act
+        result = DnsBenchmarkService().run(DnsBenchmarkPlan("127.0.0.1", []))
+
+        # Assert
+        self.assertEqual(result.message, "No queries to send")
@@ -0,0 +1,91 @@
+"""Tests for the DNS wire format encoder and decoder."""
+
+import struct
+import unittest
+
+from packages_engine.services.dns_benchmark import DnsResponse, decode_response, encode_query
+
+
+def a_response(query: bytes, ttls: list[int], rcode: int = 0) -> bytes:
+    """Build a response to a query with one compressed A record per TTL."""
+    query_id = struct.unpack_from("!H", query)[0]
+    header = struct.pack("!HHHHHH", query_id, 0x8180 | rcode, 1, len(ttls), 0, 0)
+    answers = b"".join(
+        b"\xc0\x0c" + struct.pack("!HHIH", 1, 1, ttl, 4) + bytes([10, 10, 0, 1]) for ttl in ttls
+    )
+    return header + query[12:] + answers
+
+
+class TestDnsWire(unittest.TestCase):
+    """Test suite for encode_query and decode_response."""
+
+    def test_encode_query(self):
+        """Verifies a recursive A query with length prefixed labels."""
+        # Act
+        result = encode_query(0x1234, "gitea.internal.app")
+
+        # Assert
+        self.assertEqual(
+            result,
+            b"\x12\x34\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00"
+            b"\x05gitea\x08internal\x03app\x00\x00\x01\x00\x01",
+        )
+
+    def test_encode_rejects_empty_labels(self):
+        """Verifies names with empty labels are rejected."""
+        with self.assertRaises(ValueError):
+            encode_query(1, "gitea..app")
+
+    def test_decode_answers_with_compressed_names(self):
+        """Verifies answers are walked and the lowest TTL is reported."""
+        # Arrange
+        query = encode_query(7, "example.com")
+
+        # Act
+        result = decode_response(a_response(query, [300, 42]))
+
+        # Assert
+        self.assertEqual(result, DnsResponse(7, 0, 2, 42, "example.com", 1))
+
+    def test_decode_error_response(self):
+        """Verifies the response code of an answerless response."""
+        # Act
+        result = decode_response(a_response(encode_query(9, "missing.app"), [], rcode=3))
+
+        # Assert
+        self.assertEqual(result, DnsResponse(9, 3, 0, None, "missing.app", 1))
+
+    def test_response_answers_only_its_question(self):
+        """Verifies the echoed question matches case-insensitively and by record type."""
+        # Arrange
+        response = decode_response(a_response(encode_query(7, "Example.COM"), [300]))
+
+        # Act
+        result = [
+            response.answers("example.com.", 1),
+            response.answers("example.org", 1),
+            response.answers("example.com", 28),
+        ]
+
+        # Assert
+        self.assertEqual(result, [True, False, False])
+
+    def test_decode_rejects_compression_loops(self):
+        """Verifies a question name pointing at itself is rejected."""
+        # Arrange
+        data = struct.pack("!HHHHHH", 7, 0x8180, 1, 0, 0, 0) + b"\xc0\x0c\x00\x01\x00\x01"
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            decode_response(data)
+
+    def test_decode_rejects_queries_and_truncated_data(self):
+        """Verifies queries and truncated records are not accepted as responses."""
+        # Arrange
+        query = encode_query(7, "example.com")
+        truncated = a_response(query, [300])[:-2]
+
+        # Act / Assert
+        for data in (query, truncated, b"\x00\x01"):
+            with self.assertRaises(ValueError):
+                decode_response(data)
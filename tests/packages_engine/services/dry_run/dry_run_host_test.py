@@ -0,0 +1,110 @@
+"""Tests for the dry run host."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from packages_engine.services.dry_run import (
+    DryRunOptions,
+    create_dry_run_host,
+    parse_dry_run_options,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.system_management_engine.engines import (
+    LatencyDistribution,
+    SimulatedLatencyModel,
+)
+
+
+class TestDryRunHost(unittest.TestCase):
+    """Test suite for the dry run options and host."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.maxDiff = None
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_options_require_the_flag(self):
+        """Verifies tools run for real without --dry-run."""
+        # Act
+        result = parse_dry_run_options(["--seed=3"])
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_options_from_command_line(self):
+        """Verifies seed, time scale and latency file are read."""
+        # Arrange
+        latency_path = self.root / "latency.json"
+        latency_path.write_text(json.dumps({"apt_install": {"median_seconds": 5}}), "utf-8")
+
+        # Act
+        result = parse_dry_run_options(
+            ["--dry-run", "--seed=3", "--time-scale=0.5", f"--latency={latency_path}"]
+        )
+
+        # Assert
+        assert result is not None
+        self.assertEqual(
+            [result.seed, result.time_scale, result.latency.latencies["apt_install"]],
+            [3, 0.5, LatencyDistribution(5.0)],
+        )
+
+    def test_invalid_options(self):
+        """Verifies unusable values are rejected."""
+        for argv in (["--dry-run", "--seed=x"], ["--dry-run", "--latency=/missing.json"]):
+            with self.assertRaises(ValueError):
+                parse_dry_run_options(argv)
+
+    def test_host_looks_self_deployed(self):
+        """Verifies templates and tools are where they are and where they get deployed."""
+        # Arrange
+        (self.root / "data" / "nginx").mkdir(parents=True)
+        (self.root / "data" / "nginx" / "gitea.conf").write_text("server {}", "utf-8")
+        (self.root / "installer.pyz").write_bytes(b"PK\x03\x04")
+
+        # Act
+        host = create_dry_run_host(DryRunOptions(), str(self.root))
+
+        # Assert
+        file_system = host.file_system
+        self.assertEqual(
+            [
+                file_system.read_text("data/nginx/gitea.conf").data,
+                file_system.read_text("/usr/local/share/srv/data/nginx/gitea.conf").data,
+                file_system.path_exists("installer.pyz"),
+                file_system.path_exists("/usr/local/sbin/installer.pyz"),
+                file_system.path_exists("/proc/meminfo"),
+                host.engine.file_system is file_system,
+            ],
+            ["server {}", "server {}", True, True, True, True],
+        )
+
+    def test_report_splits_time_by_kind(self):
+        """Verifies the report shows commands and simulated time."""
+        # Arrange
+        latency = SimulatedLatencyModel(
+            {"spawn": LatencyDistribution(0.5), "apt_install": LatencyDistribution(20.0)}
+        )
+        host = create_dry_run_host(DryRunOptions(latency), str(self.root))
+        notifications = MockNotificationsService()
+        host.engine.install("nginx")
+
+        # Act
+        host.report(notifications)
+
+        # Assert
+        self.assertEqual(
+            notifications.params,
+            [
+                {"text": "Dry run: 1 commands, 20.5 s simulated", "type": "info"},
+                {"text": "\tspawn: 0.50 s", "type": "info"},
+                {"text": "\tapt_install: 20.00 s", "type": "info"},
+            ],
+        )
@@ -0,0 +1,142 @@
+"""Tests for the plan host."""
+
+import unittest
+
+from packages_engine.models.bundle import BundleArtifact
+from packages_engine.services.configuration.configuration_tasks.docker_orchestration import (
+    add_unique_value,
+    merge_docker_daemon_json,
+    restart_docker_on_daemon_json_change_command,
+)
+from packages_engine.services.dry_run import create_plan_host
+from packages_engine.services.file_system import InMemoryFileSystemService
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.system_management_engine.engines import SimulatedEngineService
+
+
+class TestPlanHost(unittest.TestCase):
+    """Test suite for the plan host."""
+
+    def setUp(self):
+        self.lower = InMemoryFileSystemService({"/etc/nginx/nginx.conf": "workers 1;\n"})
+        self.queries = SimulatedEngineService(installed={"nginx"}, running={"nginx"})
+        self.host = create_plan_host(self.lower, self.queries)
+        self.maxDiff = None
+
+    def test_plan_collects_changes_and_commands(self):
+        """Verifies writes and commands are recorded without reaching the server."""
+        # Arrange
+        self.host.file_system.write_text("/etc/nginx/nginx.conf", "workers 4;\n")
+        self.host.engine.execute_raw_command("sudo systemctl reload nginx")
+
+        # Act
+        result = self.host.plan()
+
+        # Assert
+        self.assertEqual(
+            [
+                [change.path for change in result.changes],
+                result.commands,
+                result.reloads(),
+                self.lower.read_text("/etc/nginx/nginx.conf").data,
+                self.queries.commands,
+            ],
+            [
+                ["/etc/nginx/nginx.conf"],
+                ["sudo systemctl reload nginx"],
+                ["nginx"],
+                "workers 1;\n",
+                [],
+            ],
+        )
+
+    def test_engine_answers_queries_from_the_server(self):
+        """Verifies package and unit queries reflect the server being planned."""
+        # Act
+        result = [
+            self.host.engine.is_installed("nginx"),
+            self.host.engine.is_installed("dnsmasq"),
+            self.host.engine.is_running("nginx").data,
+            self.host.engine.is_running("dnsmasq").data,
+        ]
+
+        # Assert
+        self.assertEqual(result, [True, False, True, False])
+
+    def test_artifacts_carry_modes_and_owners_of_the_run(self):
+        """Verifies compiled files keep the mode and owner the commands gave them."""
+        # Arrange
+        self.host.file_system.write_text("/srv/postgres/conf/postgresql.conf", "port = 5432\n")
+        self.host.file_system.write_text("/etc/nginx/nginx.conf", "workers 4;\n")
+        self.host.file_system.write_text("/etc/wireguard/server.key", "secret\n")
+        self.host.engine.execute_raw_command(
+            "sudo chown 999:999 /srv/postgres/conf/postgresql.conf "
+            "&& sudo chmod 0640 /srv/postgres/conf/postgresql.conf"
+        )
+
+        # Act
+        result = self.host.artifacts()
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                BundleArtifact("/etc/nginx/nginx.conf", "workers 4;\n"),
+                BundleArtifact(
+                    "/srv/postgres/conf/postgresql.conf", "port = 5432\n", 0o640, "999:999"
+                ),
+            ],
+        )
+
+    def test_report_shows_diffs_commands_and_redundant_restarts(self):
+        """Verifies the report lists every diff, command and reload."""
+        # Arrange
+        notifications = MockNotificationsService()
+        self.host.file_system.write_text("/etc/nginx/nginx.conf", "workers 4;\n")
+        self.host.engine.execute_raw_command("sudo systemctl restart dnsmasq")
+
+        # Act
+        self.host.report(notifications)
+
+        # Assert
+        self.assertEqual(
+            notifications.params,
+            [
+                {
+                    "text": "--- a/etc/nginx/nginx.conf\n+++ b/etc/nginx/nginx.conf\n"
+                    "@@ -1 +1 @@\n-workers 1;\n+workers 4;",
+                    "type": "info",
+                },
+                {"text": "Plan: 1 files would change.", "type": "info"},
+                {"text": "Plan: 1 commands would run:", "type": "info"},
+                {"text": "\tsudo systemctl restart dnsmasq", "type": "info"},
+                {"text": "Plan: reloads needed: nginx", "type": "info"},
+                {
+                    "text": "Plan: restarted without a configuration change: dnsmasq",
+                    "type": "warning",
+                },
+            ],
+        )
+
+    def test_daemon_json_merge_is_not_a_redundant_restart(self):
+        """Verifies a daemon.json merge shows as a change that explains the Docker restart."""
+        # Arrange
+        merge_docker_daemon_json(
+            self.host.file_system, lambda daemon: add_unique_value(daemon, "dns", "10.10.0.1")
+        )
+        self.host.engine.execute_raw_command(restart_docker_on_daemon_json_change_command())
+
+        # Act
+        result = self.host.plan()
+
+        # Assert
+        self.assertEqual(
+            [[change.path for change in result.changes], result.redundant_restarts()],
+            [["/etc/docker/daemon.json"], []],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
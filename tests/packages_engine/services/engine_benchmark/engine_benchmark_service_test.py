@@ -0,0 +1,88 @@
+"""Tests for the EngineBenchmarkService class and its in-memory hosts."""
+
+import unittest
+from pathlib import Path
+
+from packages_engine.models.benchmark import EngineBenchmarkPlan
+from packages_engine.services.engine_benchmark import (
+    EngineBenchmarkService,
+    build_engine_fixture,
+)
+
+DATA_DIR = str(Path(__file__).resolve().parents[4] / "data")
+
+
+class TestEngineBenchmarkService(unittest.TestCase):
+    """Test suite for EngineBenchmarkService."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_fixture_holds_clients_and_templates(self):
+        """Verifies the host has the stored configuration, templates and client files."""
+        # Act
+        fixture = build_engine_fixture({"wireguard/wg0.shared.conf": "[Interface]"}, 300)
+
+        # Assert
+        file_system = fixture.file_system
+        self.assertEqual(
+            [
+                len(fixture.config.wireguard_client_names),
+                file_system.read_text("/usr/local/share/srv/data/wireguard/wg0.shared.conf").data,
+                file_system.read_text("/etc/wireguard/clients/client00299.ip").data,
+                file_system.read_json("/usr/local/share/args/configuration_data.json").data[
+                    "num_wireguard_clients"
+                ],
+            ],
+            [300, "[Interface]", "10.10.1.45", 300],
+        )
+
+    def test_run_measures_every_case_per_client_count(self):
+        """Verifies each case completes on the shipped templates and is measured."""
+        # Act
+        result = EngineBenchmarkService().run(EngineBenchmarkPlan(DATA_DIR, [2, 20], repeats=1))
+
+        # Assert
+        self.assertTrue(result.success, result.message)
+        assert result.data is not None
+        self.assertEqual(
+            [case.key for case in result.data.cases],
+            [
+                "raw_string_reader/2",
+                "raw_string_reader/20",
+                "wireguard_server_reader/2",
+                "wireguard_server_reader/20",
+                "wireguard_shared_reader/2",
+                "wireguard_shared_reader/20",
+                "configuration_data_from_object/2",
+                "configuration_data_from_object/20",
+                "configuration_data_as_object/2",
+                "configuration_data_as_object/20",
+                "configure_command/2",
+                "configure_command/20",
+            ],
+        )
+        self.assertTrue(all(case.seconds > 0 and case.peak_bytes > 0 for case in result.data.cases))
+
+    def test_run_fails_when_a_case_does_not_complete(self):
+        """Verifies a case reporting an incomplete run fails the benchmark."""
+        # Arrange
+        service = EngineBenchmarkService()
+        service.cases = {"stops_early": lambda fixture: lambda: False}
+
+        # Act
+        result = service.run(EngineBenchmarkPlan(DATA_DIR, [2], repeats=1))
+
+        # Assert
+        self.assertEqual(
+            [result.success, result.message],
+            [False, "Case stops_early did not complete with 2 clients"],
+        )
+
+    def test_run_fails_without_templates(self):
+        """Verifies a missing data directory fails the benchmark."""
+        # Act
+        result = EngineBenchmarkService().run(EngineBenchmarkPlan("/nonexistent", [2]))
+
+        # Assert
+        self.assertEqual(result.message, "No templates found in /nonexistent")
@@ -0,0 +1,107 @@
+"""Tests for the InMemoryFileSystemService class."""
+
+import unittest
+
+from packages_engine.services.file_system import InMemoryFileSystemService
+
+
+class TestInMemoryFileSystemService(unittest.TestCase):
+    """Test suite for InMemoryFileSystemService."""
+
+    def setUp(self):
+        self.file_system = InMemoryFileSystemService({"/etc/wireguard/server.ip": "10.10.0.1"})
+        self.maxDiff = None
+
+    def test_read_text_of_initial_files(self):
+        """Verifies initial files are readable through normalized paths."""
+        # Act
+        result = self.file_system.read_text("/etc/./wireguard//server.ip")
+
+        # Assert
+        self.assertEqual([result.success, result.data], [True, "10.10.0.1"])
+
+    def test_read_text_of_missing_file_and_directory(self):
+        """Verifies missing paths and directories cannot be read as files."""
+        # Act
+        result = [
+            self.file_system.read_text("/etc/missing").message,
+            self.file_system.read_text("/etc/wireguard").message,
+        ]
+
+        # Assert
+        self.assertEqual(
+            result,
+            ["Path /etc/missing does not exist", "Path /etc/wireguard is not a file"],
+        )
+
+    def test_write_text_creates_parent_directories(self):
+        """Verifies written files make their parents exist."""
+        # Act
+        self.file_system.write_text("/srv/clients/laptop/wg0.conf", "[Interface]")
+
+        # Assert
+        self.assertEqual(
+            [self.file_system.path_exists(path) for path in ("/srv", "/srv/clients/laptop")],
+            [True, True],
+        )
+
+    def test_json_round_trip(self):
+        """Verifies JSON is stored as text and parsed back."""
+        # Act
+        self.file_system.write_json("/args/data.json", {"clients": ["laptop"]})
+        result = self.file_system.read_json("/args/data.json")
+
+        # Assert
+        self.assertEqual(
+            [self.file_system.files["/args/data.json"], result.data],
+            ['{"clients": ["laptop"]}', {"clients": ["laptop"]}],
+        )
+
+    def test_read_json_of_invalid_text(self):
+        """Verifies invalid JSON fails to read."""
+        # Act
+        result = self.file_system.read_json("/etc/wireguard/server.ip")
+
+        # Assert
+        self.assertFalse(result.success)
+
+    def test_make_dir_over_file_fails(self):
+        """Verifies a file cannot become a directory."""
+        # Act
+        result = self.file_system.make_dir("/etc/wireguard/server.ip")
+
+        # Assert
+        self.assertFalse(result.success)
+
+    def test_chmod_records_mode_of_existing_paths(self):
+        """Verifies modes are recorded and missing paths fail."""
+        # Act
+        result = [
+            self.file_system.chmod("/etc/wireguard/server.ip", 0o600).success,
+            self.file_system.chmod("/etc/missing", 0o600).success,
+        ]
+
+        # Assert
+        self.assertEqual(
+            [result, self.file_system.modes], [[True, False], {"/etc/wireguard/server.ip": 0o600}]
+        )
+
+    def test_copy_and_remove_directory(self):
+        """Verifies directories are copied recursively and removed with their contents."""
+        # Arrange
+        self.file_system.make_dir("/etc/wireguard/clients")
+
+        # Act
+        self.file_system.copy_path("/etc/wireguard", "/backup/wireguard")
+        self.file_system.remove_location("/etc/wireguard")
+
+        # Assert
+        self.assertEqual(
+            [
+                self.file_system.read_text("/backup/wireguard/server.ip").data,
+                self.file_system.path_exists("/backup/wireguard/clients"),
+                self.file_system.path_exists("/etc/wireguard"),
+                self.file_system.path_exists("/etc"),
+            ],
+            ["10.10.0.1", True, False, True],
+        )
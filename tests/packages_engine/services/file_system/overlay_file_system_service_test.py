@@ -0,0 +1,124 @@
+"""Tests for the OverlayFileSystemService class."""
+
+import unittest
+
+from packages_engine.models.plan import FileChange
+from packages_engine.services.file_system import (
+    InMemoryFileSystemService,
+    OverlayFileSystemService,
+)
+
+
+class TestOverlayFileSystemService(unittest.TestCase):
+    """Test suite for OverlayFileSystemService."""
+
+    def setUp(self):
+        self.lower = InMemoryFileSystemService(
+            {
+                "/etc/nginx/nginx.conf": "worker_processes 1;\n",
+                "/etc/dnsmasq.d/internal.conf": "port=53\n",
+            }
+        )
+        self.file_system = OverlayFileSystemService(self.lower)
+        self.maxDiff = None
+
+    def test_reads_fall_through_to_the_lower_file_system(self):
+        """Verifies files not written through the overlay come from below."""
+        # Act
+        result = self.file_system.read_text("/etc/nginx//nginx.conf")
+
+        # Assert
+        self.assertEqual([result.success, result.data], [True, "worker_processes 1;\n"])
+
+    def test_writes_stay_in_the_overlay(self):
+        """Verifies writes are visible through the overlay only."""
+        # Act
+        self.file_system.write_text("/etc/nginx/nginx.conf", "worker_processes 4;\n")
+        self.file_system.write_json("/srv/stack/state.json", {"ready": True})
+
+        # Assert
+        self.assertEqual(
+            [
+                self.file_system.read_text("/etc/nginx/nginx.conf").data,
+                self.file_system.read_json("/srv/stack/state.json").data,
+                self.file_system.path_exists("/srv/stack"),
+                self.lower.read_text("/etc/nginx/nginx.conf").data,
+                self.lower.path_exists("/srv/stack"),
+            ],
+            ["worker_processes 4;\n", {"ready": True}, True, "worker_processes 1;\n", False],
+        )
+
+    def test_removed_paths_hide_the_lower_files(self):
+        """Verifies removals shadow the lower file system without touching it."""
+        # Act
+        self.file_system.remove_location("/etc/dnsmasq.d")
+
+        # Assert
+        self.assertEqual(
+            [
+                self.file_system.path_exists("/etc/dnsmasq.d/internal.conf"),
+                self.file_system.read_text("/etc/dnsmasq.d/internal.conf").success,
+                self.lower.path_exists("/etc/dnsmasq.d/internal.conf"),
+            ],
+            [False, False, True],
+        )
+
+    def test_chmod_requires_an_existing_path(self):
+        """Verifies modes are recorded for existing paths only."""
+        # Act
+        result = [
+            self.file_system.chmod("/etc/nginx/nginx.conf", 0o640).success,
+            self.file_system.chmod("/etc/missing", 0o640).success,
+        ]
+
+        # Assert
+        self.assertEqual(
+            [result, self.file_system.modes], [[True, False], {"/etc/nginx/nginx.conf": 0o640}]
+        )
+
+    def test_copy_path_copies_lower_files_and_overlay_directories(self):
+        """Verifies copies read through the overlay and cannot list lower directories."""
+        # Arrange
+        self.file_system.write_text("/srv/clients/laptop/wg0.conf", "[Interface]\n")
+
+        # Act
+        result = [
+            self.file_system.copy_path("/etc/nginx/nginx.conf", "/tmp/nginx.conf").success,
+            self.file_system.copy_path("/srv/clients", "/srv/archive").success,
+            self.file_system.copy_path("/etc/dnsmasq.d", "/tmp/dnsmasq.d").success,
+        ]
+
+        # Assert
+        self.assertEqual(
+            [
+                result,
+                self.file_system.read_text("/tmp/nginx.conf").data,
+                self.file_system.read_text("/srv/archive/laptop/wg0.conf").data,
+            ],
+            [[True, True, False], "worker_processes 1;\n", "[Interface]\n"],
+        )
+
+    def test_changes_lists_created_changed_and_removed_files(self):
+        """Verifies changes compare the overlay with the lower file system."""
+        # Arrange
+        self.file_system.write_text("/etc/nginx/nginx.conf", "worker_processes 1;\n")
+        self.file_system.write_text("/etc/wireguard/wg0.conf", "[Interface]\n")
+        self.file_system.chmod("/etc/wireguard/wg0.conf", 0o600)
+        self.file_system.remove_location("/etc/dnsmasq.d/internal.conf")
+        self.file_system.remove_location("/etc/missing.conf")
+
+        # Act
+        result = self.file_system.changes()
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                FileChange("/etc/dnsmasq.d/internal.conf", "port=53\n", None),
+                FileChange("/etc/wireguard/wg0.conf", None, "[Interface]\n", 0o600),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Tests for HostResourcesService."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from packages_engine.models import OperationResult
+from packages_engine.services.file_system.file_system_service_mock import MockFileSystemService
+from packages_engine.services.host_resources import HostResourcesService
+
+
+class TestHostResourcesService(unittest.TestCase):
+    """Test suite for HostResourcesService."""
+
+    file_system: MockFileSystemService
+    service: HostResourcesService
+
+    def setUp(self):
+        self.file_system = MockFileSystemService()
+        self.service = HostResourcesService(self.file_system)
+
+    def test_memory_total_bytes_reads_meminfo(self):
+        """Verifies MemTotal is parsed from /proc/meminfo and converted to bytes."""
+        # Arrange
+        self.file_system.read_text_result = OperationResult[str].succeed(
+            "MemTotal:        4028288 kB\nMemFree:          123456 kB\n"
+        )
+
+        # Act
+        result = self.service.memory_total_bytes()
+
+        # Assert
+        self.assertEqual(result, OperationResult[int].succeed(4028288 * 1024))
+        self.assertEqual(self.file_system.read_text_params, ["/proc/meminfo"])
+
+    def test_memory_total_bytes_missing_entry_fails(self):
+        """Verifies missing MemTotal entry results in failure."""
+        # Arrange
+        self.file_system.read_text_result = OperationResult[str].succeed("MemFree: 1 kB\n")
+
+        # Act
+        result = self.service.memory_total_bytes()
+
+        # Assert
+        self.assertFalse(result.success)
+
+    def test_memory_total_bytes_read_failure_is_propagated(self):
+        """Verifies read failure propagates as failed result."""
+        # Arrange
+        self.file_system.read_text_result = OperationResult[str].fail("Failure")
+
+        # Act
+        result = self.service.memory_total_bytes()
+
+        # Assert
+        self.assertEqual(result, OperationResult[int].fail("Failure"))
+
+    @patch("os.cpu_count", return_value=None)
+    def test_cpu_count_defaults_to_one(self, _):
+        """Verifies unknown CPU count falls back to a single CPU."""
+        # Act
+        result = self.service.cpu_count()
+
+        # Assert
+        self.assertEqual(result, 1)
+
+    @patch("os.cpu_count", return_value=8)
+    def test_cpu_count(self, _):
+        """Verifies CPU count comes from the runtime."""
+        # Act
+        result = self.service.cpu_count()
+
+        # Assert
+        self.assertEqual(result, 8)
+
+    def _make_block_devices(self, root: str, devices: dict[str, str]):
+        for device, flag in devices.items():
+            queue_dir = Path(root) / device / "queue"
+            queue_dir.mkdir(parents=True)
+            (queue_dir / "rotational").write_text(flag, encoding="utf-8")
+            self.file_system.read_text_result_map[(queue_dir / "rotational").as_posix()] = (
+                OperationResult[str].succeed(flag)
+            )
+
+    def test_storage_is_rotational_for_hdd(self):
+        """Verifies a rotational physical disk is detected."""
+        with tempfile.TemporaryDirectory() as root:
+            # Arrange
+            self._make_block_devices(root, {"nvme0n1": "0\n", "sda": "1\n"})
+            service = HostResourcesService(self.file_system, root)
+
+            # Act
+            result = service.storage_is_rotational()
+
+        # Assert
+        self.assertTrue(result)
+
+    def test_storage_is_not_rotational_for_ssd_only(self):
+        """Verifies virtual devices are ignored and SSD only hosts are not rotational."""
+        with tempfile.TemporaryDirectory() as root:
+            # Arrange
+            self._make_block_devices(root, {"nvme0n1": "0\n", "loop0": "1\n", "sr0": "1\n"})
+            service = HostResourcesService(self.file_system, root)
+
+            # Act
+            result = service.storage_is_rotational()
+
+        # Assert
+        self.assertFalse(result)
+
+    @patch("resource.getrlimit", return_value=(1024, 524288))
+    def test_open_files_limit_uses_hard_limit(self, _):
+        """Verifies the hard open files limit is returned."""
+        # Act
+        result = self.service.open_files_limit()
+
+        # Assert
+        self.assertEqual(result, 524288)
+
+    @patch("resource.getrlimit", return_value=(1024, -1))
+    def test_open_files_limit_unlimited(self, _):
+        """Verifies an unlimited hard limit is capped."""
+        # Act
+        result = self.service.open_files_limit()
+
+        # Assert
+        self.assertEqual(result, 1048576)
+
+    def test_disk_free_bytes_uses_nearest_existing_parent(self):
+        """Verifies a missing path is resolved to its nearest existing parent."""
+        with tempfile.TemporaryDirectory() as root:
+            # Arrange
+            with patch("shutil.disk_usage") as disk_usage:
+                disk_usage.return_value.free = 123456
+
+                # Act
+                result = self.service.disk_free_bytes(f"{root}/cache/nginx/gitea")
+
+        # Assert
+        self.assertEqual(result, 123456)
+        disk_usage.assert_called_once_with(Path(root))
+
+    @patch("shutil.disk_usage", side_effect=OSError("unavailable"))
+    def test_disk_free_bytes_failure_returns_zero(self, _):
+        """Verifies an unreadable filesystem reports no free space."""
+        # Act
+        result = self.service.disk_free_bytes("/")
+
+        # Assert
+        self.assertEqual(result, 0)
+
+    def test_network_interfaces_are_sorted(self):
+        """Verifies interfaces are listed from the sysfs directory in a stable order."""
+        with tempfile.TemporaryDirectory() as root:
+            # Arrange
+            for name in ("wg0", "eth0", "br-vpnfwd"):
+                (Path(root) / name).mkdir()
+            service = HostResourcesService(self.file_system, sys_class_net_dir=root)
+
+            # Act
+            result = service.network_interfaces()
+
+        # Assert
+        self.assertEqual(result, ["br-vpnfwd", "eth0", "wg0"])
+
+    def test_network_interfaces_missing_directory_is_empty(self):
+        """Verifies an unreadable sysfs directory reports no interfaces."""
+        # Arrange
+        service = HostResourcesService(self.file_system, sys_class_net_dir="/nonexistent/net")
+
+        # Act
+        result = service.network_interfaces()
+
+        # Assert
+        self.assertEqual(result, [])
@@ -0,0 +1,219 @@
+"""Tests for HttpBenchmarkService against a local stand-in HTTP server."""
+
+import socket
+import socketserver
+import threading
+import time
+import unittest
+
+from packages_engine.models.benchmark import HttpBenchmarkPlan, HttpRequestSpec, LatencySummary
+from packages_engine.services.http_benchmark import HttpBenchmarkService
+
+
+class StandInHandler(socketserver.StreamRequestHandler):
+    """Answers keep-alive HTTP/1.1 requests by path.
+
+    `/missing` gets a 404, `/slow` answers after half a second and every
+    other path gets a 200 with a two byte body, which HEAD leaves out.
+    """
+
+    server: "StandInHttpServer"
+
+    def handle(self):
+        self.server.connections += 1
+        while True:
+            request_line = self.rfile.readline()
+            if not request_line:
+                return
+            close = False
+            while (header := self.rfile.readline()) not in (b"\r\n", b""):
+                close = close or header.lower() == b"connection: close\r\n"
+            method, path = request_line.split()[:2]
+            if path == b"/slow":
+                time.sleep(0.5)
+            status = b"404 Not Found" if path == b"/missing" else b"200 OK"
+            connection = b"close" if close else b"keep-alive"
+            self.wfile.write(
+                b"HTTP/1.1 " + status + b"\r\nContent-Length: 2\r\n"
+                b"Connection: " + connection + b"\r\n\r\n" + (b"" if method == b"HEAD" else b"ok")
+            )
+            if close:
+                return
+
+
+class StandInHttpServer(socketserver.ThreadingTCPServer):
+    """Threaded HTTP server on 127.0.0.1 counting accepted connections."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.port = self.server_address[1]
+        self.connections = 0
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class TestHttpBenchmarkService(unittest.TestCase):
+    """Test suite for HttpBenchmarkService."""
+
+    def setUp(self):
+        self.service = HttpBenchmarkService()
+        self.maxDiff = None
+
+    def test_keep_alive_reuses_one_connection_per_worker(self):
+        """Verifies every request completes over one connection per worker."""
+        # Arrange
+        with StandInHttpServer() as server:
+            plan = HttpBenchmarkPlan(
+                "127.0.0.1",
+                server.port,
+                [HttpRequestSpec("GET", "/", 3), HttpRequestSpec("HEAD", "/api/v1/version")],
+                concurrency=2,
+                total_requests=20,
+            )
+
+            # Act
+            result = self.service.run(plan)
+
+        # Assert
+        assert result.data is not None
+        report = result.data
+        self.assertEqual(
+            [
+                result.success,
+                report.target,
+                report.requests,
+                report.failed,
+                report.connections_opened,
+                server.connections,
+                report.bytes_received,
+                report.status_counts,
+                report.errors,
+                report.histogram.total,
+                [(r.method, r.path, r.requests, r.failed) for r in report.per_request],
+            ],
+            [
+                True,
+                f"http://127.0.0.1:{server.port}",
+                20,
+                0,
+                2,
+                2,
+                30,
+                {"200": 20},
+                {},
+                20,
+                [("GET", "/", 15, 0), ("HEAD", "/api/v1/version", 5, 0)],
+            ],
+        )
+
+    def test_without_keep_alive_each_request_connects(self):
+        """Verifies a new connection is opened for every request."""
+        # Arrange
+        with StandInHttpServer() as server:
+            plan = HttpBenchmarkPlan(
+                "127.0.0.1",
+                server.port,
+                [HttpRequestSpec("GET", "/")],
+                concurrency=3,
+                total_requests=9,
+                keep_alive=False,
+            )
+
+            # Act
+            result = self.service.run(plan)
+
+        # Assert
+        assert result.data is not None
+        self.assertEqual(
+            [result.data.requests, result.data.connections_opened, server.connections], [9, 9, 9]
+        )
+
+    def test_error_breakdown(self):
+        """Verifies 4xx responses and timeouts both count as failures."""
+        # Arrange
+        with StandInHttpServer() as server:
+            plan = HttpBenchmarkPlan(
+                "127.0.0.1",
+                server.port,
+                [
+                    HttpRequestSpec("GET", "/"),
+                    HttpRequestSpec("GET", "/missing"),
+                    HttpRequestSpec("GET", "/slow"),
+                ],
+                concurrency=1,
+                total_requests=3,
+                timeout_seconds=0.2,
+            )
+
+            # Act
+            result = self.service.run(plan)
+
+        # Assert
+        assert result.data is not None
+        report = result.data
+        self.assertEqual(
+            [
+                report.requests,
+                report.failed,
+                report.status_counts,
+                report.errors,
+                report.latency.count,
+                [r.failed for r in report.per_request],
+            ],
+            [3, 2, {"200": 1, "404": 1}, {"timeout": 1}, 2, [0, 1, 1]],
+        )
+
+    def test_refused_connections_are_reported(self):
+        """Verifies requests to a closed port are recorded as connection errors."""
+        # Arrange
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        plan = HttpBenchmarkPlan(
+            "127.0.0.1", port, [HttpRequestSpec("GET", "/")], concurrency=2, total_requests=4
+        )
+
+        # Act
+        result = self.service.run(plan)
+
+        # Assert
+        assert result.data is not None
+        self.assertEqual(
+            [
+                result.data.failed,
+                result.data.connections_opened,
+                result.data.errors,
+                result.data.latency,
+            ],
+            [4, 0, {"ConnectionRefusedError": 4}, LatencySummary(0, 0.0, 0.0, 0.0, 0.0)],
+        )
+
+    def test_invalid_plans_fail(self):
+        """Verifies an empty request mix and a missing CA file fail before sending."""
+        # Act
+        result = [
+            self.service.run(HttpBenchmarkPlan("127.0.0.1", 80, [])),
+            self.service.run(
+                HttpBenchmarkPlan(
+                    "127.0.0.1",
+                    443,
+                    [HttpRequestSpec("GET", "/")],
+                    use_tls=True,
+                    ca_file="/nonexistent/ca.pem",
+                )
+            ),
+        ]
+
+        # Assert
+        self.assertEqual([r.success for r in result], [False, False])
+        self.assertEqual(result[0].message, "No requests to send")
+        self.assertTrue(result[1].message.startswith("Loading CA /nonexistent/ca.pem failed"))
@@ -0,0 +1,143 @@
+"""Tests for the HTTP benchmark request and response framing."""
+
+import asyncio
+import unittest
+
+from packages_engine.models.benchmark import HttpRequestSpec
+from packages_engine.services.http_benchmark import (
+    HttpResponse,
+    build_request,
+    parse_request_mix,
+    request_schedule,
+)
+from packages_engine.services.http_benchmark.http_wire import read_response
+
+
+def read(raw: bytes, method: str = "GET") -> tuple[HttpResponse, bytes]:
+    """Read one response from raw bytes and return it with the unread rest."""
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        response = await read_response(reader, method)
+        return response, await reader.read()
+
+    return asyncio.run(run())
+
+
+class TestHttpWire(unittest.TestCase):
+    """Test suite for the HTTP framing helpers."""
+
+    def test_build_request(self):
+        """Verifies a bodyless HTTP/1.1 request with Host and Connection headers."""
+        # Act
+        result = build_request(
+            HttpRequestSpec("GET", "/explore/repos"), "gitea.internal.app", False
+        )
+
+        # Assert
+        self.assertEqual(
+            result,
+            b"GET /explore/repos HTTP/1.1\r\n"
+            b"Host: gitea.internal.app\r\n"
+            b"User-Agent: http-benchmark\r\n"
+            b"Accept: */*\r\n"
+            b"Connection: close\r\n"
+            b"\r\n",
+        )
+
+    def test_content_length_body_is_drained(self):
+        """Verifies the body is consumed and the next response is left unread."""
+        # Act
+        result = read(b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhelloHTTP/1.1")
+
+        # Assert
+        self.assertEqual(result, (HttpResponse(200, 5, True), b"HTTP/1.1"))
+
+    def test_chunked_body(self):
+        """Verifies chunked bodies including trailers are consumed."""
+        # Act
+        result = read(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"4\r\nabcd\r\n3;ext=1\r\nefg\r\n0\r\nX-Trailer: 1\r\n\r\nrest"
+        )
+
+        # Assert
+        self.assertEqual(result, (HttpResponse(200, 7, True), b"rest"))
+
+    def test_head_and_not_modified_have_no_body(self):
+        """Verifies HEAD responses and 304s are read without a body."""
+        # Act
+        result = [
+            read(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n", "HEAD"),
+            read(b"HTTP/1.1 304 Not Modified\r\n\r\n"),
+        ]
+
+        # Assert
+        self.assertEqual(
+            result, [(HttpResponse(200, 0, True), b""), (HttpResponse(304, 0, True), b"")]
+        )
+
+    def test_connection_reuse(self):
+        """Verifies close headers, HTTP/1.0 and read-to-close bodies end the connection."""
+        # Act
+        result = [
+            read(b"HTTP/1.1 404 Not Found\r\nConnection: close\r\nContent-Length: 0\r\n\r\n")[0],
+            read(b"HTTP/1.0 200 OK\r\nContent-Length: 0\r\n\r\n")[0],
+            read(b"HTTP/1.0 200 OK\r\nConnection: keep-alive\r\nContent-Length: 0\r\n\r\n")[0],
+            read(b"HTTP/1.1 200 OK\r\n\r\nuntil close")[0],
+        ]
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                HttpResponse(404, 0, False),
+                HttpResponse(200, 0, False),
+                HttpResponse(200, 0, True),
+                HttpResponse(200, 11, False),
+            ],
+        )
+
+    def test_invalid_status_line(self):
+        """Verifies a non HTTP response raises ValueError."""
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            read(b"SSH-2.0-OpenSSH_9.6\r\n\r\n")
+
+    def test_request_schedule_spreads_by_weight(self):
+        """Verifies weighted requests are interleaved rather than sent in blocks."""
+        # Arrange
+        home = HttpRequestSpec("GET", "/", 3)
+        version = HttpRequestSpec("GET", "/api/v1/version", 1)
+
+        # Act
+        result = [spec.path for spec in request_schedule([home, version], 8)]
+
+        # Assert
+        self.assertEqual(
+            result, ["/", "/", "/api/v1/version", "/", "/", "/", "/api/v1/version", "/"]
+        )
+
+    def test_parse_request_mix(self):
+        """Verifies methods default to GET and weights to 1."""
+        # Act
+        result = parse_request_mix("GET /:5, head /api/v1/version:2,/explore/repos")
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                HttpRequestSpec("GET", "/", 5),
+                HttpRequestSpec("HEAD", "/api/v1/version", 2),
+                HttpRequestSpec("GET", "/explore/repos", 1),
+            ],
+        )
+
+    def test_parse_request_mix_rejects_invalid_entries(self):
+        """Verifies missing paths and non positive weights raise ValueError."""
+        # Act / Assert
+        for text in ["GET home:1", "GET /:0", "GET /:x"]:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_request_mix(text)
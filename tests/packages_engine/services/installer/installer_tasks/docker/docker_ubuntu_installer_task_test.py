@@ -125,12 +125,15 @@ class TestDockerUbuntuInstallerTask(unittest.TestCase):
                     # 0) Remove conflicting packages (safe to run even if none present)
                     "for pkg in docker.io docker-doc docker-compose docker-compose-v2 podman-docker "
                     "containerd runc; do sudo apt-get -y remove $pkg >/dev/null 2>&1 || true; done",
-                    # 1) Keyring dir + official key (per docs)
+                    # 1) Keyring dir + official key (per docs), the offline bundle ships the packages
                     "sudo install -m 0755 -d /etc/apt/keyrings",
+                    "test -f /etc/apt/sources.list.d/offline-bundle.list || "
                     "test -f /etc/apt/keyrings/docker.asc || sudo curl -fsSL "
                     "https://download.docker.com/linux/ubuntu/gpg -o /etc/apt/keyrings/docker.asc",
+                    "test -f /etc/apt/sources.list.d/offline-bundle.list || "
                     "sudo chmod a+r /etc/apt/keyrings/docker.asc",
                     # 2) Repo line (idempotent write)
+                    "test -f /etc/apt/sources.list.d/offline-bundle.list || "
                     "grep -qs '^deb .*download.docker.com/linux/ubuntu' "
                     "/etc/apt/sources.list.d/docker.list || "
                     'echo "deb [arch=$(dpkg --print-architecture) signed-by=/etc/apt/keyrings/docker.asc] '
@@ -138,6 +141,7 @@ class TestDockerUbuntuInstallerTask(unittest.TestCase):
                     '$(. /etc/os-release && echo \\"${UBUNTU_CODENAME:-$VERSION_CODENAME}\\") stable" | '
                     "sudo tee /etc/apt/sources.list.d/docker.list >/dev/null",
                     # 3) Update indexes NOW that the repo exists
+                    "test -f /etc/apt/sources.list.d/offline-bundle.list || "
                     "sudo DEBIAN_FRONTEND=noninteractive apt-get update",
                     # 4) Install Docker Engine + friends (no recommends keeps it lean)
                     "sudo DEBIAN_FRONTEND=noninteractive apt-get install -y --no-install-recommends "
@@ -0,0 +1,113 @@
+"""Necessary imports for the tests."""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.services.file_system.file_system_service_mock import MockFileSystemService
+from packages_engine.services.installer.installer_tasks.offline_bundle import (
+    OfflineBundleUbuntuInstallerTask,
+)
+from packages_engine.services.notifications.notifications_service_mock import (
+    MockNotificationsService,
+)
+from packages_engine.services.package_controller.package_controller_service_mock import (
+    MockPackageControllerService,
+)
+
+
+class TestOfflineBundleUbuntuInstallerTask(unittest.TestCase):
+    """Offline Bundle Ubuntu Installer Task Tests"""
+
+    notifications: MockNotificationsService
+    file_system: MockFileSystemService
+    controller: MockPackageControllerService
+    task: OfflineBundleUbuntuInstallerTask
+
+    def setUp(self):
+        self.notifications = MockNotificationsService()
+        self.file_system = MockFileSystemService()
+        self.controller = MockPackageControllerService()
+        self.task = OfflineBundleUbuntuInstallerTask(
+            self.notifications, self.file_system, self.controller
+        )
+
+    def test_checks_for_bundle_manifest(self):
+        """Checks for bundle manifest."""
+        # Act
+        self.task.install()
+
+        # Assert
+        self.assertEqual(
+            self.file_system.path_exists_params, ["/usr/local/share/bundle/manifest.json"]
+        )
+
+    def test_nothing_is_done_when_bundle_not_deployed(self):
+        """Nothing is done when bundle not deployed."""
+        # Arrange
+        self.file_system.path_exists_result = False
+
+        # Act
+        result = self.task.install()
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].succeed(True))
+        self.assertEqual(self.controller.run_raw_commands_params, [])
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {"type": "info", "text": "Offline bundle will be registered if it is deployed."},
+                {
+                    "type": "success",
+                    "text": "\tOffline bundle is not deployed. Packages will be downloaded.",
+                },
+            ],
+        )
+
+    def test_correct_commands_executed(self):
+        """Correct commands executed."""
+        # Act
+        self.task.install()
+
+        # Assert
+        self.assertEqual(
+            self.controller.run_raw_commands_params,
+            [
+                [
+                    "cd /usr/local/share/bundle && sha256sum --quiet --strict -c SHA256SUMS",
+                    "echo 'deb [trusted=yes] file:/usr/local/share/bundle/debs ./' | "
+                    "sudo tee /etc/apt/sources.list.d/offline-bundle.list >/dev/null",
+                    "sudo DEBIAN_FRONTEND=noninteractive apt-get update "
+                    "-o Dir::Etc::sourcelist=/etc/apt/sources.list.d/offline-bundle.list "
+                    "-o Dir::Etc::sourceparts=- -o APT::Get::List-Cleanup=0",
+                ]
+            ],
+        )
+
+    def test_notifications_flow_on_failure(self):
+        """Notifications flow on failure."""
+        # Arrange
+        self.controller.run_raw_commands_result = OperationResult[bool].fail("failure")
+
+        # Act
+        self.task.install()
+
+        # Assert
+        self.assertEqual(
+            self.notifications.params,
+            [
+                {"type": "info", "text": "Offline bundle will be registered if it is deployed."},
+                {"type": "error", "text": "Command failed. Message: failure."},
+            ],
+        )
+
+    def test_returns_result_from_packages_controller(self):
+        """Returns result from packages controller."""
+        # Arrange
+        operation_result = OperationResult[bool].fail("failure")
+        self.controller.run_raw_commands_result = operation_result
+
+        # Act
+        result = self.task.install()
+
+        # Assert
+        self.assertEqual(result, operation_result)
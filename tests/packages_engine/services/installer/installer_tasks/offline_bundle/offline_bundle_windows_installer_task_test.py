@@ -0,0 +1,25 @@
+"""Necessary imports for the tests."""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.services.installer.installer_tasks.offline_bundle import (
+    OfflineBundleWindowsInstallerTask,
+)
+
+
+class TestOfflineBundleWindowsInstallerTask(unittest.TestCase):
+    """Tests for the Windows installer task."""
+
+    task: OfflineBundleWindowsInstallerTask
+
+    def setUp(self):
+        self.task = OfflineBundleWindowsInstallerTask()
+
+    def test_returns_unsupported_error(self):
+        """Returns unsupported error."""
+        # Act
+        result = self.task.install()
+
+        # Assert
+        self.assertEqual(result, OperationResult[bool].fail("Not supported"))
@@ -0,0 +1,86 @@
+"""Tests for PathMtuService."""
+
+import unittest
+
+from packages_engine.models import OperationResult
+from packages_engine.services.path_mtu import PathMtuService
+
+
+class StandInPinger:
+    """Answers pings up to a packet size, like a path with that MTU."""
+
+    def __init__(self, path_mtu: int, header_bytes: int = 28):
+        self.path_mtu = path_mtu
+        self.header_bytes = header_bytes
+        self.params: list[tuple[str, int]] = []
+
+    def __call__(self, host: str, payload_bytes: int) -> bool:
+        self.params.append((host, payload_bytes))
+        return payload_bytes + self.header_bytes <= self.path_mtu
+
+
+class TestPathMtuService(unittest.TestCase):
+    """Test suite for PathMtuService."""
+
+    def test_discovers_ethernet_path(self):
+        """Verifies a plain Ethernet path is found at 1500 bytes."""
+        # Arrange
+        pinger = StandInPinger(1500)
+        service = PathMtuService(pinger)
+
+        # Act
+        result = service.discover("203.0.113.10")
+
+        # Assert
+        self.assertEqual(result, OperationResult[int].succeed(1500))
+        self.assertEqual(pinger.params[0], ("203.0.113.10", 1252))
+
+    def test_discovers_pppoe_path(self):
+        """Verifies a PPPoE path is found at 1492 bytes within a few probes."""
+        # Arrange
+        pinger = StandInPinger(1492)
+        service = PathMtuService(pinger)
+
+        # Act
+        result = service.discover("203.0.113.10")
+
+        # Assert
+        self.assertEqual(result, OperationResult[int].succeed(1492))
+        self.assertLessEqual(len(pinger.params), 10)
+
+    def test_ipv6_probes_account_for_the_larger_header(self):
+        """Verifies IPv6 payloads leave room for the 40 byte IPv6 header."""
+        # Arrange
+        pinger = StandInPinger(1480, header_bytes=48)
+        service = PathMtuService(pinger)
+
+        # Act
+        result = service.discover("2001:db8::10")
+
+        # Assert
+        self.assertEqual(result, OperationResult[int].succeed(1480))
+        self.assertEqual(pinger.params[0], ("2001:db8::10", 1232))
+
+    def test_unanswered_probe_fails(self):
+        """Verifies discovery fails when even the smallest probe is not answered."""
+        # Arrange
+        service = PathMtuService(lambda host, payload: False)
+
+        # Act
+        result = service.discover("203.0.113.10")
+
+        # Assert
+        self.assertEqual(
+            result, OperationResult[int].fail("203.0.113.10 did not answer a 1280 byte probe")
+        )
+
+    def test_hostname_fails(self):
+        """Verifies only IP addresses are probed."""
+        # Arrange
+        service = PathMtuService(lambda host, payload: True)
+
+        # Act
+        result = service.discover("vpn.example.com")
+
+        # Assert
+        self.assertEqual(result, OperationResult[int].fail("vpn.example.com is not an IP address"))
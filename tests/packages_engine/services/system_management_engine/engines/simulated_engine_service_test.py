@@ -0,0 +1,198 @@
+"""Tests for the SimulatedEngineService class."""
+
+import unittest
+
+from packages_engine.services.file_system import InMemoryFileSystemService
+from packages_engine.services.system_management_engine.engines import (
+    LatencyDistribution,
+    SimulatedEngineService,
+    SimulatedLatencyModel,
+)
+
+COMPOSE = """services:
+  postgres:
+    container_name: postgres
+  gitea:
+    container_name: "gitea"
+"""
+
+
+class TestSimulatedEngineService(unittest.TestCase):
+    """Test suite for SimulatedEngineService."""
+
+    def setUp(self):
+        self.file_system = InMemoryFileSystemService({"/srv/stack/docker-compose.yml": COMPOSE})
+        self.maxDiff = None
+
+    def test_records_commands_in_order(self):
+        """Verifies every operation is recorded and succeeds."""
+        # Arrange
+        engine = SimulatedEngineService()
+
+        # Act
+        results = [
+            engine.install("nginx").success,
+            engine.start("nginx").success,
+            engine.execute_command(["docker", "compose", "up", "-d"], "/srv/app").success,
+            engine.execute_raw_command("wg show").success,
+        ]
+
+        # Assert
+        self.assertEqual(
+            [results, engine.commands],
+            [
+                [True, True, True, True],
+                [
+                    "apt-get install -y nginx",
+                    "systemctl start nginx",
+                    "cd /srv/app && docker compose up -d",
+                    "wg show",
+                ],
+            ],
+        )
+
+    def test_tracks_installed_and_running_packages(self):
+        """Verifies installs and restarts change what is reported."""
+        # Arrange
+        engine = SimulatedEngineService(installed={"nginx"})
+
+        # Act
+        engine.restart("dnsmasq")
+
+        # Assert
+        self.assertEqual(
+            [
+                engine.is_installed("nginx"),
+                engine.is_installed("dnsmasq"),
+                engine.is_running("dnsmasq").data,
+                engine.is_running("nginx").data,
+            ],
+            [True, False, True, False],
+        )
+
+    def test_applies_unit_and_container_effects(self):
+        """Verifies systemctl, apt and docker lines change the host state."""
+        # Arrange
+        engine = SimulatedEngineService(file_system=self.file_system)
+
+        # Act
+        engine.execute_raw_command("sudo apt-get install -y --no-install-recommends jq curl")
+        engine.execute_raw_command("sudo systemctl enable --now dnsmasq")
+        engine.execute_raw_command(
+            "sudo systemctl enable wg-quick@wg0 && sudo systemctl stop nginx"
+        )
+        engine.execute_raw_command("cd /srv/stack && sudo docker compose up -d --remove-orphans")
+        engine.execute_command(["docker", "run", "-d", "--name", "busybox", "busybox"])
+        engine.execute_command(["docker", "compose", "down"], "/srv/stack")
+
+        # Assert
+        self.assertEqual(
+            [engine.installed, engine.running, engine.enabled, engine.containers],
+            [{"jq", "curl"}, {"dnsmasq"}, {"dnsmasq", "wg-quick@wg0"}, {"busybox"}],
+        )
+
+    def test_applies_file_effects(self):
+        """Verifies keys, openssl outputs, directories and modes are created once."""
+        # Arrange
+        engine = SimulatedEngineService(file_system=self.file_system)
+        key = "/etc/wireguard/server.key"
+        generate = f"test -f {key} || (umask 077 && wg genkey | sudo tee {key} >/dev/null)"
+
+        # Act
+        engine.execute_raw_command(generate)
+        generated_key = self.file_system.files[key]
+        self.file_system.write_text(key, "existing\n")
+        engine.execute_raw_command(generate)
+        engine.execute_raw_command(
+            f"sudo cat {key} | wg pubkey | sudo tee /etc/wireguard/server.pub"
+        )
+        engine.execute_raw_command(f"sudo chmod 600 {key}")
+        engine.execute_raw_command("sudo install -d -m 0700 -o 999 -g 999 /srv/postgres/data")
+        engine.execute_raw_command("openssl req -x509 -new -key ca.key -out /etc/pki/ca.crt")
+
+        # Assert
+        self.assertEqual(
+            [
+                len(generated_key),
+                self.file_system.files[key],
+                self.file_system.path_exists("/etc/wireguard/server.pub"),
+                self.file_system.modes,
+                self.file_system.path_exists("/srv/postgres/data"),
+                self.file_system.files["/etc/pki/ca.crt"].splitlines()[0],
+            ],
+            [
+                45,
+                "existing\n",
+                True,
+                {key: 0o600},
+                True,
+                "-----BEGIN CERTIFICATE-----",
+            ],
+        )
+
+    def test_installs_and_renames_files(self):
+        """Verifies `install /dev/null` creates a file with its mode and owner and `mv` moves it."""
+        # Arrange
+        engine = SimulatedEngineService(file_system=self.file_system)
+        staged = "/etc/nginx/.nginx.conf.bundle-new"
+
+        # Act
+        engine.execute_raw_command(f"sudo install -D -m 0640 -o root -g www /dev/null {staged}")
+        staged_mode = self.file_system.modes.get(staged)
+        self.file_system.write_text(staged, "workers 4;\n")
+        engine.execute_raw_command(f"sudo mv -f {staged} /etc/nginx/nginx.conf")
+
+        # Assert
+        self.assertEqual(
+            [
+                staged_mode,
+                self.file_system.path_exists(staged),
+                self.file_system.files["/etc/nginx/nginx.conf"],
+                engine.owners,
+            ],
+            [0o640, False, "workers 4;\n", {"/etc/nginx/nginx.conf": "root:www"}],
+        )
+
+    def test_records_owners(self):
+        """Verifies chown sets owners of paths and, recursively, of everything below."""
+        # Arrange
+        engine = SimulatedEngineService()
+
+        # Act
+        engine.execute_raw_command("sudo chown 1000:1000 /srv/gitea/config/app.ini")
+        engine.execute_raw_command("sudo chown -R root:root /etc/nginx/staging/")
+
+        # Assert
+        self.assertEqual(
+            [
+                engine.owner_of("/srv/gitea/config/app.ini"),
+                engine.owner_of("/etc/nginx/staging/sites/gitea.app"),
+                engine.owner_of("/srv/gitea/config/other.ini"),
+            ],
+            ["1000:1000", "root:root", None],
+        )
+
+    def test_simulates_latency(self):
+        """Verifies operations take their sampled time and sleep it scaled."""
+        # Arrange
+        slept: list[float] = []
+        latency = SimulatedLatencyModel(
+            {
+                "spawn": LatencyDistribution(0.005),
+                "apt_install": LatencyDistribution(20.0),
+                "systemctl": LatencyDistribution(0.05),
+            }
+        )
+        engine = SimulatedEngineService(latency=latency, time_scale=0.01, sleep=slept.append)
+
+        # Act
+        engine.install("nginx")
+        engine.execute_raw_command("sudo systemctl daemon-reload && sudo systemctl restart nginx")
+
+        # Assert
+        self.assertAlmostEqual(engine.simulated_seconds, 20.11)
+        self.assertEqual(
+            {kind: round(seconds, 6) for kind, seconds in engine.seconds_by_kind().items()},
+            {"spawn": 0.01, "apt_install": 20.0, "systemctl": 0.1},
+        )
+        self.assertEqual([round(seconds, 6) for seconds in slept], [0.20005, 0.00105])
@@ -0,0 +1,70 @@
+"""Tests for the simulated engine's latency model."""
+
+import random
+import unittest
+
+from packages_engine.services.system_management_engine.engines import (
+    LatencyDistribution,
+    SimulatedLatencyModel,
+)
+
+
+class TestSimulatedLatencyModel(unittest.TestCase):
+    """Test suite for SimulatedLatencyModel and LatencyDistribution."""
+
+    def test_kinds_of_command_lines(self):
+        """Verifies every command spawns and each recognized program adds its kind."""
+        # Arrange
+        model = SimulatedLatencyModel()
+
+        # Act
+        result = [
+            model.kinds("sudo apt-get install -y nginx"),
+            model.kinds("sudo apt-get update"),
+            model.kinds("cd /srv/stack && sudo docker compose up -d --remove-orphans"),
+            model.kinds("sudo docker network inspect vpn-internal >/dev/null 2>&1"),
+            model.kinds("sudo systemctl reload nginx || sudo systemctl restart nginx"),
+            model.kinds("sudo cat /etc/wireguard/server.key | wg pubkey | sudo tee server.pub"),
+            model.kinds("sudo install -d -m 0700 /etc/wireguard/wg0"),
+        ]
+
+        # Assert
+        self.assertEqual(
+            result,
+            [
+                ["spawn", "apt_install"],
+                ["spawn"],
+                ["spawn", "docker_compose_up"],
+                ["spawn", "docker"],
+                ["spawn", "systemctl", "systemctl"],
+                ["spawn", "wg"],
+                ["spawn"],
+            ],
+        )
+
+    def test_samples_spread_around_the_median(self):
+        """Verifies fixed latencies, log-normal spread and unknown kinds."""
+        # Arrange
+        model = SimulatedLatencyModel(
+            {"fixed": LatencyDistribution(0.05), "spread": LatencyDistribution(1.0, 0.5)}
+        )
+        rng = random.Random(7)
+
+        # Act
+        spread = sorted(model.sample("spread", rng) for _ in range(1001))
+
+        # Assert
+        self.assertEqual([model.sample("fixed", rng), model.sample("unknown", rng)], [0.05, 0.0])
+        self.assertAlmostEqual(spread[500], 1.0, delta=0.1)
+        self.assertLess(spread[0], 0.5)
+
+    def test_from_object_overrides_defaults(self):
+        """Verifies configured kinds replace the defaults and the rest are kept."""
+        # Act
+        result = SimulatedLatencyModel.from_object({"apt_install": {"median_seconds": 2}})
+
+        # Assert
+        self.assertEqual(
+            [result.latencies["apt_install"], result.latencies["systemctl"]],
+            [LatencyDistribution(2.0, 0.0), SimulatedLatencyModel().latencies["systemctl"]],
+        )
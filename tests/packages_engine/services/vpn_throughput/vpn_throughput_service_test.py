@@ -0,0 +1,169 @@
+"""Tests for VpnThroughputService with client and server over loopback."""
+
+import socket
+import threading
+import unittest
+from typing import Any
+
+from packages_engine.models.benchmark import VpnThroughputPlan
+from packages_engine.services.vpn_throughput import VpnThroughputService
+
+# Pacing time a loaded test machine may lose to late event loop wakeups
+PACING_SLACK_SECONDS = 0.1
+
+
+def free_port() -> int:
+    """Find a port that is free over both TCP and UDP on 127.0.0.1."""
+    while True:
+        with socket.socket() as tcp, socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp:
+            tcp.bind(("127.0.0.1", 0))
+            port = tcp.getsockname()[1]
+            try:
+                udp.bind(("127.0.0.1", port))
+            except OSError:
+                continue
+            return port
+
+
+class LoopbackServer:
+    """Runs VpnThroughputService.serve in a thread and keeps the recorded reports."""
+
+    def __init__(self):
+        self.port = free_port()
+        self.records: list[tuple[str, Any]] = []
+        self.stop = threading.Event()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(
+            target=VpnThroughputService().serve,
+            args=("127.0.0.1", self.port, self.record, self.stop, self.ready),
+            daemon=True,
+        )
+
+    def record(self, address: str, report: Any) -> str:
+        self.records.append((address, report))
+        return "alice"
+
+    def __enter__(self):
+        self.thread.start()
+        self.ready.wait(5)
+        return self
+
+    def __exit__(self, *args):
+        self.stop.set()
+        self.thread.join(5)
+
+
+class TestVpnThroughputService(unittest.TestCase):
+    """Test suite for VpnThroughputService."""
+
+    def setUp(self):
+        self.service = VpnThroughputService()
+        self.maxDiff = None
+
+    def test_tcp_streams(self):
+        """Verifies every TCP stream moves data and the run is recorded under the peer name."""
+        # Arrange
+        with LoopbackServer() as server:
+            plan = VpnThroughputPlan(
+                "127.0.0.1", server.port, "tcp", streams=3, duration_seconds=0.3, rtt_samples=5
+            )
+
+            # Act
+            result = self.service.run_client(plan)
+
+        # Assert
+        assert result.data is not None
+        report = result.data
+        self.assertEqual(
+            [
+                result.success,
+                [stream.stream for stream in report.streams],
+                all(stream.bytes_received > 0 for stream in report.streams),
+                report.idle_rtt.count,
+                report.loaded_rtt.count,
+                report.rtt_errors,
+                report.peer,
+                [(address, record["protocol"]) for address, record in server.records],
+            ],
+            [True, [1, 2, 3], True, 5, 5, {}, "alice", [("127.0.0.1", "tcp")]],
+        )
+        self.assertGreater(report.aggregate_mbps, 0)
+
+    def test_udp_streams_are_paced_and_counted(self):
+        """Verifies UDP streams split the bitrate and the server counts their packets."""
+        # Arrange
+        with LoopbackServer() as server:
+            plan = VpnThroughputPlan(
+                "127.0.0.1",
+                server.port,
+                "udp",
+                streams=2,
+                duration_seconds=0.5,
+                udp_bitrate_mbps=4.8,
+                udp_payload_bytes=1200,
+                rtt_samples=3,
+            )
+
+            # Act
+            result = self.service.run_client(plan)
+
+        # Assert
+        assert result.data is not None
+        streams = result.data.streams
+        # 4.8 Mbit/s of 1200 byte packets over two streams is 250 packets per second each.
+        # The pacer never runs ahead of the schedule, so at most one packet more than the
+        # 0.5 s allow goes out, but a late last tick on a busy machine loses pacing time.
+        packets_per_second = 250
+        highest = int(packets_per_second * 0.5) + 1
+        lowest = int(packets_per_second * (0.5 - PACING_SLACK_SECONDS))
+        self.assertEqual(
+            [lowest <= stream.packets_sent <= highest for stream in streams], [True, True]
+        )
+        self.assertEqual(
+            [stream.packets_received for stream in streams],
+            [stream.packets_sent - stream.packets_lost for stream in streams],
+        )
+        self.assertGreater(min(stream.packets_received for stream in streams), 100)
+        self.assertEqual(result.data.peer, "alice")
+
+    def test_unreachable_server_fails(self):
+        """Verifies a run against a closed port fails with the target in the message."""
+        # Arrange
+        port = free_port()
+        plan = VpnThroughputPlan("127.0.0.1", port, duration_seconds=0.1, rtt_samples=0)
+
+        # Act
+        result = self.service.run_client(plan)
+
+        # Assert
+        self.assertEqual(result.success, False)
+        self.assertTrue(result.message.startswith(f"Connecting to 127.0.0.1:{port} failed"))
+
+    def test_invalid_plans_fail(self):
+        """Verifies unknown protocols and empty runs fail before connecting."""
+        # Act
+        result = [
+            self.service.run_client(VpnThroughputPlan("127.0.0.1", protocol="icmp")),
+            self.service.run_client(VpnThroughputPlan("127.0.0.1", streams=0)),
+        ]
+
+        # Assert
+        self.assertEqual(
+            [(r.success, r.message) for r in result],
+            [(False, "Unsupported protocol icmp"), (False, "Nothing to send")],
+        )
+
+    def test_serve_reports_port_in_use(self):
+        """Verifies serving on a bound port fails instead of raising."""
+        # Arrange
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+            port = taken.getsockname()[1]
+
+            # Act
+            result = self.service.serve("127.0.0.1", port, lambda address, report: "")
+
+        # Assert
+        self.assertEqual(result.success, False)
+        self.assertTrue(result.message.startswith(f"Listening on 127.0.0.1:{port} failed"))
@@ -0,0 +1,67 @@
+"""Tests for the VPN throughput wire format."""
+
+import unittest
+
+from packages_engine.services.vpn_throughput import (
+    UdpStreamStats,
+    decode_datagram,
+    encode_datagram,
+)
+from packages_engine.services.vpn_throughput.vpn_wire import (
+    MODE_SINK,
+    UDP_STATS,
+    decode_hello,
+    encode_hello,
+)
+
+
+class TestVpnWire(unittest.TestCase):
+    """Test suite for the VPN throughput wire format."""
+
+    def test_datagram_round_trip_is_padded(self):
+        """Verifies datagrams decode to their header fields and fill the payload size."""
+        # Act
+        datagram = encode_datagram(0xCAFE, 3, 41, 123456789, 1200)
+
+        # Assert
+        self.assertEqual(
+            [len(datagram), decode_datagram(datagram)], [1200, (0xCAFE, 3, 41, 123456789)]
+        )
+
+    def test_foreign_datagrams_are_ignored(self):
+        """Verifies short datagrams and other magic numbers decode to None."""
+        # Act
+        result = [decode_datagram(b"VPNT"), decode_datagram(b"X" * 64)]
+
+        # Assert
+        self.assertEqual(result, [None, None])
+
+    def test_hello_round_trip(self):
+        """Verifies hellos carry mode, stream and token and reject other protocols."""
+        # Act
+        result = decode_hello(encode_hello(MODE_SINK, 2, 77))
+
+        # Assert
+        self.assertEqual(result, (MODE_SINK, 2, 77))
+        with self.assertRaises(ValueError):
+            decode_hello(b"GET / HTTP/1.1\r\n"[:12])
+
+    def test_stream_stats_count_reordering_and_jitter(self):
+        """Verifies out of order packets are counted and jitter smooths transit changes."""
+        # Arrange
+        stats = UdpStreamStats()
+
+        # Act
+        # Transit times of 5, 5, 5 and 17 ms, the third packet is overtaken
+        stats.record(0, 0, 5_000_000, 100)
+        stats.record(1, 10_000_000, 15_000_000, 100)
+        stats.record(3, 30_000_000, 35_000_000, 100)
+        stats.record(2, 20_000_000, 37_000_000, 100)
+
+        # Assert
+        packets, received, out_of_order, elapsed_ns, jitter_ms = UDP_STATS.unpack(stats.encode())
+        expected_jitter = 0.0
+        for change in (0.0, 0.0, 12.0):
+            expected_jitter += (change - expected_jitter) / 16
+        self.assertEqual([packets, received, out_of_order, elapsed_ns], [4, 400, 1, 32_000_000])
+        self.assertAlmostEqual(jitter_ms, expected_jitter)
@@ -1,4 +1,7 @@
+import sys
+
 from packages_engine.commands import AutostartCommand
+from packages_engine.services.dry_run import create_dry_run_host, parse_dry_run_options
 from packages_engine.services.notifications import NotificationsService
 from packages_engine.services.package_controller import PackageControllerService
 from packages_engine.services.system_management import SystemManagementService
@@ -8,8 +11,13 @@ from packages_engine.services.system_management_engine_locator import (
 
 
 def main():
-    system_management_engine_locator_service = SystemManagementEngineLocatorService()
-    engine = system_management_engine_locator_service.locate_engine()
+    dry_run_options = parse_dry_run_options(sys.argv[1:])
+    dry_run_host = create_dry_run_host(dry_run_options) if dry_run_options else None
+    if dry_run_host:
+        engine = dry_run_host.engine
+    else:
+        system_management_engine_locator_service = SystemManagementEngineLocatorService()
+        engine = system_management_engine_locator_service.locate_engine()
     system_management_service = SystemManagementService(engine)
 
     notifications_service = NotificationsService()
@@ -19,3 +27,6 @@ def main():
     command = AutostartCommand(controller)
 
     command.execute()
+
+    if dry_run_host:
+        dry_run_host.report(notifications_service)
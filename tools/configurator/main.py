@@ -1,6 +1,9 @@
 """Imports for the configurator task."""
 
-from packages_engine.commands import ConfigureCommand
+import sys
+
+from packages_engine.commands import ApplyBundleCommand, CompileBundleCommand, ConfigureCommand
+from packages_engine.services.config_bundle import ConfigBundleService
 from packages_engine.services.configuration import ConfigurationDataReaderService
 from packages_engine.services.configuration.configuration_content_reader import (
     ConfigurationContentReaderService,
@@ -10,83 +13,60 @@ from packages_engine.services.configuration.configuration_content_reader.content
     WireguardServerConfigContentReader,
     WireguardSharedConfigContentReader,
 )
-from packages_engine.services.configuration.configuration_tasks import GenericConfigurationTask
-from packages_engine.services.configuration.configuration_tasks.autostart import (
-    AutostartUbuntuConfigurationTask,
-    AutostartWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.certificates import (
-    CertificatesUbuntuConfigurationTask,
-    CertificatesWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.dnsmasq import (
-    DnsmasqUbuntuConfigurationTask,
-    DnsmasqWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.docker_orchestration import (
-    DockerOrchestrationUbuntuConfigurationTask,
-    DockerOrchestrationWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.docker_resources import (
-    DockerResourcesUbuntuConfigurationTask,
-    DockerResourcesWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.docker_seed_gitea import (
-    DockerSeedGiteaUbuntuConfigurationTask,
-    DockerSeedGiteaWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.docker_setup_gitea_admin import (
-    DockerSetupGiteaAdminUbuntuConfigurationTask,
-    DockerSetupGiteaAdminWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.nftables import (
-    NftablesUbuntuConfigurationTask,
-    NftablesWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.nginx import (
-    NginxUbuntuConfigurationTask,
-    NginxWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.share_certificates import (
-    ShareCertificatesUbuntuConfigurationTask,
-    ShareCertificatesWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.systemd import (
-    SystemdUbuntuConfigurationTask,
-    SystemdWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.wireguard import (
-    WireguardUbuntuConfigurationTask,
-    WireguardWindowsConfigurationTask,
+from packages_engine.services.configuration.configuration_tasks.default_configuration_tasks import (
+    create_default_configuration_tasks,
 )
-from packages_engine.services.configuration.configuration_tasks.wireguard_peers import (
-    WireguardPeersUbuntuConfigurationTask,
-    WireguardPeersWindowsConfigurationTask,
-)
-from packages_engine.services.configuration.configuration_tasks.wireguard_share import (
-    WireguardShareUbuntuConfigurationTask,
-    WireguardShareWindowsConfigurationTask,
+from packages_engine.services.dry_run import (
+    PLAN_FLAG,
+    create_dry_run_host,
+    create_plan_host,
+    parse_dry_run_options,
 )
 from packages_engine.services.file_system import FileSystemService
+from packages_engine.services.host_resources import HostResourcesService
 from packages_engine.services.input_collection import InputCollectionService
 from packages_engine.services.notifications import NotificationsService
 from packages_engine.services.package_controller import PackageControllerService
+from packages_engine.services.path_mtu import PathMtuService
 from packages_engine.services.system_management import SystemManagementService
 from packages_engine.services.system_management_engine_locator import (
     SystemManagementEngineLocatorService,
 )
 
+COMPILE_FLAG = "--compile"
+APPLY_FLAG = "--apply"
+
 
 def main():
-    """Entry point."""
-    system_management_engine_locator_service = SystemManagementEngineLocatorService()
-    engine = system_management_engine_locator_service.locate_engine()
+    """
+    Entry point. With --dry-run, runs against a simulated server instead of this one.
+
+    With --plan, nothing is changed: the diff of every file and the commands
+    the run would apply are shown instead. With --compile, the rendered
+    configuration is written into a signed bundle instead of the server, and
+    --apply installs the changed files of such a bundle without running the tasks.
+    """
+    argv = sys.argv[1:]
+    dry_run_options = parse_dry_run_options(argv)
+    dry_run_host = create_dry_run_host(dry_run_options) if dry_run_options else None
+    if dry_run_host:
+        engine = dry_run_host.engine
+    else:
+        system_management_engine_locator_service = SystemManagementEngineLocatorService()
+        engine = system_management_engine_locator_service.locate_engine()
     system_management_service = SystemManagementService(engine)
+    file_system = (
+        dry_run_host.file_system if dry_run_host else FileSystemService(system_management_service)
+    )
+    planned = PLAN_FLAG in argv or COMPILE_FLAG in argv
+    plan_host = create_plan_host(file_system, engine) if planned else None
+    if plan_host:
+        system_management_service = SystemManagementService(plan_host.engine)
+        file_system = plan_host.file_system
 
     notifications_service = NotificationsService()
 
     input_collection = InputCollectionService(notifications_service)
-    file_system = FileSystemService(system_management_service)
     config_reader = ConfigurationDataReaderService(input_collection, file_system)
 
     wireguard_server_config_reader = WireguardServerConfigContentReader(file_system)
@@ -99,122 +79,27 @@ def main():
         wireguard_shared_config_reader,
     )
     controller = PackageControllerService(system_management_service, notifications_service)
-
-    wireguard_peers = GenericConfigurationTask(
-        WireguardPeersUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        WireguardPeersWindowsConfigurationTask(),
-    )
-
-    wireguard = GenericConfigurationTask(
-        WireguardUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        WireguardWindowsConfigurationTask(),
-    )
-
-    wireguard_share = GenericConfigurationTask(
-        WireguardShareUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        WireguardShareWindowsConfigurationTask(),
-    )
-
-    dnsmasq = GenericConfigurationTask(
-        DnsmasqUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        DnsmasqWindowsConfigurationTask(),
-    )
-
-    nftables = GenericConfigurationTask(
-        NftablesUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        NftablesWindowsConfigurationTask(),
-    )
-
-    systemd = GenericConfigurationTask(
-        SystemdUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        SystemdWindowsConfigurationTask(),
-    )
-
-    docker_resources = GenericConfigurationTask(
-        DockerResourcesUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        DockerResourcesWindowsConfigurationTask(),
-    )
-
-    docker_seed_gitea = GenericConfigurationTask(
-        DockerSeedGiteaUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        DockerSeedGiteaWindowsConfigurationTask(),
-    )
-
-    docker_orchestration = GenericConfigurationTask(
-        DockerOrchestrationUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        DockerOrchestrationWindowsConfigurationTask(),
-    )
-
-    docker_setup_gitea_admin = GenericConfigurationTask(
-        DockerSetupGiteaAdminUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        DockerSetupGiteaAdminWindowsConfigurationTask(),
-    )
-
-    certificates = GenericConfigurationTask(
-        CertificatesUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        CertificatesWindowsConfigurationTask(),
-    )
-
-    share_certificates = GenericConfigurationTask(
-        ShareCertificatesUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        ShareCertificatesWindowsConfigurationTask(),
-    )
-
-    nginx = GenericConfigurationTask(
-        NginxUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        NginxWindowsConfigurationTask(),
-    )
-
-    autostart = GenericConfigurationTask(
-        AutostartUbuntuConfigurationTask(
-            content_reader, file_system, notifications_service, controller
-        ),
-        AutostartWindowsConfigurationTask(),
-    )
-
-    command = ConfigureCommand(
-        config_reader,
-        [
-            nftables,
-            dnsmasq,
-            wireguard_peers,
-            wireguard,
-            wireguard_share,
-            systemd,
-            docker_resources,
-            docker_seed_gitea,
-            docker_orchestration,
-            docker_setup_gitea_admin,
-            certificates,
-            share_certificates,
-            nginx,
-            autostart,
-        ],
-    )
-    command.execute()
+    host_resources = HostResourcesService(file_system)
+    # Dry runs have no real network path, so they see one that carries 1500-byte packets. Plans
+    # of a live host send the probes, which change nothing, to take the same MTU as a real run.
+    path_mtu = PathMtuService(ping=lambda host, size: True) if dry_run_host else PathMtuService()
+
+    tasks = create_default_configuration_tasks(
+        content_reader, file_system, notifications_service, controller, host_resources, path_mtu
+    )
+
+    command = ConfigureCommand(config_reader, tasks)
+    config_bundle = ConfigBundleService(file_system, system_management_service)
+    if APPLY_FLAG in argv:
+        ApplyBundleCommand(input_collection, notifications_service, config_bundle).execute()
+    elif COMPILE_FLAG in argv and plan_host:
+        CompileBundleCommand(
+            input_collection, notifications_service, config_bundle, command, plan_host
+        ).execute()
+    else:
+        command.execute()
+
+    if plan_host and PLAN_FLAG in argv:
+        plan_host.report(notifications_service)
+    elif dry_run_host and not plan_host:
+        dry_run_host.report(notifications_service)
@@ -0,0 +1,15 @@
+"""Necessary imports to configure the DNS benchmark tool."""
+
+from packages_engine.commands import DnsBenchmarkCommand
+from packages_engine.services.dns_benchmark import DnsBenchmarkService
+from packages_engine.services.input_collection import InputCollectionService
+from packages_engine.services.notifications import NotificationsService
+
+
+def main():
+    """Entry point."""
+    notifications_service = NotificationsService()
+    input_collection = InputCollectionService(notifications_service)
+
+    command = DnsBenchmarkCommand(input_collection, notifications_service, DnsBenchmarkService())
+    command.execute()
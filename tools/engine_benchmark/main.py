@@ -0,0 +1,29 @@
+"""Necessary imports to configure the engine benchmark tool."""
+
+from packages_engine.commands import EngineBenchmarkCommand
+from packages_engine.services.engine_benchmark import EngineBenchmarkService
+from packages_engine.services.file_system import FileSystemService
+from packages_engine.services.input_collection import InputCollectionService
+from packages_engine.services.notifications import NotificationsService
+from packages_engine.services.system_management import SystemManagementService
+from packages_engine.services.system_management_engine_locator import (
+    SystemManagementEngineLocatorService,
+)
+
+
+def main():
+    """Entry point. Exits with status 1 on failures or regressions so CI can gate on it."""
+    system_management_engine_locator_service = SystemManagementEngineLocatorService()
+    engine = system_management_engine_locator_service.locate_engine()
+    system_management_service = SystemManagementService(engine)
+
+    notifications_service = NotificationsService()
+
+    input_collection = InputCollectionService(notifications_service)
+    file_system = FileSystemService(system_management_service)
+
+    command = EngineBenchmarkCommand(
+        input_collection, notifications_service, file_system, EngineBenchmarkService()
+    )
+    if not command.execute():
+        raise SystemExit(1)
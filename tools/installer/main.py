@@ -1,6 +1,10 @@
 """Necessary imports to configure the installer tool."""
 
+import sys
+
 from packages_engine.commands import InstallCommand
+from packages_engine.services.dry_run import create_dry_run_host, parse_dry_run_options
+from packages_engine.services.file_system import FileSystemService
 from packages_engine.services.installer import InstallerService
 from packages_engine.services.installer.installer_tasks import GenericInstallerTask
 from packages_engine.services.installer.installer_tasks.dnsmasq import (
@@ -19,6 +23,10 @@ from packages_engine.services.installer.installer_tasks.nginx import (
     NginxUbuntuInstallerTask,
     NginxWindowsInstallerTask,
 )
+from packages_engine.services.installer.installer_tasks.offline_bundle import (
+    OfflineBundleUbuntuInstallerTask,
+    OfflineBundleWindowsInstallerTask,
+)
 from packages_engine.services.installer.installer_tasks.post_install_check import (
     PostInstallCheckUbuntuInstallerTask,
     PostInstallCheckWindowsInstallerTask,
@@ -40,16 +48,29 @@ from packages_engine.services.system_management_engine_locator import (
 
 
 def main():
-    """Entry point."""
-    system_management_engine_locator_service = SystemManagementEngineLocatorService()
-    engine = system_management_engine_locator_service.locate_engine()
+    """Entry point. With --dry-run, runs against a simulated server instead of this one."""
+    dry_run_options = parse_dry_run_options(sys.argv[1:])
+    dry_run_host = create_dry_run_host(dry_run_options) if dry_run_options else None
+    if dry_run_host:
+        engine = dry_run_host.engine
+    else:
+        system_management_engine_locator_service = SystemManagementEngineLocatorService()
+        engine = system_management_engine_locator_service.locate_engine()
     system_management_service = SystemManagementService(engine)
 
     notifications_service = NotificationsService()
+    file_system = (
+        dry_run_host.file_system if dry_run_host else FileSystemService(system_management_service)
+    )
 
     controller = PackageControllerService(system_management_service, notifications_service)
     installer_service = InstallerService()
 
+    offline_bundle = GenericInstallerTask(
+        OfflineBundleUbuntuInstallerTask(notifications_service, file_system, controller),
+        OfflineBundleWindowsInstallerTask(),
+    )
+
     setup = GenericInstallerTask(
         SetupUbuntuInstallerTask(notifications_service, controller),
         SetupWindowsInstallerTask(),
@@ -86,6 +107,19 @@ def main():
     )
 
     command = InstallCommand(
-        installer_service, [setup, wireguard, dnsmasq, nftables, docker, nginx, post_install_check]
+        installer_service,
+        [
+            offline_bundle,
+            setup,
+            wireguard,
+            dnsmasq,
+            nftables,
+            docker,
+            nginx,
+            post_install_check,
+        ],
     )
     command.execute()
+
+    if dry_run_host:
+        dry_run_host.report(notifications_service)
@@ -1,6 +1,9 @@
 """Necessary imports to configure the self deployment tool."""
 
+import sys
+
 from packages_engine.commands import SelfDeployCommand
+from packages_engine.services.dry_run import create_dry_run_host, parse_dry_run_options
 from packages_engine.services.file_system import FileSystemService
 from packages_engine.services.input_collection import InputCollectionService
 from packages_engine.services.notifications import NotificationsService
@@ -11,15 +14,25 @@ from packages_engine.services.system_management_engine_locator import (
 
 
 def main():
-    """Entry point."""
-    system_management_engine_locator_service = SystemManagementEngineLocatorService()
-    engine = system_management_engine_locator_service.locate_engine()
+    """Entry point. With --dry-run, runs against a simulated server instead of this one."""
+    dry_run_options = parse_dry_run_options(sys.argv[1:])
+    dry_run_host = create_dry_run_host(dry_run_options) if dry_run_options else None
+    if dry_run_host:
+        engine = dry_run_host.engine
+    else:
+        system_management_engine_locator_service = SystemManagementEngineLocatorService()
+        engine = system_management_engine_locator_service.locate_engine()
     system_management_service = SystemManagementService(engine)
 
     notifications_service = NotificationsService()
 
     input_collection = InputCollectionService(notifications_service)
-    file_system = FileSystemService(system_management_service)
+    file_system = (
+        dry_run_host.file_system if dry_run_host else FileSystemService(system_management_service)
+    )
 
     command = SelfDeployCommand(file_system, input_collection, notifications_service)
     command.execute()
+
+    if dry_run_host:
+        dry_run_host.report(notifications_service)
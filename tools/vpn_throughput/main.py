@@ -0,0 +1,34 @@
+"""Necessary imports to configure the VPN throughput tool."""
+
+from packages_engine.commands import VpnThroughputCommand
+from packages_engine.services.configuration import ConfigurationDataReaderService
+from packages_engine.services.file_system import FileSystemService
+from packages_engine.services.input_collection import InputCollectionService
+from packages_engine.services.notifications import NotificationsService
+from packages_engine.services.system_management import SystemManagementService
+from packages_engine.services.system_management_engine_locator import (
+    SystemManagementEngineLocatorService,
+)
+from packages_engine.services.vpn_throughput import VpnThroughputService
+
+
+def main():
+    """Entry point."""
+    system_management_engine_locator_service = SystemManagementEngineLocatorService()
+    engine = system_management_engine_locator_service.locate_engine()
+    system_management_service = SystemManagementService(engine)
+
+    notifications_service = NotificationsService()
+
+    input_collection = InputCollectionService(notifications_service)
+    file_system = FileSystemService(system_management_service)
+    config_data_reader = ConfigurationDataReaderService(input_collection, file_system)
+
+    command = VpnThroughputCommand(
+        input_collection,
+        notifications_service,
+        file_system,
+        config_data_reader,
+        VpnThroughputService(),
+    )
+    command.execute()